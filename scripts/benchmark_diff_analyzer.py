@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark DiffAnalyzer.analyze on large pages.
+
+Times DiffAnalyzer.analyze (run once per surgically pushed page) on
+synthetic pages of headings, paragraphs and tables, for a few typical
+edits. For the page where every paragraph was reworded, it also times the
+pairwise similarity search that analyze used before block fingerprints
+(_find_similar_block, which re-keys and re-splits every candidate block
+for every modified block) against the fingerprinted, word-indexed search.
+
+Usage:
+    python scripts/benchmark_diff_analyzer.py                  # 500 and 2000 blocks
+    python scripts/benchmark_diff_analyzer.py --blocks 5000    # one larger page
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.page_operations.diff_analyzer import DiffAnalyzer
+from src.page_operations.models import BlockType, ContentBlock
+
+COMMON = "the a of to and in is for on with".split()
+# Realistic pages have a large vocabulary: a few common words, many rare ones
+WORDS = COMMON * 50 + [f"term{i}" for i in range(3000)]
+
+
+def make_page(count: int, seed: int = 1) -> List[ContentBlock]:
+    """Build a synthetic page: a heading every 10 blocks, some tables."""
+    rng = random.Random(seed)
+    blocks = []
+    for i in range(count):
+        if i % 10 == 0:
+            blocks.append(ContentBlock(BlockType.HEADING, f"Section {i // 10}", level=2, index=i))
+        elif i % 10 == 5:
+            rows = [["Name", "Value"]] + [[f"key {i}-{r}", rng.choice(WORDS)] for r in range(5)]
+            content = " ".join(cell for row in rows for cell in row)
+            blocks.append(ContentBlock(BlockType.TABLE, content, rows=rows, index=i))
+        else:
+            text = f"Paragraph {i}: " + " ".join(rng.choice(WORDS) for _ in range(30))
+            blocks.append(ContentBlock(BlockType.PARAGRAPH, text, index=i))
+    return blocks
+
+
+def edited_pages(original: List[ContentBlock]) -> Dict[str, List[ContentBlock]]:
+    """Build modified versions of a page for each benchmark case."""
+    def reword(block: ContentBlock) -> ContentBlock:
+        if block.block_type != BlockType.PARAGRAPH:
+            return block
+        return ContentBlock(block.block_type, "Edited: " + block.content, index=block.index)
+
+    middle = len(original) // 2
+    return {
+        'unchanged': list(original),
+        'insert at top': [ContentBlock(BlockType.PARAGRAPH, "New intro", index=0)] + original,
+        'edit 1 paragraph': original[:middle + 1] + [reword(original[middle + 1])] + original[middle + 2:],
+        'reword every paragraph': [reword(block) for block in original],
+    }
+
+
+def best_of(rounds: int, func: Callable[[], None]) -> float:
+    """Return the fastest of several timed runs, in seconds."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def pairwise_search(analyzer: DiffAnalyzer, original, modified) -> None:
+    """Similarity search as analyze did it before fingerprints."""
+    matched = set()
+    for block in modified:
+        match = analyzer._find_similar_block(block, original, matched)
+        if match is not None:
+            matched.add(analyzer._block_key(match))
+
+
+def indexed_search(analyzer: DiffAnalyzer, original, modified) -> None:
+    """Fingerprinted, word-indexed similarity search (one gap)."""
+    orig_prints = [analyzer._fingerprint(block) for block in original]
+    mod_prints = [analyzer._fingerprint(block) for block in modified]
+    analyzer._match_gap(orig_prints, list(range(len(orig_prints))),
+                        mod_prints, list(range(len(mod_prints))))
+
+
+def run(analyzer: DiffAnalyzer, count: int, rounds: int) -> None:
+    """Time and print every case for one page size."""
+    original = make_page(count)
+    pages = edited_pages(original)
+    print(f"{count} blocks, best of {rounds} rounds")
+
+    print(f"{'analyze case':<40} {'time':>10} {'ops':>6}")
+    for case, modified in pages.items():
+        elapsed = best_of(rounds, lambda m=modified: analyzer.analyze(original, m))
+        operations = len(analyzer.analyze(original, modified))
+        print(f"{case:<40} {elapsed * 1000:>8.1f}ms {operations:>6}")
+
+    changed_orig = [b for b in original if b.block_type == BlockType.PARAGRAPH]
+    changed_mod = [b for b in pages['reword every paragraph'] if b.block_type == BlockType.PARAGRAPH]
+    # One round only: the pairwise search takes seconds on large pages
+    pairwise = best_of(1, lambda: pairwise_search(analyzer, changed_orig, changed_mod))
+    indexed = best_of(rounds, lambda: indexed_search(analyzer, changed_orig, changed_mod))
+    print(f"{'similarity search':<40} {'pairwise':>10} {'indexed':>10} {'speedup':>8}")
+    print(f"{f'{len(changed_mod)} reworded paragraphs':<40} {pairwise * 1000:>8.1f}ms "
+          f"{indexed * 1000:>8.1f}ms {pairwise / indexed:>7.1f}x")
+    print()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--blocks', type=int, action='append',
+                        help='Blocks per page (repeatable, default 500 and 2000)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed runs per case (best is kept)')
+    args = parser.parse_args()
+
+    analyzer = DiffAnalyzer()
+    for count in args.blocks or [500, 2000]:
+        run(analyzer, count, args.rounds)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
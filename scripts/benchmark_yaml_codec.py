@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the YAML codec on the frontmatter, config and state hot paths.
+
+Times FrontmatterHandler.parse (run once per local file per scan), state
+load/save and frontmatter generation with the pure-Python PyYAML classes
+and with the libyaml C classes selected by src.file_mapper.yaml_codec.
+
+Usage:
+    python scripts/benchmark_yaml_codec.py                # 2000 files, 5 rounds
+    python scripts/benchmark_yaml_codec.py --files 10000  # larger workspace
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+import yaml
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.file_mapper import yaml_codec
+from src.file_mapper.frontmatter_handler import FrontmatterHandler
+
+URL = "https://example.atlassian.net/wiki/spaces/TEAM/pages/{page_id}"
+
+
+def make_files(count: int) -> Dict[str, str]:
+    """Build synthetic markdown files with typical frontmatter."""
+    files = {}
+    for i in range(count):
+        frontmatter = yaml.safe_dump({
+            'confluence_url': URL.format(page_id=100000 + i),
+            'title': f"Page {i}: design notes",
+            'tags': ['docs', 'team', f"area-{i % 7}"],
+            'owner': {'name': 'Docs Team', 'email': 'docs@example.com'},
+        }, sort_keys=False)
+        files[f"docs/page-{i}.md"] = f"---\n{frontmatter}---\n# Page {i}\n\nBody text.\n"
+    return files
+
+
+def best_of(rounds: int, func: Callable[[], None]) -> float:
+    """Return the fastest of several timed runs, in seconds."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(files: Dict[str, str], rounds: int) -> Dict[str, float]:
+    """Time each hot path with the codec's current loader/dumper."""
+    state = {'last_synced': '2024-01-15T10:30:00+00:00',
+             'tracked_pages': {str(100000 + i): path for i, path in enumerate(files)}}
+    state_text = yaml_codec.safe_dump(state, default_flow_style=False, sort_keys=False)
+
+    def parse_all():
+        for path, content in files.items():
+            FrontmatterHandler.parse(path, content)
+
+    def load_state():
+        yaml_codec.safe_load(state_text)
+
+    def dump_state():
+        yaml_codec.safe_dump(state, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+    return {
+        'FrontmatterHandler.parse (all files)': best_of(rounds, parse_all),
+        'state load': best_of(rounds, load_state),
+        'state save': best_of(rounds, dump_state),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=2000, help='Number of synthetic files')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed runs per case (best is kept)')
+    args = parser.parse_args()
+
+    if not yaml_codec.HAS_LIBYAML:
+        print("PyYAML was built without libyaml; only the pure-Python path is available.")
+        return 1
+
+    files = make_files(args.files)
+
+    c_loader, c_dumper = yaml_codec.SafeLoader, yaml_codec.SafeDumper
+    yaml_codec.SafeLoader, yaml_codec.SafeDumper = yaml.SafeLoader, yaml.SafeDumper
+    try:
+        python_times = run(files, args.rounds)
+    finally:
+        yaml_codec.SafeLoader, yaml_codec.SafeDumper = c_loader, c_dumper
+    c_times = run(files, args.rounds)
+
+    print(f"{args.files} files, best of {args.rounds} rounds")
+    print(f"{'case':<40} {'pure Python':>12} {'libyaml':>12} {'speedup':>8}")
+    for case, python_time in python_times.items():
+        c_time = c_times[case]
+        print(f"{case:<40} {python_time * 1000:>10.1f}ms {c_time * 1000:>10.1f}ms "
+              f"{python_time / c_time:>7.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
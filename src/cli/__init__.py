@@ -8,7 +8,7 @@ into a seamless command-line workflow with progress indication and error handlin
 
 from .sync_command import SyncCommand
 from .init_command import InitCommand
-from .models import ExitCode, SyncState, ChangeDetectionResult, SyncSummary
+from .models import ExitCode, PageRecord, SyncState, ChangeDetectionResult, SyncSummary
 from .errors import (
     CLIError,
     ConfigNotFoundError,
@@ -22,6 +22,7 @@ __all__ = [
     'InitCommand',
     'ExitCode',
     'SyncState',
+    'PageRecord',
     'ChangeDetectionResult',
     'SyncSummary',
     'CLIError',
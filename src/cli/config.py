@@ -1,16 +1,22 @@
 """State file loading and validation.
 
-This module handles loading and saving sync state from YAML files
-according to ADR-013. State files track project-level sync timestamps
-rather than per-file timestamps.
+This module handles loading and saving sync state according to ADR-013.
+State files track project-level sync timestamps rather than per-file
+timestamps. Paths ending in .db are stored in SQLite (StateStore); any other
+path is a YAML file.
 """
 
+import logging
 import os
 from typing import Dict, Any, Optional
-import yaml
+
+from src.file_mapper import yaml_codec
 
 from .errors import StateError, StateFilesystemError
-from .models import SyncState
+from .models import PageRecord, SyncState
+from .state_store import StateStore
+
+logger = logging.getLogger(__name__)
 
 
 class StateManager:
@@ -25,18 +31,39 @@ class StateManager:
 
     If the file is missing or corrupted, it's treated as a fresh state
     (never synced) with last_synced=None.
+
+    Paths with a STORE_SUFFIXES extension use the SQLite StateStore, which
+    keeps per-page records and writes only changed rows. Loading a store that
+    does not exist yet migrates the YAML file next to it (state.db <-
+    state.yaml); the YAML file is then renamed to state.yaml.migrated.
     """
 
     # Default state directory
     DEFAULT_STATE_DIR = '.confluence-sync'
-    DEFAULT_STATE_FILE = 'state.yaml'
+    DEFAULT_STATE_FILE = 'state.db'
+    LEGACY_STATE_FILE = 'state.yaml'
+
+    # Extensions that select the SQLite state store
+    STORE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+    @classmethod
+    def is_store_path(cls, state_path: str) -> bool:
+        """Check whether a state path selects the SQLite state store.
+
+        Args:
+            state_path: Path to the state file
+
+        Returns:
+            True for .db/.sqlite/.sqlite3 paths, False for YAML paths
+        """
+        return os.path.splitext(str(state_path))[1].lower() in cls.STORE_SUFFIXES
 
     @classmethod
     def load(cls, state_path: str) -> SyncState:
-        """Load and parse state from a YAML file.
+        """Load and parse state from a YAML file or state database.
 
         Args:
-            state_path: Path to the YAML state file
+            state_path: Path to the YAML state file or SQLite state database
 
         Returns:
             SyncState object with parsed state
@@ -45,6 +72,9 @@ class StateManager:
             StateFilesystemError: If file cannot be read (except FileNotFoundError)
             StateError: If state file is invalid or malformed
         """
+        if cls.is_store_path(state_path):
+            return cls._load_store(state_path)
+
         # Read file - treat missing file as fresh state
         try:
             with open(state_path, 'r', encoding='utf-8') as f:
@@ -71,8 +101,8 @@ class StateManager:
 
         # Parse YAML
         try:
-            state_dict = yaml.safe_load(content)
-        except yaml.YAMLError as e:
+            state_dict = yaml_codec.safe_load(content)
+        except yaml_codec.YAMLError as e:
             raise StateError(
                 f"Invalid YAML syntax: {str(e)}"
             )
@@ -88,25 +118,64 @@ class StateManager:
         # Validate and parse
         return cls._parse_state(state_dict)
 
+    @classmethod
+    def _load_store(cls, state_path: str) -> SyncState:
+        """Load state from a state database, migrating state.yaml if needed.
+
+        Args:
+            state_path: Path to the SQLite state database
+
+        Returns:
+            SyncState object with parsed state
+
+        Raises:
+            StateFilesystemError: If a file cannot be read or written
+            StateError: If the database or the legacy YAML file is invalid
+        """
+        store = StateStore(state_path)
+        if store.exists():
+            return store.load()
+
+        legacy_path = os.path.splitext(state_path)[0] + '.yaml'
+        if not os.path.exists(legacy_path):
+            return SyncState()
+
+        logger.info(f"Migrating sync state from {legacy_path} to {state_path}")
+        sync_state = cls.load(legacy_path)
+        store.save(sync_state)
+        try:
+            os.replace(legacy_path, legacy_path + '.migrated')
+        except OSError as e:
+            # The database exists now and takes precedence on the next load
+            logger.warning(f"Could not rename {legacy_path} after migration: {e}")
+        return sync_state
+
     @classmethod
     def save(cls, state_path: str, sync_state: SyncState) -> None:
-        """Save state to a YAML file.
+        """Save state to a YAML file or state database.
 
         Args:
-            state_path: Path to the YAML state file
+            state_path: Path to the YAML state file or SQLite state database
             sync_state: SyncState object to save
 
         Raises:
             StateFilesystemError: If file cannot be written
         """
+        if cls.is_store_path(state_path):
+            StateStore(state_path).save(sync_state)
+            return
+
         # Convert SyncState to dictionary
         state_dict = {
             'last_synced': sync_state.last_synced,
             'tracked_pages': sync_state.tracked_pages
         }
+        # Only written when git change detection is in use
+        if sync_state.workspace_commits:
+            state_dict['workspace_commits'] = sync_state.workspace_commits
 
         # Generate YAML
-        yaml_str = yaml.safe_dump(
+        yaml_str = yaml_codec.safe_dump(
             state_dict,
             default_flow_style=False,
             allow_unicode=True,
@@ -142,6 +211,32 @@ class StateManager:
                 str(e)
             )
 
+    @classmethod
+    def record_page(
+        cls,
+        state_path: str,
+        page_id: str,
+        path: str,
+        record: PageRecord,
+    ) -> None:
+        """Update the stored record of a single page.
+
+        Only the SQLite state store keeps per-page records; for YAML state
+        files this is a no-op.
+
+        Args:
+            state_path: Path to the state file
+            page_id: Confluence page ID
+            path: Local file path
+            record: Version, content hash and sync time of the page
+
+        Raises:
+            StateFilesystemError: If the database cannot be written
+            StateError: If the database is corrupted
+        """
+        if cls.is_store_path(state_path):
+            StateStore(state_path).update_page(page_id, path, record)
+
     @classmethod
     def _parse_state(cls, state_dict: Dict[str, Any]) -> SyncState:
         """Parse and validate state dictionary.
@@ -201,4 +296,18 @@ class StateManager:
         else:
             tracked_pages = {}
 
-        return SyncState(last_synced=last_synced, tracked_pages=tracked_pages)
+        # Extract workspace_commits (optional field)
+        workspace_commits = state_dict.get('workspace_commits') or {}
+        if not isinstance(workspace_commits, dict) or not all(
+            isinstance(k, str) and isinstance(v, str) for k, v in workspace_commits.items()
+        ):
+            raise StateError(
+                "Field 'workspace_commits' must be a dictionary of strings",
+                'workspace_commits'
+            )
+
+        return SyncState(
+            last_synced=last_synced,
+            tracked_pages=tracked_pages,
+            workspace_commits=workspace_commits
+        )
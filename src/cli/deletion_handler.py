@@ -14,6 +14,7 @@ from typing import Optional
 
 from src.cli.errors import CLIError
 from src.cli.models import DeletionInfo, DeletionResult
+from src.file_mapper.workspace_index import map_ordered
 
 logger = logging.getLogger(__name__)
 
@@ -181,13 +182,15 @@ class DeletionHandler:
         self,
         deletions: list[DeletionInfo],
         dryrun: bool = False,
+        max_workers: int = 1,
     ) -> list[str]:
         """Delete Confluence pages for locally deleted files.
 
         This method processes local files that have been deleted and
         moves their corresponding Confluence pages to trash. Each deletion is
         handled independently - errors are logged but don't stop processing
-        of other deletions.
+        of other deletions. Up to max_workers deletions run at once, sharing
+        the API rate limiter.
 
         Per ADR requirements:
         - No confirmation prompts (use dryrun parameter for preview)
@@ -199,6 +202,7 @@ class DeletionHandler:
         Args:
             deletions: List of DeletionInfo for locally deleted files
             dryrun: If True, log deletions without executing (default: False)
+            max_workers: Maximum number of deletions running at once (default: 1)
 
         Returns:
             List of page IDs successfully deleted (empty list in dryrun mode)
@@ -233,49 +237,47 @@ class DeletionHandler:
             logger.error("PageOperations instance not provided")
             raise CLIError("Cannot delete Confluence pages: PageOperations not initialized")
 
-        deleted_page_ids = []
+        to_delete: list[DeletionInfo] = []
 
         for deletion in deletions:
-            try:
-                # Validate deletion info
-                if not deletion.page_id:
-                    logger.warning(
-                        f"Deletion ({deletion.title}): "
-                        f"No page ID specified, skipping"
-                    )
-                    continue
+            # Validate deletion info
+            if not deletion.page_id:
+                logger.warning(
+                    f"Deletion ({deletion.title}): "
+                    f"No page ID specified, skipping"
+                )
+                continue
 
-                # Check direction is correct
-                if deletion.direction != "local_to_confluence":
-                    logger.warning(
-                        f"Page {deletion.page_id} ({deletion.title}): "
-                        f"Incorrect direction '{deletion.direction}' for Confluence deletion, skipping"
-                    )
-                    continue
+            # Check direction is correct
+            if deletion.direction != "local_to_confluence":
+                logger.warning(
+                    f"Page {deletion.page_id} ({deletion.title}): "
+                    f"Incorrect direction '{deletion.direction}' for Confluence deletion, skipping"
+                )
+                continue
 
-                if dryrun:
-                    # Dry run mode - just log what would be deleted
-                    logger.info(
-                        f"[DRYRUN] Would delete Confluence page: {deletion.page_id} "
-                        f"({deletion.title})"
-                    )
-                else:
-                    # Actually delete the page (move to trash)
-                    logger.info(
-                        f"Deleting Confluence page: {deletion.page_id} "
-                        f"({deletion.title})"
-                    )
-                    self.page_operations.delete_page(deletion.page_id)
-                    deleted_page_ids.append(deletion.page_id)
-                    logger.debug(f"Successfully deleted page {deletion.page_id}")
+            if dryrun:
+                # Dry run mode - just log what would be deleted
+                logger.info(
+                    f"[DRYRUN] Would delete Confluence page: {deletion.page_id} "
+                    f"({deletion.title})"
+                )
+            else:
+                to_delete.append(deletion)
 
-            except Exception as e:
+        # Actually delete the pages (move to trash), up to max_workers at once
+        deleted_page_ids = []
+        for deletion, _, error in map_ordered(
+            self._delete_confluence_page, to_delete, max_workers=max_workers
+        ):
+            if error is not None:
                 # Any error - log and continue
                 logger.error(
                     f"Failed to delete Confluence page {deletion.page_id} "
-                    f"({deletion.title}): {e}"
+                    f"({deletion.title}): {error}"
                 )
                 continue
+            deleted_page_ids.append(deletion.page_id)
 
         if dryrun:
             logger.info(
@@ -289,3 +291,18 @@ class DeletionHandler:
             )
 
         return deleted_page_ids
+
+    def _delete_confluence_page(self, deletion: DeletionInfo) -> None:
+        """Move one Confluence page to trash.
+
+        Runs on a worker thread of delete_confluence_pages.
+
+        Args:
+            deletion: DeletionInfo of a locally deleted file
+        """
+        logger.info(
+            f"Deleting Confluence page: {deletion.page_id} "
+            f"({deletion.title})"
+        )
+        self.page_operations.delete_page(deletion.page_id)
+        logger.debug(f"Successfully deleted page {deletion.page_id}")
@@ -356,7 +356,8 @@ class InitCommand:
             page_limit=100,
             force_pull=False,
             force_push=False,
-            temp_dir=".confluence-sync/temp"
+            temp_dir=".confluence-sync/temp",
+            cache_dir=".confluence-sync"
         )
 
         # Save configuration
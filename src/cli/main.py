@@ -18,6 +18,7 @@ from src.cli.init_command import InitCommand
 from src.cli.models import ExitCode
 from src.cli.output import OutputHandler
 from src.cli.sync_command import SyncCommand
+from src.cli.watch_command import DEFAULT_REMOTE_POLL_SECONDS, WatchCommand
 
 # Create Typer app - no_args_is_help=False allows running without args
 app = typer.Typer(
@@ -30,6 +31,7 @@ QUICK START:
   confluence-sync --dry-run                                        # Preview changes
   confluence-sync --force-push                                     # Local → Confluence
   confluence-sync --force-pull                                     # Confluence → local
+  confluence-sync --watch                                          # Keep syncing changes
 
 EXAMPLE:
   confluence-sync --init --local ./docs --url https://company.atlassian.net/wiki/spaces/TEAM/pages/123456
@@ -50,6 +52,7 @@ GETTING_STARTED_MESSAGE = """confluence-sync
 --dry-run                                                         # Preview changes
 --force-push                                                      # Local → Confluence
 --force-pull                                                      # Confluence → local
+--watch                                                           # Keep syncing changes
 --help                                                            # Show all options
 
 Example:
@@ -186,7 +189,10 @@ def _run_sync(
     exclude_local: Optional[List[str]],
     logdir: Optional[str],
     verbosity: int,
-    no_color: bool
+    no_color: bool,
+    watch: bool = False,
+    watch_interval: float = DEFAULT_REMOTE_POLL_SECONDS,
+    resume: bool = False
 ) -> None:
     """Run sync command.
 
@@ -200,6 +206,9 @@ def _run_sync(
         logdir: Directory for log files
         verbosity: Verbosity level
         no_color: Whether to disable colored output
+        watch: Keep running and sync changes as they occur
+        watch_interval: Seconds between remote change polls in watch mode
+        resume: Skip the work an interrupted sync already applied
     """
     # Configure logging
     _configure_logging(verbosity, logdir)
@@ -292,6 +301,19 @@ def _run_sync(
     # Create sync command
     sync_cmd = SyncCommand(output_handler=output)
 
+    # Resume only applies to a full bidirectional sync
+    if resume and (file or dry_run or force_push or force_pull or watch):
+        output.error("--resume cannot be combined with a file, --dry-run, --force-* or --watch")
+        raise typer.Exit(ExitCode.GENERAL_ERROR)
+
+    # Watch mode: initial full sync, then incremental syncs until Ctrl-C
+    if watch:
+        if file or dry_run or force_push or force_pull:
+            output.error("--watch cannot be combined with a file, --dry-run or --force-*")
+            raise typer.Exit(ExitCode.GENERAL_ERROR)
+        exit_code = WatchCommand(sync_cmd, remote_poll_interval=watch_interval).run()
+        raise typer.Exit(exit_code)
+
     # Run sync operation (exclusions now in config, no need to pass separately)
     # Single-file sync should not update global timestamp
     exit_code = sync_cmd.run(
@@ -301,6 +323,7 @@ def _run_sync(
         single_file=file,
         update_timestamp=not bool(file),  # False when single_file provided
         cli_exclude_page_ids=None,  # Exclusions already in config
+        resume=resume,
     )
 
     # Exit with appropriate code
@@ -366,6 +389,22 @@ def main_command(
         help="Local file path(s) to exclude from sync (can be used multiple times)",
         metavar="PATH",
     ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help="Keep running: sync local edits as they happen and poll Confluence for changes",
+    ),
+    watch_interval: float = typer.Option(
+        DEFAULT_REMOTE_POLL_SECONDS,
+        "--watch-interval",
+        help="With --watch: seconds between checks for Confluence changes",
+        metavar="SECONDS",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue an interrupted sync, skipping the pages it already synced",
+    ),
     logdir: Optional[str] = typer.Option(
         None,
         "--logdir",
@@ -398,6 +437,7 @@ def main_command(
       confluence-sync --dry-run                                        # Preview changes
       confluence-sync --force-push                                     # Local → Confluence
       confluence-sync --force-pull                                     # Confluence → local
+      confluence-sync --watch                                          # Keep syncing changes
 
     \b
     EXCLUSIONS:
@@ -444,7 +484,10 @@ def main_command(
         return
 
     # Check if any sync-related options were provided (indicates user wants to sync)
-    has_sync_options = dry_run or force_push or force_pull or file is not None or logdir is not None
+    has_sync_options = (
+        dry_run or force_push or force_pull or watch or resume
+        or file is not None or logdir is not None
+    )
 
     # If no options at all, show getting started message
     if not has_sync_options and verbosity == 0 and not no_color:
@@ -455,7 +498,10 @@ def main_command(
             raise typer.Exit()
 
     # Run sync (default behavior)
-    _run_sync(file, dry_run, force_push, force_pull, exclude_confluence, exclude_local, logdir, verbosity, no_color)
+    _run_sync(
+        file, dry_run, force_push, force_pull, exclude_confluence, exclude_local, logdir,
+        verbosity, no_color, watch, watch_interval, resume
+    )
 
 
 def main() -> None:
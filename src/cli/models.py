@@ -32,9 +32,23 @@ class ExitCode(IntEnum):
     NETWORK_ERROR = 4
 
 
+@dataclass
+class PageRecord:
+    """Per-page sync metadata kept by the SQLite state store.
+
+    Attributes:
+        version: Confluence version number after the last sync (None if unknown)
+        content_hash: SHA-256 hex digest of the local file at the last sync
+        last_synced: ISO 8601 timestamp of the last sync that changed this record
+    """
+    version: Optional[int] = None
+    content_hash: Optional[str] = None
+    last_synced: Optional[str] = None
+
+
 @dataclass
 class SyncState:
-    """Project-level sync state tracked in .confluence-sync/state.yaml.
+    """Project-level sync state tracked in .confluence-sync/state.db.
 
     The sync state maintains the last successful sync timestamp at the
     project level (not per-file) per ADR-013. This timestamp is used
@@ -43,6 +57,11 @@ class SyncState:
     Attributes:
         last_synced: ISO 8601 timestamp of last successful sync (None if never synced)
         tracked_pages: Dict mapping page_id to local file path for all synced pages
+        workspace_commits: Dict mapping git repository root to the work tree
+                           snapshot commit taken at the last sync (used by
+                           local_change_detection: git)
+        page_records: Dict mapping page_id to its PageRecord (only persisted by
+                      the SQLite state store; the YAML format ignores it)
 
     Example:
         >>> state = SyncState(last_synced="2024-01-15T10:30:00Z")
@@ -50,6 +69,8 @@ class SyncState:
     """
     last_synced: Optional[str] = None
     tracked_pages: Dict[str, str] = field(default_factory=dict)
+    workspace_commits: Dict[str, str] = field(default_factory=dict)
+    page_records: Dict[str, PageRecord] = field(default_factory=dict)
 
 
 @dataclass
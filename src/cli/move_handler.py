@@ -10,10 +10,11 @@ the actual move operations, including nested moves and empty folder cleanup.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.cli.errors import CLIError
-from src.cli.models import MoveResult
+from src.cli.models import MoveInfo, MoveResult
+from src.file_mapper.workspace_index import map_ordered
 
 logger = logging.getLogger(__name__)
 
@@ -251,6 +252,8 @@ class MoveHandler:
         self,
         moves: list,
         dryrun: bool = False,
+        remote_pages: Optional[Dict[str, dict]] = None,
+        max_workers: int = 1,
     ) -> list[str]:
         """Move Confluence pages to match local folder hierarchy changes.
 
@@ -259,6 +262,12 @@ class MoveHandler:
         Each move is handled independently - errors are logged but don't stop
         processing of other moves.
 
+        Moves run in levels: a page whose new parent is also being moved is
+        moved after its parent. The moves of one level run on up to
+        max_workers threads, sharing the API rate limiter. When remote_pages
+        has a page's current version and title, the page is moved without
+        fetching it first.
+
         Per ADR requirements:
         - Local → Confluence: Update Confluence page parents via API
         - Nested moves handled (parent + children moved together)
@@ -269,6 +278,9 @@ class MoveHandler:
         Args:
             moves: List of MoveInfo for pages moved locally
             dryrun: If True, log moves without executing (default: False)
+            remote_pages: Remote page info by page ID, with the current
+                "title" and "version" of each page (optional)
+            max_workers: Maximum number of moves running at once (default: 1)
 
         Returns:
             List of page IDs successfully moved (empty list in dryrun mode)
@@ -306,7 +318,8 @@ class MoveHandler:
             logger.error("PageOperations instance not provided - cannot move Confluence pages")
             raise CLIError("PageOperations instance required for Confluence moves")
 
-        moved_page_ids = []
+        # Validate moves and resolve new parents (reads local frontmatter only)
+        pending: List[Tuple[MoveInfo, Optional[str]]] = []
 
         for move in moves:
             try:
@@ -344,46 +357,7 @@ class MoveHandler:
                         f"-> parent {parent_display}"
                     )
                 else:
-                    # Actually move the page in Confluence
-                    parent_display = new_parent_id if new_parent_id else "(space root)"
-                    logger.info(
-                        f"Updating Confluence parent: {move.title} (page {move.page_id}) "
-                        f"-> parent {parent_display}"
-                    )
-
-                    # Call update_page_parent if available, otherwise use update_page with parent_id
-                    if hasattr(self.page_operations, 'update_page_parent'):
-                        # Use dedicated method if available (from subtask 8-2)
-                        result = self.page_operations.update_page_parent(
-                            page_id=move.page_id,
-                            parent_id=new_parent_id
-                        )
-                        if not result.get('success', True):
-                            logger.error(
-                                f"Failed to update parent for page {move.page_id}: "
-                                f"{result.get('error', 'Unknown error')}"
-                            )
-                            continue
-                    else:
-                        # Fallback: Use update_page with parent_id in kwargs
-                        # This requires fetching current page state first
-                        from ..page_operations.page_operations import PageOperations
-                        snapshot = self.page_operations.get_page_snapshot(move.page_id)
-
-                        # Update with parent_id in kwargs
-                        # Note: Confluence API update_page can accept parent_id
-                        result = self.page_operations.api.update_page(
-                            page_id=move.page_id,
-                            title=snapshot.title,
-                            body=snapshot.xhtml,
-                            version=snapshot.version,
-                            parent_id=new_parent_id
-                        )
-
-                    moved_page_ids.append(move.page_id)
-                    logger.debug(
-                        f"Successfully updated parent for page {move.page_id} to {parent_display}"
-                    )
+                    pending.append((move, new_parent_id))
 
             except CLIError:
                 # Already logged, just re-raise to stop processing
@@ -396,6 +370,29 @@ class MoveHandler:
                 )
                 continue
 
+        # Move parents before children, each level by up to max_workers threads
+        moved = set()
+        for level in self._parent_first_levels(pending):
+            outcomes = map_ordered(
+                lambda item: self._move_confluence_page(item[0], item[1], remote_pages),
+                level,
+                max_workers=max_workers,
+            )
+            for (move, _), success, error in outcomes:
+                if isinstance(error, CLIError):
+                    # Already logged, just re-raise to stop processing
+                    raise error
+                if error is not None:
+                    # Unexpected error - log and continue
+                    logger.error(
+                        f"Unexpected error moving page {move.page_id} ({move.title}) "
+                        f"in Confluence: {error}"
+                    )
+                elif success:
+                    moved.add(move.page_id)
+
+        moved_page_ids = [move.page_id for move, _ in pending if move.page_id in moved]
+
         if dryrun:
             logger.info(
                 f"Dry run complete: Would move {len(moves)} page(s) in Confluence"
@@ -409,6 +406,110 @@ class MoveHandler:
 
         return moved_page_ids
 
+    def _move_confluence_page(
+        self,
+        move: MoveInfo,
+        new_parent_id: Optional[str],
+        remote_pages: Optional[Dict[str, dict]] = None,
+    ) -> bool:
+        """Update one Confluence page's parent.
+
+        Runs on a worker thread of move_confluence_pages.
+
+        Args:
+            move: MoveInfo of a locally moved page
+            new_parent_id: Resolved parent page ID (None for space root)
+            remote_pages: Remote page info by page ID, with the current
+                "title" and "version" of each page (optional)
+
+        Returns:
+            True if the parent was updated
+        """
+        parent_display = new_parent_id if new_parent_id else "(space root)"
+        logger.info(
+            f"Updating Confluence parent: {move.title} (page {move.page_id}) "
+            f"-> parent {parent_display}"
+        )
+
+        # Call update_page_parent if available, otherwise use update_page with parent_id
+        if hasattr(self.page_operations, 'update_page_parent'):
+            # Use dedicated method if available (from subtask 8-2)
+            remote_page = (remote_pages or {}).get(move.page_id) or {}
+            if remote_page.get('version') and remote_page.get('title'):
+                # Version known from the hierarchy - no fetch before the move
+                result = self.page_operations.update_page_parent(
+                    page_id=move.page_id,
+                    parent_id=new_parent_id,
+                    version=remote_page['version'],
+                    title=remote_page['title'],
+                )
+            else:
+                result = self.page_operations.update_page_parent(
+                    page_id=move.page_id,
+                    parent_id=new_parent_id
+                )
+            if isinstance(result, dict):
+                success, error = result.get('success', True), result.get('error')
+            else:
+                success, error = result.success, result.error
+            if not success:
+                logger.error(
+                    f"Failed to update parent for page {move.page_id}: "
+                    f"{error or 'Unknown error'}"
+                )
+                return False
+        else:
+            # Fallback: Use update_page with parent_id in kwargs
+            # This requires fetching current page state first
+            snapshot = self.page_operations.get_page_snapshot(move.page_id)
+
+            # Update with parent_id in kwargs
+            # Note: Confluence API update_page can accept parent_id
+            self.page_operations.api.update_page(
+                page_id=move.page_id,
+                title=snapshot.title,
+                body=snapshot.xhtml,
+                version=snapshot.version,
+                parent_id=new_parent_id
+            )
+
+        logger.debug(
+            f"Successfully updated parent for page {move.page_id} to {parent_display}"
+        )
+        return True
+
+    @staticmethod
+    def _parent_first_levels(
+        pending: List[Tuple[MoveInfo, Optional[str]]],
+    ) -> List[List[Tuple[MoveInfo, Optional[str]]]]:
+        """Group moves so a page moves after its new parent does.
+
+        A move whose new parent is itself being moved goes one level below
+        that parent's move. Moves within a level keep their input order.
+
+        Args:
+            pending: (MoveInfo, new parent page ID) pairs
+
+        Returns:
+            Levels of moves, parents' level first
+        """
+        parents = {move.page_id: parent_id for move, parent_id in pending}
+        depths: Dict[str, int] = {}
+
+        def depth_of(page_id: str, seen: Set[str]) -> int:
+            if page_id not in depths:
+                parent_id = parents[page_id]
+                if parent_id in parents and parent_id not in seen:
+                    depths[page_id] = depth_of(parent_id, seen | {page_id}) + 1
+                else:
+                    depths[page_id] = 0
+            return depths[page_id]
+
+        levels: Dict[int, List[Tuple[MoveInfo, Optional[str]]]] = {}
+        for item in pending:
+            levels.setdefault(depth_of(item[0].page_id, set()), []).append(item)
+        return [levels[depth] for depth in sorted(levels)]
+
     def resolve_parent_page_id(
         self,
         file_path,
@@ -21,6 +21,8 @@ from rich.progress import (
 from rich.spinner import Spinner
 from rich.live import Live
 
+from src.git_integration.models import CacheStats
+
 
 class OutputHandler:
     """Handles all terminal output using Rich library.
@@ -223,6 +225,21 @@ class OutputHandler:
         else:
             self.console.print("\n[green]Sync completed successfully[/green]")
 
+    def print_cache_stats(self, stats: Optional[CacheStats]) -> None:
+        """Display page content cache counters of the run.
+
+        Nothing is printed if there was no cache or it was not consulted.
+
+        Args:
+            stats: Cache counters for this run (None if no cache)
+        """
+        if stats is None or stats.hits + stats.misses == 0:
+            return
+
+        self.console.print(
+            f"  [dim]Cache: {stats.hits} hit(s), {stats.misses} miss(es)[/dim]"
+        )
+
     def print_force_summary(self, count: int, direction: str) -> None:
         """Display force operation summary.
 
@@ -274,6 +291,40 @@ class OutputHandler:
         if not to_push and not to_pull and not conflicts:
             self.console.print("\n[green]Already in sync. No changes to apply.[/green]")
 
+    def print_sync_plan(self, plan) -> None:
+        """Display the actions a sync would apply (dry run).
+
+        Args:
+            plan: SyncPlan from the planner
+        """
+        self.console.print("\n[bold]Dry Run - Sync Plan:[/bold]")
+
+        sections = (
+            ("delete", "red", "Would delete"),
+            ("move", "blue", "Would move"),
+            ("create", "green", "Would create in Confluence"),
+            ("update", "green", "Would push"),
+            ("pull", "blue", "Would pull"),
+            ("merge", "red", "Conflicts to merge"),
+        )
+        for kind, color, heading in sections:
+            actions = plan.of_kind(kind)
+            if not actions:
+                continue
+            self.console.print(f"\n[{color}]{heading} ({len(actions)} page(s)):[/{color}]")
+            for action in actions:
+                label = action.path or action.title or action.page_id
+                if kind == "delete":
+                    label = f"{label} ({action.detail})"
+                elif kind == "move":
+                    label = f"{label} → {action.detail}"
+                elif action.depends_on:
+                    label = f"{label} (after {', '.join(action.depends_on)})"
+                self.console.print(f"  • {label}")
+
+        if not plan.actions:
+            self.console.print("\n[green]Already in sync. No changes to apply.[/green]")
+
     def print_deletion_summary(
         self,
         local_deleted: int = 0,
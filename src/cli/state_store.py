@@ -0,0 +1,260 @@
+"""SQLite-backed sync state store.
+
+A state.yaml file is rewritten in full on every save and parsed in full on
+every load, which gets slow once tracked_pages holds thousands of pages.
+StateStore keeps the same SyncState in a SQLite database instead: one row per
+tracked page (path, version, content hash, last synced) plus a small meta
+table. Saves diff the new state against the stored rows and only write the
+rows that changed, in a single transaction.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from typing import Dict, Optional, Tuple
+
+from .errors import StateError, StateFilesystemError
+from .models import PageRecord, SyncState
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the table layout changes
+SCHEMA_VERSION = 1
+
+# Seconds to wait for a lock held by another process (e.g. --watch)
+SQLITE_TIMEOUT = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS pages (
+    page_id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    version INTEGER,
+    content_hash TEXT,
+    last_synced TEXT
+);
+"""
+
+# (path, version, content_hash, last_synced)
+_Row = Tuple[str, Optional[int], Optional[str], Optional[str]]
+
+
+class StateStore:
+    """Stores SyncState in a SQLite database.
+
+    Example:
+        >>> store = StateStore(".confluence-sync/state.db")
+        >>> state = store.load()
+        >>> state.tracked_pages["123"] = "docs/page.md"
+        >>> store.save(state)  # writes only the row for page 123
+    """
+
+    def __init__(self, db_path: str):
+        """Initialize the store.
+
+        Args:
+            db_path: Path to the SQLite database file (created on first save)
+        """
+        self.db_path = db_path
+
+    def exists(self) -> bool:
+        """Check whether the database file exists.
+
+        Returns:
+            True if the database has been created
+        """
+        return os.path.exists(self.db_path)
+
+    def _connect(self, operation: str) -> sqlite3.Connection:
+        """Open the database and make sure the schema exists.
+
+        Args:
+            operation: 'read' or 'write' (for error messages)
+
+        Returns:
+            Open connection
+
+        Raises:
+            StateFilesystemError: If the database cannot be opened or created
+            StateError: If the file is not a state database
+        """
+        if operation == 'write':
+            state_dir = os.path.dirname(self.db_path)
+            if state_dir:
+                try:
+                    os.makedirs(state_dir, exist_ok=True)
+                except Exception as e:
+                    raise StateFilesystemError(state_dir, 'create_directory', str(e)) from e
+
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=SQLITE_TIMEOUT)
+        except sqlite3.Error as e:
+            raise StateFilesystemError(self.db_path, operation, str(e)) from e
+
+        try:
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),)
+                )
+                conn.commit()
+            elif row[0] != str(SCHEMA_VERSION):
+                raise StateError(
+                    f"Unsupported state database schema version {row[0]} "
+                    f"(expected {SCHEMA_VERSION})"
+                )
+        except sqlite3.DatabaseError as e:
+            conn.close()
+            if isinstance(e, sqlite3.OperationalError):
+                raise StateFilesystemError(self.db_path, operation, str(e)) from e
+            raise StateError(f"Invalid state database: {e}") from e
+        except StateError:
+            conn.close()
+            raise
+        return conn
+
+    def load(self) -> SyncState:
+        """Load the full sync state.
+
+        Returns:
+            SyncState (fresh state if the database does not exist)
+
+        Raises:
+            StateFilesystemError: If the database cannot be read
+            StateError: If the database is corrupted
+        """
+        if not self.exists():
+            return SyncState()
+
+        conn = self._connect('read')
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            rows = conn.execute(
+                "SELECT page_id, path, version, content_hash, last_synced FROM pages"
+            ).fetchall()
+        except sqlite3.DatabaseError as e:
+            raise StateError(f"Invalid state database: {e}") from e
+        finally:
+            conn.close()
+
+        try:
+            workspace_commits = json.loads(meta.get('workspace_commits') or '{}')
+        except ValueError:
+            raise StateError(
+                "Field 'workspace_commits' must be a dictionary of strings",
+                'workspace_commits'
+            )
+
+        state = SyncState(
+            last_synced=meta.get('last_synced'),
+            workspace_commits=workspace_commits,
+        )
+        for page_id, path, version, content_hash, last_synced in rows:
+            state.tracked_pages[page_id] = path
+            state.page_records[page_id] = PageRecord(
+                version=version,
+                content_hash=content_hash,
+                last_synced=last_synced,
+            )
+        return state
+
+    def save(self, sync_state: SyncState) -> None:
+        """Save sync state, writing only rows that changed.
+
+        Pages missing from tracked_pages are deleted; pages whose path or
+        record differs from the stored row are upserted; all other rows are
+        left untouched.
+
+        Args:
+            sync_state: SyncState to persist
+
+        Raises:
+            StateFilesystemError: If the database cannot be written
+            StateError: If the database is corrupted
+        """
+        wanted: Dict[str, _Row] = {}
+        for page_id, path in sync_state.tracked_pages.items():
+            record = sync_state.page_records.get(page_id) or PageRecord()
+            wanted[page_id] = (path, record.version, record.content_hash, record.last_synced)
+
+        conn = self._connect('write')
+        try:
+            with conn:
+                stored = {
+                    row[0]: tuple(row[1:])
+                    for row in conn.execute(
+                        "SELECT page_id, path, version, content_hash, last_synced FROM pages"
+                    )
+                }
+                removed = [(page_id,) for page_id in stored if page_id not in wanted]
+                changed = [
+                    (page_id, *row) for page_id, row in wanted.items()
+                    if stored.get(page_id) != row
+                ]
+
+                conn.executemany("DELETE FROM pages WHERE page_id = ?", removed)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO pages "
+                    "(page_id, path, version, content_hash, last_synced) VALUES (?, ?, ?, ?, ?)",
+                    changed
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ('last_synced', sync_state.last_synced),
+                        ('workspace_commits', json.dumps(sync_state.workspace_commits)),
+                    ]
+                )
+        except sqlite3.OperationalError as e:
+            raise StateFilesystemError(self.db_path, 'write', str(e)) from e
+        except sqlite3.DatabaseError as e:
+            raise StateError(f"Invalid state database: {e}") from e
+        finally:
+            conn.close()
+
+        logger.debug(
+            f"Saved state to {self.db_path}: {len(changed)} page(s) written, "
+            f"{len(removed)} removed, {len(wanted) - len(changed)} unchanged"
+        )
+
+    def update_page(
+        self,
+        page_id: str,
+        path: str,
+        record: Optional[PageRecord] = None,
+    ) -> None:
+        """Insert or replace a single page row.
+
+        Used after a single-file sync, which must not touch the global
+        last_synced timestamp or any other page.
+
+        Args:
+            page_id: Confluence page ID
+            path: Local file path
+            record: Version, content hash and sync time (all unknown if None)
+
+        Raises:
+            StateFilesystemError: If the database cannot be written
+            StateError: If the database is corrupted
+        """
+        record = record or PageRecord()
+        conn = self._connect('write')
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO pages "
+                    "(page_id, path, version, content_hash, last_synced) VALUES (?, ?, ?, ?, ?)",
+                    (page_id, path, record.version, record.content_hash, record.last_synced)
+                )
+        except sqlite3.OperationalError as e:
+            raise StateFilesystemError(self.db_path, 'write', str(e)) from e
+        except sqlite3.DatabaseError as e:
+            raise StateError(f"Invalid state database: {e}") from e
+        finally:
+            conn.close()
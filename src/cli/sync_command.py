@@ -6,11 +6,15 @@ MergeOrchestrator, StateManager, and OutputHandler to provide a complete
 bidirectional sync experience with multiple modes (dry run, force push/pull).
 """
 
+import hashlib
+import json
 import logging
 import os
+import threading
+from dataclasses import replace
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from src.cli.ancestor_resolver import AncestorResolver
 from src.cli.baseline_manager import BaselineManager
@@ -19,9 +23,10 @@ from src.cli.config import StateManager
 from src.cli.conflict_resolver import ConflictResolver
 from src.cli.deletion_handler import DeletionHandler
 from src.cli.errors import CLIError, ConfigNotFoundError
-from src.cli.models import ExitCode, SyncSummary
+from src.cli.models import ExitCode, PageRecord, SyncSummary
 from src.cli.move_handler import MoveHandler
 from src.cli.output import OutputHandler
+from src.cli.sync_journal import JOURNAL_FILE, SyncJournal
 from src.confluence_client.api_wrapper import APIWrapper
 from src.confluence_client.auth import Authenticator
 from src.confluence_client.errors import (
@@ -32,8 +37,12 @@ from src.confluence_client.errors import (
 from src.file_mapper.config_loader import ConfigLoader
 from src.file_mapper.errors import ConfigError
 from src.file_mapper.file_mapper import FileMapper
+from src.file_mapper.models import PageAction, PlannedAction, SyncPlan
+from src.file_mapper.workspace_index import WorkspaceIndex
+from src.git_integration.errors import GitRepositoryError
 from src.git_integration.merge_orchestrator import MergeOrchestrator
-from src.git_integration.models import MergeStrategy
+from src.git_integration.models import CacheStats, MergeStrategy
+from src.git_integration.workspace_git import WorkspaceGit
 from src.page_operations.page_operations import PageOperations
 
 logger = logging.getLogger(__name__)
@@ -71,7 +80,7 @@ class SyncCommand:
     def __init__(
         self,
         config_path: str = ".confluence-sync/config.yaml",
-        state_path: str = ".confluence-sync/state.yaml",
+        state_path: str = ".confluence-sync/state.db",
         file_mapper: Optional[FileMapper] = None,
         change_detector: Optional[ChangeDetector] = None,
         merge_orchestrator: Optional[MergeOrchestrator] = None,
@@ -88,7 +97,8 @@ class SyncCommand:
 
         Args:
             config_path: Path to configuration YAML file
-            state_path: Path to state YAML file
+            state_path: Path to the state file (.db for the SQLite state store,
+                anything else for YAML)
             file_mapper: FileMapper for page discovery (optional)
             change_detector: ChangeDetector for change detection (optional)
             merge_orchestrator: MergeOrchestrator for conflict resolution (optional)
@@ -121,6 +131,36 @@ class SyncCommand:
         self.baseline_manager = baseline_manager
         self.conflict_resolver = conflict_resolver
 
+        # Shared single-pass index of local markdown files (rebuilt per run)
+        self.workspace_index = WorkspaceIndex()
+
+        # Write-ahead journal of applied actions (kept next to the state file)
+        self.journal = SyncJournal(os.path.join(os.path.dirname(state_path), JOURNAL_FILE))
+        # Serializes baseline commits from concurrently running plan batches
+        self._baseline_lock = threading.Lock()
+        # Remote pages found by the deletion phase; their titles and versions
+        # let the move phase update parents without fetching each page
+        self._remote_pages: Dict[str, dict] = {}
+        # Confluence versions of the pages pushed or pulled by the current run
+        self._synced_versions: Dict[str, int] = {}
+
+        # Lazily created API wrapper (one HTTP session reused across runs)
+        self._api_wrapper: Optional[APIWrapper] = None
+        self._markdown_converter = None
+
+    def get_api_wrapper(self) -> APIWrapper:
+        """Get the shared APIWrapper, creating it on first use.
+
+        Reusing one wrapper keeps its HTTP session (and connection pool) warm
+        across handlers and across repeated runs, e.g. in watch mode.
+
+        Returns:
+            APIWrapper bound to self.authenticator
+        """
+        if self._api_wrapper is None:
+            self._api_wrapper = APIWrapper(self.authenticator)
+        return self._api_wrapper
+
     def run(
         self,
         dry_run: bool = False,
@@ -129,6 +169,7 @@ class SyncCommand:
         single_file: Optional[str] = None,
         update_timestamp: bool = True,
         cli_exclude_page_ids: Optional[List[str]] = None,
+        resume: bool = False,
     ) -> ExitCode:
         """Execute sync operation with specified mode.
 
@@ -142,6 +183,8 @@ class SyncCommand:
             single_file: Optional path to single file to sync (all others ignored)
             update_timestamp: If True, update state.last_synced timestamp after successful sync
             cli_exclude_page_ids: Optional list of page IDs to exclude (from command line)
+            resume: If True, skip the work an interrupted bidirectional sync
+                already applied (from the sync journal)
 
         Returns:
             ExitCode indicating success or specific failure type
@@ -175,6 +218,10 @@ class SyncCommand:
             config = ConfigLoader.load(self.config_path)
             logger.info(f"Loaded config with {len(config.spaces)} space(s)")
 
+            # All phases of this run share one scan of the local workspace
+            self.workspace_index.clear()
+            config.workspace = self.workspace_index
+
             # Note: CLI exclusions are now processed and persisted to config.yaml
             # in main.py before sync runs, so cli_exclude_page_ids is no longer used here.
             # The parameter is kept for backward compatibility with tests.
@@ -199,14 +246,12 @@ class SyncCommand:
 
             if not self.deletion_handler:
                 # Initialize PageOperations with APIWrapper for deletion handler
-                api_wrapper = APIWrapper(self.authenticator)
-                page_operations = PageOperations(api_wrapper)
+                page_operations = PageOperations(self.get_api_wrapper())
                 self.deletion_handler = DeletionHandler(page_operations, self.file_mapper)
 
             if not self.move_handler:
                 # Initialize PageOperations with APIWrapper for move handler
-                api_wrapper = APIWrapper(self.authenticator)
-                page_operations = PageOperations(api_wrapper)
+                page_operations = PageOperations(self.get_api_wrapper())
                 self.move_handler = MoveHandler(page_operations)
 
             if not self.ancestor_resolver:
@@ -229,7 +274,9 @@ class SyncCommand:
             elif force_pull:
                 return self._run_force_pull(config, state, single_file)
             else:
-                return self._run_bidirectional_sync(config, state, single_file, update_timestamp)
+                return self._run_bidirectional_sync(
+                    config, state, single_file, update_timestamp, resume=resume
+                )
 
         except InvalidCredentialsError as e:
             logger.error(f"Authentication failed: {e}")
@@ -266,16 +313,23 @@ class SyncCommand:
         state,
         single_file: Optional[str] = None,
         update_timestamp: bool = True,
+        resume: bool = False,
     ) -> ExitCode:
         """Execute bidirectional sync with conflict resolution.
 
         This method performs timestamp-based change detection and syncs changes
         in both directions, using MergeOrchestrator for conflict resolution.
 
+        Completed phases and every applied push or pull are recorded in the
+        sync journal, and each page's baseline is committed as soon as the
+        page is synced, so an interrupted run loses no finished work.
+
         Args:
             config: SyncConfig with spaces to sync
             state: SyncState with last_synced timestamp
             single_file: Optional path to single file to sync
+            update_timestamp: If True, update state.last_synced after the sync
+            resume: If True, skip phases and pages the interrupted run recorded
 
         Returns:
             ExitCode.SUCCESS on success, ExitCode.CONFLICTS if unresolved conflicts
@@ -288,90 +342,31 @@ class SyncCommand:
             config.force_push = False
             config.force_pull = False
 
-            # Phase 1: Deletion Detection and Execution
-            logger.info("Phase 1: Detecting deletions")
-            self.output_handler.info("Detecting deletions...")
-
-            # Get current local and remote page state for deletion detection
-            current_local_pages = self._discover_tracked_pages(config)
-            current_remote_pages = self._get_remote_pages(config)
-
-            # Detect deletions by comparing tracked_pages with current state
-            deletion_result = self.change_detector.detect_deletions(
-                tracked_pages=state.tracked_pages if hasattr(state, 'tracked_pages') else {},
-                local_pages=current_local_pages,
-                remote_pages=current_remote_pages
-            )
-
-            # Execute deletions if any detected
-            if deletion_result.deleted_in_confluence or deletion_result.deleted_locally:
-                logger.info(f"Found {len(deletion_result.deleted_in_confluence)} Confluence deletions, "
-                           f"{len(deletion_result.deleted_locally)} local deletions")
-
-                # Delete local files for Confluence deletions
-                if deletion_result.deleted_in_confluence:
-                    self.output_handler.info(f"Deleting {len(deletion_result.deleted_in_confluence)} local files...")
-                    self.deletion_handler.delete_local_files(
-                        deletion_result.deleted_in_confluence,
-                        dryrun=False
-                    )
-
-                # Delete Confluence pages for local deletions
-                if deletion_result.deleted_locally:
-                    self.output_handler.info(f"Deleting {len(deletion_result.deleted_locally)} Confluence pages...")
-                    self.deletion_handler.delete_confluence_pages(
-                        deletion_result.deleted_locally,
-                        dryrun=False
-                    )
+            # Journal applied work (single-file syncs are not journaled)
+            completed_phases: Set[str] = set()
+            self._synced_versions = {}
+            if not single_file:
+                completed_phases, config.completed_pages = self._start_journal(resume)
+                config.on_page_synced = self._on_page_synced
+                for page_action in (config.completed_pages or {}).values():
+                    self._record_synced_version(page_action)
 
-                # Print deletion summary
-                self.output_handler.print_deletion_summary(
-                    local_deleted=len(deletion_result.deleted_in_confluence),
-                    confluence_deleted=len(deletion_result.deleted_locally)
-                )
+            # Phase 1: Deletion Detection and Execution
+            self._remote_pages = {}
+            if 'deletions' in completed_phases:
+                logger.info("Phase 1: Deletions already applied by the interrupted sync - skipping")
             else:
-                logger.info("No deletions detected")
+                self._run_deletion_phase(config, state)
+                if not single_file:
+                    self.journal.record_phase('deletions')
 
             # Phase 2: Move Detection and Execution
-            logger.info("Phase 2: Detecting moves")
-            self.output_handler.info("Detecting moves...")
-
-            # Detect moves by comparing tracked_pages with current state
-            # We need to fetch current pages with ancestors for move detection
-            move_result = self.change_detector.detect_moves(
-                local_pages={},  # Will be populated by FileMapper
-                tracked_pages=state.tracked_pages if hasattr(state, 'tracked_pages') else {},
-                pages_with_ancestors={}  # Will be populated by AncestorResolver
-            )
-
-            # Execute moves if any detected
-            if move_result.moved_in_confluence or move_result.moved_locally:
-                logger.info(f"Found {len(move_result.moved_in_confluence)} Confluence moves, "
-                           f"{len(move_result.moved_locally)} local moves")
-
-                # Move local files for Confluence moves
-                if move_result.moved_in_confluence:
-                    self.output_handler.info(f"Moving {len(move_result.moved_in_confluence)} local files...")
-                    self.move_handler.move_local_files(
-                        move_result.moved_in_confluence,
-                        dryrun=False
-                    )
-
-                # Move Confluence pages for local moves
-                if move_result.moved_locally:
-                    self.output_handler.info(f"Updating {len(move_result.moved_locally)} Confluence page parents...")
-                    self.move_handler.move_confluence_pages(
-                        move_result.moved_locally,
-                        dryrun=False
-                    )
-
-                # Print move summary
-                self.output_handler.print_move_summary(
-                    local_moved=len(move_result.moved_in_confluence),
-                    confluence_moved=len(move_result.moved_locally)
-                )
+            if 'moves' in completed_phases:
+                logger.info("Phase 2: Moves already applied by the interrupted sync - skipping")
             else:
-                logger.info("No moves detected")
+                self._run_move_phase(config, state)
+                if not single_file:
+                    self.journal.record_phase('moves')
 
             # Phase 3: Execute bidirectional sync using FileMapper
             logger.info("Phase 3: Syncing content changes")
@@ -386,6 +381,8 @@ class SyncCommand:
             # Pass last_synced timestamp and baseline callback to FileMapper
             config.last_synced = state.last_synced
             config.get_baseline = self.baseline_manager.get_baseline_content
+            if config.local_change_detection == 'git' and state.last_synced:
+                config.locally_changed_paths = self._detect_git_changes(config, state)
             logger.info(f"Change detection configured: last_synced={state.last_synced}")
 
             # Handle single-file sync
@@ -452,6 +449,10 @@ class SyncCommand:
                     dryrun=False
                 )
 
+                # Merged files (and conflict markers) were written locally
+                for local_path in local_pages_dict.values():
+                    self.workspace_index.invalidate(local_path)
+
                 # Print merge summary
                 self.output_handler.print_merge_summary(
                     merged_count=conflict_resolution_result.auto_merged_count,
@@ -494,12 +495,17 @@ class SyncCommand:
 
             # Update tracked_pages with current state
             state.tracked_pages = self._discover_tracked_pages(config)
+            self._update_page_records(state)
+            if update_timestamp:
+                self._record_workspace_commits(config, state)
             self.state_manager.save(self.state_path, state)
 
             # Phase 5: Update baseline repository
             logger.info("Phase 5: Updating baseline repository")
             self.output_handler.info("Updating baseline repository...")
             self._update_baseline_repository(state.tracked_pages)
+            if not single_file:
+                self.journal.complete()
 
             # Display summary using actual sync result
             pushed = 0
@@ -520,6 +526,7 @@ class SyncCommand:
                 conflict_count=unresolved_conflict_count,  # Only unresolved conflicts
                 unchanged_count=0  # TODO: Track unchanged pages in SyncResult
             )
+            self.output_handler.print_cache_stats(self._cache_stats_of(sync_result))
             logger.info("Bidirectional sync completed successfully")
 
             return ExitCode.SUCCESS
@@ -529,6 +536,205 @@ class SyncCommand:
             self.output_handler.error(f"Sync failed: {e}")
             raise
 
+    @staticmethod
+    def _cache_stats_of(sync_result) -> Optional[CacheStats]:
+        """Get the content cache counters of a FileMapper sync result, if any.
+
+        Args:
+            sync_result: Result returned by FileMapper.sync_spaces (or None)
+
+        Returns:
+            CacheStats of the run, or None if caching was off
+        """
+        cache_stats = getattr(sync_result, 'cache_stats', None)
+        # isinstance check handles Mock objects in tests
+        return cache_stats if isinstance(cache_stats, CacheStats) else None
+
+    def _start_journal(self, resume: bool):
+        """Start the sync journal for a bidirectional run.
+
+        Args:
+            resume: If True, load and continue the interrupted run's journal
+
+        Returns:
+            Tuple of (completed phase names, applied pages by page_id or None)
+        """
+        if resume:
+            phases, pages = self.journal.load()
+            if phases or pages:
+                logger.info(
+                    f"Resuming interrupted sync: phases {sorted(phases)}, {len(pages)} page(s) applied"
+                )
+                self.output_handler.info(
+                    f"Resuming interrupted sync ({len(pages)} page(s) already applied)..."
+                )
+            else:
+                self.output_handler.info("No interrupted sync to resume - running a full sync")
+            self.journal.start(resume=True)
+            return phases, pages or None
+
+        if self.journal.exists():
+            _, pages = self.journal.load()
+            logger.warning(f"Previous sync was interrupted after {len(pages)} page(s)")
+            self.output_handler.warning(
+                f"Previous sync was interrupted after {len(pages)} page(s); "
+                f"run with --resume to skip the work it already applied"
+            )
+        self.journal.start()
+        return set(), None
+
+    def _on_page_synced(self, page_action: PageAction, content: str) -> None:
+        """Journal an applied push or pull and commit the page's baseline.
+
+        Called by FileMapper after each page is synced (SyncConfig.on_page_synced),
+        so the baseline of a page no longer depends on the whole run finishing.
+
+        Args:
+            page_action: The applied action
+            content: File content (with frontmatter) the page now has
+        """
+        self._record_synced_version(page_action)
+        try:
+            self.journal.record_page(page_action)
+        finally:
+            with self._baseline_lock:
+                self.baseline_manager.update_baseline(page_action.page_id, content)
+
+    def _commit_pushed_page(self, page_action: PageAction, content: str) -> None:
+        """Record the version of a page pushed by push_local_edit and commit its baseline.
+
+        Args:
+            page_action: The applied push
+            content: File content (with frontmatter) the page now has
+        """
+        self._record_synced_version(page_action)
+        with self._baseline_lock:
+            self.baseline_manager.update_baseline(page_action.page_id, content)
+
+    def _record_synced_version(self, page_action: PageAction, content: str = "") -> None:
+        """Remember the Confluence version a pushed or pulled page now has.
+
+        Used directly as SyncConfig.on_page_synced by force runs, which are
+        not journaled.
+
+        Args:
+            page_action: The applied action
+            content: File content the page now has (unused)
+        """
+        if page_action.version is not None:
+            with self._baseline_lock:
+                self._synced_versions[page_action.page_id] = page_action.version
+
+    def _run_deletion_phase(self, config, state) -> None:
+        """Phase 1: detect and apply deletions on either side.
+
+        Args:
+            config: SyncConfig with spaces to sync
+            state: SyncState with tracked_pages from the last sync
+        """
+        logger.info("Phase 1: Detecting deletions")
+        self.output_handler.info("Detecting deletions...")
+
+        # Get current local and remote page state for deletion detection
+        current_local_pages = self._discover_tracked_pages(config)
+        current_remote_pages = self._get_remote_pages(config)
+        self._remote_pages = current_remote_pages
+
+        # Detect deletions by comparing tracked_pages with current state
+        deletion_result = self.change_detector.detect_deletions(
+            tracked_pages=state.tracked_pages if hasattr(state, 'tracked_pages') else {},
+            local_pages=current_local_pages,
+            remote_pages=current_remote_pages
+        )
+
+        # Execute deletions if any detected
+        if deletion_result.deleted_in_confluence or deletion_result.deleted_locally:
+            logger.info(f"Found {len(deletion_result.deleted_in_confluence)} Confluence deletions, "
+                       f"{len(deletion_result.deleted_locally)} local deletions")
+
+            # Delete local files for Confluence deletions
+            if deletion_result.deleted_in_confluence:
+                self.output_handler.info(f"Deleting {len(deletion_result.deleted_in_confluence)} local files...")
+                self.deletion_handler.delete_local_files(
+                    deletion_result.deleted_in_confluence,
+                    dryrun=False
+                )
+                for deletion in deletion_result.deleted_in_confluence:
+                    local_file = getattr(deletion, 'local_path', None)
+                    if local_file:
+                        self.workspace_index.invalidate(local_file)
+
+            # Delete Confluence pages for local deletions
+            if deletion_result.deleted_locally:
+                self.output_handler.info(f"Deleting {len(deletion_result.deleted_locally)} Confluence pages...")
+                self.deletion_handler.delete_confluence_pages(
+                    deletion_result.deleted_locally,
+                    dryrun=False,
+                    max_workers=config.concurrency
+                )
+
+            # Print deletion summary
+            self.output_handler.print_deletion_summary(
+                local_deleted=len(deletion_result.deleted_in_confluence),
+                confluence_deleted=len(deletion_result.deleted_locally)
+            )
+        else:
+            logger.info("No deletions detected")
+
+    def _run_move_phase(self, config, state) -> None:
+        """Phase 2: detect and apply moves on either side.
+
+        Args:
+            config: SyncConfig with spaces to sync
+            state: SyncState with tracked_pages from the last sync
+        """
+        logger.info("Phase 2: Detecting moves")
+        self.output_handler.info("Detecting moves...")
+
+        # Detect moves by comparing tracked_pages with current state
+        # We need to fetch current pages with ancestors for move detection
+        move_result = self.change_detector.detect_moves(
+            local_pages={},  # Will be populated by FileMapper
+            tracked_pages=state.tracked_pages if hasattr(state, 'tracked_pages') else {},
+            pages_with_ancestors={}  # Will be populated by AncestorResolver
+        )
+
+        # Execute moves if any detected
+        if move_result.moved_in_confluence or move_result.moved_locally:
+            logger.info(f"Found {len(move_result.moved_in_confluence)} Confluence moves, "
+                       f"{len(move_result.moved_locally)} local moves")
+
+            # Move local files for Confluence moves
+            if move_result.moved_in_confluence:
+                self.output_handler.info(f"Moving {len(move_result.moved_in_confluence)} local files...")
+                self.move_handler.move_local_files(
+                    move_result.moved_in_confluence,
+                    dryrun=False
+                )
+                for move in move_result.moved_in_confluence:
+                    for moved_path in (getattr(move, 'old_path', None),
+                                       getattr(move, 'new_path', None)):
+                        if moved_path:
+                            self.workspace_index.invalidate(moved_path)
+
+            # Move Confluence pages for local moves
+            if move_result.moved_locally:
+                self.output_handler.info(f"Updating {len(move_result.moved_locally)} Confluence page parents...")
+                self.move_handler.move_confluence_pages(
+                    move_result.moved_locally,
+                    dryrun=False,
+                    remote_pages=self._remote_pages,
+                    max_workers=config.concurrency
+                )
+
+            # Print move summary
+            self.output_handler.print_move_summary(
+                local_moved=len(move_result.moved_in_confluence),
+                confluence_moved=len(move_result.moved_locally)
+            )
+        else:
+            logger.info("No moves detected")
+
     def _run_force_push(
         self,
         config,
@@ -563,6 +769,8 @@ class SyncCommand:
             config.force_push = True
             config.force_pull = False
             config.get_baseline = self.baseline_manager.get_baseline_content
+            self._synced_versions = {}
+            config.on_page_synced = self._record_synced_version
 
             # Execute force push using FileMapper
             # FileMapper will detect the force_push flag and push all local
@@ -573,6 +781,8 @@ class SyncCommand:
             state.last_synced = datetime.now(UTC).isoformat()
             # Update tracked_pages with current state
             state.tracked_pages = self._discover_tracked_pages(config)
+            self._update_page_records(state)
+            self._record_workspace_commits(config, state)
             self.state_manager.save(self.state_path, state)
 
             # Update baseline repository
@@ -634,6 +844,8 @@ class SyncCommand:
             config.force_pull = True
             config.force_push = False
             config.get_baseline = self.baseline_manager.get_baseline_content
+            self._synced_versions = {}
+            config.on_page_synced = self._record_synced_version
 
             # Execute force pull using FileMapper
             # FileMapper will detect the force_pull flag and pull all Confluence
@@ -644,6 +856,8 @@ class SyncCommand:
             state.last_synced = datetime.now(UTC).isoformat()
             # Update tracked_pages with current state
             state.tracked_pages = self._discover_tracked_pages(config)
+            self._update_page_records(state)
+            self._record_workspace_commits(config, state)
             self.state_manager.save(self.state_path, state)
 
             # Update baseline repository
@@ -662,6 +876,7 @@ class SyncCommand:
                 count=pulled_count,
                 direction="pull"
             )
+            self.output_handler.print_cache_stats(self._cache_stats_of(sync_result))
             logger.info("Force pull completed successfully")
 
             return ExitCode.SUCCESS
@@ -679,8 +894,8 @@ class SyncCommand:
     ) -> ExitCode:
         """Execute dry run (preview changes without applying).
 
-        This method performs change detection and displays what would be
-        synced, but does not apply any changes.
+        Builds the same sync plan a bidirectional run would execute, using
+        the same change detection, and prints it. Nothing is written.
 
         Args:
             config: SyncConfig with spaces to sync
@@ -694,53 +909,24 @@ class SyncCommand:
         self.output_handler.info("Dry run mode - previewing changes...")
 
         try:
-            # Discover current local and remote pages
-            current_local_pages = self._discover_tracked_pages(config)
-            current_remote_pages = self._get_remote_pages(config)
-
-            logger.info(f"Found {len(current_local_pages)} local pages, {len(current_remote_pages)} remote pages")
-
-            # Determine what would be synced
-            to_push = []
-            to_pull = []
-            conflicts = []
-
-            local_page_ids = set(current_local_pages.keys())
-            remote_page_ids = set(current_remote_pages.keys())
-
-            # Pages only in remote = would be pulled
-            for page_id in remote_page_ids - local_page_ids:
-                page_info = current_remote_pages.get(page_id, {})
-                relative_path = page_info.get("relative_path", f"page_id:{page_id}")
-                to_pull.append(relative_path)
-
-            # Pages only in local (with page_id) = already synced, check for changes
-            # Pages in both = check for changes using timestamps
-            for page_id in local_page_ids & remote_page_ids:
-                local_path = current_local_pages[page_id]
-                # For dry run, we can't easily determine if content changed
-                # without reading and comparing. Mark as potential sync.
-                # In a full implementation, this would use change_detector
-                pass
-
-            # New local pages (files without page_id) would be pushed
-            # This requires scanning for files without page_id in frontmatter
-            for space_config in config.spaces:
-                new_pages = self._find_new_local_pages(space_config.local_path)
-                for file_path in new_pages:
-                    to_push.append(file_path)
+            # Same change detection as a real run (baselines are only read)
+            config.last_synced = state.last_synced
+            if self.baseline_manager.is_initialized():
+                config.get_baseline = self.baseline_manager.get_baseline_content
+            if config.local_change_detection == 'git' and state.last_synced:
+                config.locally_changed_paths = self._detect_git_changes(config, state)
+
+            plan = self._build_sync_plan(config, state)
+            logger.debug(f"Sync plan: {json.dumps(plan.to_dict())}")
 
             # Display dry run preview
-            self.output_handler.print_dryrun_summary(
-                to_push=to_push,
-                to_pull=to_pull,
-                conflicts=conflicts,
-            )
+            self.output_handler.print_sync_plan(plan)
 
-            logger.info(f"Dry run complete: {len(to_push)} to push, {len(to_pull)} to pull, {len(conflicts)} conflicts")
+            conflicts = plan.of_kind('merge')
+            logger.info(f"Dry run complete: {plan.counts() or 'no changes'}")
 
             # Return CONFLICTS exit code if conflicts detected
-            if len(conflicts) > 0:
+            if conflicts:
                 return ExitCode.CONFLICTS
 
             return ExitCode.SUCCESS
@@ -750,46 +936,66 @@ class SyncCommand:
             self.output_handler.error(f"Dry run failed: {e}")
             raise
 
-    def _find_new_local_pages(self, local_path: str) -> list:
-        """Find local markdown files that don't have a page_id (new pages).
+    def _build_sync_plan(self, config, state) -> SyncPlan:
+        """Plan a bidirectional sync without applying anything.
+
+        Combines the deletions and moves detected against tracked_pages with
+        the content actions planned by FileMapper.plan_sync. Content actions
+        for pages that are about to be deleted are dropped, as a real run
+        deletes them before syncing content.
 
         Args:
-            local_path: Path to local directory to scan
+            config: SyncConfig with spaces to sync (change detection configured)
+            state: SyncState with tracked_pages from the last sync
 
         Returns:
-            List of file paths for new pages (no page_id in frontmatter)
+            SyncPlan of the whole run
         """
-        import os
-        from src.file_mapper.frontmatter_handler import FrontmatterHandler
-
-        new_pages = []
-        frontmatter_handler = FrontmatterHandler()
-
-        if not os.path.exists(local_path):
-            return new_pages
+        plan = SyncPlan()
+        tracked_pages = state.tracked_pages if hasattr(state, 'tracked_pages') else {}
 
-        for root, dirs, files in os.walk(local_path):
-            for filename in files:
-                if not filename.endswith('.md'):
-                    continue
-
-                file_path = os.path.join(root, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Use get_page_id which handles both confluence_url and page_id formats
-                    page_id = FrontmatterHandler.get_page_id(content)
-
-                    if not page_id:
-                        # No page_id = new page that would be created
-                        new_pages.append(file_path)
-
-                except Exception as e:
-                    logger.warning(f"Failed to read {file_path}: {e}")
-                    continue
+        deletion_result = self.change_detector.detect_deletions(
+            tracked_pages=tracked_pages,
+            local_pages=self._discover_tracked_pages(config),
+            remote_pages=self._get_remote_pages(config)
+        )
+        for side, deletions in (('local', deletion_result.deleted_in_confluence),
+                                ('confluence', deletion_result.deleted_locally)):
+            for deletion in deletions:
+                local_path = deletion.local_path or tracked_pages.get(deletion.page_id)
+                plan.add(PlannedAction(
+                    action_id=f"delete:{side}:{deletion.page_id}", kind='delete',
+                    page_id=deletion.page_id, path=str(local_path) if local_path else None,
+                    title=deletion.title, detail=side
+                ))
+
+        move_result = self.change_detector.detect_moves(
+            local_pages={},
+            tracked_pages=tracked_pages,
+            pages_with_ancestors={}
+        )
+        for side, moves in (('local', move_result.moved_in_confluence),
+                            ('confluence', move_result.moved_locally)):
+            for move in moves:
+                plan.add(PlannedAction(
+                    action_id=f"move:{side}:{move.page_id}", kind='move',
+                    page_id=move.page_id, path=str(move.old_path),
+                    title=move.title, detail=str(move.new_path)
+                ))
+
+        deleted_ids = {action.page_id for action in plan.of_kind('delete')}
+        content_plan = self.file_mapper.plan_sync(config)
+        dropped = {
+            action.action_id for action in content_plan.actions
+            if action.page_id and action.page_id in deleted_ids
+        }
+        for action in content_plan.actions:
+            if action.action_id in dropped:
+                continue
+            action.depends_on = [d for d in action.depends_on if d not in dropped]
+            plan.add(action)
 
-        return new_pages
+        return plan
 
     def _discover_tracked_pages(self, config) -> dict:
         """Discover all pages currently synced to build tracked_pages mapping.
@@ -808,12 +1014,7 @@ class SyncCommand:
             >>> tracked = self._discover_tracked_pages(config)
             >>> # {"123456": "docs/my-page.md", "789012": "docs/other-page.md"}
         """
-        from pathlib import Path
-        import os
-        from src.file_mapper.frontmatter_handler import FrontmatterHandler
-
         tracked_pages = {}
-        frontmatter_handler = FrontmatterHandler()
 
         logger.info(f"Discovering tracked pages across {len(config.spaces)} space(s)")
 
@@ -824,40 +1025,141 @@ class SyncCommand:
                 logger.warning(f"Local path does not exist: {local_path}")
                 continue
 
-            # Recursively find all .md files
-            for root, dirs, files in os.walk(local_path):
-                for filename in files:
-                    if not filename.endswith('.md'):
-                        continue
+            # All .md files from the shared workspace index (one scan per run;
+            # paths written by the sync are invalidated and re-read). Frontmatter
+            # is read concurrently; results come back in scan order.
+            paths = [entry.path for entry in self.workspace_index.files(local_path)]
+            for file_path, page_id, error in self.workspace_index.get_page_ids(paths):
+                if error is not None:
+                    logger.warning(f"Failed to read {file_path}: {error}")
+                    continue
 
-                    file_path = os.path.join(root, filename)
+                if page_id:
+                    # Store relative path from current directory
+                    tracked_pages[str(page_id)] = file_path
+                    logger.debug(f"Tracked page {page_id}: {file_path}")
 
-                    try:
-                        # Read frontmatter to get page_id
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
+        logger.info(f"Discovered {len(tracked_pages)} tracked pages")
+        return tracked_pages
 
-                        # Use get_page_id which handles both confluence_url and page_id formats
-                        page_id = FrontmatterHandler.get_page_id(content)
+    def _detect_git_changes(self, config, state) -> Optional[Set[str]]:
+        """Ask git which local files changed since the last sync.
 
-                        if page_id:
-                            # Store relative path from current directory
-                            tracked_pages[str(page_id)] = file_path
-                            logger.debug(f"Tracked page {page_id}: {file_path}")
+        Used when local_change_detection is "git": only the returned files
+        are considered for the baseline comparison and the mtime check is
+        skipped. Falls back to mtime detection (returns None) when a space is
+        not inside a git repository or no usable snapshot commit exists.
 
-                    except Exception as e:
-                        logger.warning(f"Failed to read {file_path}: {e}")
-                        continue
+        Args:
+            config: SyncConfig with spaces to check
+            state: SyncState with workspace_commits from the last sync
 
-        logger.info(f"Discovered {len(tracked_pages)} tracked pages")
-        return tracked_pages
+        Returns:
+            Set of changed file paths (realpath), or None to use mtime detection
+        """
+        changed: Set[str] = set()
+        for space_config in config.spaces:
+            local_path = space_config.local_path
+            if not os.path.isdir(local_path):
+                continue
+
+            repo = WorkspaceGit.discover(local_path)
+            if repo is None:
+                logger.warning(
+                    f"{local_path} is not in a git repository - using mtime change detection"
+                )
+                return None
+
+            since = state.workspace_commits.get(repo.root)
+            if not since:
+                logger.info(f"No git snapshot recorded for {repo.root} - using mtime change detection")
+                return None
+
+            try:
+                changed |= repo.changed_files(since, local_path)
+            except GitRepositoryError as e:
+                logger.warning(f"Git change detection failed: {e} - using mtime change detection")
+                return None
+
+        logger.info(f"Git change detection: {len(changed)} candidate file(s)")
+        return changed
+
+    def _record_workspace_commits(self, config, state) -> None:
+        """Snapshot the git work tree(s) of all spaces into state.
+
+        No-op unless local_change_detection is "git". Snapshot failures are
+        logged; the next sync then falls back to mtime detection.
+
+        Args:
+            config: SyncConfig with spaces
+            state: SyncState to update (workspace_commits)
+        """
+        if config.local_change_detection != 'git':
+            return
+
+        commits: Dict[str, str] = {}
+        for space_config in config.spaces:
+            if not os.path.isdir(space_config.local_path):
+                continue
+            repo = WorkspaceGit.discover(space_config.local_path)
+            if repo is None or repo.root in commits:
+                continue
+            try:
+                commits[repo.root] = repo.snapshot()
+            except GitRepositoryError as e:
+                logger.warning(f"Could not record git snapshot of {repo.root}: {e}")
+
+        state.workspace_commits = commits
+
+    def _update_page_records(self, state) -> None:
+        """Refresh per-page records (version, content hash, sync time) in state.
+
+        Only the SQLite state store persists page records, so nothing is
+        hashed for YAML state files. Records of pages whose content hash and
+        version are unchanged are kept as they are, so the store rewrites
+        only the rows of pages that actually changed. The version comes from
+        the pushes and pulls of this run; a changed page this run did not
+        report a version for gets None rather than a stale number.
+
+        Args:
+            state: SyncState with up-to-date tracked_pages
+        """
+        if not StateManager.is_store_path(self.state_path):
+            return
+
+        records = {}
+        for page_id, file_path in state.tracked_pages.items():
+            record = state.page_records.get(page_id)
+            try:
+                content_hash = self.workspace_index.content_hash(file_path)
+            except OSError as e:
+                logger.warning(f"Failed to hash {file_path}: {e}")
+                if record is not None:
+                    records[page_id] = record
+                continue
+
+            version = self._synced_versions.get(str(page_id))
+            if (
+                record is None
+                or record.content_hash != content_hash
+                or (version is not None and version != record.version)
+            ):
+                record = PageRecord(
+                    version=version,
+                    content_hash=content_hash,
+                    last_synced=state.last_synced,
+                )
+            records[page_id] = record
+
+        state.page_records = records
 
     def _get_remote_pages(self, config: "SyncConfig") -> dict:
         """Get all current pages from Confluence with their metadata.
 
         This method queries Confluence API for all pages in the configured spaces
         and returns a mapping of page_id to page info dict. Used for
-        deletion detection and dry run display.
+        deletion detection and dry run display. Only page metadata is listed;
+        page bodies are never downloaded.
 
         Args:
             config: Sync configuration with space settings
@@ -867,9 +1169,11 @@ class SyncCommand:
             - last_modified: ISO 8601 timestamp
             - title: Page title
             - relative_path: Relative file path (e.g., "./docs/products/prd.md")
+            - version: Current Confluence version number
 
         Example:
-            {"123456": {"last_modified": "2024-01-15T10:30:00Z", "title": "Page", "relative_path": "./docs/page.md"}}
+            {"123456": {"last_modified": "2024-01-15T10:30:00Z", "title": "Page",
+                        "relative_path": "./docs/page.md", "version": 7}}
         """
         remote_pages = {}
 
@@ -892,7 +1196,8 @@ class SyncCommand:
                         parent_page_id=space_config.parent_page_id,
                         space_key=space_config.space_key,
                         page_limit=config.page_limit,
-                        exclude_page_ids=space_config.exclude_page_ids
+                        exclude_page_ids=space_config.exclude_page_ids,
+                        metadata_only=True
                     )
 
                     local_path = space_config.local_path
@@ -922,6 +1227,7 @@ class SyncCommand:
                                 "last_modified": node.last_modified,
                                 "title": node.title,
                                 "relative_path": relative_path,
+                                "version": node.version,
                             }
 
                         # For children, determine directory path
@@ -1072,8 +1378,7 @@ class SyncCommand:
                     error_count += 1
                     continue
 
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self.workspace_index.read_text(file_path)
 
                 # Update baseline for this page
                 self.baseline_manager.update_baseline(page_id, content)
@@ -1089,7 +1394,112 @@ class SyncCommand:
             f"Baseline update complete: {success_count} succeeded, {error_count} failed"
         )
 
-    def _sync_single_file(self, file_path: str, config, state) -> None:
+    def push_local_edit(self, file_path: str, config, state) -> Optional[int]:
+        """Push one edited, already synced file to Confluence (watch mode).
+
+        The page is only pushed if its Confluence version is still the one
+        recorded at its last sync (state.page_records). Otherwise, or if no
+        version is recorded (e.g. with a YAML state file), nothing is pushed
+        and None is returned, so the caller can run a full sync, which
+        detects conflicts and merges. The push goes through FileMapper's
+        surgical update path against the page's baseline; the baseline and
+        the page's state record are updated afterwards.
+
+        Args:
+            file_path: Path of the edited file
+            config: SyncConfig with the spaces to sync
+            state: SyncState loaded from the state store
+
+        Returns:
+            Confluence version of the page after the push, or None if the
+            page may have changed in Confluence since its last sync
+
+        Raises:
+            CLIError: If the file cannot be read, has no page_id, is outside
+                every configured space, or the push fails
+        """
+        from src.file_mapper.frontmatter_handler import FrontmatterHandler
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            local_page = FrontmatterHandler.parse(file_path, content)
+        except Exception as e:
+            raise CLIError(f"Failed to read {file_path}: {e}") from e
+
+        if not local_page.page_id:
+            raise CLIError(f"File has no page_id or confluence_url in frontmatter: {file_path}")
+        page_id = str(local_page.page_id)
+
+        real_path = os.path.realpath(file_path)
+        space_config = next(
+            (
+                space for space in config.spaces
+                if real_path.startswith(os.path.realpath(space.local_path) + os.sep)
+            ),
+            None
+        )
+        if space_config is None:
+            raise CLIError(f"File is not inside a configured space: {file_path}")
+
+        record = state.page_records.get(page_id)
+        synced_version = record.version if record is not None else None
+        try:
+            remote_page = self.get_api_wrapper().get_page_by_id(page_id=page_id, expand="version")
+            remote_version = int(remote_page['version']['number'])
+        except Exception as e:
+            raise CLIError(f"Failed to fetch page {page_id}: {e}") from e
+
+        if synced_version is None or remote_version != synced_version:
+            logger.info(
+                f"Page {page_id} is at version {remote_version} in Confluence "
+                f"(last synced: {synced_version}) - not pushing {file_path}"
+            )
+            return None
+
+        if not self.authenticator:
+            self.authenticator = Authenticator()
+        if not self.file_mapper:
+            self.file_mapper = FileMapper(self.authenticator)
+        if not self.baseline_manager.is_initialized():
+            self.baseline_manager.initialize()
+
+        push_config = replace(
+            config,
+            # The workspace index of the last full sync is stale for edited files
+            workspace=None,
+            get_baseline=self.baseline_manager.get_baseline_content,
+            on_page_synced=self._commit_pushed_page,
+            completed_pages=None,
+        )
+        with self._baseline_lock:
+            self._synced_versions.pop(page_id, None)
+        try:
+            self.file_mapper.push_modified_pages({file_path: local_page}, space_config, push_config)
+        except Exception as e:
+            logger.error(f"Failed to sync page {page_id}: {e}")
+            raise CLIError(f"Failed to sync {file_path}: {e}") from e
+
+        # Unchanged pages (baseline match) are not pushed and keep their version
+        version = self._synced_versions.get(page_id, remote_version)
+        try:
+            self.state_manager.record_page(
+                self.state_path,
+                page_id,
+                file_path,
+                PageRecord(
+                    version=version,
+                    content_hash=hashlib.sha256(Path(file_path).read_bytes()).hexdigest(),
+                    last_synced=datetime.now(UTC).isoformat(),
+                ),
+            )
+        except (CLIError, OSError) as e:
+            logger.warning(f"Could not record state of page {page_id}: {e}")
+
+        self.output_handler.success(f"✓ Synced {file_path}")
+        return version
+
+    def _sync_single_file(self, file_path: str, config, state) -> int:
         """Sync a single file without updating global timestamp.
 
         This method syncs only the specified file to/from Confluence and updates
@@ -1101,13 +1511,13 @@ class SyncCommand:
             config: SyncConfig with spaces to sync
             state: SyncState with last_synced timestamp
 
+        Returns:
+            Confluence version number of the page after the update
+
         Raises:
             CLIError: If file doesn't exist or has no page_id
         """
-        from pathlib import Path
         from src.file_mapper.frontmatter_handler import FrontmatterHandler
-        from src.page_operations.page_operations import PageOperations
-        from src.confluence_client.api_wrapper import APIWrapper
         from src.content_converter.markdown_converter import MarkdownConverter
 
         # Validate file exists
@@ -1120,7 +1530,6 @@ class SyncCommand:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        frontmatter_handler = FrontmatterHandler()
         # Use get_page_id which handles both confluence_url and page_id formats
         page_id = FrontmatterHandler.get_page_id(content)
 
@@ -1133,9 +1542,8 @@ class SyncCommand:
 
         logger.info(f"Syncing page {page_id} from {file_path}")
 
-        # Initialize API wrapper and page operations
-        api_wrapper = APIWrapper(self.authenticator)
-        page_operations = PageOperations(api_wrapper)
+        # Reuse the shared API wrapper (keeps the HTTP session warm)
+        api_wrapper = self.get_api_wrapper()
 
         # Fetch current page from Confluence
         try:
@@ -1153,9 +1561,11 @@ class SyncCommand:
             # (Full change detection would be complex for single file)
             logger.info(f"Pushing local content to Confluence for page {page_id}")
 
-            # Convert markdown to Confluence XHTML storage format
-            converter = MarkdownConverter()
-            xhtml_content = converter.markdown_to_xhtml(page_content)
+            # Convert markdown (without frontmatter) to Confluence XHTML storage format
+            page_content = FrontmatterHandler.parse(file_path, content).content
+            if self._markdown_converter is None:
+                self._markdown_converter = MarkdownConverter()
+            xhtml_content = self._markdown_converter.markdown_to_xhtml(page_content)
             logger.debug(f"Converted markdown to XHTML ({len(xhtml_content)} chars)")
 
             # Update page on Confluence using APIWrapper.update_page
@@ -1176,7 +1586,24 @@ class SyncCommand:
             self.baseline_manager.update_baseline(page_id, content)
             logger.info(f"Baseline updated for page {page_id}")
 
+            # Record the new version of this page only (global state untouched)
+            try:
+                self.state_manager.record_page(
+                    self.state_path,
+                    str(page_id),
+                    file_path,
+                    PageRecord(
+                        version=remote_version + 1,
+                        content_hash=hashlib.sha256(Path(file_path).read_bytes()).hexdigest(),
+                        last_synced=datetime.now(UTC).isoformat(),
+                    ),
+                )
+            except (CLIError, OSError) as e:
+                logger.warning(f"Could not record state of page {page_id}: {e}")
+
+            self._synced_versions[str(page_id)] = remote_version + 1
             self.output_handler.success(f"✓ Synced {file_path}")
+            return remote_version + 1
 
         except Exception as e:
             logger.error(f"Failed to sync page {page_id}: {e}")
@@ -0,0 +1,207 @@
+"""Write-ahead journal of applied sync actions.
+
+A bidirectional sync applies deletions, moves and then one push or pull per
+page. If the run dies part-way (network failure, Ctrl-C, rate limiting), the
+work already done is invisible to the next run. SyncJournal appends one JSON
+line per completed phase and per applied page to
+.confluence-sync/journal.jsonl, flushing and fsyncing each line, and deletes
+the file when the sync finishes. A journal left behind therefore describes
+an interrupted run, and `confluence-sync --resume` uses it to skip the work
+that run already applied.
+
+Journal lines:
+    {"type": "start", "at": "2024-01-15T10:30:00+00:00"}
+    {"type": "phase", "phase": "deletions"}
+    {"type": "page", "page_id": "123", "action": "push", "path": "docs/a.md",
+     "content_hash": "9f86d0...", "version": 8}
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, UTC
+from typing import Dict, Optional, Set, Tuple
+
+from src.file_mapper.models import PageAction
+
+from .errors import StateFilesystemError
+
+logger = logging.getLogger(__name__)
+
+# File name of the journal inside the state directory
+JOURNAL_FILE = 'journal.jsonl'
+
+
+class SyncJournal:
+    """Append-only record of the sync actions applied by the current run.
+
+    Thread-safe: pages may be recorded from worker threads.
+
+    Example:
+        >>> journal = SyncJournal(".confluence-sync/journal.jsonl")
+        >>> journal.start()
+        >>> journal.record_phase("deletions")
+        >>> journal.record_page(page_action)
+        >>> journal.complete()  # sync finished, journal removed
+    """
+
+    def __init__(self, journal_path: str):
+        """Initialize the journal.
+
+        Args:
+            journal_path: Path to the journal file
+        """
+        self.journal_path = journal_path
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Check whether a journal from an unfinished run exists.
+
+        Returns:
+            True if the journal file exists
+        """
+        return os.path.exists(self.journal_path)
+
+    def load(self) -> Tuple[Set[str], Dict[str, PageAction]]:
+        """Read the actions recorded by an interrupted run.
+
+        A torn last line (the process died mid-write) is ignored.
+
+        Returns:
+            Tuple of (completed phase names, applied pages by page_id; the
+            latest entry wins if a page was recorded more than once)
+
+        Raises:
+            StateFilesystemError: If the journal exists but cannot be read
+        """
+        phases: Set[str] = set()
+        pages: Dict[str, PageAction] = {}
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return phases, pages
+        except OSError as e:
+            raise StateFilesystemError(self.journal_path, 'read', str(e))
+
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                if entry['type'] == 'phase':
+                    phases.add(entry['phase'])
+                elif entry['type'] == 'page':
+                    pages[str(entry['page_id'])] = PageAction(
+                        page_id=str(entry['page_id']),
+                        file_path=entry['path'],
+                        action=entry['action'],
+                        content_hash=entry['content_hash'],
+                        version=entry.get('version'),
+                    )
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(
+                    f"Ignoring unreadable journal line {line_number} in {self.journal_path}: {e}"
+                )
+
+        return phases, pages
+
+    def start(self, resume: bool = False) -> None:
+        """Begin journaling a sync run.
+
+        Args:
+            resume: If True, keep the entries of the interrupted run and append
+                    to them; otherwise start an empty journal
+
+        Raises:
+            StateFilesystemError: If the journal cannot be written
+        """
+        if not resume:
+            self.discard()
+        elif self._ends_with_torn_line():
+            # Keep the next entry off the partially written line
+            self._append(None)
+        self._append({'type': 'start', 'at': datetime.now(UTC).isoformat()})
+
+    def record_phase(self, phase: str) -> None:
+        """Record that a sync phase finished.
+
+        Args:
+            phase: Phase name (e.g. "deletions", "moves")
+
+        Raises:
+            StateFilesystemError: If the journal cannot be written
+        """
+        self._append({'type': 'phase', 'phase': phase})
+
+    def record_page(self, page_action: PageAction) -> None:
+        """Record an applied page push or pull.
+
+        Args:
+            page_action: The applied action
+
+        Raises:
+            StateFilesystemError: If the journal cannot be written
+        """
+        self._append({
+            'type': 'page',
+            'page_id': page_action.page_id,
+            'action': page_action.action,
+            'path': page_action.file_path,
+            'content_hash': page_action.content_hash,
+            'version': page_action.version,
+        })
+
+    def complete(self) -> None:
+        """Mark the run as finished by removing the journal."""
+        self.discard()
+
+    def discard(self) -> None:
+        """Remove the journal file if it exists."""
+        with self._lock:
+            try:
+                os.remove(self.journal_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove sync journal {self.journal_path}: {e}")
+
+    def _ends_with_torn_line(self) -> bool:
+        """Check whether the journal ends without a trailing newline.
+
+        Returns:
+            True if the last line was only partially written
+        """
+        try:
+            with open(self.journal_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b'\n'
+        except OSError:
+            return False
+
+    def _append(self, entry: Optional[dict]) -> None:
+        """Append one entry and force it to disk.
+
+        Args:
+            entry: JSON-serializable journal entry (None writes only a newline)
+
+        Raises:
+            StateFilesystemError: If the journal cannot be written
+        """
+        line = '\n' if entry is None else json.dumps(entry, separators=(',', ':')) + '\n'
+        with self._lock:
+            try:
+                journal_dir = os.path.dirname(self.journal_path)
+                if journal_dir:
+                    os.makedirs(journal_dir, exist_ok=True)
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                raise StateFilesystemError(self.journal_path, 'write', str(e))
@@ -0,0 +1,428 @@
+"""Watch mode for continuous incremental sync.
+
+This module provides WatchCommand, which keeps one SyncCommand alive and
+syncs changes as they happen instead of re-running a full sync from cron:
+
+- Local changes are collected from filesystem events (watchdog/inotify when
+  the optional `watchdog` package is installed, stat polling otherwise) and
+  debounced into batches. Edited tracked files are pushed one by one through
+  the surgical update path (SyncCommand.push_local_edit) as long as their
+  page has not changed in Confluence since the last sync; new or deleted
+  files and remotely changed pages trigger a full sync, which detects
+  conflicts and merges.
+- The remote side is polled periodically with a `lastmodified` CQL query; a
+  full sync only runs when a page actually changed on Confluence.
+
+Because the same SyncCommand (and its FileMapper, APIWrapper and caches) is
+reused for every batch, HTTP sessions and caches stay warm between batches.
+"""
+
+import logging
+import math
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from src.cli.models import ExitCode
+from src.cli.sync_command import SyncCommand
+from src.file_mapper.config_loader import ConfigLoader
+from src.file_mapper.frontmatter_handler import FrontmatterHandler
+from src.file_mapper.models import SyncConfig
+from src.file_mapper.workspace_index import WorkspaceIndex
+
+# watchdog is optional; without it local changes are detected by stat polling
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    HAS_WATCHDOG = False
+
+logger = logging.getLogger(__name__)
+
+# Quiet period after the last local change before a batch is synced
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+
+# Interval between remote lastmodified CQL polls
+DEFAULT_REMOTE_POLL_SECONDS = 60.0
+
+# Interval between local stat scans when watchdog is not available
+DEFAULT_LOCAL_POLL_SECONDS = 2.0
+
+# Maximum number of results inspected per remote poll
+REMOTE_POLL_LIMIT = 100
+
+# (mtime_ns, size) of a local file
+Signature = Tuple[int, int]
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """watchdog event handler that queues paths of changed markdown files."""
+
+    def __init__(self, changes: "queue.Queue[str]"):
+        super().__init__()
+        self._changes = changes
+
+    def on_any_event(self, event) -> None:
+        if getattr(event, 'is_directory', False):
+            return
+        for path in (getattr(event, 'src_path', None), getattr(event, 'dest_path', None)):
+            if path and os.fsdecode(path).endswith('.md'):
+                self._changes.put(os.path.abspath(os.fsdecode(path)))
+
+
+class WatchCommand:
+    """Runs an initial full sync, then syncs local and remote changes as they occur.
+
+    Example:
+        >>> watch = WatchCommand(SyncCommand(output_handler=output))
+        >>> exit_code = watch.run()  # blocks until stop() or Ctrl-C
+    """
+
+    def __init__(
+        self,
+        sync_command: SyncCommand,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        remote_poll_interval: float = DEFAULT_REMOTE_POLL_SECONDS,
+        local_poll_interval: float = DEFAULT_LOCAL_POLL_SECONDS,
+        use_watchdog: Optional[bool] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize watch command.
+
+        Args:
+            sync_command: SyncCommand reused for every sync (keeps caches warm)
+            debounce_seconds: Quiet period before a batch of local changes is synced
+            remote_poll_interval: Seconds between remote lastmodified polls
+            local_poll_interval: Seconds between stat scans without watchdog
+            use_watchdog: Force (True) or disable (False) filesystem events;
+                default uses watchdog when it is installed
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.sync_command = sync_command
+        self.output_handler = sync_command.output_handler
+        self.debounce_seconds = debounce_seconds
+        self.remote_poll_interval = remote_poll_interval
+        self.local_poll_interval = local_poll_interval
+        self.use_watchdog = HAS_WATCHDOG if use_watchdog is None else use_watchdog
+        self._clock = clock
+
+        self._config: Optional[SyncConfig] = None
+        self._changes: "queue.Queue[str]" = queue.Queue()
+        self._stop = threading.Event()
+        self._observer = None
+
+        # Local file signatures as of the last sync; events for files whose
+        # signature didn't change (e.g. our own writes) are ignored
+        self._signatures: Dict[str, Signature] = {}
+        # Signatures from the latest stat poll (polling mode only)
+        self._last_scan: Dict[str, Signature] = {}
+        # Latest known remote version per page (pushed by us or already synced)
+        self._known_versions: Dict[str, int] = {}
+        # Clock time at which the last successful remote poll of each space started
+        self._last_remote_poll: Dict[str, float] = {}
+
+        self._pending: Set[str] = set()
+        self._last_change = 0.0
+        self._next_local_poll = 0.0
+        self._next_remote_poll = 0.0
+
+    def run(self) -> ExitCode:
+        """Run the initial full sync and then watch until stopped.
+
+        Returns:
+            Exit code of the initial sync if it failed, otherwise SUCCESS
+        """
+        exit_code = self.sync_command.run()
+        if exit_code not in (ExitCode.SUCCESS, ExitCode.CONFLICTS):
+            return exit_code
+
+        self._config = ConfigLoader.load(self.sync_command.config_path)
+        self._signatures = self._snapshot()
+        self._last_scan = self._signatures
+        self._poll_remote(prime=True)
+
+        now = self._clock()
+        self._next_local_poll = now + self.local_poll_interval
+        self._next_remote_poll = now + self.remote_poll_interval
+
+        self._start_observer()
+        mode = "filesystem events" if self._observer else "polling"
+        self.output_handler.info(
+            f"Watching {len(self._config.spaces)} space(s) for changes ({mode}), "
+            f"remote poll every {self.remote_poll_interval:.0f}s - press Ctrl-C to stop"
+        )
+
+        try:
+            while not self._stop.is_set():
+                self._run_cycle()
+        except KeyboardInterrupt:
+            self.output_handler.info("Stopping watch mode")
+        finally:
+            self._stop_observer()
+
+        return ExitCode.SUCCESS
+
+    def stop(self) -> None:
+        """Ask the watch loop to exit after the current cycle."""
+        self._stop.set()
+
+    def _run_cycle(self) -> None:
+        """Wait briefly for local changes, then sync whatever is due."""
+        tick = min(0.5, self.debounce_seconds) if self.debounce_seconds > 0 else 0.1
+        try:
+            self._pending.add(self._changes.get(timeout=tick))
+            self._last_change = self._clock()
+        except queue.Empty:
+            pass
+
+        while True:
+            try:
+                self._pending.add(self._changes.get_nowait())
+                self._last_change = self._clock()
+            except queue.Empty:
+                break
+
+        now = self._clock()
+        if self._observer is None and now >= self._next_local_poll:
+            # Stat polling: anything that changed since the previous scan
+            # counts as an event (and restarts the debounce period)
+            current = self._snapshot()
+            changed = {
+                path for path in set(current) | set(self._last_scan)
+                if current.get(path) != self._last_scan.get(path)
+            }
+            if changed:
+                self._pending.update(changed)
+                self._last_change = now
+            self._last_scan = current
+            self._next_local_poll = now + self.local_poll_interval
+
+        if self._pending and now - self._last_change >= self.debounce_seconds:
+            batch, self._pending = self._pending, set()
+            self._process_batch(batch)
+
+        if now >= self._next_remote_poll:
+            if self._poll_remote():
+                self._run_full_sync("remote changes detected")
+            self._next_remote_poll = self._clock() + self.remote_poll_interval
+
+    def _start_observer(self) -> None:
+        """Start watchdog observers for all space directories, if enabled."""
+        if not self.use_watchdog or Observer is None:
+            return
+
+        if self._config is None:
+            return
+
+        observer = Observer()
+        handler = _ChangeHandler(self._changes)
+        for space in self._config.spaces:
+            if os.path.isdir(space.local_path):
+                observer.schedule(handler, space.local_path, recursive=True)
+        observer.start()
+        self._observer = observer
+
+    def _stop_observer(self) -> None:
+        """Stop the watchdog observer, if running."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _snapshot(self) -> Dict[str, Signature]:
+        """Scan all space directories and record each markdown file's signature.
+
+        Returns:
+            Mapping of absolute path to (mtime_ns, size)
+        """
+        index = WorkspaceIndex()
+        signatures = {}
+        for space in self._config.spaces if self._config else []:
+            for entry in index.files(space.local_path):
+                signatures[os.path.abspath(entry.path)] = (
+                    entry.stat.st_mtime_ns, entry.stat.st_size
+                )
+        return signatures
+
+    def _changed_paths(
+        self,
+        current: Dict[str, Signature],
+        candidates: Optional[Iterable[str]] = None
+    ) -> Set[str]:
+        """Compare signatures against the last sync.
+
+        Args:
+            current: Current signatures (from _snapshot)
+            candidates: Paths to check; all known and current paths if None
+
+        Returns:
+            Paths that were created, modified or deleted since the last sync
+        """
+        if candidates is None:
+            candidates = set(current) | set(self._signatures)
+        return {
+            path for path in candidates
+            if current.get(path) != self._signatures.get(path)
+        }
+
+    def _process_batch(self, paths: Set[str]) -> None:
+        """Sync a debounced batch of changed local files.
+
+        Modified files with a page_id are pushed one by one with
+        SyncCommand.push_local_edit. New files (no page_id) and deleted files
+        need hierarchy and state changes, and pages that changed in
+        Confluence since their last sync need conflict detection, so any of
+        them triggers one full sync for the whole batch.
+
+        Args:
+            paths: Absolute paths reported as changed
+        """
+        current = self._snapshot()
+        changed = self._changed_paths(current, paths)
+        if not changed:
+            logger.debug(f"Ignoring {len(paths)} event(s) without content changes")
+            return
+
+        logger.info(f"Syncing batch of {len(changed)} changed local file(s)")
+        full_sync_reasons: Set[str] = set()
+        state = None
+
+        for path in sorted(changed):
+            if path not in current:
+                logger.info(f"Local file removed: {path}")
+                full_sync_reasons.add("local files added or removed")
+                continue
+
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    page_id = FrontmatterHandler.get_page_id(f.read())
+            except Exception as e:
+                logger.warning(f"Failed to read {path}: {e}")
+                continue
+
+            if not page_id:
+                logger.info(f"New local file: {path}")
+                full_sync_reasons.add("local files added or removed")
+                continue
+
+            if state is None:
+                state = self.sync_command.state_manager.load(self.sync_command.state_path)
+            try:
+                version = self.sync_command.push_local_edit(path, self._config, state)
+            except Exception as e:
+                logger.error(f"Failed to sync {path}: {e}")
+                self.output_handler.error(f"Failed to sync {path}: {e}")
+                continue
+
+            if version is None:
+                full_sync_reasons.add("edited pages changed on Confluence")
+            else:
+                self._known_versions[str(page_id)] = version
+
+        if full_sync_reasons:
+            self._run_full_sync(", ".join(sorted(full_sync_reasons)))
+        else:
+            self._signatures = self._snapshot()
+            self._last_scan = self._signatures
+
+    def _run_full_sync(self, reason: str) -> None:
+        """Run a full bidirectional sync with the shared SyncCommand.
+
+        Args:
+            reason: Why the full sync runs (for output)
+        """
+        self.output_handler.info(f"Running full sync ({reason})")
+        exit_code = self.sync_command.run()
+        if exit_code not in (ExitCode.SUCCESS, ExitCode.CONFLICTS):
+            self.output_handler.warning(f"Sync finished with exit code {int(exit_code)}")
+
+        try:
+            # Pick up exclusions or spaces changed while watching
+            self._config = ConfigLoader.load(self.sync_command.config_path)
+        except Exception as e:
+            logger.warning(f"Keeping previous configuration, reload failed: {e}")
+        self._pending.clear()
+        self._signatures = self._snapshot()
+        self._last_scan = self._signatures
+        # Pages modified during the run are now in sync
+        self._poll_remote(prime=True)
+
+    def _build_remote_cql(self, space) -> str:
+        """Build the lastmodified CQL query for one space.
+
+        The window reaches back to the start of the last successful poll of
+        the space (one poll interval before the first poll), plus a minute of
+        overlap as CQL times have minute granularity. Local batches and full
+        syncs can delay a poll well past the interval, so the window is
+        measured rather than assumed. Already-seen versions are filtered out
+        by _poll_remote.
+
+        Args:
+            space: SpaceConfig
+
+        Returns:
+            CQL query string
+        """
+        last_poll = self._last_remote_poll.get(space.space_key)
+        elapsed = self.remote_poll_interval if last_poll is None else self._clock() - last_poll
+        minutes = math.ceil(elapsed / 60) + 1
+        return (
+            f'type = page AND space = "{space.space_key}" '
+            f'AND (ancestor = {space.parent_page_id} OR id = {space.parent_page_id}) '
+            f'AND lastmodified >= now("-{minutes}m")'
+        )
+
+    def _poll_remote(self, prime: bool = False) -> bool:
+        """Check Confluence for pages modified since the last poll.
+
+        Args:
+            prime: Only record the current versions (after a full sync)
+
+        Returns:
+            True if a page changed that this process hasn't synced yet
+        """
+        if self._config is None:
+            return False
+
+        api = self.sync_command.get_api_wrapper()
+        changed = False
+
+        for space in self._config.spaces:
+            started = self._clock()
+            try:
+                response = api.search_by_cql(
+                    self._build_remote_cql(space),
+                    limit=REMOTE_POLL_LIMIT,
+                    expand="content.version"
+                )
+            except Exception as e:
+                # The next poll's window still reaches back to the last success
+                logger.warning(f"Remote poll failed for space {space.space_key}: {e}")
+                continue
+            self._last_remote_poll[space.space_key] = started
+
+            for result in response.get('results', []):
+                content = result.get('content', result)
+                page_id = str(content.get('id', ''))
+                if not page_id or page_id in space.exclude_page_ids:
+                    continue
+
+                version = content.get('version', {}).get('number')
+                if not isinstance(version, int):
+                    logger.debug(f"Ignoring poll result without a version for page {page_id}")
+                    continue
+                known = self._known_versions.get(page_id)
+                if known is not None and version <= known:
+                    continue
+
+                self._known_versions[page_id] = version
+                if not prime:
+                    logger.info(f"Page {page_id} changed on Confluence (version {version})")
+                    changed = True
+
+        return changed
@@ -748,3 +748,66 @@ class APIWrapper:
                 raise self._translate_error(e, f"update_page_adf({page_id})") from e
 
         return retry_on_rate_limit(_update)
+
+    def move_page(
+        self,
+        page_id: str,
+        title: str,
+        parent_id: Optional[str],
+        version: int,
+    ) -> Dict[str, Any]:
+        """Change a page's parent without fetching or resending its body.
+
+        The update carries only title, version and ancestors, so a caller that
+        already knows the current version (e.g. from the page hierarchy) can
+        move a page in a single request.
+
+        Args:
+            page_id: The Confluence page ID
+            title: The current page title
+            parent_id: New parent page ID (None moves the page to the space root)
+            version: The current version number (for optimistic locking)
+
+        Returns:
+            Dict containing updated page data
+
+        Raises:
+            InvalidCredentialsError: If credentials are invalid
+            PageNotFoundError: If page doesn't exist
+            APIUnreachableError: If API is unreachable
+            APIAccessError: If API access fails (including version conflict)
+        """
+        # Validate input to prevent injection attacks
+        self._validate_page_id(page_id)
+        if parent_id:
+            self._validate_page_id(parent_id)
+
+        def _move():
+            try:
+                client = self._get_client()
+                payload = {
+                    "version": {"number": version + 1},
+                    "title": title,
+                    "type": "page",
+                    "ancestors": [{"id": parent_id}] if parent_id else [],
+                }
+                response = client._session.put(
+                    f"{client.url}/rest/api/content/{page_id}",
+                    json=payload
+                )
+
+                if response.status_code == 409:
+                    raise APIAccessError(
+                        f"Version conflict moving page {page_id} "
+                        f"(version {version} is stale)"
+                    )
+
+                response.raise_for_status()
+                return response.json()
+
+            except APIAccessError:
+                raise
+            except Exception as e:
+                raise self._translate_error(e, f"move_page({page_id})") from e
+
+        return retry_on_rate_limit(_move)
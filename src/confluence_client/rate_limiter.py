@@ -0,0 +1,116 @@
+"""Process-wide rate limiter for Confluence API requests.
+
+Page pushes and pulls can run on several worker threads at once (the
+`concurrency` config option). Every request made through
+retry_on_rate_limit first passes the shared RateLimiter, which:
+
+1. Paces request starts to at most `requests_per_second` (disabled by
+   default), so N workers do not multiply the request rate by N.
+2. Holds every thread back while one of them is backing off from a 429
+   response, instead of letting the other workers keep hitting the limit.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Thread-safe request pacer with a shared 429 cooldown.
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_second=10)
+        >>> limiter.acquire()   # blocks until a request may start
+        >>> until = limiter.pause(2)   # 429 received: hold all threads for 2s
+        >>> limiter.resume(until)      # the retried request went through
+    """
+
+    def __init__(self, requests_per_second: Optional[float] = None):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_second: Maximum request starts per second across all
+                threads (None or 0 disables pacing)
+
+        Raises:
+            ValueError: If requests_per_second is negative
+        """
+        self._lock = threading.Lock()
+        self._interval = 0.0
+        self._next_slot = 0.0
+        self._cooldown_until = 0.0
+        self.configure(requests_per_second)
+
+    def configure(self, requests_per_second: Optional[float]) -> None:
+        """Change the pacing rate.
+
+        Args:
+            requests_per_second: Maximum request starts per second across all
+                threads (None or 0 disables pacing)
+
+        Raises:
+            ValueError: If requests_per_second is negative
+        """
+        if requests_per_second is not None and requests_per_second < 0:
+            raise ValueError(
+                f"requests_per_second must not be negative, got {requests_per_second}"
+            )
+        with self._lock:
+            self._interval = 1.0 / requests_per_second if requests_per_second else 0.0
+            self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Block until the calling thread may start a request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._cooldown_until)
+            if self._interval:
+                start = max(start, self._next_slot)
+                self._next_slot = start + self._interval
+            wait = start - now
+
+        if wait > 0:
+            logger.debug(f"Rate limiter: waiting {wait:.2f}s before next request")
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> float:
+        """Hold back all new requests for a while (after a 429 response).
+
+        Args:
+            seconds: How long no new request may start
+
+        Returns:
+            Deadline of this pause, to pass to resume()
+        """
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._cooldown_until = max(self._cooldown_until, until)
+            return until
+
+    def resume(self, until: float) -> None:
+        """End a cooldown early (the request that hit the limit has finished).
+
+        Only the cooldown set by the matching pause() is cleared; if another
+        thread has since paused for longer, its cooldown stays in effect.
+
+        Args:
+            until: Deadline returned by pause()
+        """
+        with self._lock:
+            if self._cooldown_until == until:
+                self._cooldown_until = 0.0
+
+
+_shared_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the rate limiter shared by all API requests of this process.
+
+    Returns:
+        The process-wide RateLimiter
+    """
+    return _shared_limiter
@@ -2,15 +2,17 @@
 
 This module provides retry functionality specifically for handling 429 rate limit
 responses from the Confluence API. It implements exponential backoff (1s, 2s, 4s)
-and fails fast for non-rate-limit errors.
+and fails fast for non-rate-limit errors. Requests pass the process-wide
+RateLimiter, so concurrent workers share pacing and back off together.
 """
 
 import time
 import logging
-from typing import Callable, TypeVar
+from typing import Callable, Optional, TypeVar
 from functools import wraps
 
 from .errors import APIAccessError
+from .rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,9 @@ def retry_on_rate_limit(func: Callable[..., T], *args, **kwargs) -> T:
     with exponential backoff (1s, 2s, 4s) when a rate limit error is encountered.
     Fails fast for all other errors.
 
+    The first attempt waits for the shared RateLimiter. While a call backs off
+    from a rate limit, the limiter holds back new requests from other threads.
+
     Args:
         func: The function to execute with retry logic
         *args: Positional arguments to pass to the function
@@ -40,20 +45,31 @@ def retry_on_rate_limit(func: Callable[..., T], *args, **kwargs) -> T:
         >>> result = retry_on_rate_limit(api.get_page, page_id="123")
     """
     max_retries = 3
+    limiter = get_rate_limiter()
+    limiter.acquire()
+    cooldown: Optional[float] = None
 
     for retry_num in range(max_retries + 1):  # 0, 1, 2, 3 = 4 attempts total
         try:
-            return func(*args, **kwargs)
+            result = func(*args, **kwargs)
+            if cooldown is not None:
+                # This call held the other threads back; let them continue
+                limiter.resume(cooldown)
+            return result
         except Exception as e:
             # Check if this is a rate limit error (429)
             is_rate_limit = _is_rate_limit_error(e)
 
             if not is_rate_limit:
                 # Not a rate limit error - fail fast
+                if cooldown is not None:
+                    limiter.resume(cooldown)
                 raise
 
             if retry_num >= max_retries:
                 # Exhausted retries - give up
+                if cooldown is not None:
+                    limiter.resume(cooldown)
                 logger.error(
                     f"Rate limit persisted after {max_retries} retries, giving up"
                 )
@@ -65,6 +81,7 @@ def retry_on_rate_limit(func: Callable[..., T], *args, **kwargs) -> T:
                 f"Rate limit hit, retrying in {wait_time}s "
                 f"(retry {retry_num + 1}/{max_retries})"
             )
+            cooldown = limiter.pause(wait_time)
             time.sleep(wait_time)
 
     # Should never reach here, but make type checker happy
@@ -6,7 +6,7 @@ access, RAG tool integration, and local editing workflows.
 """
 
 from .file_mapper import FileMapper
-from .models import PageNode, LocalPage, SpaceConfig, SyncConfig
+from .models import PageNode, LocalPage, PlannedAction, SpaceConfig, SyncConfig, SyncPlan
 from .errors import (
     FileMapperError,
     FilesystemError,
@@ -18,6 +18,7 @@ from .config_loader import ConfigLoader
 from .filesafe_converter import FilesafeConverter
 from .frontmatter_handler import FrontmatterHandler
 from .hierarchy_builder import HierarchyBuilder
+from .plan_executor import PlanExecutor
 
 __all__ = [
     'FileMapper',
@@ -25,6 +26,8 @@ __all__ = [
     'LocalPage',
     'SpaceConfig',
     'SyncConfig',
+    'SyncPlan',
+    'PlannedAction',
     'FileMapperError',
     'FilesystemError',
     'ConfigError',
@@ -34,4 +37,5 @@ __all__ = [
     'FilesafeConverter',
     'FrontmatterHandler',
     'HierarchyBuilder',
+    'PlanExecutor',
 ]
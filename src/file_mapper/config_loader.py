@@ -7,8 +7,9 @@ point for the hierarchy rather than local file paths.
 
 import os
 from typing import Dict, Any, List
-import yaml
 
+from . import yaml_codec
+from .content_cache import CACHE_FORMATS
 from .errors import ConfigError, FilesystemError
 from .models import SpaceConfig, SyncConfig
 
@@ -30,6 +31,13 @@ class ConfigLoader:
         force_pull: false
         force_push: false
         temp_dir: ".confluence-sync/temp"
+        cache_dir: ".confluence-sync"   # null disables the page content cache
+        cache_format: "files"            # or "pack": one pack file per cache store
+        local_change_detection: "mtime"  # or "git" when local_path is in a git repo
+        concurrency: 1                   # workers for independent page actions
+        requests_per_second: 0           # API request pacing for all workers (0 = off)
+        push_pipeline_depth: 0           # pages fetched ahead while diffing (0 = off)
+        space_concurrency: 1             # spaces synced at once
     """
 
     # Required top-level config fields
@@ -43,9 +51,19 @@ class ConfigLoader:
         'page_limit': 100,
         'force_pull': False,
         'force_push': False,
-        'temp_dir': '.confluence-sync/temp'
+        'temp_dir': '.confluence-sync/temp',
+        'cache_dir': '.confluence-sync',
+        'cache_format': 'files',
+        'local_change_detection': 'mtime',
+        'concurrency': 1,
+        'requests_per_second': 0,
+        'push_pipeline_depth': 0,
+        'space_concurrency': 1
     }
 
+    # Supported values for local_change_detection
+    LOCAL_CHANGE_DETECTION_MODES = {'mtime', 'git'}
+
     @classmethod
     def load(cls, config_path: str) -> SyncConfig:
         """Load and parse configuration from a YAML file.
@@ -85,8 +103,8 @@ class ConfigLoader:
 
         # Parse YAML
         try:
-            config_dict = yaml.safe_load(content)
-        except yaml.YAMLError as e:
+            config_dict = yaml_codec.safe_load(content)
+        except yaml_codec.YAMLError as e:
             raise ConfigError(
                 f"Invalid YAML syntax: {str(e)}"
             )
@@ -134,11 +152,18 @@ class ConfigLoader:
             'page_limit': sync_config.page_limit,
             'force_pull': sync_config.force_pull,
             'force_push': sync_config.force_push,
-            'temp_dir': sync_config.temp_dir
+            'temp_dir': sync_config.temp_dir,
+            'cache_dir': sync_config.cache_dir,
+            'cache_format': sync_config.cache_format,
+            'local_change_detection': sync_config.local_change_detection,
+            'concurrency': sync_config.concurrency,
+            'requests_per_second': sync_config.requests_per_second,
+            'push_pipeline_depth': sync_config.push_pipeline_depth,
+            'space_concurrency': sync_config.space_concurrency
         }
 
         # Generate YAML
-        yaml_str = yaml.safe_dump(
+        yaml_str = yaml_codec.safe_dump(
             config_dict,
             default_flow_style=False,
             allow_unicode=True,
@@ -285,6 +310,21 @@ class ConfigLoader:
         force_pull = config_dict.get('force_pull', cls.DEFAULTS['force_pull'])
         force_push = config_dict.get('force_push', cls.DEFAULTS['force_push'])
         temp_dir = config_dict.get('temp_dir', cls.DEFAULTS['temp_dir'])
+        cache_dir = config_dict.get('cache_dir', cls.DEFAULTS['cache_dir'])
+        cache_format = config_dict.get('cache_format', cls.DEFAULTS['cache_format'])
+        local_change_detection = config_dict.get(
+            'local_change_detection', cls.DEFAULTS['local_change_detection']
+        )
+        concurrency = config_dict.get('concurrency', cls.DEFAULTS['concurrency'])
+        requests_per_second = config_dict.get(
+            'requests_per_second', cls.DEFAULTS['requests_per_second']
+        )
+        push_pipeline_depth = config_dict.get(
+            'push_pipeline_depth', cls.DEFAULTS['push_pipeline_depth']
+        )
+        space_concurrency = config_dict.get(
+            'space_concurrency', cls.DEFAULTS['space_concurrency']
+        )
 
         # Validate types
         try:
@@ -292,6 +332,14 @@ class ConfigLoader:
             force_pull = bool(force_pull)
             force_push = bool(force_push)
             temp_dir = str(temp_dir)
+            if cache_dir is not None:
+                cache_dir = str(cache_dir)
+            cache_format = str(cache_format)
+            local_change_detection = str(local_change_detection)
+            concurrency = int(concurrency)
+            requests_per_second = float(requests_per_second)
+            push_pipeline_depth = int(push_pipeline_depth)
+            space_concurrency = int(space_concurrency)
         except (ValueError, TypeError) as e:
             raise ConfigError(
                 f"Invalid field type for optional field: {str(e)}"
@@ -304,6 +352,45 @@ class ConfigLoader:
                 'page_limit'
             )
 
+        if concurrency < 1:
+            raise ConfigError(
+                f"Field 'concurrency' must be at least 1, got {concurrency}",
+                'concurrency'
+            )
+
+        if requests_per_second < 0:
+            raise ConfigError(
+                f"Field 'requests_per_second' must not be negative, got {requests_per_second}",
+                'requests_per_second'
+            )
+
+        if push_pipeline_depth < 0:
+            raise ConfigError(
+                f"Field 'push_pipeline_depth' must not be negative, got {push_pipeline_depth}",
+                'push_pipeline_depth'
+            )
+
+        if space_concurrency < 1:
+            raise ConfigError(
+                f"Field 'space_concurrency' must be at least 1, got {space_concurrency}",
+                'space_concurrency'
+            )
+
+        if local_change_detection not in cls.LOCAL_CHANGE_DETECTION_MODES:
+            raise ConfigError(
+                f"Field 'local_change_detection' must be one of "
+                f"{', '.join(sorted(cls.LOCAL_CHANGE_DETECTION_MODES))}, "
+                f"got '{local_change_detection}'",
+                'local_change_detection'
+            )
+
+        if cache_format not in CACHE_FORMATS:
+            raise ConfigError(
+                f"Field 'cache_format' must be one of {', '.join(CACHE_FORMATS)}, "
+                f"got '{cache_format}'",
+                'cache_format'
+            )
+
         # Validate mutually exclusive force flags
         if force_pull and force_push:
             raise ConfigError(
@@ -315,5 +402,12 @@ class ConfigLoader:
             page_limit=page_limit,
             force_pull=force_pull,
             force_push=force_push,
-            temp_dir=temp_dir
+            temp_dir=temp_dir,
+            cache_dir=cache_dir,
+            cache_format=cache_format,
+            local_change_detection=local_change_detection,
+            concurrency=concurrency,
+            requests_per_second=requests_per_second,
+            push_pipeline_depth=push_pipeline_depth,
+            space_concurrency=space_concurrency
         )
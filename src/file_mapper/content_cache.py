@@ -0,0 +1,195 @@
+"""Page content cache for the pull path.
+
+This module provides PageContentCache, which lets hierarchy discovery skip
+the body download and XHTML→markdown conversion for page versions that were
+already fetched. It keeps two stores per space:
+- {cache_dir}/{SPACE}_xhtml: raw storage-format XHTML (shared with
+  ConflictDetector, which uses the same layout)
+- {cache_dir}/{SPACE}_markdown: the converted markdown for the same version
+
+The stores are XHTMLCache (two small files per entry) by default, or
+XHTMLPackCache (one append-only pack file per store) with the "pack" cache
+format. ConflictDetector always reads the files layout, so with "pack" it
+does not share the cached XHTML.
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Optional, Union
+
+from ..git_integration.errors import CacheError
+from ..git_integration.models import CacheStats
+from ..git_integration.xhtml_cache import XHTMLCache
+from ..git_integration.xhtml_pack_cache import XHTMLPackCache
+
+logger = logging.getLogger(__name__)
+
+# Storage formats of the page content cache
+CACHE_FORMATS = ("files", "pack")
+
+CacheStore = Union[XHTMLCache, XHTMLPackCache]
+
+
+class PageContentCache:
+    """Caches XHTML and converted markdown per (page_id, version).
+
+    Entries are validated against the Confluence version timestamp
+    (version.when), so a cached entry is only used when both the version
+    number and its timestamp match what the API reported.
+
+    Example:
+        >>> cache = PageContentCache(".confluence-sync", "TEAM")
+        >>> markdown = cache.get_markdown("123456", 15, "2024-01-01T00:00:00.000Z")
+        >>> if markdown is None:
+        ...     cache.put("123456", 15, "2024-01-01T00:00:00.000Z", xhtml, markdown)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        space_key: str,
+        max_age_days: int = 7,
+        cache_format: str = "files"
+    ):
+        """Initialize the content cache for one space.
+
+        Args:
+            cache_dir: Base cache directory (e.g., .confluence-sync)
+            space_key: Confluence space key
+            max_age_days: Max age before re-fetch (default: 7 days)
+            cache_format: Storage format, "files" or "pack" (see CACHE_FORMATS)
+
+        Raises:
+            CacheError: If the cache directories cannot be created
+            ValueError: If cache_format is unknown
+        """
+        if cache_format not in CACHE_FORMATS:
+            raise ValueError(f"Unknown cache format '{cache_format}'")
+        store_class = XHTMLPackCache if cache_format == "pack" else XHTMLCache
+
+        self.space_key = space_key
+        self.cache_format = cache_format
+        self.xhtml: CacheStore = store_class(
+            os.path.join(cache_dir, f"{space_key}_xhtml"), max_age_days=max_age_days
+        )
+        self.markdown: CacheStore = store_class(
+            os.path.join(cache_dir, f"{space_key}_markdown"), max_age_days=max_age_days
+        )
+
+    @staticmethod
+    def _parse_timestamp(last_modified: str) -> Optional[datetime]:
+        """Parse a Confluence version.when timestamp, or None if invalid."""
+        if not last_modified:
+            return None
+        try:
+            return datetime.fromisoformat(last_modified)
+        except ValueError:
+            return None
+
+    def _get(
+        self, store: CacheStore, page_id: str, version: int, last_modified: str
+    ) -> Optional[str]:
+        """Look up an entry in one store, treating unreadable entries as misses."""
+        timestamp = self._parse_timestamp(last_modified)
+        if timestamp is None:
+            return None
+        try:
+            return store.get(page_id, version, timestamp)
+        except CacheError as e:
+            logger.warning(f"Ignoring unreadable cache entry for page {page_id}: {e}")
+            store.invalidate(page_id)
+            return None
+
+    def get_markdown(self, page_id: str, version: int, last_modified: str) -> Optional[str]:
+        """Get cached markdown for a page version.
+
+        Args:
+            page_id: Confluence page ID
+            version: Version number
+            last_modified: Confluence version.when timestamp (ISO 8601)
+
+        Returns:
+            Cached markdown, or None on cache miss
+        """
+        return self._get(self.markdown, page_id, version, last_modified)
+
+    def get_xhtml(self, page_id: str, version: int, last_modified: str) -> Optional[str]:
+        """Get cached XHTML for a page version.
+
+        Args:
+            page_id: Confluence page ID
+            version: Version number
+            last_modified: Confluence version.when timestamp (ISO 8601)
+
+        Returns:
+            Cached XHTML, or None on cache miss
+        """
+        return self._get(self.xhtml, page_id, version, last_modified)
+
+    def put(
+        self,
+        page_id: str,
+        version: int,
+        last_modified: str,
+        xhtml: Optional[str],
+        markdown: Optional[str],
+    ) -> None:
+        """Store XHTML and/or markdown for a page version.
+
+        Cache write failures are logged and otherwise ignored, since the cache
+        is only an optimization.
+
+        Args:
+            page_id: Confluence page ID
+            version: Version number
+            last_modified: Confluence version.when timestamp (ISO 8601)
+            xhtml: Storage-format XHTML (None to skip)
+            markdown: Converted markdown (None to skip)
+        """
+        timestamp = self._parse_timestamp(last_modified)
+        if timestamp is None:
+            return
+
+        for store, content in ((self.xhtml, xhtml), (self.markdown, markdown)):
+            if content is None:
+                continue
+            try:
+                store.put(page_id, version, content, timestamp)
+            except CacheError as e:
+                logger.warning(f"Failed to cache content for page {page_id}: {e}")
+
+    def get_stats(self) -> CacheStats:
+        """Get counters of the markdown store (the one consulted first).
+
+        Returns:
+            CacheStats snapshot
+        """
+        return self.markdown.get_stats()
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries from both stores.
+
+        Failures are logged and otherwise ignored, since the cache is only
+        an optimization.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for store in (self.xhtml, self.markdown):
+            try:
+                removed += store.cleanup_expired()
+            except (CacheError, OSError) as e:
+                logger.warning(f"Cache cleanup of {store.cache_dir} failed: {e}")
+        return removed
+
+    def flush(self) -> None:
+        """Persist which entries were used (for LRU eviction after a restart).
+
+        Pack stores keep no LRU order and write each record as it is added,
+        so there is nothing to flush for them.
+        """
+        for store in (self.xhtml, self.markdown):
+            if isinstance(store, XHTMLCache):
+                store.flush_recency()
@@ -5,22 +5,42 @@ operations including syncing between Confluence and local markdown files,
 managing hierarchies, and ensuring atomic file operations (ADR-011).
 """
 
+import copy
 import hashlib
 import logging
 import os
 import re
 import shutil
+import threading
+from dataclasses import replace
 from datetime import datetime, UTC
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from ..confluence_client.auth import Authenticator
 from ..confluence_client.api_wrapper import APIWrapper
+from ..confluence_client.rate_limiter import get_rate_limiter
+from ..git_integration.errors import CacheError
+from ..page_operations.adf_models import AdfUpdateResult
 from ..page_operations.page_operations import PageOperations
+from .content_cache import PageContentCache
 from .hierarchy_builder import HierarchyBuilder
+from .local_manifest import LazyLocalPage, LocalFileManifest
+from .workspace_index import DEFAULT_READ_WORKERS, WorkspaceIndex, map_ordered
 from .config_loader import ConfigLoader
 from .filesafe_converter import FilesafeConverter
 from .frontmatter_handler import FrontmatterHandler
-from .models import PageNode, LocalPage, SpaceConfig, SyncConfig
+from .models import (
+    LocalPage,
+    PageAction,
+    PageNode,
+    PlannedAction,
+    PushPipelineStats,
+    SpaceConfig,
+    SyncConfig,
+    SyncPlan,
+)
+from .plan_executor import PlanExecutor
+from .push_pipeline import PushPipeline
 from .errors import FilesystemError, ConfigError
 
 
@@ -79,6 +99,11 @@ class FileMapper:
         self._hierarchy_builder = HierarchyBuilder(authenticator)
         self._base_path = ""  # Set during sync to calculate relative paths
         self._confluence_base_url: Optional[str] = None  # Cached base URL
+        # Push pipeline queue occupancy for the current sync_spaces run
+        self.push_pipeline_stats = PushPipelineStats()
+        self._stats_lock = threading.Lock()
+        # Page content caches by (cache_dir, space_key, cache_format), kept across runs
+        self._content_caches: Dict[Tuple[str, str, str], PageContentCache] = {}
 
     def _get_confluence_base_url(self) -> str:
         """Get the Confluence base URL from credentials.
@@ -126,6 +151,82 @@ class FileMapper:
         # Show the full relative path (not just filename)
         self._sync_print(f"  {action} {rel_path}")
 
+    def _notify_page_synced(
+        self,
+        sync_config: SyncConfig,
+        page_id: str,
+        file_path: str,
+        action: str,
+        content: str,
+        version: Optional[int] = None,
+    ) -> None:
+        """Report an applied push or pull to sync_config.on_page_synced.
+
+        Callback failures are logged and never stop the sync: the page has
+        already been written on both sides.
+
+        Args:
+            sync_config: SyncConfig with the optional on_page_synced callback
+            page_id: Confluence page ID
+            file_path: Local file path
+            action: "push" or "pull"
+            content: File content (with frontmatter) the page now has
+            version: Confluence version number after the action, if known
+        """
+        if not sync_config.on_page_synced:
+            return
+
+        page_action = PageAction(
+            page_id=str(page_id),
+            file_path=file_path,
+            action=action,
+            content_hash=hashlib.sha256(content.encode('utf-8')).hexdigest(),
+            version=version,
+        )
+        try:
+            sync_config.on_page_synced(page_action, content)
+        except Exception as e:
+            logger.warning(f"Failed to record {action} of page {page_id}: {e}")
+
+    def _is_already_applied(
+        self,
+        page_id: Optional[str],
+        sync_config: SyncConfig,
+        local_page: Optional[LocalPage] = None,
+        version: Optional[int] = None,
+    ) -> bool:
+        """Check whether a resumed run already applied this page.
+
+        A page counts as applied if the interrupted run recorded it and the
+        side being checked has not changed since: the local content hash
+        (local_page given) or the Confluence version (version given) still
+        matches the recorded action.
+
+        Args:
+            page_id: Confluence page ID
+            sync_config: SyncConfig with completed_pages from the sync journal
+            local_page: Current local page
+            version: Current Confluence version number
+
+        Returns:
+            True if the page should not be pushed or pulled again
+        """
+        if not sync_config.completed_pages or not page_id:
+            return False
+
+        completed = sync_config.completed_pages.get(str(page_id))
+        if completed is None:
+            return False
+
+        if local_page is not None:
+            try:
+                content = FrontmatterHandler.generate(local_page)
+            except ValueError as e:
+                logger.debug(f"Cannot hash {local_page.file_path} for resume check: {e}")
+                return False
+            return completed.content_hash == hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return version is not None and completed.version == version
+
     def _has_conflict_markers(self, content: str) -> bool:
         """Check if content contains unresolved merge conflict markers.
 
@@ -218,7 +319,8 @@ class FileMapper:
 
         This is the main entry point for syncing operations. It processes
         each space in the configuration and syncs according to the sync
-        direction and force flags.
+        direction and force flags. With config.space_concurrency above 1,
+        independent spaces are synced concurrently.
 
         Args:
             config: SyncConfig with spaces to sync and sync options
@@ -234,6 +336,16 @@ class FileMapper:
 
         logger.info(f"Starting sync for {len(config.spaces)} space(s)")
 
+        # Concurrent workers share one request pace
+        get_rate_limiter().configure(config.requests_per_second)
+        self.push_pipeline_stats = PushPipelineStats()
+
+        space_workers = min(config.space_concurrency, len(config.spaces))
+        if space_workers > 1:
+            combined_result = self._sync_spaces_concurrently(config, space_workers)
+            logger.info("All spaces synced successfully")
+            return combined_result
+
         # Aggregate results from all spaces
         combined_result = SyncResult()
 
@@ -244,16 +356,123 @@ class FileMapper:
             )
             space_result = self._sync_space(space_config, config)
             if space_result:
-                combined_result.pushed_count += space_result.pushed_count
-                combined_result.pulled_count += space_result.pulled_count
-                combined_result.conflict_page_ids.extend(space_result.conflict_page_ids)
-                combined_result.conflict_local_paths.update(space_result.conflict_local_paths)
-                combined_result.conflict_remote_content.update(space_result.conflict_remote_content)
-                combined_result.conflict_titles.update(space_result.conflict_titles)
+                combined_result.merge(space_result)
 
         logger.info("All spaces synced successfully")
         return combined_result
 
+    def _sync_spaces_concurrently(self, config: SyncConfig, space_workers: int) -> "SyncResult":
+        """Sync independent spaces on a thread pool.
+
+        Each space runs on its own view of this mapper (_space_mapper), so
+        per-space state such as _base_path does not race, and stages its
+        files in its own subdirectory of temp_dir. The `concurrency` budget
+        is split evenly between the spaces running at once: as the shared
+        rate limiter hands out request slots first come first served, equal
+        worker counts give each space an equal share of API throughput.
+
+        Results are merged on the calling thread in configuration order.
+        A failed space does not stop the others; the first failure (in
+        configuration order) is re-raised once all spaces have finished.
+
+        Args:
+            config: SyncConfig with spaces to sync and sync options
+            space_workers: Number of spaces synced at once
+
+        Returns:
+            SyncResult of all spaces
+        """
+        from .models import SyncResult
+
+        space_concurrency = max(1, config.concurrency // space_workers)
+        logger.info(
+            f"Syncing up to {space_workers} spaces at once "
+            f"({space_concurrency} worker(s) per space)"
+        )
+
+        def sync_one(indexed_space: Tuple[int, SpaceConfig]) -> "SyncResult":
+            index, space_config = indexed_space
+            logger.info(
+                f"Syncing space {space_config.space_key} "
+                f"(parent page: {space_config.parent_page_id})"
+            )
+            space_sync_config = replace(
+                config,
+                concurrency=space_concurrency,
+                temp_dir=os.path.join(config.temp_dir, f"space-{index}")
+            )
+            return self._space_mapper(space_config)._sync_space(space_config, space_sync_config)
+
+        combined_result = SyncResult()
+        first_error: Optional[Exception] = None
+        for (_, space_config), space_result, error in map_ordered(
+            sync_one, list(enumerate(config.spaces)), max_workers=space_workers
+        ):
+            if error is not None:
+                logger.error(f"Sync of space {space_config.space_key} failed: {error}")
+                if first_error is None:
+                    first_error = error
+            elif space_result:
+                combined_result.merge(space_result)
+
+        if first_error is not None:
+            raise first_error
+        return combined_result
+
+    def _space_mapper(self, space_config: SpaceConfig) -> "FileMapper":
+        """Get a view of this mapper for syncing one space concurrently.
+
+        The view is a shallow copy: API clients, caches and the push
+        pipeline stats are shared, while per-space attributes (_base_path)
+        are its own.
+
+        Args:
+            space_config: Space the view syncs
+
+        Returns:
+            FileMapper for the space
+        """
+        space_mapper = copy.copy(self)
+        space_mapper._base_path = str(space_config.local_path)
+        return space_mapper
+
+    def plan_sync(self, config: SyncConfig) -> SyncPlan:
+        """Plan a sync of all configured spaces without changing anything.
+
+        Discovers each space's Confluence hierarchy and local files and runs
+        the same change detection a real sync uses, returning the actions it
+        would apply. Used by --dry-run.
+
+        Args:
+            config: SyncConfig with spaces to sync and sync options
+
+        Returns:
+            SyncPlan covering all spaces
+
+        Raises:
+            PageNotFoundError: If parent page doesn't exist
+            PageLimitExceededError: If page limit is exceeded
+            APIAccessError: If API operations fail
+        """
+        plan = SyncPlan()
+        for space_config in config.spaces:
+            hierarchy, local_pages, sync_direction = self._prepare_space(space_config, config)
+            logger.debug(f"Planning {sync_direction} sync for space {space_config.space_key}")
+
+            if sync_direction == 'pull':
+                plan.extend(self._plan_pull(
+                    hierarchy, space_config, self._full_pull_page_ids(hierarchy, space_config)
+                ))
+            elif sync_direction == 'push':
+                plan.extend(self._plan_push(local_pages, space_config, config))
+            else:
+                plan.extend(self._plan_bidirectional(
+                    hierarchy, local_pages, space_config, config
+                ))
+
+        logger.info(f"Sync plan: {plan.counts() or 'no changes'}")
+        return plan
+
     def _sync_space(self, space_config: SpaceConfig, sync_config: SyncConfig) -> "SyncResult":
         """Sync a single space.
 
@@ -261,53 +480,50 @@ class FileMapper:
             space_config: Configuration for the space to sync
             sync_config: Overall sync configuration with options
 
+        Expired content cache entries are removed once the space is synced,
+        so the cleanup never deletes entries discovery is still reading.
+
         Returns:
-            SyncResult with push/pull counts and conflict information
+            SyncResult with push/pull counts, conflict information and the
+            content cache counters of this run
         """
-        from .models import SyncResult
+        content_cache = self._get_content_cache(space_config, sync_config)
+        cache_start = content_cache.get_stats() if content_cache else None
 
-        # Set base path for relative path logging
-        self._base_path = str(space_config.local_path)
+        result = self._sync_space_pages(space_config, sync_config)
 
-        # Build hierarchy from Confluence
-        self._sync_print("Querying Confluence...")
-        logger.debug(f"Building hierarchy for space {space_config.space_key}")
-        hierarchy = self._hierarchy_builder.build_hierarchy(
-            parent_page_id=space_config.parent_page_id,
-            space_key=space_config.space_key,
-            page_limit=sync_config.page_limit,
-            exclude_page_ids=space_config.exclude_page_ids
-        )
+        if content_cache is not None and cache_start is not None:
+            content_cache.cleanup_expired()
+            result.cache_stats = content_cache.get_stats().since(cache_start)
+            content_cache.flush()
+        return result
 
-        # Read local files
-        logger.debug(f"Reading local files from {space_config.local_path}")
-        local_pages = self._read_local_files(space_config.local_path)
+    def _sync_space_pages(
+        self,
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> "SyncResult":
+        """Discover a space and push/pull its pages in the detected direction.
 
-        # Determine sync direction
-        sync_direction = self._detect_sync_direction(
-            hierarchy=hierarchy,
-            local_pages=local_pages,
-            force_pull=sync_config.force_pull,
-            force_push=sync_config.force_push
-        )
+        Args:
+            space_config: Configuration for the space to sync
+            sync_config: Overall sync configuration with options
 
-        logger.debug(f"Sync direction: {sync_direction}")
+        Returns:
+            SyncResult with push/pull counts and conflict information
+        """
+        from .models import SyncResult
+
+        hierarchy, local_pages, sync_direction = self._prepare_space(space_config, sync_config)
 
         # Perform sync based on direction
         if sync_direction == 'pull':
-            # Get all page IDs from hierarchy - pull everything
-            all_page_ids = self._collect_page_ids_from_hierarchy(hierarchy)
-
-            # Exclude parent page if configured (ADR: exclude_parent option)
-            if space_config.exclude_parent:
-                all_page_ids.discard(hierarchy.page_id)
-                logger.debug(f"Excluding parent page {hierarchy.page_id} from sync (exclude_parent=True)")
-
+            # Pull everything (full pull also removes orphaned local files)
             pulled_count = self._pull_from_confluence(
                 hierarchy=hierarchy,
                 space_config=space_config,
                 sync_config=sync_config,
-                page_ids_to_pull=all_page_ids
+                page_ids_to_pull=self._full_pull_page_ids(hierarchy, space_config)
             )
             return SyncResult(pulled_count=pulled_count)
         elif sync_direction == 'push':
@@ -329,6 +545,131 @@ class FileMapper:
 
         return SyncResult()
 
+    def _prepare_space(
+        self,
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> Tuple[PageNode, Dict[str, LocalPage], str]:
+        """Discover a space's Confluence hierarchy and local files.
+
+        Args:
+            space_config: Configuration for the space
+            sync_config: Overall sync configuration with options
+
+        Returns:
+            Tuple of (hierarchy, local pages by file path, sync direction)
+        """
+        # Set base path for relative path logging
+        self._base_path = str(space_config.local_path)
+
+        # Build hierarchy from Confluence
+        self._sync_print("Querying Confluence...")
+        logger.debug(f"Building hierarchy for space {space_config.space_key}")
+        hierarchy = self._hierarchy_builder.build_hierarchy(
+            parent_page_id=space_config.parent_page_id,
+            space_key=space_config.space_key,
+            page_limit=sync_config.page_limit,
+            exclude_page_ids=space_config.exclude_page_ids,
+            content_cache=self._get_content_cache(space_config, sync_config)
+        )
+
+        # Read local files (only files changed since the last scan are parsed)
+        logger.debug(f"Reading local files from {space_config.local_path}")
+        manifest = self._get_local_manifest(space_config, sync_config)
+        local_pages = self._read_local_files(
+            space_config.local_path,
+            manifest=manifest,
+            workspace=sync_config.workspace
+        )
+        if manifest:
+            manifest.save()
+
+        # Determine sync direction
+        sync_direction = self._detect_sync_direction(
+            hierarchy=hierarchy,
+            local_pages=local_pages,
+            force_pull=sync_config.force_pull,
+            force_push=sync_config.force_push
+        )
+
+        logger.debug(f"Sync direction: {sync_direction}")
+        return hierarchy, local_pages, sync_direction
+
+    def _full_pull_page_ids(self, hierarchy: PageNode, space_config: SpaceConfig) -> Set[str]:
+        """Get the page IDs a full pull of a space writes.
+
+        Args:
+            hierarchy: PageNode tree from Confluence
+            space_config: Space configuration
+
+        Returns:
+            All page IDs in the hierarchy (without the parent if exclude_parent)
+        """
+        all_page_ids = self._collect_page_ids_from_hierarchy(hierarchy)
+
+        # Exclude parent page if configured (ADR: exclude_parent option)
+        if space_config.exclude_parent:
+            all_page_ids.discard(hierarchy.page_id)
+            logger.debug(f"Excluding parent page {hierarchy.page_id} from sync (exclude_parent=True)")
+        return all_page_ids
+
+    def _get_content_cache(
+        self,
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> Optional[PageContentCache]:
+        """Get the page content cache for a space, if caching is enabled.
+
+        The cache is created on first use and then reused by later runs of
+        this mapper.
+
+        Args:
+            space_config: Configuration for the space being synced
+            sync_config: Overall sync configuration (cache_dir, cache_format)
+
+        Returns:
+            PageContentCache, or None if caching is disabled or unavailable
+        """
+        if not sync_config.cache_dir:
+            return None
+
+        key = (sync_config.cache_dir, space_config.space_key, sync_config.cache_format)
+        with self._stats_lock:
+            content_cache = self._content_caches.get(key)
+            if content_cache is None:
+                try:
+                    content_cache = PageContentCache(
+                        sync_config.cache_dir,
+                        space_config.space_key,
+                        cache_format=sync_config.cache_format
+                    )
+                except CacheError as e:
+                    logger.warning(f"Page content cache disabled: {e}")
+                    return None
+                self._content_caches[key] = content_cache
+        return content_cache
+
+    def _get_local_manifest(
+        self,
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> Optional[LocalFileManifest]:
+        """Load the local file manifest for a space, if caching is enabled.
+
+        Args:
+            space_config: Configuration for the space being synced
+            sync_config: Overall sync configuration (cache_dir)
+
+        Returns:
+            LocalFileManifest, or None if caching is disabled
+        """
+        if not sync_config.cache_dir:
+            return None
+
+        return LocalFileManifest(
+            os.path.join(sync_config.cache_dir, f"{space_config.space_key}_manifest.json")
+        )
+
     def _detect_sync_direction(
         self,
         hierarchy: PageNode,
@@ -419,11 +760,9 @@ class FileMapper:
         # Only needed for full pull - partial pull shouldn't delete unchanged files
         existing_files = set()
         if is_full_pull and os.path.exists(space_config.local_path):
-            for root, dirs, files in os.walk(space_config.local_path):
-                for filename in files:
-                    if filename.endswith('.md'):
-                        file_path = os.path.join(root, filename)
-                        existing_files.add(file_path)
+            existing_files = set(
+                self._iter_markdown_files(space_config.local_path, sync_config.workspace)
+            )
 
         # Build list of files to write (only pages in page_ids_to_pull)
         files_to_write: List[Tuple[str, str]] = []
@@ -442,9 +781,22 @@ class FileMapper:
         # Write files atomically
         self._write_files_atomic(
             files_to_write=files_to_write,
-            temp_dir=sync_config.temp_dir
+            temp_dir=sync_config.temp_dir,
+            workspace=sync_config.workspace
         )
 
+        if sync_config.on_page_synced:
+            page_map: Dict[str, PageNode] = {}
+            self._build_page_map(hierarchy, page_map)
+            for file_path, content in files_to_write:
+                page_id = FrontmatterHandler.get_page_id(content)
+                if page_id:
+                    node = page_map.get(page_id)
+                    self._notify_page_synced(
+                        sync_config, page_id, file_path, "pull", content,
+                        version=node.version if node else None
+                    )
+
         # Delete orphaned files (files that existed before but aren't in new hierarchy)
         # Only for full pull - partial pull doesn't delete files
         if is_full_pull:
@@ -457,6 +809,8 @@ class FileMapper:
                     try:
                         os.remove(orphaned_file)
                         logger.debug(f"Deleted orphaned file: {orphaned_file}")
+                        if sync_config.workspace:
+                            sync_config.workspace.invalidate(orphaned_file)
 
                         # Clean up empty parent directories
                         parent_dir = os.path.dirname(orphaned_file)
@@ -607,23 +961,27 @@ class FileMapper:
         files_to_update: List[Tuple[str, str]] = []
 
         # Create/update pages in hierarchical order (parents before children)
-        self._push_hierarchy_to_confluence(
-            hierarchy=hierarchy,
-            page_ops=page_ops,
-            space_config=space_config,
-            sync_config=sync_config,
-            files_to_update=files_to_update,
-            parent_page_id=space_config.parent_page_id
-        )
+        try:
+            self._push_hierarchy_to_confluence(
+                hierarchy=hierarchy,
+                page_ops=page_ops,
+                space_config=space_config,
+                sync_config=sync_config,
+                files_to_update=files_to_update,
+                parent_page_id=space_config.parent_page_id
+            )
+        finally:
+            # Update local files with new page_ids atomically (also after a
+            # failure, so pages already created are not created again)
+            if files_to_update:
+                logger.debug(f"Updating {len(files_to_update)} local file(s) with page IDs")
+                self._write_files_atomic(
+                    files_to_write=files_to_update,
+                    temp_dir=sync_config.temp_dir,
+                    workspace=sync_config.workspace
+                )
 
-        # Update local files with new page_ids atomically
         actual_pushed = len(files_to_update)
-        if files_to_update:
-            logger.debug(f"Updating {len(files_to_update)} local file(s) with page IDs")
-            self._write_files_atomic(
-                files_to_write=files_to_update,
-                temp_dir=sync_config.temp_dir
-            )
 
         logger.debug(f"Successfully pushed {actual_pushed} page(s) to Confluence")
         return actual_pushed
@@ -735,222 +1093,379 @@ class FileMapper:
         current_dir: str = '__root__',
         depth: int = 0
     ) -> None:
-        """Recursively push pages to Confluence maintaining hierarchy.
+        """Push pages to Confluence level by level, maintaining hierarchy.
+
+        Each directory level is one wave: every page of the level already has
+        its parent in Confluence, so the level's pages are created or updated
+        by up to sync_config.concurrency workers; the calling thread uses
+        page_ops and every other worker its own PageOperations (and API
+        client). Created page IDs become the parent IDs of
+        the next level. New sibling pages with the same title are created in
+        successive rounds, in file order, so the duplicate-title fallback
+        always renames the same file.
+
+        Results are collected in file order: files_to_update and the next
+        level are the same for any number of workers. If a page fails, the
+        rest of its wave still runs, the pages pushed so far stay in
+        files_to_update, and the first error is raised before the next level.
 
         Args:
             hierarchy: Hierarchy map from _build_local_hierarchy
-            page_ops: PageOperations instance for creating/updating pages
+            page_ops: PageOperations of the calling thread
             space_config: Space configuration
             sync_config: Sync configuration with get_baseline callback
             files_to_update: List to append (file_path, content) tuples for updates
             parent_page_id: Parent page ID in Confluence
-            current_dir: Current directory being processed
-            depth: Current recursion depth (default: 0, increments with each level)
+            current_dir: Directory whose pages are pushed first
+            depth: Depth of current_dir (default: 0, increments with each level)
 
         Raises:
-            FilesystemError: If recursion depth exceeds MAX_RECURSION_DEPTH
+            FilesystemError: If hierarchy depth exceeds MAX_RECURSION_DEPTH
         """
-        # Check recursion depth to prevent stack overflow (M2)
-        if depth > MAX_RECURSION_DEPTH:
-            raise FilesystemError(
-                current_dir,
-                'hierarchy',
-                f'Directory hierarchy exceeds maximum depth of {MAX_RECURSION_DEPTH}. '
-                f'This may indicate a circular reference or excessively deep nesting.'
+        thread_page_ops = self._per_thread_page_ops(page_ops)
+
+        def push(
+            item: Tuple[int, str, str, LocalPage]
+        ) -> Tuple[Optional[str], Optional[Tuple[str, str]]]:
+            _, file_path, level_parent_id, local_page = item
+            return self._push_local_page(
+                thread_page_ops(), file_path, local_page, level_parent_id, space_config, sync_config
             )
 
-        if current_dir not in hierarchy:
-            return
+        # (file_path, Confluence parent page ID) for the current level
+        level = [(file_path, parent_page_id) for file_path in hierarchy.get(current_dir, [])]
+
+        while level:
+            # Check hierarchy depth to catch circular or runaway nesting (M2)
+            if depth > MAX_RECURSION_DEPTH:
+                raise FilesystemError(
+                    current_dir,
+                    'hierarchy',
+                    f'Directory hierarchy exceeds maximum depth of {MAX_RECURSION_DEPTH}. '
+                    f'This may indicate a circular reference or excessively deep nesting.'
+                )
+
+            local_pages = self._read_push_level([file_path for file_path, _ in level])
+
+            # Outcome per level index: (page ID for children, file to update)
+            outcomes: Dict[int, Tuple[Optional[str], Optional[Tuple[str, str]]]] = {}
+            first_error: Optional[Exception] = None
+
+            for push_round in self._push_rounds(level, local_pages, sync_config):
+                items = [(index, *level[index], local_pages[index]) for index in push_round]
+                for item, outcome, error in map_ordered(
+                    push, items, max_workers=sync_config.concurrency
+                ):
+                    if error is not None:
+                        if first_error is None:
+                            first_error = error
+                        continue
+                    outcomes[item[0]] = outcome
+
+            next_level: List[Tuple[str, str]] = []
+            for index, (file_path, _) in enumerate(level):
+                if index not in outcomes:
+                    continue
+                child_parent_id, file_update = outcomes[index]
+                if file_update is not None:
+                    files_to_update.append(file_update)
+                # Process children (subdirectory with same name as file without .md)
+                if child_parent_id:
+                    child_dir_key = self._child_dir_key(file_path, space_config)
+                    next_level.extend(
+                        (child_path, child_parent_id)
+                        for child_path in hierarchy.get(child_dir_key, [])
+                    )
+
+            if first_error is not None:
+                raise first_error
+
+            if next_level:
+                current_dir = os.path.dirname(
+                    os.path.relpath(next_level[0][0], space_config.local_path)
+                )
+            level = next_level
+            depth += 1
+
+    def _read_push_level(self, file_paths: List[str]) -> List[LocalPage]:
+        """Read and parse the local files of one push level.
+
+        Args:
+            file_paths: Files of the level, in push order
+
+        Returns:
+            Parsed pages in the same order
 
-        # Process all files in current directory level
-        for file_path in hierarchy[current_dir]:
+        Raises:
+            FilesystemError: If a file exceeds MAX_FILE_SIZE
+            OSError: If a file cannot be read
+        """
+        def read(file_path: str) -> LocalPage:
             # Validate file size to prevent memory exhaustion (M1)
             self._validate_file_size(file_path)
 
-            # Read the local file
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # Parse frontmatter
-            local_page = FrontmatterHandler.parse(file_path, content)
+            return FrontmatterHandler.parse(file_path, content)
 
-            # Check for unresolved conflict markers during bidirectional sync only
-            # For force-push, user explicitly wants to overwrite - don't block
-            if not sync_config.force_push and self._has_conflict_markers(local_page.content or ""):
-                self._log_conflict_marker_error(file_path)
-                # Still need to process children even if this file is skipped
-                filename = os.path.basename(file_path)
-                dir_name = filename[:-3] if filename.endswith('.md') else filename
-                rel_path = os.path.relpath(file_path, space_config.local_path)
-                parent_dir = os.path.dirname(rel_path)
-                child_dir_key = os.path.join(parent_dir, dir_name) if parent_dir and parent_dir != '.' else dir_name
-                # Use existing page_id if available for children, otherwise skip children too
-                if local_page.page_id:
-                    self._push_hierarchy_to_confluence(
-                        hierarchy=hierarchy,
-                        page_ops=page_ops,
-                        space_config=space_config,
-                        sync_config=sync_config,
-                        files_to_update=files_to_update,
-                        parent_page_id=local_page.page_id,
-                        current_dir=child_dir_key,
-                        depth=depth + 1
-                    )
-                continue
+        local_pages: List[LocalPage] = []
+        for _, local_page, error in map_ordered(read, file_paths):
+            if error is not None:
+                raise error
+            local_pages.append(local_page)
+        return local_pages
 
-            # Derive title from content (H1 heading or filename)
-            title = self._derive_title_from_content(local_page.content, file_path)
+    def _push_rounds(
+        self,
+        level: List[Tuple[str, str]],
+        local_pages: List[LocalPage],
+        sync_config: SyncConfig
+    ) -> List[List[int]]:
+        """Split one push level into rounds that can run concurrently.
 
-            # Check if page needs to be created (no page_id)
-            if not local_page.page_id:
-                logger.debug(f"Creating new page in Confluence: {title}")
+        A new page goes into the first round that has no other new page with
+        the same title; all other pages go into the first round. Confluence
+        titles are unique per space (whatever the parent), so creating two
+        same-titled pages at once would make the duplicate-title fallback
+        pick whichever request lost the race.
 
-                # Create page in Confluence
-                try:
-                    result = page_ops.create_page(
-                        space_key=space_config.space_key,
-                        title=title,
-                        markdown_content=local_page.content or "",
-                        parent_id=parent_page_id
-                    )
+        Args:
+            level: (file_path, parent page ID) pairs of the level
+            local_pages: Parsed pages of the level, in the same order
+            sync_config: Sync configuration (force_push disables the
+                         conflict marker check)
 
-                    # Handle duplicate title (create_page returns success=False
-                    # with the existing page's ID - do NOT use that ID)
-                    if not result.success and 'already exists' in (result.error or '').lower():
-                        filename = os.path.basename(file_path)
-                        fallback_title = filename[:-3] if filename.endswith('.md') else filename
-                        logger.warning(
-                            f"Page '{title}' already exists under same parent "
-                            f"- retrying with filename-based title '{fallback_title}'"
-                        )
-                        result = page_ops.create_page(
-                            space_key=space_config.space_key,
-                            title=fallback_title,
-                            markdown_content=local_page.content or "",
-                            parent_id=parent_page_id
-                        )
-                        if not result.success:
-                            raise RuntimeError(
-                                f"Failed to create page with fallback title '{fallback_title}': {result.error}"
-                            )
-                        title = fallback_title
+        Returns:
+            Rounds of level indexes, each in file order
+        """
+        rounds: List[List[int]] = [[]]
+        round_titles: List[Set[str]] = [set()]
+
+        for index, (file_path, _) in enumerate(level):
+            local_page = local_pages[index]
+            skipped = (not sync_config.force_push
+                       and self._has_conflict_markers(local_page.content or ""))
+            if local_page.page_id or skipped:
+                rounds[0].append(index)
+                continue
 
-                    created_page_id = result.page_id
+            title = self._derive_title_from_content(local_page.content, file_path)
+            key = title.casefold()
+            round_number = 0
+            while key in round_titles[round_number]:
+                round_number += 1
+                if round_number == len(rounds):
+                    rounds.append([])
+                    round_titles.append(set())
+            rounds[round_number].append(index)
+            round_titles[round_number].add(key)
+
+        return [sorted(push_round) for push_round in rounds if push_round]
+
+    def _per_thread_page_ops(
+        self,
+        caller_page_ops: Optional[PageOperations] = None
+    ) -> Callable[[], PageOperations]:
+        """Get a factory returning one PageOperations per worker thread.
 
-                    # Log the page action (← = Confluence updated from local)
-                    self._log_page_action("←", file_path)
-                    logger.debug(f"Created page '{title}' with ID {created_page_id}")
+        PageOperations holds an API client with its own HTTP session, which
+        must not be shared between threads.
 
-                    # Update local_page with new page_id and context for confluence_url
-                    local_page.page_id = created_page_id
-                    local_page.title = title
-                    local_page.space_key = space_config.space_key
-                    local_page.confluence_base_url = self._get_confluence_base_url()
+        Args:
+            caller_page_ops: PageOperations to return on the calling thread
+                             (None creates one for it as well)
 
-                    # Generate updated content with new frontmatter
-                    updated_content = FrontmatterHandler.generate(local_page)
+        Returns:
+            Function returning the PageOperations of the thread calling it
+        """
+        caller = threading.get_ident()
+        worker_state = threading.local()
 
-                    # Add to files to update
-                    files_to_update.append((file_path, updated_content))
+        def thread_page_ops() -> PageOperations:
+            if caller_page_ops is not None and threading.get_ident() == caller:
+                return caller_page_ops
+            if not hasattr(worker_state, 'page_ops'):
+                worker_state.page_ops = PageOperations()
+            return worker_state.page_ops
 
-                except Exception as e:
-                    logger.error(f"Failed to create page '{title}': {e}")
-                    raise
+        return thread_page_ops
 
-            else:
-                # Page already exists - update it using surgical operations
-                logger.debug(f"Updating existing page (ID: {local_page.page_id})")
+    def _child_dir_key(self, file_path: str, space_config: SpaceConfig) -> str:
+        """Get the hierarchy key of the directory holding a page's children.
 
-                try:
-                    # BASELINE-CENTRIC DIFFING: Compare local against baseline, not remote
-                    # This ensures we're comparing markdown-to-markdown (same format)
-                    baseline_content = None
-                    if sync_config.get_baseline:
-                        baseline_content = sync_config.get_baseline(local_page.page_id)
-
-                    # Normalize content for comparison (strip whitespace)
-                    local_content_normalized = (local_page.content or "").strip()
-
-                    # Compare against baseline (not remote!)
-                    if baseline_content is not None:
-                        # Strip frontmatter from baseline for content comparison
-                        baseline_parsed = FrontmatterHandler.parse(file_path, baseline_content)
-                        baseline_content_normalized = (baseline_parsed.content or "").strip()
-
-                        # Check if local content differs from baseline
-                        if local_content_normalized != baseline_content_normalized:
-                            # Use ADF surgical update with baseline for accurate diffing
-                            result = page_ops.update_page_surgical_adf(
-                                page_id=local_page.page_id,
-                                new_markdown_content=local_page.content or "",
-                                baseline_markdown=baseline_parsed.content or "",
-                            )
-
-                            if result.success:
-                                # Log the page action (← = Confluence updated from local)
-                                self._log_page_action("←", file_path)
-                                logger.debug(
-                                    f"Updated page (ID: {local_page.page_id}) "
-                                    f"with {result.operations_applied} surgical operations"
-                                )
-                            else:
-                                logger.warning(f"Page update returned: {result.error}")
-                        else:
-                            # Log unchanged pages during force-push so user sees all files
-                            if sync_config.force_push:
-                                self._log_page_action("=", file_path)  # = means unchanged
-                            logger.debug(f"No changes for page {local_page.page_id} (baseline match) - skipping")
-                    else:
-                        # No baseline available - use full replacement
-                        logger.warning(f"No baseline for page {local_page.page_id} - using full replacement")
-                        result = page_ops.update_page_surgical_adf(
-                            page_id=local_page.page_id,
-                            new_markdown_content=local_page.content or "",
-                            baseline_markdown=None,  # Triggers full replacement
+        Args:
+            file_path: Path of the parent page's file
+            space_config: Space configuration
+
+        Returns:
+            Directory key relative to the space's local_path
+        """
+        filename = os.path.basename(file_path)
+        dir_name = filename[:-3] if filename.endswith('.md') else filename
+        rel_path = os.path.relpath(file_path, space_config.local_path)
+        parent_dir = os.path.dirname(rel_path)
+        return os.path.join(parent_dir, dir_name) if parent_dir and parent_dir != '.' else dir_name
+
+    def _push_local_page(
+        self,
+        page_ops: PageOperations,
+        file_path: str,
+        local_page: LocalPage,
+        parent_page_id: str,
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> Tuple[Optional[str], Optional[Tuple[str, str]]]:
+        """Create or update one local page in Confluence.
+
+        Runs on a worker thread of _push_hierarchy_to_confluence.
+
+        Args:
+            page_ops: PageOperations instance for creating/updating pages
+            file_path: Path of the local file
+            local_page: Parsed local page
+            parent_page_id: Parent page ID in Confluence
+            space_config: Space configuration
+            sync_config: Sync configuration with get_baseline callback
+
+        Returns:
+            Tuple of (page ID the page's children go under, or None to skip
+            them; (file_path, content) to write back, or None)
+        """
+        # Check for unresolved conflict markers during bidirectional sync only
+        # For force-push, user explicitly wants to overwrite - don't block
+        if not sync_config.force_push and self._has_conflict_markers(local_page.content or ""):
+            self._log_conflict_marker_error(file_path)
+            # Children still go under the existing page; without one they are skipped too
+            return local_page.page_id, None
+
+        # Derive title from content (H1 heading or filename)
+        title = self._derive_title_from_content(local_page.content, file_path)
+
+        # Check if page needs to be created (no page_id)
+        if not local_page.page_id:
+            logger.debug(f"Creating new page in Confluence: {title}")
+
+            # Create page in Confluence
+            try:
+                result = page_ops.create_page(
+                    space_key=space_config.space_key,
+                    title=title,
+                    markdown_content=local_page.content or "",
+                    parent_id=parent_page_id
+                )
+
+                # Handle duplicate title (create_page returns success=False
+                # with the existing page's ID - do NOT use that ID)
+                if not result.success and 'already exists' in (result.error or '').lower():
+                    filename = os.path.basename(file_path)
+                    fallback_title = filename[:-3] if filename.endswith('.md') else filename
+                    logger.warning(
+                        f"Page '{title}' already exists under same parent "
+                        f"- retrying with filename-based title '{fallback_title}'"
+                    )
+                    result = page_ops.create_page(
+                        space_key=space_config.space_key,
+                        title=fallback_title,
+                        markdown_content=local_page.content or "",
+                        parent_id=parent_page_id
+                    )
+                    if not result.success:
+                        raise RuntimeError(
+                            f"Failed to create page with fallback title '{fallback_title}': {result.error}"
                         )
+                    title = fallback_title
 
-                        if result.success:
-                            self._log_page_action("←", file_path)
-                            logger.debug(f"Updated page (ID: {local_page.page_id}) via full replacement")
-                        else:
-                            logger.warning(f"Page update returned: {result.error}")
+                created_page_id = result.page_id
 
-                    # Ensure local_page has context for confluence_url generation
-                    if not local_page.space_key:
-                        local_page.space_key = space_config.space_key
-                    if not local_page.confluence_base_url:
-                        local_page.confluence_base_url = self._get_confluence_base_url()
+                # Log the page action (← = Confluence updated from local)
+                self._log_page_action("←", file_path)
+                logger.debug(f"Created page '{title}' with ID {created_page_id}")
 
-                    # Generate updated content with new frontmatter
-                    updated_content = FrontmatterHandler.generate(local_page)
+                # Update local_page with new page_id and context for confluence_url
+                local_page.page_id = created_page_id
+                local_page.title = title
+                local_page.space_key = space_config.space_key
+                local_page.confluence_base_url = self._get_confluence_base_url()
 
-                    # Add to files to update
-                    files_to_update.append((file_path, updated_content))
+                # Generate updated content with new frontmatter
+                updated_content = FrontmatterHandler.generate(local_page)
+                return created_page_id, (file_path, updated_content)
 
-                except Exception as e:
-                    logger.error(f"Failed to update page (ID: {local_page.page_id}): {e}")
-                    raise
+            except Exception as e:
+                logger.error(f"Failed to create page '{title}': {e}")
+                raise
 
-                created_page_id = local_page.page_id
+        # Page already exists - update it using surgical operations
+        logger.debug(f"Updating existing page (ID: {local_page.page_id})")
 
-            # Process children (subdirectory with same name as file without .md)
-            filename = os.path.basename(file_path)
-            dir_name = filename[:-3] if filename.endswith('.md') else filename
-            rel_path = os.path.relpath(file_path, space_config.local_path)
-            parent_dir = os.path.dirname(rel_path)
-            child_dir_key = os.path.join(parent_dir, dir_name) if parent_dir and parent_dir != '.' else dir_name
+        try:
+            # BASELINE-CENTRIC DIFFING: Compare local against baseline, not remote
+            # This ensures we're comparing markdown-to-markdown (same format)
+            baseline_content = None
+            if sync_config.get_baseline:
+                baseline_content = sync_config.get_baseline(local_page.page_id)
 
-            # Recursively push children
-            self._push_hierarchy_to_confluence(
-                hierarchy=hierarchy,
-                page_ops=page_ops,
-                space_config=space_config,
-                sync_config=sync_config,
-                files_to_update=files_to_update,
-                parent_page_id=created_page_id,
-                current_dir=child_dir_key,
-                depth=depth + 1
-            )
+            # Normalize content for comparison (strip whitespace)
+            local_content_normalized = (local_page.content or "").strip()
+
+            # Compare against baseline (not remote!)
+            if baseline_content is not None:
+                # Strip frontmatter from baseline for content comparison
+                baseline_parsed = FrontmatterHandler.parse(file_path, baseline_content)
+                baseline_content_normalized = (baseline_parsed.content or "").strip()
+
+                # Check if local content differs from baseline
+                if local_content_normalized != baseline_content_normalized:
+                    # Use ADF surgical update with baseline for accurate diffing
+                    result = page_ops.update_page_surgical_adf(
+                        page_id=local_page.page_id,
+                        new_markdown_content=local_page.content or "",
+                        baseline_markdown=baseline_parsed.content or "",
+                    )
+
+                    if result.success:
+                        # Log the page action (← = Confluence updated from local)
+                        self._log_page_action("←", file_path)
+                        logger.debug(
+                            f"Updated page (ID: {local_page.page_id}) "
+                            f"with {result.operations_applied} surgical operations"
+                        )
+                    else:
+                        logger.warning(f"Page update returned: {result.error}")
+                else:
+                    # Log unchanged pages during force-push so user sees all files
+                    if sync_config.force_push:
+                        self._log_page_action("=", file_path)  # = means unchanged
+                    logger.debug(f"No changes for page {local_page.page_id} (baseline match) - skipping")
+            else:
+                # No baseline available - use full replacement
+                logger.warning(f"No baseline for page {local_page.page_id} - using full replacement")
+                result = page_ops.update_page_surgical_adf(
+                    page_id=local_page.page_id,
+                    new_markdown_content=local_page.content or "",
+                    baseline_markdown=None,  # Triggers full replacement
+                )
+
+                if result.success:
+                    self._log_page_action("←", file_path)
+                    logger.debug(f"Updated page (ID: {local_page.page_id}) via full replacement")
+                else:
+                    logger.warning(f"Page update returned: {result.error}")
+
+            # Ensure local_page has context for confluence_url generation
+            if not local_page.space_key:
+                local_page.space_key = space_config.space_key
+            if not local_page.confluence_base_url:
+                local_page.confluence_base_url = self._get_confluence_base_url()
+
+            # Generate updated content with new frontmatter
+            updated_content = FrontmatterHandler.generate(local_page)
+            return local_page.page_id, (file_path, updated_content)
+
+        except Exception as e:
+            logger.error(f"Failed to update page (ID: {local_page.page_id}): {e}")
+            raise
 
     def _bidirectional_sync(
         self,
@@ -961,14 +1476,13 @@ class FileMapper:
     ) -> "SyncResult":
         """Perform bidirectional sync comparing changes on both sides.
 
-        Uses hybrid change detection (mtime + baseline) to determine which
-        pages need to be synced:
-        1. Filter local pages to only those actually modified
-        2. Filter remote pages to only those actually modified
-        3. Detect conflicts (modified on both sides) - exclude from auto-sync
-        4. Push non-conflicting modified local pages to Confluence
-        5. Pull non-conflicting modified remote pages to local
-        6. Return conflict info for resolution by CLI layer
+        Plans the sync with _plan_bidirectional, then applies the plan with
+        PlanExecutor (sync_config.concurrency workers):
+        - update actions push modified local pages to Confluence (one batch
+          per wave; _update_modified_pages runs its own worker pool)
+        - pull actions write modified remote pages to local files
+        - merge actions (modified on both sides) are returned as conflict
+          info for resolution by the CLI layer
 
         Args:
             hierarchy: PageNode tree from Confluence
@@ -982,6 +1496,85 @@ class FileMapper:
         from .models import SyncResult
         logger.debug("Performing bidirectional sync")
 
+        plan = self._plan_bidirectional(hierarchy, local_pages, space_config, sync_config)
+
+        confluence_pages: Dict[str, PageNode] = {}
+        self._build_page_map(hierarchy, confluence_pages)
+
+        sync_result = SyncResult()
+        result_lock = threading.Lock()
+
+        def collect_conflicts(actions: List[PlannedAction]) -> None:
+            for action in actions:
+                conflict = self._build_conflict(confluence_pages[action.page_id], space_config)
+                with result_lock:
+                    sync_result.conflict_page_ids.append(action.page_id)
+                    sync_result.conflict_titles[action.page_id] = action.title
+                    sync_result.conflict_remote_content[action.page_id] = conflict
+                    if action.path:
+                        sync_result.conflict_local_paths[action.page_id] = action.path
+                logger.info(f"  → {action.title} (ID: {action.page_id})")
+
+        def push_updates(actions: List[PlannedAction]) -> None:
+            # Use direct update for existing pages (more efficient than hierarchy traversal)
+            self._update_modified_pages(
+                {action.path: local_pages[action.path] for action in actions},
+                space_config, self._worker_sync_config(sync_config)
+            )
+            with result_lock:
+                sync_result.pushed_count += len(actions)
+
+        def pull_pages(actions: List[PlannedAction]) -> None:
+            # Selective pull: only the modified pages
+            pulled = self._pull_from_confluence(
+                hierarchy, space_config, self._worker_sync_config(sync_config),
+                page_ids_to_pull={action.page_id for action in actions}
+            )
+            with result_lock:
+                sync_result.pulled_count += pulled
+
+        merges = plan.of_kind('merge')
+        if merges:
+            logger.info(f"Both sides modified: {len(merges)} page(s) - attempting auto-merge")
+
+        PlanExecutor(max_workers=sync_config.concurrency).execute(plan, {
+            'merge': collect_conflicts,
+            'update': push_updates,
+            'pull': pull_pages,
+        }, whole_batch_kinds={'update'})
+
+        logger.info(
+            f"Bidirectional sync completed: {sync_result.pushed_count} pushed, "
+            f"{sync_result.pulled_count} pulled, {len(sync_result.conflict_page_ids)} conflicts"
+        )
+        return sync_result
+
+    def _plan_bidirectional(
+        self,
+        hierarchy: PageNode,
+        local_pages: Dict[str, LocalPage],
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> SyncPlan:
+        """Plan a bidirectional sync of one space.
+
+        Uses hybrid change detection (mtime + baseline) to determine which
+        pages need to be synced:
+        1. Filter local pages to only those actually modified
+        2. Filter remote pages to only those actually modified
+        3. Pages modified on both sides become merge actions
+        4. Other modified local pages become update actions
+        5. Other modified remote pages become pull actions
+
+        Args:
+            hierarchy: PageNode tree from Confluence
+            local_pages: Dictionary of local pages by file path
+            space_config: Space configuration
+            sync_config: Overall sync configuration
+
+        Returns:
+            SyncPlan for the space
+        """
         # Build a map of page_id to PageNode for easier lookup
         confluence_pages: Dict[str, PageNode] = {}
         self._build_page_map(hierarchy, confluence_pages)
@@ -994,8 +1587,19 @@ class FileMapper:
         # Step 1: Filter local pages to only those actually modified
         modified_local_pages: Dict[str, LocalPage] = {}
         for path, page in local_pages.items():
-            if self._is_locally_modified(path, page, sync_config):
-                modified_local_pages[path] = page
+            if self._is_already_applied(page.page_id, sync_config, local_page=page):
+                logger.debug(f"Already applied by interrupted sync: {path}")
+                continue
+            try:
+                if not self._is_locally_modified(path, page, sync_config):
+                    continue
+                # Read now: a file that became unreadable since the scan is
+                # left out of this sync instead of failing it (or being pushed empty)
+                _ = page.content
+            except FilesystemError as e:
+                logger.warning(f"Skipping unreadable local file: {e}")
+                continue
+            modified_local_pages[path] = page
 
         logger.debug(
             f"Change detection: {len(modified_local_pages)}/{len(local_pages)} "
@@ -1006,6 +1610,9 @@ class FileMapper:
         modified_remote_pages: List[PageNode] = []
         all_remote_pages = list(confluence_pages.values())
         for page_node in all_remote_pages:
+            if self._is_already_applied(page_node.page_id, sync_config, version=page_node.version):
+                logger.debug(f"Already applied by interrupted sync: {page_node.title}")
+                continue
             if self._is_remotely_modified(page_node, sync_config):
                 modified_remote_pages.append(page_node)
 
@@ -1022,78 +1629,166 @@ class FileMapper:
         remote_modified_ids = {page.page_id for page in modified_remote_pages}
         conflict_ids = local_modified_ids & remote_modified_ids
 
-        # Build sync result to return conflict information
-        sync_result = SyncResult()
-
-        if conflict_ids:
-            logger.info(
-                f"Both sides modified: {len(conflict_ids)} page(s) - attempting auto-merge"
-            )
-            # Collect conflict data for resolution by CLI layer
-            for page_id in conflict_ids:
-                page_node = confluence_pages.get(page_id)
-                if page_node:
-                    sync_result.conflict_page_ids.append(page_id)
-                    sync_result.conflict_titles[page_id] = page_node.title
-
-                    # Build remote content WITH frontmatter to match local/baseline format
-                    # This is critical for 3-way merge to work correctly
-                    markdown_content = page_node.markdown_content or ""
-                    if markdown_content.strip().startswith("# "):
-                        content = markdown_content
-                    else:
-                        content = f"# {page_node.title}\n\n{markdown_content}".strip() + "\n"
-
-                    remote_local_page = LocalPage(
-                        file_path="",  # Not used for content generation
-                        page_id=page_id,
-                        content=content,
-                        space_key=page_node.space_key,
-                        confluence_base_url=self._get_confluence_base_url()
-                    )
-                    sync_result.conflict_remote_content[page_id] = FrontmatterHandler.generate(remote_local_page)
-
-                    # Find local path for this page_id
-                    for path, local_page in local_pages.items():
-                        if local_page.page_id == page_id:
-                            sync_result.conflict_local_paths[page_id] = path
-                            break
-                    logger.info(f"  → {page_node.title} (ID: {page_id})")
+        plan = SyncPlan()
+        space_key = space_config.space_key
+        local_path_by_id = {
+            page.page_id: path for path, page in local_pages.items() if page.page_id
+        }
+        for page_node in modified_remote_pages:
+            if page_node.page_id in conflict_ids:
+                plan.add(PlannedAction(
+                    action_id=f"merge:{page_node.page_id}", kind='merge', space_key=space_key,
+                    page_id=page_node.page_id, path=local_path_by_id.get(page_node.page_id),
+                    title=page_node.title
+                ))
 
         # Step 4: Push modified local pages to Confluence (excluding conflicts)
-        non_conflict_local = {
-            path: page for path, page in modified_local_pages.items()
-            if page.page_id not in conflict_ids
-        }
-        if non_conflict_local:
-            logger.debug(f"Pushing {len(non_conflict_local)} modified local page(s) to Confluence")
-            # Use direct update for existing pages (more efficient than hierarchy traversal)
-            self._update_modified_pages(non_conflict_local, space_config, sync_config)
-            sync_result.pushed_count = len(non_conflict_local)
-        else:
-            logger.debug("No local pages to push (excluding conflicts)")
+        for path, page in modified_local_pages.items():
+            if not page.page_id:
+                # New pages are only created by a push-direction sync
+                logger.warning(f"Skipping new page without page_id: {path}")
+                continue
+            if page.page_id in conflict_ids:
+                continue
+            plan.add(PlannedAction(
+                action_id=f"update:{page.page_id}", kind='update', space_key=space_key,
+                page_id=page.page_id, path=path,
+                title=self._derive_title_from_content(page.content, path)
+            ))
 
         # Step 5: Pull modified remote pages to local (excluding conflicts)
-        non_conflict_remote = [
-            page for page in modified_remote_pages
-            if page.page_id not in conflict_ids
-        ]
-        if non_conflict_remote:
-            logger.debug(f"Pulling {len(non_conflict_remote)} modified remote page(s) to local")
-            # Build set of page IDs to selectively pull (only modified pages)
-            page_ids_to_pull = {page.page_id for page in non_conflict_remote}
-            sync_result.pulled_count = self._pull_from_confluence(
-                hierarchy, space_config, sync_config,
-                page_ids_to_pull=page_ids_to_pull
-            )
+        page_ids_to_pull = {
+            page.page_id for page in modified_remote_pages if page.page_id not in conflict_ids
+        }
+        if page_ids_to_pull:
+            plan.extend(self._plan_pull(hierarchy, space_config, page_ids_to_pull))
+
+        return plan
+
+    def _plan_pull(
+        self,
+        hierarchy: PageNode,
+        space_config: SpaceConfig,
+        page_ids_to_pull: Set[str]
+    ) -> SyncPlan:
+        """Plan pull actions with the file paths _pull_from_confluence writes.
+
+        Args:
+            hierarchy: PageNode tree from Confluence
+            space_config: Space configuration
+            page_ids_to_pull: Page IDs to pull
+
+        Returns:
+            SyncPlan with one pull action per page, in hierarchy order
+        """
+        plan = SyncPlan()
+        # Iterative walk mirroring _build_file_list_from_hierarchy's paths
+        stack = [(hierarchy, space_config.local_path)]
+        while stack:
+            node, parent_path = stack.pop()
+            filename = FilesafeConverter.title_to_filename(node.title)
+            child_dir = parent_path
+            if node.page_id in page_ids_to_pull:
+                plan.add(PlannedAction(
+                    action_id=f"pull:{node.page_id}", kind='pull',
+                    space_key=node.space_key or space_config.space_key,
+                    page_id=node.page_id, path=os.path.join(parent_path, filename),
+                    title=node.title
+                ))
+                dir_name = filename[:-3] if filename.endswith('.md') else filename
+                child_dir = os.path.join(parent_path, dir_name)
+            stack.extend((child, child_dir) for child in reversed(node.children))
+        return plan
+
+    def _plan_push(
+        self,
+        local_pages: Dict[str, LocalPage],
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> SyncPlan:
+        """Plan a push-direction sync (first push or --force-push).
+
+        Pages without a page_id are created, others updated. A page depends on
+        the page of its parent directory (docs/a/b.md on docs/a.md), so parents
+        are handled before their children.
+
+        Args:
+            local_pages: Dictionary of local pages by file path
+            space_config: Space configuration
+            sync_config: Overall sync configuration (force_push)
+
+        Returns:
+            SyncPlan for the space
+        """
+        plan = SyncPlan()
+        action_ids: Dict[str, str] = {}
+        for path in sorted(local_pages):
+            page = local_pages[path]
+            try:
+                content = page.content
+            except FilesystemError as e:
+                logger.warning(f"Skipping unreadable local file: {e}")
+                continue
+            if not sync_config.force_push and self._has_conflict_markers(content or ""):
+                continue
+            kind = 'update' if page.page_id else 'create'
+            action_id = f"{kind}:{page.page_id or path}"
+            parent_file = os.path.dirname(path) + '.md'
+            plan.add(PlannedAction(
+                action_id=action_id, kind=kind, space_key=space_config.space_key,
+                page_id=page.page_id, path=path,
+                title=self._derive_title_from_content(content, path),
+                depends_on=[action_ids[parent_file]] if parent_file in action_ids else []
+            ))
+            action_ids[path] = action_id
+        return plan
+
+    def _build_conflict(self, page_node: PageNode, space_config: SpaceConfig) -> str:
+        """Build the remote side of a conflict for the 3-way merge.
+
+        Args:
+            page_node: Remote page
+            space_config: Space configuration
+
+        Returns:
+            Remote content WITH frontmatter, matching the local/baseline format
+        """
+        # This is critical for 3-way merge to work correctly
+        markdown_content = page_node.markdown_content or ""
+        if markdown_content.strip().startswith("# "):
+            content = markdown_content
         else:
-            logger.debug("No remote pages to pull (excluding conflicts)")
+            content = f"# {page_node.title}\n\n{markdown_content}".strip() + "\n"
+
+        remote_local_page = LocalPage(
+            file_path="",  # Not used for content generation
+            page_id=page_node.page_id,
+            content=content,
+            space_key=page_node.space_key or space_config.space_key,
+            confluence_base_url=self._get_confluence_base_url()
+        )
+        return FrontmatterHandler.generate(remote_local_page)
 
-        logger.info(
-            f"Bidirectional sync completed: {sync_result.pushed_count} pushed, "
-            f"{sync_result.pulled_count} pulled, {len(sync_result.conflict_page_ids)} conflicts"
+    def _worker_sync_config(self, sync_config: SyncConfig) -> SyncConfig:
+        """Get the sync config a plan batch handler should use.
+
+        _write_files_atomic removes its temp directory when it finishes, so
+        batches running concurrently each stage files in their own
+        subdirectory of temp_dir.
+
+        Args:
+            sync_config: Overall sync configuration
+
+        Returns:
+            sync_config itself when running sequentially, otherwise a copy
+            with a per-thread temp_dir
+        """
+        if sync_config.concurrency <= 1:
+            return sync_config
+        return replace(
+            sync_config,
+            temp_dir=os.path.join(sync_config.temp_dir, f"worker-{threading.get_ident()}")
         )
-        return sync_result
 
     def _count_hierarchy_pages(self, node: PageNode) -> int:
         """Count total pages in a hierarchy tree.
@@ -1155,6 +1850,33 @@ class FileMapper:
         for child in node.children:
             self._build_page_map(child, page_map)
 
+    def push_modified_pages(
+        self,
+        local_pages: Dict[str, LocalPage],
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> None:
+        """Push locally modified pages that already exist in Confluence.
+
+        Entry point to the update path of a bidirectional sync for callers
+        that know which files changed (e.g. watch mode): each page is diffed
+        against its baseline (sync_config.get_baseline) and updated
+        surgically, sync_config.on_page_synced is called for every pushed
+        page, and the regenerated frontmatter is written back. The caller is
+        responsible for making sure the pages did not change in Confluence
+        since their last sync.
+
+        Args:
+            local_pages: Dictionary mapping file_path to LocalPage objects
+            space_config: Space configuration of the pages
+            sync_config: Overall sync configuration
+
+        Raises:
+            Exception: The first error raised while updating a page
+        """
+        self._base_path = str(space_config.local_path)
+        self._update_modified_pages(local_pages, space_config, sync_config)
+
     def _update_modified_pages(
         self,
         local_pages: Dict[str, LocalPage],
@@ -1168,10 +1890,22 @@ class FileMapper:
         _push_to_confluence which handles hierarchy creation, this method
         directly updates existing pages by their page_id.
 
+        Pages are pushed by up to sync_config.concurrency workers, each with
+        its own PageOperations; API requests of all workers share the
+        process-wide rate limiter. With sync_config.push_pipeline_depth set,
+        pages go through PushPipeline instead, so ADF fetches of later pages
+        overlap the diffing of earlier ones. A failed page is logged and does
+        not stop the others. Frontmatter of the pushed pages is written back
+        in one atomic batch at the end, after which the first failure is
+        re-raised.
+
         Args:
             local_pages: Dictionary mapping file_path to LocalPage objects
             space_config: Space configuration
             sync_config: Overall sync configuration
+
+        Raises:
+            Exception: The first error raised while updating a page
         """
         logger.debug(f"Updating {len(local_pages)} modified page(s) in Confluence")
 
@@ -1179,9 +1913,7 @@ class FileMapper:
             logger.debug("No pages to update")
             return
 
-        page_ops = PageOperations()
-        files_to_update: List[Tuple[str, str]] = []
-        updated_count = 0
+        to_push: List[Tuple[str, LocalPage]] = []
         skipped_count = 0
 
         for file_path, local_page in local_pages.items():
@@ -1197,86 +1929,264 @@ class FileMapper:
                 skipped_count += 1
                 continue
 
-            try:
-                # BASELINE-CENTRIC DIFFING: Compare local against baseline, not remote
-                # This ensures we're comparing markdown-to-markdown (same format)
-                baseline_content = None
-                if sync_config.get_baseline:
-                    baseline_content = sync_config.get_baseline(local_page.page_id)
+            to_push.append((file_path, local_page))
 
-                # Normalize content for comparison (strip whitespace)
-                local_content_normalized = (local_page.content or "").strip()
+        thread_page_ops = self._per_thread_page_ops()
 
-                # Compare against baseline (not remote!)
-                if baseline_content is not None:
-                    # Strip frontmatter from baseline for content comparison
-                    baseline_parsed = FrontmatterHandler.parse(file_path, baseline_content)
-                    baseline_content_normalized = (baseline_parsed.content or "").strip()
-
-                    # Check if local content differs from baseline
-                    if local_content_normalized != baseline_content_normalized:
-                        # Use ADF surgical update with baseline for accurate diffing
-                        result = page_ops.update_page_surgical_adf(
-                            page_id=local_page.page_id,
-                            new_markdown_content=local_page.content or "",
-                            baseline_markdown=baseline_parsed.content or "",
-                        )
-
-                        if result.success:
-                            # Log the page action (← = Confluence updated from local)
-                            self._log_page_action("←", file_path)
-                            logger.debug(
-                                f"Updated page (ID: {local_page.page_id}) "
-                                f"with {result.operations_applied} surgical operations"
-                            )
-                            updated_count += 1
-                        else:
-                            logger.warning(f"Page update returned: {result.error}")
-                    else:
-                        # Content matches baseline - skip update
-                        logger.debug(f"No changes for page {local_page.page_id} (baseline match) - skipping")
-                        skipped_count += 1
-                        continue  # Skip to next page without updating local file
-                else:
-                    # No baseline available - use full replacement
-                    logger.warning(f"No baseline for page {local_page.page_id} - using full replacement")
-                    result = page_ops.update_page_surgical_adf(
-                        page_id=local_page.page_id,
-                        new_markdown_content=local_page.content or "",
-                        baseline_markdown=None,  # Triggers full replacement
-                    )
+        def push(item: Tuple[str, LocalPage]) -> Tuple[bool, Optional[str]]:
+            return self._update_modified_page(
+                thread_page_ops(), item[0], item[1], space_config, sync_config
+            )
 
-                    if result.success:
-                        self._log_page_action("←", file_path)
-                        logger.debug(f"Updated page (ID: {local_page.page_id}) via full replacement")
-                        updated_count += 1
-                    else:
-                        logger.warning(f"Page update returned: {result.error}")
+        if sync_config.push_pipeline_depth:
+            outcomes = self._update_modified_pages_pipelined(
+                to_push, thread_page_ops, space_config, sync_config
+            )
+        else:
+            outcomes = map_ordered(push, to_push, max_workers=sync_config.concurrency)
 
-                # Ensure local_page has context for confluence_url generation
-                if not local_page.space_key:
-                    local_page.space_key = space_config.space_key
-                if not local_page.confluence_base_url:
-                    local_page.confluence_base_url = self._get_confluence_base_url()
+        files_to_update: List[Tuple[str, str]] = []
+        updated_count = 0
+        first_error: Optional[Exception] = None
 
-                # Generate updated content with frontmatter for local file
-                updated_content = FrontmatterHandler.generate(local_page)
-                files_to_update.append((file_path, updated_content))
+        for (file_path, local_page), outcome, error in outcomes:
+            if error is not None:
+                logger.error(f"Failed to update page (ID: {local_page.page_id}): {error}")
+                if first_error is None:
+                    first_error = error
+                continue
 
-            except Exception as e:
-                logger.error(f"Failed to update page (ID: {local_page.page_id}): {e}")
-                raise
+            updated, updated_content = outcome
+            if updated_content is None:
+                skipped_count += 1
+                continue
+            if updated:
+                updated_count += 1
+            files_to_update.append((file_path, updated_content))
 
         # Write updated frontmatter back to local files atomically
         if files_to_update:
             logger.debug(f"Updating {len(files_to_update)} local file(s) with page IDs")
             self._write_files_atomic(
                 files_to_write=files_to_update,
-                temp_dir=sync_config.temp_dir
+                temp_dir=sync_config.temp_dir,
+                workspace=sync_config.workspace
             )
 
+        if first_error is not None:
+            raise first_error
+
         logger.debug(f"Successfully updated {updated_count} page(s), skipped {skipped_count}")
 
+    def _update_modified_pages_pipelined(
+        self,
+        to_push: List[Tuple[str, LocalPage]],
+        thread_page_ops: Callable[[], PageOperations],
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> List[Tuple[Tuple[str, LocalPage], Optional[Tuple[bool, Optional[str]]], Optional[Exception]]]:
+        """Push modified pages through a fetch/prepare/upload pipeline.
+
+        The stages split _update_modified_page: the baseline lookup and ADF
+        fetch run on the pipeline's fetch threads, parsing and diffing
+        (PageOperations.prepare_surgical_adf_update) on the calling thread,
+        and uploads on sync_config.concurrency upload threads. A version
+        conflict on upload is retried by update_page_surgical_adf from a
+        fresh fetch. Queue occupancy is added to push_pipeline_stats.
+
+        Args:
+            to_push: (file_path, local_page) pairs to push
+            thread_page_ops: Returns the calling thread's PageOperations
+            space_config: Space configuration
+            sync_config: Overall sync configuration
+
+        Returns:
+            (item, (updated, content to write back), error) tuples in input
+            order, as map_ordered returns them for _update_modified_page
+        """
+        def fetch(item: Tuple[str, LocalPage]) -> Optional[Tuple[Optional[str], Any]]:
+            file_path, local_page = item
+            changed, baseline_markdown = self._push_baseline(file_path, local_page, sync_config)
+            if not changed:
+                return None
+            return baseline_markdown, thread_page_ops().fetch_page_adf(local_page.page_id)
+
+        def prepare(
+            item: Tuple[str, LocalPage],
+            fetched: Optional[Tuple[Optional[str], Any]]
+        ) -> Optional[Tuple[Optional[str], Any]]:
+            if fetched is None:
+                return None
+            baseline_markdown, adf_response = fetched
+            if isinstance(adf_response, AdfUpdateResult):
+                return fetched  # Page not found
+            return baseline_markdown, thread_page_ops().prepare_surgical_adf_update(
+                item[1].page_id, adf_response, item[1].content or "", baseline_markdown
+            )
+
+        def upload(
+            item: Tuple[str, LocalPage],
+            prepared: Optional[Tuple[Optional[str], Any]]
+        ) -> Tuple[bool, Optional[str]]:
+            if prepared is None:
+                return False, None
+            file_path, local_page = item
+            baseline_markdown, update = prepared
+            if isinstance(update, AdfUpdateResult):
+                result = update
+            else:
+                result = thread_page_ops().update_page_surgical_adf(
+                    page_id=local_page.page_id,
+                    new_markdown_content=local_page.content or "",
+                    baseline_markdown=baseline_markdown,
+                    prepared=update,
+                )
+            return self._finish_modified_page(
+                file_path, local_page, result, baseline_markdown is not None,
+                space_config, sync_config
+            )
+
+        pipeline = PushPipeline(
+            depth=sync_config.push_pipeline_depth, upload_workers=sync_config.concurrency
+        )
+        outcomes = pipeline.run(to_push, fetch=fetch, prepare=prepare, upload=upload)
+        with self._stats_lock:
+            self.push_pipeline_stats.merge(pipeline.stats)
+        return outcomes
+
+    def _update_modified_page(
+        self,
+        page_ops: PageOperations,
+        file_path: str,
+        local_page: LocalPage,
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> Tuple[bool, Optional[str]]:
+        """Push one locally modified page to Confluence.
+
+        Runs on a worker thread of _update_modified_pages.
+
+        Args:
+            page_ops: PageOperations owned by the calling thread
+            file_path: Path of the local file
+            local_page: Local page with page_id and content
+            space_config: Space configuration
+            sync_config: Overall sync configuration
+
+        Returns:
+            Tuple of (whether Confluence was updated, file content with
+            regenerated frontmatter to write back; None if the page matched
+            its baseline and was skipped)
+        """
+        changed, baseline_markdown = self._push_baseline(file_path, local_page, sync_config)
+        if not changed:
+            return False, None
+
+        # Surgical update against the baseline, or full replacement (baseline None)
+        result = page_ops.update_page_surgical_adf(
+            page_id=local_page.page_id,
+            new_markdown_content=local_page.content or "",
+            baseline_markdown=baseline_markdown,
+        )
+        return self._finish_modified_page(
+            file_path, local_page, result, baseline_markdown is not None,
+            space_config, sync_config
+        )
+
+    def _push_baseline(
+        self,
+        file_path: str,
+        local_page: LocalPage,
+        sync_config: SyncConfig
+    ) -> Tuple[bool, Optional[str]]:
+        """Decide how a locally modified page is pushed.
+
+        BASELINE-CENTRIC DIFFING: local content is compared against the
+        baseline, not the remote page, so the comparison is
+        markdown-to-markdown (same format).
+
+        Args:
+            file_path: Path of the local file
+            local_page: Local page with page_id and content
+            sync_config: Sync configuration with get_baseline callback
+
+        Returns:
+            Tuple of (whether the page needs pushing, baseline markdown for
+            the surgical diff; None means full replacement)
+        """
+        baseline_content = None
+        if sync_config.get_baseline:
+            baseline_content = sync_config.get_baseline(local_page.page_id)
+
+        if baseline_content is None:
+            # No baseline available - use full replacement
+            logger.warning(f"No baseline for page {local_page.page_id} - using full replacement")
+            return True, None
+
+        # Strip frontmatter from baseline for content comparison
+        baseline_parsed = FrontmatterHandler.parse(file_path, baseline_content)
+
+        # Normalize content for comparison (strip whitespace)
+        if (local_page.content or "").strip() == (baseline_parsed.content or "").strip():
+            # Content matches baseline - skip update
+            logger.debug(f"No changes for page {local_page.page_id} (baseline match) - skipping")
+            return False, None
+
+        return True, baseline_parsed.content or ""
+
+    def _finish_modified_page(
+        self,
+        file_path: str,
+        local_page: LocalPage,
+        result: AdfUpdateResult,
+        surgical: bool,
+        space_config: SpaceConfig,
+        sync_config: SyncConfig
+    ) -> Tuple[bool, Optional[str]]:
+        """Record the outcome of a page update and build its write-back content.
+
+        Args:
+            file_path: Path of the local file
+            local_page: Local page that was pushed
+            result: Result of update_page_surgical_adf
+            surgical: False if the update was a full replacement
+            space_config: Space configuration
+            sync_config: Sync configuration with on_page_synced callback
+
+        Returns:
+            Tuple of (whether Confluence was updated, file content with
+            regenerated frontmatter to write back)
+        """
+        if result.success:
+            # Log the page action (← = Confluence updated from local)
+            self._log_page_action("←", file_path)
+            if surgical:
+                logger.debug(
+                    f"Updated page (ID: {local_page.page_id}) "
+                    f"with {result.operations_applied} surgical operations"
+                )
+            else:
+                logger.debug(f"Updated page (ID: {local_page.page_id}) via full replacement")
+        else:
+            logger.warning(f"Page update returned: {result.error}")
+
+        # Ensure local_page has context for confluence_url generation
+        if not local_page.space_key:
+            local_page.space_key = space_config.space_key
+        if not local_page.confluence_base_url:
+            local_page.confluence_base_url = self._get_confluence_base_url()
+
+        # Generate updated content with frontmatter for local file
+        updated_content = FrontmatterHandler.generate(local_page)
+
+        if result.success:
+            self._notify_page_synced(
+                sync_config, local_page.page_id, file_path, "push",
+                updated_content, version=result.new_version
+            )
+
+        return result.success, updated_content
+
     def _is_locally_modified(
         self,
         file_path: str,
@@ -1286,7 +2196,8 @@ class FileMapper:
         """Check if a local file has been modified since last sync.
 
         Uses hybrid approach for change detection:
-        1. mtime check (fast filter): Skip if file mtime < last_synced
+        1. fast filter: with git change detection, skip files git doesn't
+           report as changed; otherwise skip if file mtime < last_synced
         2. baseline check (confirmation): Compare content to baseline
 
         Args:
@@ -1296,14 +2207,24 @@ class FileMapper:
 
         Returns:
             True if file is modified (should be pushed), False otherwise
+
+        Raises:
+            FilesystemError: If the file can no longer be read
         """
         # New pages (no page_id) are always considered "modified" (need to be created)
         if not local_page.page_id:
             logger.debug(f"New local page (no page_id): {file_path}")
             return True
 
-        # Step 1: mtime check (fast filter)
-        if sync_config.last_synced:
+        # Step 1a: git candidate check (fast filter, replaces the mtime check)
+        if sync_config.locally_changed_paths is not None:
+            if os.path.realpath(file_path) not in sync_config.locally_changed_paths:
+                logger.debug(f"File unchanged (git check): {file_path}")
+                return False
+            logger.debug(f"File potentially modified (git check): {file_path}")
+
+        # Step 1b: mtime check (fast filter)
+        elif sync_config.last_synced:
             try:
                 file_mtime = os.path.getmtime(file_path)
                 # Parse ISO 8601 timestamp to Unix timestamp
@@ -1343,6 +2264,9 @@ class FileMapper:
                     # No baseline exists - treat as modified (first sync for this page)
                     logger.debug(f"No baseline found for page {local_page.page_id}: {file_path}")
                     return True
+            except FilesystemError:
+                # Unreadable file: must not be treated as modified (pushed empty)
+                raise
             except Exception as e:
                 logger.warning(f"Baseline check failed for {file_path}: {e}, assuming modified")
                 return True
@@ -1447,14 +2371,57 @@ class FileMapper:
         logger.debug(f"Using filename as title: {title}")
         return title
 
-    def _read_local_files(self, local_path: str) -> Dict[str, LocalPage]:
+    def _iter_markdown_files(
+        self,
+        local_path: str,
+        workspace: Optional[WorkspaceIndex] = None
+    ):
+        """Yield paths of all .md files under local_path.
+
+        Uses the shared workspace index when available, otherwise walks the
+        directory tree.
+
+        Args:
+            local_path: Root directory to scan
+            workspace: Optional shared workspace index
+
+        Yields:
+            Markdown file paths (os.path.join(root, filename) form)
+        """
+        if workspace is not None:
+            for entry in workspace.files(local_path):
+                yield entry.path
+            return
+
+        for root, dirs, files in os.walk(local_path):
+            for filename in files:
+                if filename.endswith('.md'):
+                    yield os.path.join(root, filename)
+
+    def _read_local_files(
+        self,
+        local_path: str,
+        manifest: Optional[LocalFileManifest] = None,
+        workspace: Optional[WorkspaceIndex] = None,
+        max_workers: int = DEFAULT_READ_WORKERS
+    ) -> Dict[str, LocalPage]:
         """Read all markdown files from local directory.
 
         Recursively scans the directory for .md files and parses their
-        frontmatter to create LocalPage objects.
+        frontmatter to create LocalPage objects. Files are read and parsed on
+        a bounded thread pool; the result keeps the scan order.
+
+        With a manifest, files whose size, mtime_ns and inode are unchanged
+        are not read; they are returned as LazyLocalPage objects built from
+        the recorded metadata. The manifest is updated in memory (call
+        manifest.save() to persist it).
 
         Args:
             local_path: Root directory to scan
+            manifest: Optional local file manifest from a previous scan
+            workspace: Optional shared workspace index (avoids re-walking and
+                re-reading files other sync phases already scanned)
+            max_workers: Maximum number of files read concurrently
 
         Returns:
             Dictionary mapping file paths to LocalPage objects
@@ -1479,31 +2446,7 @@ class FileMapper:
 
         # Walk directory tree
         try:
-            for root, dirs, files in os.walk(local_path):
-                for filename in files:
-                    if filename.endswith('.md'):
-                        file_path = os.path.join(root, filename)
-                        try:
-                            # Validate path safety to prevent traversal attacks
-                            self._validate_path_safety(file_path, local_path)
-
-                            # Validate file size to prevent memory exhaustion (M1)
-                            self._validate_file_size(file_path)
-
-                            # Read file content
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-
-                            # Parse frontmatter
-                            local_page = FrontmatterHandler.parse(file_path, content)
-                            local_pages[file_path] = local_page
-
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to parse {file_path}: {e} - skipping"
-                            )
-                            # Continue processing other files
-
+            file_paths = list(self._iter_markdown_files(local_path, workspace))
         except PermissionError:
             raise FilesystemError(
                 local_path,
@@ -1517,13 +2460,144 @@ class FileMapper:
                 str(e)
             )
 
+        results = map_ordered(
+            lambda file_path: self._read_local_file(file_path, local_path, manifest, workspace),
+            file_paths,
+            max_workers
+        )
+        for file_path, local_page, error in results:
+            if error is not None:
+                logger.warning(
+                    f"Failed to parse {file_path}: {error} - skipping"
+                )
+                # Continue processing other files
+                continue
+            local_pages[file_path] = local_page
+
+        if manifest is not None:
+            manifest.retain(
+                os.path.relpath(file_path, local_path) for file_path in local_pages
+            )
+
         logger.debug(f"Found {len(local_pages)} local markdown file(s)")
         return local_pages
 
+    def _read_local_file(
+        self,
+        file_path: str,
+        local_path: str,
+        manifest: Optional[LocalFileManifest] = None,
+        workspace: Optional[WorkspaceIndex] = None
+    ) -> LocalPage:
+        """Validate, read and parse one local markdown file.
+
+        Called concurrently from _read_local_files.
+
+        Args:
+            file_path: Path to the markdown file
+            local_path: Root directory of the space
+            manifest: Optional local file manifest
+            workspace: Optional shared workspace index
+
+        Returns:
+            LocalPage for the file
+
+        Raises:
+            FilesystemError: If the path is unsafe or the file is too large
+            OSError: If the file cannot be read
+            FrontmatterError: If frontmatter is invalid
+        """
+        # Validate path safety to prevent traversal attacks
+        self._validate_path_safety(file_path, local_path)
+
+        # Validate file size to prevent memory exhaustion (M1)
+        self._validate_file_size(file_path)
+
+        if manifest is not None:
+            return self._read_local_file_incremental(
+                file_path, local_path, manifest, workspace
+            )
+
+        # Read file content
+        if workspace is not None:
+            content = workspace.read_text(file_path)
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+        # Parse frontmatter
+        return FrontmatterHandler.parse(file_path, content)
+
+    def _read_local_file_incremental(
+        self,
+        file_path: str,
+        local_path: str,
+        manifest: LocalFileManifest,
+        workspace: Optional[WorkspaceIndex] = None
+    ) -> LocalPage:
+        """Read one local file, reusing manifest metadata when possible.
+
+        - stat unchanged: return a LazyLocalPage (file is not opened)
+        - stat changed but content hash unchanged (e.g. touched file):
+          reuse recorded frontmatter metadata, skip the YAML parse
+        - otherwise: full read and frontmatter parse
+
+        Args:
+            file_path: Path to the markdown file
+            local_path: Root directory of the space (for manifest keys)
+            manifest: Local file manifest to consult and update
+            workspace: Optional shared workspace index (stat and content source)
+
+        Returns:
+            LocalPage for the file
+
+        Raises:
+            OSError: If the file cannot be read
+            FrontmatterError: If frontmatter is invalid
+        """
+        rel_path = os.path.relpath(file_path, local_path)
+        stat = workspace.get_stat(file_path) if workspace is not None else os.stat(file_path)
+
+        entry = manifest.lookup(rel_path, stat)
+        if entry is not None:
+            return LazyLocalPage(
+                file_path=file_path,
+                page_id=entry.page_id,
+                space_key=entry.space_key,
+                confluence_base_url=entry.confluence_base_url
+            )
+
+        if workspace is not None:
+            content = workspace.read_text(file_path)
+            sha256 = workspace.content_hash(file_path)
+        else:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            # Same newline translation as reading in text mode
+            content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            sha256 = hashlib.sha256(raw).hexdigest()
+
+        previous = manifest.lookup_content(rel_path, sha256)
+        if previous is not None:
+            match = FrontmatterHandler.FRONTMATTER_PATTERN.match(content)
+            local_page = LocalPage(
+                file_path=file_path,
+                page_id=previous.page_id,
+                content=content[match.end():] if match else content,
+                space_key=previous.space_key,
+                confluence_base_url=previous.confluence_base_url
+            )
+        else:
+            local_page = FrontmatterHandler.parse(file_path, content)
+
+        manifest.record(rel_path, stat, sha256, local_page)
+        return local_page
+
     def _write_files_atomic(
         self,
         files_to_write: List[Tuple[str, str]],
-        temp_dir: str
+        temp_dir: str,
+        workspace: Optional[WorkspaceIndex] = None
     ) -> None:
         """Write multiple files atomically using two-phase commit.
 
@@ -1537,6 +2611,8 @@ class FileMapper:
         Args:
             files_to_write: List of (file_path, content) tuples
             temp_dir: Temporary directory for staging files
+            workspace: Optional shared workspace index; written paths are
+                invalidated in it
 
         Raises:
             FilesystemError: If file operations fail
@@ -1601,6 +2677,8 @@ class FileMapper:
                     # Move file (atomic on most filesystems)
                     shutil.move(temp_file_path, final_file_path)
                     moved_files.append(final_file_path)
+                    if workspace is not None:
+                        workspace.invalidate(final_file_path)
 
             except Exception as e:
                 # Rollback: restore from temp if possible
@@ -14,8 +14,8 @@ Sync timestamps are tracked globally in state.yaml, not per-file.
 
 import re
 from typing import Optional, Tuple
-import yaml
 
+from . import yaml_codec
 from .errors import FrontmatterError
 from .models import LocalPage
 
@@ -53,6 +53,20 @@ class FrontmatterHandler:
     # Maximum allowed depth for YAML structures to prevent DoS attacks
     MAX_YAML_DEPTH = 10
 
+    # Bytes read from the start of a file when only the page_id is needed
+    PAGE_ID_SCAN_BYTES = 4096
+
+    # Fast path for get_page_id: a frontmatter line of the form "key: value"
+    # (unindented plain key, no complex YAML), matched without a YAML parse
+    SIMPLE_LINE_PATTERN = re.compile(r'^([A-Za-z_][\w.-]*):(?:[ \t]+(.*?))?[ \t]*$')
+
+    # Values the fast path doesn't interpret (flow collections, anchors, tags,
+    # block scalars, comments, nested mappings...); those fall back to YAML
+    UNSAFE_PLAIN_VALUE_PATTERN = re.compile(r'^[-?:,\[\]{}#&*!|>\'"%@`]|: |:$| #|\t')
+
+    # Characters PyYAML rejects; frontmatter containing them falls back to YAML
+    CONTROL_CHAR_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
     @classmethod
     def _validate_yaml_depth(cls, obj, current_depth: int = 0, max_depth: int = MAX_YAML_DEPTH) -> None:
         """Validate that YAML structure depth doesn't exceed maximum.
@@ -152,8 +166,8 @@ class FrontmatterHandler:
 
         # Parse YAML
         try:
-            frontmatter = yaml.safe_load(frontmatter_str)
-        except yaml.YAMLError as e:
+            frontmatter = yaml_codec.safe_load(frontmatter_str)
+        except yaml_codec.YAMLError as e:
             raise FrontmatterError(
                 file_path,
                 f"Invalid YAML syntax: {str(e)}"
@@ -229,12 +243,12 @@ class FrontmatterHandler:
             frontmatter_str = match.group(1)
             content_without_frontmatter = local_page.content[match.end():]
             try:
-                existing_frontmatter = yaml.safe_load(frontmatter_str) or {}
+                existing_frontmatter = yaml_codec.safe_load(frontmatter_str) or {}
                 if not isinstance(existing_frontmatter, dict):
                     existing_frontmatter = {}
                 # Validate YAML depth to prevent DoS attacks
                 cls._validate_yaml_depth(existing_frontmatter)
-            except (yaml.YAMLError, FrontmatterError):
+            except (yaml_codec.YAMLError, FrontmatterError):
                 existing_frontmatter = {}
 
         # Remove confluence_url field if present (we'll regenerate it)
@@ -265,7 +279,7 @@ class FrontmatterHandler:
             return content_without_frontmatter
 
         # Generate YAML
-        yaml_str = yaml.safe_dump(
+        yaml_str = yaml_codec.safe_dump(
             final_frontmatter,
             default_flow_style=False,
             allow_unicode=True,
@@ -300,8 +314,8 @@ class FrontmatterHandler:
 
         # Parse YAML
         try:
-            frontmatter = yaml.safe_load(frontmatter_str)
-        except yaml.YAMLError as e:
+            frontmatter = yaml_codec.safe_load(frontmatter_str)
+        except yaml_codec.YAMLError as e:
             raise FrontmatterError(
                 "<unknown>",
                 f"Invalid YAML syntax: {str(e)}"
@@ -319,17 +333,83 @@ class FrontmatterHandler:
         return frontmatter, markdown_content
 
     @classmethod
-    def get_page_id(cls, content: str) -> Optional[str]:
-        """Extract page_id from content frontmatter.
+    def _scan_simple_frontmatter(cls, frontmatter_str: str) -> Tuple[bool, Optional[str]]:
+        """Extract confluence_url from trivial frontmatter without a YAML parse.
+
+        Handles frontmatter made only of unindented "key: value" lines (plus
+        blank and comment lines) whose values are plain or simply quoted
+        scalars - the format generate() writes. Anything else is reported as
+        not handled so the caller can fall back to yaml.safe_load.
 
         Args:
-            content: Full markdown content including frontmatter
+            frontmatter_str: Text between the --- delimiters
 
         Returns:
-            Page ID string, or None if not found
+            Tuple of (handled, page_id). When handled is True, page_id is what
+            the full YAML parse would have produced.
+        """
+        if cls.CONTROL_CHAR_PATTERN.search(frontmatter_str):
+            return False, None
+
+        url = None
+        found_key = False
+        for line in frontmatter_str.split('\n'):
+            if not line.strip() or line.startswith('#'):
+                continue
+
+            match = cls.SIMPLE_LINE_PATTERN.match(line)
+            if not match:
+                return False, None
+            found_key = True
+
+            value = match.group(2) or ''
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                # Quoted scalar: only simple ones without escapes or inner quotes
+                value = value[1:-1]
+                if '\\' in value or '"' in value or "'" in value:
+                    return False, None
+            elif cls.UNSAFE_PLAIN_VALUE_PATTERN.search(value):
+                return False, None
+
+            # Duplicate keys: last one wins, as with yaml.safe_load
+            if match.group(1) == 'confluence_url':
+                url = value
+
+        if not found_key:
+            return False, None
+
+        if not url:
+            return True, None
+        _, page_id = cls.parse_confluence_url(url)
+        return True, page_id
+
+    @classmethod
+    def get_page_id_from_frontmatter(cls, frontmatter_str: str) -> Optional[str]:
+        """Extract page_id from the text between the --- delimiters.
+
+        Simple frontmatter is scanned line by line; yaml.safe_load (with the
+        MAX_YAML_DEPTH check) is only used when the frontmatter is non-trivial.
+
+        Args:
+            frontmatter_str: Frontmatter text without the --- delimiters
+
+        Returns:
+            Page ID string, or None if not found or frontmatter is invalid
         """
+        handled, page_id = cls._scan_simple_frontmatter(frontmatter_str)
+        if handled:
+            return page_id
+
         try:
-            frontmatter, _ = cls.extract_frontmatter_and_content(content)
+            frontmatter = yaml_codec.safe_load(frontmatter_str)
+        except yaml_codec.YAMLError:
+            return None
+
+        if not isinstance(frontmatter, dict):
+            return None
+
+        try:
+            cls._validate_yaml_depth(frontmatter)
         except FrontmatterError:
             return None
 
@@ -340,3 +420,20 @@ class FrontmatterHandler:
                 return page_id
 
         return None
+
+    @classmethod
+    def get_page_id(cls, content: str) -> Optional[str]:
+        """Extract page_id from content frontmatter.
+
+        Args:
+            content: Full markdown content including frontmatter. A prefix of
+                the file is enough as long as it contains the closing ---.
+
+        Returns:
+            Page ID string, or None if not found
+        """
+        match = cls.FRONTMATTER_PATTERN.match(content)
+        if not match:
+            return None
+
+        return cls.get_page_id_from_frontmatter(match.group(1))
@@ -7,7 +7,7 @@ relationships.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
 from ..confluence_client.api_wrapper import APIWrapper
 from ..confluence_client.auth import Authenticator
@@ -18,11 +18,16 @@ from ..confluence_client.errors import (
     InvalidCredentialsError,
 )
 from ..content_converter.markdown_converter import MarkdownConverter
+from .content_cache import PageContentCache
 from .models import PageNode
 from .errors import PageLimitExceededError
 
 logger = logging.getLogger(__name__)
 
+# Above this share of cache misses in one level, the level is listed again
+# with bodies (one request) instead of fetching each missed page by id
+RELIST_MISS_RATIO = 0.5
+
 
 class HierarchyBuilder:
     """Builds page hierarchy trees using CQL queries.
@@ -35,6 +40,11 @@ class HierarchyBuilder:
     The CQL query pattern is: `parent = {page_id}`
     This returns all direct children of the specified page.
 
+    When a PageContentCache is passed, pages are first listed without their
+    bodies. Versions already in the cache reuse the cached markdown, and
+    bodies are only downloaded (and converted) for cache misses. With
+    metadata_only, no bodies are downloaded at all.
+
     Example:
         >>> auth = Authenticator()
         >>> builder = HierarchyBuilder(auth)
@@ -56,7 +66,9 @@ class HierarchyBuilder:
         parent_page_id: str,
         space_key: str,
         page_limit: int = 100,
-        exclude_page_ids: Optional[List[str]] = None
+        exclude_page_ids: Optional[List[str]] = None,
+        content_cache: Optional[PageContentCache] = None,
+        metadata_only: bool = False
     ) -> PageNode:
         """Build a complete page hierarchy starting from a parent page.
 
@@ -69,6 +81,10 @@ class HierarchyBuilder:
             space_key: The space key where the page resides
             page_limit: Maximum number of child pages allowed per level (default 100)
             exclude_page_ids: Optional list of page IDs to exclude from the tree
+            content_cache: Optional cache used to skip body download and
+                conversion for unchanged page versions
+            metadata_only: List ids, titles and versions only; every node
+                gets empty markdown_content (content_cache is not used)
 
         Returns:
             PageNode: Root node of the page hierarchy tree with all children
@@ -89,13 +105,28 @@ class HierarchyBuilder:
                 f"building minimal tree without children"
             )
 
+        if metadata_only:
+            content_cache = None
+
         # Fetch the parent page to get its metadata and content
-        logger.info(f"Confluence API: GET /content/{parent_page_id}?expand=version,space,ancestors,body.storage")
+        expand = "version,space,ancestors"
+        if not content_cache and not metadata_only:
+            expand += ",body.storage"
+        logger.info(f"Confluence API: GET /content/{parent_page_id}?expand={expand}")
         parent_data = self._api.get_page_by_id(
             page_id=parent_page_id,
-            expand="version,space,ancestors,body.storage"
+            expand=expand
         )
 
+        parent_markdown = "" if metadata_only else None
+        if content_cache:
+            parent_markdown = self._get_cached_markdown(parent_data, content_cache)
+            if parent_markdown is None:
+                parent_data = self._api.get_page_by_id(
+                    page_id=parent_page_id,
+                    expand="version,space,ancestors,body.storage"
+                )
+
         # Validate the page is in the expected space (case-insensitive comparison)
         page_space = parent_data.get('space', {}).get('key', '')
         if page_space.lower() != space_key.lower():
@@ -105,7 +136,12 @@ class HierarchyBuilder:
             )
 
         # Create the root node
-        root = self._create_page_node(parent_data, parent_id=None)
+        root = self._create_page_node(
+            parent_data,
+            parent_id=None,
+            content_cache=content_cache,
+            markdown_content=parent_markdown
+        )
 
         # Build the tree recursively if parent is not excluded
         if parent_page_id not in exclude_set:
@@ -113,7 +149,9 @@ class HierarchyBuilder:
                 node=root,
                 space_key=space_key,
                 page_limit=page_limit,
-                exclude_page_ids=exclude_set
+                exclude_page_ids=exclude_set,
+                content_cache=content_cache,
+                metadata_only=metadata_only
             )
 
         return root
@@ -123,7 +161,9 @@ class HierarchyBuilder:
         node: PageNode,
         space_key: str,
         page_limit: int,
-        exclude_page_ids: set
+        exclude_page_ids: set,
+        content_cache: Optional[PageContentCache] = None,
+        metadata_only: bool = False
     ) -> None:
         """Recursively build child nodes for a given page.
 
@@ -136,13 +176,17 @@ class HierarchyBuilder:
             space_key: The space key for CQL queries
             page_limit: Maximum number of children allowed
             exclude_page_ids: Set of page IDs to exclude
+            content_cache: Optional content cache (see build_hierarchy)
+            metadata_only: Skip page bodies (see build_hierarchy)
 
         Raises:
             PageLimitExceededError: If children count exceeds page_limit
         """
         # Query for children using CQL
         logger.debug(f"Querying children of page {node.page_id}")
-        children_data = self._query_children_cql(node.page_id, space_key)
+        children_data = self._query_children_cql(
+            node.page_id, space_key, include_body=content_cache is None and not metadata_only
+        )
 
         # Filter out excluded pages
         filtered_children = [
@@ -161,9 +205,39 @@ class HierarchyBuilder:
                 limit=page_limit
             )
 
+        # Resolve cached content; bodies are only downloaded for misses
+        cached_markdown: Dict[str, Optional[str]] = {}
+        if metadata_only:
+            cached_markdown = {child['id']: "" for child in filtered_children}
+        elif content_cache:
+            for child_data in filtered_children:
+                cached_markdown[child_data['id']] = self._get_cached_markdown(
+                    child_data, content_cache
+                )
+
+            missing_ids = {
+                page_id for page_id, markdown in cached_markdown.items() if markdown is None
+            }
+            if missing_ids:
+                logger.debug(
+                    f"Content cache: {len(filtered_children) - len(missing_ids)} hit(s), "
+                    f"{len(missing_ids)} miss(es) under page {node.page_id}"
+                )
+                with_bodies = self._fetch_bodies(
+                    node.page_id, space_key, missing_ids, len(filtered_children)
+                )
+                filtered_children = [
+                    with_bodies.get(child['id'], child) for child in filtered_children
+                ]
+
         # Create child nodes
         for child_data in filtered_children:
-            child_node = self._create_page_node(child_data, parent_id=node.page_id)
+            child_node = self._create_page_node(
+                child_data,
+                parent_id=node.page_id,
+                content_cache=content_cache,
+                markdown_content=cached_markdown.get(child_data['id'])
+            )
             node.children.append(child_node)
 
             # Recursively build grandchildren
@@ -171,13 +245,57 @@ class HierarchyBuilder:
                 node=child_node,
                 space_key=space_key,
                 page_limit=page_limit,
-                exclude_page_ids=exclude_page_ids
+                exclude_page_ids=exclude_page_ids,
+                content_cache=content_cache,
+                metadata_only=metadata_only
             )
 
+    def _fetch_bodies(
+        self,
+        parent_page_id: str,
+        space_key: str,
+        missing_ids: Set[str],
+        level_size: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """Download the bodies of the children the content cache missed.
+
+        Each missed page is fetched by id, so unchanged siblings are not
+        downloaded again. When most of the level missed (e.g. a cold cache),
+        the level is listed once more with bodies instead, which takes one
+        request rather than one per page.
+
+        Args:
+            parent_page_id: Parent of the level
+            space_key: The space key for the children query
+            missing_ids: IDs of the children whose bodies are needed
+            level_size: Number of children in the level
+
+        Returns:
+            Page data with body.storage by page ID
+        """
+        if len(missing_ids) > level_size * RELIST_MISS_RATIO:
+            return {
+                child['id']: child
+                for child in self._query_children_cql(parent_page_id, space_key)
+                if child.get('id') in missing_ids
+            }
+
+        with_bodies = {}
+        for page_id in sorted(missing_ids):
+            logger.info(
+                f"Confluence API: GET /content/{page_id}?expand=version,space,body.storage"
+            )
+            with_bodies[page_id] = self._api.get_page_by_id(
+                page_id=page_id,
+                expand="version,space,body.storage"
+            )
+        return with_bodies
+
     def _query_children_cql(
         self,
         parent_page_id: str,
-        space_key: str
+        space_key: str,
+        include_body: bool = True
     ) -> List[Dict[str, Any]]:
         """Get child pages of a parent page.
 
@@ -188,6 +306,7 @@ class HierarchyBuilder:
         Args:
             parent_page_id: The parent page ID
             space_key: The space key (unused, kept for interface compatibility)
+            include_body: Whether to expand body.storage (default True)
 
         Returns:
             List of page data dictionaries from the API results
@@ -198,7 +317,7 @@ class HierarchyBuilder:
         logger.debug(f"Fetching children of page {parent_page_id} in space {space_key}")
 
         try:
-            expand = "version,space,body.storage"
+            expand = "version,space,body.storage" if include_body else "version,space"
 
             # Use get_page_child_by_type for reliable child fetching
             response = self._api.get_page_child_by_type(
@@ -221,10 +340,52 @@ class HierarchyBuilder:
             logger.error(f"Failed to fetch children for page {parent_page_id}: {e}")
             raise APIAccessError(f"Failed to fetch child pages: {str(e)}")
 
+    def _get_cached_markdown(
+        self,
+        page_data: Dict[str, Any],
+        content_cache: PageContentCache
+    ) -> Optional[str]:
+        """Get markdown for a page version from the content cache.
+
+        Falls back to converting cached XHTML when only the XHTML is cached.
+
+        Args:
+            page_data: Page data from Confluence API (needs id and version)
+            content_cache: Content cache to consult
+
+        Returns:
+            Markdown content, or None if the body must be downloaded
+        """
+        page_id = page_data.get('id')
+        version_info = page_data.get('version', {})
+        last_modified = version_info.get('when', '')
+        version_number = version_info.get('number', 1)
+        if not page_id:
+            return None
+
+        markdown_content = content_cache.get_markdown(page_id, version_number, last_modified)
+        if markdown_content is not None:
+            return markdown_content
+
+        xhtml_content = content_cache.get_xhtml(page_id, version_number, last_modified)
+        if xhtml_content is None:
+            return None
+
+        try:
+            markdown_content = self._converter.xhtml_to_markdown(xhtml_content)
+        except Exception as e:
+            logger.warning(f"Failed to convert cached content for page {page_id}: {e}")
+            return None
+
+        content_cache.put(page_id, version_number, last_modified, None, markdown_content)
+        return markdown_content
+
     def _create_page_node(
         self,
         page_data: Dict[str, Any],
-        parent_id: Optional[str]
+        parent_id: Optional[str],
+        content_cache: Optional[PageContentCache] = None,
+        markdown_content: Optional[str] = None
     ) -> PageNode:
         """Create a PageNode from Confluence API response data.
 
@@ -234,6 +395,9 @@ class HierarchyBuilder:
         Args:
             page_data: Page data from Confluence API
             parent_id: Parent page ID (None for root)
+            content_cache: Optional cache populated with newly converted content
+            markdown_content: Already resolved (cached) markdown; when given,
+                the body in page_data is not converted
 
         Returns:
             PageNode: New page node with metadata populated
@@ -255,16 +419,25 @@ class HierarchyBuilder:
 
         title = page_data.get('title', 'Untitled Page')
 
-        # Extract and convert content
-        body_storage = page_data.get('body', {}).get('storage', {})
-        xhtml_content = body_storage.get('value', '')
-        markdown_content = ""
-        if xhtml_content:
-            try:
-                markdown_content = self._converter.xhtml_to_markdown(xhtml_content)
-            except Exception as e:
-                logger.warning(f"Failed to convert content for page {page_id}: {e}")
-                markdown_content = ""
+        # Extract and convert content (unless resolved from cache)
+        if markdown_content is None:
+            body_storage = page_data.get('body', {}).get('storage', {})
+            xhtml_content = body_storage.get('value', '')
+            markdown_content = ""
+            converted = True
+            if xhtml_content:
+                try:
+                    markdown_content = self._converter.xhtml_to_markdown(xhtml_content)
+                except Exception as e:
+                    logger.warning(f"Failed to convert content for page {page_id}: {e}")
+                    markdown_content = ""
+                    converted = False
+
+            # Populate the cache with new versions (only if a body was fetched)
+            if content_cache and converted and 'body' in page_data:
+                content_cache.put(
+                    page_id, version_number, last_modified, xhtml_content, markdown_content
+                )
 
         # Create the node
         node = PageNode(
@@ -0,0 +1,253 @@
+"""Local file manifest for incremental workspace scans.
+
+This module persists the stat signature (size, mtime_ns, inode) and content
+hash of every local markdown file together with the metadata parsed from its
+frontmatter. FileMapper._read_local_files uses it to parse only files whose
+stat changed; unchanged files are served from the manifest as LazyLocalPage
+objects whose content is read from disk only if a sync phase needs it.
+"""
+
+import dataclasses
+import json
+import logging
+import os
+import threading
+from typing import Dict, Iterable, Optional
+
+from .errors import FilesystemError, FrontmatterError
+from .frontmatter_handler import FrontmatterHandler
+from .models import LocalPage, ManifestEntry
+
+logger = logging.getLogger(__name__)
+
+# Bump when the manifest layout changes; older manifests are discarded
+MANIFEST_FORMAT_VERSION = 1
+
+
+class LazyLocalPage(LocalPage):
+    """LocalPage for an unchanged file, with content loaded on first access.
+
+    Page metadata (page_id, space_key, confluence_base_url) comes from the
+    manifest. The markdown content is only read (and the frontmatter
+    stripped) when a caller accesses `content`, e.g. for a baseline
+    comparison or a push.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        page_id: Optional[str],
+        space_key: Optional[str] = None,
+        confluence_base_url: Optional[str] = None
+    ):
+        """Initialize lazy local page.
+
+        Args:
+            file_path: Path to the markdown file
+            page_id: Confluence page ID from the manifest
+            space_key: Space key from the manifest
+            confluence_base_url: Confluence base URL from the manifest
+        """
+        super().__init__(
+            file_path=file_path,
+            page_id=page_id,
+            space_key=space_key,
+            confluence_base_url=confluence_base_url
+        )
+        # The dataclass __init__ assigned the default content through the
+        # setter; None marks it as not read yet
+        self._content: Optional[str] = None
+
+    @property
+    def content(self) -> str:
+        """Markdown content without frontmatter (read on first access).
+
+        Raises:
+            FilesystemError: If the file vanished or cannot be read or parsed
+                since the scan (never replaced by empty content, which would
+                be pushed as an emptied page)
+        """
+        if self._content is None:
+            try:
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    self._content = FrontmatterHandler.parse(self.file_path, f.read()).content
+            except (OSError, UnicodeDecodeError, FrontmatterError) as e:
+                raise FilesystemError(self.file_path, 'read', str(e)) from e
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+
+
+class LocalFileManifest:
+    """Persisted manifest of local markdown files for one space.
+
+    Entries are keyed by path relative to the space's local_path, so the
+    manifest stays valid if the workspace is moved.
+
+    File format (JSON):
+        {"version": 1, "files": {"docs/page.md": {"size": ..., "mtime_ns": ...,
+         "inode": ..., "sha256": "...", "page_id": "...", ...}}}
+
+    Example:
+        >>> manifest = LocalFileManifest(".confluence-sync/TEAM_manifest.json")
+        >>> entry = manifest.lookup("page.md", os.stat("docs/page.md"))
+        >>> manifest.save()
+    """
+
+    def __init__(self, manifest_path: str):
+        """Initialize manifest and load it from disk if present.
+
+        A missing, unreadable or outdated manifest is treated as empty.
+
+        Args:
+            manifest_path: Path to the manifest JSON file
+        """
+        self.manifest_path = manifest_path
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._dirty = False
+        # record() is called from concurrent local file readers
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load entries from the manifest file."""
+        if not os.path.exists(self.manifest_path):
+            return
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != MANIFEST_FORMAT_VERSION:
+                logger.info(f"Discarding outdated local manifest {self.manifest_path}")
+                return
+            self._entries = {
+                path: ManifestEntry(**fields)
+                for path, fields in data.get('files', {}).items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable local manifest {self.manifest_path}: {e}")
+            self._entries = {}
+
+        logger.debug(f"Loaded local manifest with {len(self._entries)} entries")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, rel_path: str) -> Optional[ManifestEntry]:
+        """Get the recorded entry for a file regardless of its current stat.
+
+        Args:
+            rel_path: Path relative to the space's local_path
+
+        Returns:
+            ManifestEntry or None if the file is not in the manifest
+        """
+        return self._entries.get(rel_path)
+
+    def lookup(self, rel_path: str, stat: os.stat_result) -> Optional[ManifestEntry]:
+        """Get the entry for a file only if its stat signature is unchanged.
+
+        Args:
+            rel_path: Path relative to the space's local_path
+            stat: Current os.stat() result for the file
+
+        Returns:
+            ManifestEntry if size, mtime_ns and inode match, otherwise None
+        """
+        entry = self._entries.get(rel_path)
+        if (
+            entry is not None
+            and entry.size == stat.st_size
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.inode == stat.st_ino
+        ):
+            return entry
+        return None
+
+    def lookup_content(self, rel_path: str, sha256: str) -> Optional[ManifestEntry]:
+        """Get the entry for a file whose stat changed but content did not.
+
+        A checkout or touch changes mtime (and a checkout the inode) without
+        changing the bytes; the recorded frontmatter metadata is then still
+        valid and the file need not be parsed again.
+
+        Args:
+            rel_path: Path relative to the space's local_path
+            sha256: SHA-256 hex digest of the current file bytes
+
+        Returns:
+            ManifestEntry if the recorded hash matches, otherwise None
+        """
+        entry = self._entries.get(rel_path)
+        if entry is not None and entry.sha256 == sha256:
+            return entry
+        return None
+
+    def record(
+        self,
+        rel_path: str,
+        stat: os.stat_result,
+        sha256: str,
+        local_page: LocalPage
+    ) -> None:
+        """Record the current state of a freshly parsed file.
+
+        Args:
+            rel_path: Path relative to the space's local_path
+            stat: os.stat() result taken before the file was read
+            sha256: SHA-256 hex digest of the file bytes
+            local_page: LocalPage parsed from the file
+        """
+        entry = ManifestEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            sha256=sha256,
+            page_id=local_page.page_id,
+            space_key=local_page.space_key,
+            confluence_base_url=local_page.confluence_base_url
+        )
+        with self._lock:
+            self._entries[rel_path] = entry
+            self._dirty = True
+
+    def retain(self, rel_paths: Iterable[str]) -> None:
+        """Drop entries for files that no longer exist.
+
+        Args:
+            rel_paths: Paths (relative to local_path) seen in the latest scan
+        """
+        keep = set(rel_paths)
+        removed = [path for path in self._entries if path not in keep]
+        for path in removed:
+            del self._entries[path]
+        if removed:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest atomically if it changed.
+
+        Failures are logged and otherwise ignored, since the manifest is only
+        an optimization.
+        """
+        if not self._dirty:
+            return
+
+        data = {
+            'version': MANIFEST_FORMAT_VERSION,
+            'files': {
+                path: dataclasses.asdict(entry) for path, entry in self._entries.items()
+            }
+        }
+        tmp_path = f"{self.manifest_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.manifest_path)
+            self._dirty = False
+            logger.debug(f"Saved local manifest with {len(self._entries)} entries")
+        except OSError as e:
+            logger.warning(f"Failed to save local manifest {self.manifest_path}: {e}")
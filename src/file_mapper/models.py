@@ -4,9 +4,14 @@ This module defines all data models used by the file mapper library.
 All models use dataclasses for clean, type-safe data structures.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+from ..git_integration.models import CacheStats
+
+if TYPE_CHECKING:
+    from .workspace_index import WorkspaceIndex
 
 
 @dataclass
@@ -98,6 +103,7 @@ class SyncResult:
         conflict_local_paths: Dict mapping page_id to local file path for conflicts
         conflict_remote_content: Dict mapping page_id to remote XHTML content
         conflict_titles: Dict mapping page_id to page title
+        cache_stats: Page content cache counters for this run (None if no cache)
     """
     pushed_count: int = 0
     pulled_count: int = 0
@@ -105,6 +111,261 @@ class SyncResult:
     conflict_local_paths: dict = field(default_factory=dict)
     conflict_remote_content: dict = field(default_factory=dict)
     conflict_titles: dict = field(default_factory=dict)
+    cache_stats: Optional[CacheStats] = None
+
+    def merge(self, other: "SyncResult") -> None:
+        """Add another result (e.g. of one space) into this one.
+
+        Args:
+            other: Result to add
+        """
+        self.pushed_count += other.pushed_count
+        self.pulled_count += other.pulled_count
+        self.conflict_page_ids.extend(other.conflict_page_ids)
+        self.conflict_local_paths.update(other.conflict_local_paths)
+        self.conflict_remote_content.update(other.conflict_remote_content)
+        self.conflict_titles.update(other.conflict_titles)
+        if other.cache_stats is not None:
+            if self.cache_stats is None:
+                self.cache_stats = CacheStats()
+            self.cache_stats.merge(other.cache_stats)
+
+
+@dataclass
+class PageAction:
+    """A page push or pull that has been applied (sync journal entry).
+
+    Attributes:
+        page_id: Confluence page ID
+        file_path: Local file path
+        action: "push" (local -> Confluence) or "pull" (Confluence -> local)
+        content_hash: SHA-256 hex digest of the file content (with frontmatter)
+                      that was pushed or written
+        version: Confluence version number after the action (None if unknown)
+    """
+    page_id: str
+    file_path: str
+    action: str
+    content_hash: str
+    version: Optional[int] = None
+
+
+@dataclass
+class PushPipelineStats:
+    """Queue occupancy of the push pipeline (PushPipeline).
+
+    Occupancy is sampled each time a page is about to be prepared. A high
+    fetched-ahead mean means fetches outpace diffing (the pipeline is CPU
+    bound); a high upload queue mean means uploads are the bottleneck.
+
+    Attributes:
+        pages: Pages pushed through the pipeline
+        samples: Number of occupancy samples
+        fetched_ahead_total: Sum over samples of pages fetched and waiting
+        max_fetched_ahead: Most pages fetched and waiting at a sample
+        upload_queue_total: Sum over samples of uploads queued or running
+        max_upload_queue: Most uploads queued or running at a sample
+    """
+    pages: int = 0
+    samples: int = 0
+    fetched_ahead_total: int = 0
+    max_fetched_ahead: int = 0
+    upload_queue_total: int = 0
+    max_upload_queue: int = 0
+
+    @property
+    def mean_fetched_ahead(self) -> float:
+        """Average number of pages fetched and waiting to be prepared."""
+        return self.fetched_ahead_total / self.samples if self.samples else 0.0
+
+    @property
+    def mean_upload_queue(self) -> float:
+        """Average number of prepared pages queued or uploading."""
+        return self.upload_queue_total / self.samples if self.samples else 0.0
+
+    def merge(self, other: "PushPipelineStats") -> None:
+        """Add the counters of another pipeline run.
+
+        Args:
+            other: Stats to add to these
+        """
+        self.pages += other.pages
+        self.samples += other.samples
+        self.fetched_ahead_total += other.fetched_ahead_total
+        self.max_fetched_ahead = max(self.max_fetched_ahead, other.max_fetched_ahead)
+        self.upload_queue_total += other.upload_queue_total
+        self.max_upload_queue = max(self.max_upload_queue, other.max_upload_queue)
+
+
+@dataclass
+class PlannedAction:
+    """One step of a sync plan.
+
+    Attributes:
+        action_id: Unique ID within the plan (e.g. "pull:123", "update:docs/a.md")
+        kind: "create", "update", "pull", "merge", "move" or "delete"
+        space_key: Space the page belongs to (None if unknown)
+        page_id: Confluence page ID (None for pages not created yet)
+        path: Local file path the action reads or writes
+        title: Page title for display
+        detail: Kind-specific note for display (e.g. "local" for a delete of
+                the local file, the target path of a move)
+        depends_on: IDs of actions that must finish before this one starts
+    """
+    action_id: str
+    kind: str
+    space_key: Optional[str] = None
+    page_id: Optional[str] = None
+    path: Optional[str] = None
+    title: Optional[str] = None
+    detail: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SyncPlan:
+    """Ordered set of actions a sync run would apply.
+
+    Built by the planner before anything is changed, so a dry run can show
+    exactly what a real run would execute. Actions form a DAG through
+    depends_on; PlanExecutor runs them in dependency waves.
+
+    Attributes:
+        actions: Planned actions in planning order
+    """
+    actions: List[PlannedAction] = field(default_factory=list)
+    # action_ids of actions, so add() checks for duplicates in O(1)
+    _action_ids: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    # Action kinds in display order
+    KINDS = ("delete", "move", "create", "update", "pull", "merge")
+
+    def __post_init__(self) -> None:
+        """Validate and index the actions passed to the constructor.
+
+        Raises:
+            ValueError: If an action kind is unknown or an action_id is used twice
+        """
+        actions, self.actions = self.actions, []
+        for action in actions:
+            self.add(action)
+
+    def add(self, action: PlannedAction) -> PlannedAction:
+        """Append an action to the plan.
+
+        Args:
+            action: Action to add
+
+        Returns:
+            The added action
+
+        Raises:
+            ValueError: If the kind is unknown or the action_id is already used
+        """
+        if action.kind not in self.KINDS:
+            raise ValueError(f"Unknown action kind '{action.kind}'")
+        if action.action_id in self._action_ids:
+            raise ValueError(f"Duplicate action id '{action.action_id}'")
+        self._action_ids.add(action.action_id)
+        self.actions.append(action)
+        return action
+
+    def extend(self, other: "SyncPlan") -> None:
+        """Append all actions of another plan.
+
+        Args:
+            other: Plan whose actions are added
+
+        Raises:
+            ValueError: If an action kind is unknown or an action_id is already used
+        """
+        for action in other.actions:
+            self.add(action)
+
+    def of_kind(self, kind: str) -> List[PlannedAction]:
+        """Get the actions of one kind, in planning order.
+
+        Args:
+            kind: Action kind
+
+        Returns:
+            List of matching actions
+        """
+        return [action for action in self.actions if action.kind == kind]
+
+    def counts(self) -> Dict[str, int]:
+        """Count the actions of each kind.
+
+        Returns:
+            Dict mapping kind to count (kinds without actions are omitted)
+        """
+        counts: Dict[str, int] = {}
+        for action in self.actions:
+            counts[action.kind] = counts.get(action.kind, 0) + 1
+        return counts
+
+    def waves(self) -> List[List[PlannedAction]]:
+        """Group actions into dependency waves.
+
+        Every action's dependencies are in earlier waves, so the actions of
+        one wave can run concurrently.
+
+        Returns:
+            List of waves, each in planning order
+
+        Raises:
+            ValueError: If an action depends on an unknown action or the
+                dependencies form a cycle
+        """
+        by_id = {action.action_id: action for action in self.actions}
+        for action in self.actions:
+            for dependency in action.depends_on:
+                if dependency not in by_id:
+                    raise ValueError(
+                        f"Action '{action.action_id}' depends on unknown action '{dependency}'"
+                    )
+
+        done: Set[str] = set()
+        remaining = list(self.actions)
+        waves: List[List[PlannedAction]] = []
+        while remaining:
+            wave = [a for a in remaining if all(d in done for d in a.depends_on)]
+            if not wave:
+                cycle = ", ".join(a.action_id for a in remaining)
+                raise ValueError(f"Plan has a dependency cycle among: {cycle}")
+            waves.append(wave)
+            done.update(a.action_id for a in wave)
+            remaining = [a for a in remaining if a.action_id not in done]
+        return waves
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the plan to plain data (JSON/YAML friendly).
+
+        Returns:
+            Dict with an "actions" list
+        """
+        return {'actions': [asdict(action) for action in self.actions]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SyncPlan":
+        """Rebuild a plan serialized with to_dict().
+
+        Args:
+            data: Dict with an "actions" list
+
+        Returns:
+            SyncPlan
+
+        Raises:
+            ValueError: If an action is malformed
+        """
+        plan = cls()
+        for entry in data.get('actions', []):
+            try:
+                plan.add(PlannedAction(**entry))
+            except TypeError as e:
+                raise ValueError(f"Malformed plan action {entry!r}: {e}") from e
+        return plan
 
 
 @dataclass
@@ -121,9 +382,37 @@ class SyncConfig:
         force_push: Force sync to Confluence even if remote has changes
         temp_dir: Temporary directory for atomic operations (ADR-011)
         last_synced: ISO 8601 timestamp of last successful sync (for mtime comparison)
+        cache_dir: Base directory for sync caches (page content cache, local file
+                   manifest). None disables caching.
+        cache_format: Storage format of the page content cache: "files" (two
+                   files per entry) or "pack" (one append-only pack file per
+                   store)
+        local_change_detection: How locally modified files are found before the
+                   baseline comparison: "mtime" (file mtime vs last_synced) or
+                   "git" (files git reports as changed since the last sync)
+        locally_changed_paths: Candidate paths (realpath) from git change detection
+                   for the current run; None uses the mtime check.
         get_baseline: Callback to retrieve baseline content for a page_id.
                       Signature: (page_id: str) -> Optional[str]
                       Returns baseline content or None if no baseline exists.
+        workspace: Shared WorkspaceIndex for the current run (set by the CLI);
+                   None makes FileMapper walk and read the tree itself.
+        on_page_synced: Callback invoked after each page is pushed or pulled.
+                        Signature: (action: PageAction, content: str) -> None,
+                        where content is the file content the page now has.
+        completed_pages: Pages applied by an interrupted run that is being
+                         resumed, by page_id; pages still matching their entry
+                         are not pushed or pulled again.
+        concurrency: Number of workers PlanExecutor uses to run the actions of
+                     one dependency wave (1 runs them sequentially)
+        requests_per_second: Maximum Confluence API requests started per
+                     second, shared by all workers (0 disables pacing)
+        push_pipeline_depth: Pages fetched ahead / queued for upload when
+                     pushing modified pages through PushPipeline (0 pushes
+                     each page in one step on `concurrency` workers)
+        space_concurrency: Number of spaces synced at once by
+                     FileMapper.sync_spaces; `concurrency` is then split
+                     evenly between the spaces running at the same time
     """
     spaces: List[SpaceConfig] = field(default_factory=list)
     page_limit: int = 100
@@ -131,4 +420,40 @@ class SyncConfig:
     force_push: bool = False
     temp_dir: str = ".confluence-sync/temp"
     last_synced: Optional[str] = None
+    cache_dir: Optional[str] = None
+    cache_format: str = "files"
+    local_change_detection: str = "mtime"
+    locally_changed_paths: Optional[Set[str]] = None
     get_baseline: Optional[Callable[[str], Optional[str]]] = None
+    workspace: Optional["WorkspaceIndex"] = None
+    on_page_synced: Optional[Callable[[PageAction, str], None]] = None
+    completed_pages: Optional[Dict[str, PageAction]] = None
+    concurrency: int = 1
+    requests_per_second: float = 0.0
+    push_pipeline_depth: int = 0
+    space_concurrency: int = 1
+
+
+@dataclass
+class ManifestEntry:
+    """Recorded state of one local markdown file (local file manifest).
+
+    A file whose size, mtime_ns and inode still match its entry is known to be
+    unchanged, so its frontmatter does not need to be read or parsed again.
+
+    Attributes:
+        size: File size in bytes
+        mtime_ns: Modification time in nanoseconds
+        inode: Inode number (detects replaced files with restored mtimes)
+        sha256: SHA-256 hex digest of the raw file bytes
+        page_id: Confluence page ID from frontmatter (None for new files)
+        space_key: Space key from frontmatter
+        confluence_base_url: Confluence base URL from frontmatter
+    """
+    size: int
+    mtime_ns: int
+    inode: int
+    sha256: str
+    page_id: Optional[str] = None
+    space_key: Optional[str] = None
+    confluence_base_url: Optional[str] = None
@@ -0,0 +1,142 @@
+"""Dependency-ordered execution of a sync plan.
+
+The planner (FileMapper.plan_sync, SyncCommand._build_sync_plan) decides what
+a sync run will do before anything is changed; PlanExecutor applies a
+SyncPlan. Actions are run in dependency waves (SyncPlan.waves), so a parent
+page is always handled before its children. Within a wave, the actions of
+each kind are handed to that kind's batch handler, split into up to
+`max_workers` chunks that run on a thread pool. A handler that manages its
+own worker pool can instead receive each wave's actions of its kind as one
+batch (`whole_batch_kinds`).
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import PlannedAction, SyncPlan
+
+logger = logging.getLogger(__name__)
+
+# Batch handler: applies a list of actions of one kind
+ActionHandler = Callable[[List[PlannedAction]], None]
+
+
+class PlanExecutor:
+    """Runs the actions of a SyncPlan with bounded concurrency.
+
+    Execution stops after the first wave in which a handler raised: the
+    remaining chunks of that wave finish, no later wave is started, and the
+    first error is re-raised. Work applied before the error is not undone.
+
+    Example:
+        >>> executor = PlanExecutor(max_workers=4)
+        >>> executor.execute(plan, {
+        ...     "update": lambda actions: push(actions),
+        ...     "pull": lambda actions: pull(actions),
+        ... })
+    """
+
+    def __init__(self, max_workers: int = 1):
+        """Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of handler calls running at once
+                (1 runs everything sequentially on the calling thread)
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+
+    def execute(
+        self,
+        plan: SyncPlan,
+        handlers: Dict[str, ActionHandler],
+        whole_batch_kinds: Iterable[str] = ()
+    ) -> int:
+        """Apply a plan.
+
+        Args:
+            plan: Plan to apply
+            handlers: Batch handler for each action kind in the plan
+            whole_batch_kinds: Kinds whose handler receives all of a wave's
+                actions of that kind in one call, because it runs them
+                concurrently itself
+
+        Returns:
+            Number of actions applied
+
+        Raises:
+            ValueError: If the plan has a dependency error or an action kind
+                has no handler (raised before anything runs)
+            Exception: The first error raised by a handler
+        """
+        waves = plan.waves()
+        missing = {action.kind for action in plan.actions} - set(handlers)
+        if missing:
+            raise ValueError(f"No handler for action kind(s): {', '.join(sorted(missing))}")
+
+        unsplit = set(whole_batch_kinds)
+        applied = 0
+        if self.max_workers == 1:
+            for wave in waves:
+                for kind, chunk in self._chunk_wave(wave, unsplit):
+                    handlers[kind](chunk)
+                    applied += len(chunk)
+            return applied
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for wave_number, wave in enumerate(waves, 1):
+                chunks = self._chunk_wave(wave, unsplit)
+                logger.debug(
+                    f"Plan wave {wave_number}/{len(waves)}: {len(wave)} action(s) "
+                    f"in {len(chunks)} batch(es)"
+                )
+                futures = [(chunk, pool.submit(handlers[kind], chunk)) for kind, chunk in chunks]
+
+                first_error: Optional[BaseException] = None
+                for chunk, future in futures:
+                    error = future.exception()
+                    if error is None:
+                        applied += len(chunk)
+                    elif first_error is None:
+                        first_error = error
+                if first_error is not None:
+                    raise first_error
+
+        return applied
+
+    def _chunk_wave(
+        self,
+        wave: List[PlannedAction],
+        unsplit: Set[str]
+    ) -> List[Tuple[str, List[PlannedAction]]]:
+        """Split one wave into per-kind batches for the handlers.
+
+        Each kind's actions are divided into at most max_workers contiguous
+        chunks of near-equal size, keeping planning order.
+
+        Args:
+            wave: Actions whose dependencies are all applied
+            unsplit: Kinds whose actions stay in a single batch
+
+        Returns:
+            List of (kind, actions) batches
+        """
+        by_kind: Dict[str, List[PlannedAction]] = {}
+        for action in wave:
+            by_kind.setdefault(action.kind, []).append(action)
+
+        batches: List[Tuple[str, List[PlannedAction]]] = []
+        for kind, actions in by_kind.items():
+            chunk_count = 1 if kind in unsplit else min(self.max_workers, len(actions))
+            size, extra = divmod(len(actions), chunk_count)
+            start = 0
+            for i in range(chunk_count):
+                end = start + size + (1 if i < extra else 0)
+                batches.append((kind, actions[start:end]))
+                start = end
+        return batches
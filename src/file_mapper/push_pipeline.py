@@ -0,0 +1,159 @@
+"""Producer/consumer pipeline for pushing modified pages.
+
+Pushing a page is fetch ADF (network), parse and diff (CPU), upload
+(network). Run strictly in order, the CPU sits idle during both network
+calls and the network sits idle while diffing. PushPipeline overlaps them:
+
+    fetch pool ──> prepare (calling thread) ──> upload queue ──> upload pool
+
+Up to `depth` pages are fetched ahead of the page being prepared, and up to
+`depth` prepared pages wait in the upload queue. When either limit is
+reached the stage feeding it blocks, so memory stays bounded. Occupancy of
+both queues is sampled each time a page is prepared and reported as
+PushPipelineStats.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Generic, List, Optional, Tuple, TypeVar
+
+from .models import PushPipelineStats
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class PushPipeline(Generic[T, R]):
+    """Three-stage pipeline with bounded queues between the stages.
+
+    Example:
+        >>> pipeline = PushPipeline(depth=4, upload_workers=2)
+        >>> results = pipeline.run(pages, fetch=fetch_adf, prepare=diff, upload=put)
+        >>> pipeline.stats.mean_fetched_ahead
+        3.2
+    """
+
+    def __init__(self, depth: int, upload_workers: int = 1):
+        """Initialize the pipeline.
+
+        Args:
+            depth: Maximum pages fetched ahead, and maximum prepared pages
+                waiting for upload
+            upload_workers: Threads draining the upload queue
+
+        Raises:
+            ValueError: If depth or upload_workers is less than 1
+        """
+        if depth < 1:
+            raise ValueError(f"depth must be at least 1, got {depth}")
+        if upload_workers < 1:
+            raise ValueError(f"upload_workers must be at least 1, got {upload_workers}")
+        self.depth = depth
+        self.upload_workers = upload_workers
+        self.stats = PushPipelineStats()
+
+    def run(
+        self,
+        items: List[T],
+        fetch: Callable[[T], Any],
+        prepare: Callable[[T, Any], Any],
+        upload: Callable[[T, Any], R],
+    ) -> List[Tuple[T, Optional[R], Optional[Exception]]]:
+        """Push items through fetch, prepare and upload.
+
+        fetch runs on a pool of `depth` threads, prepare on the calling
+        thread in item order, upload on `upload_workers` threads. An
+        exception in any stage is captured for that item only; the item
+        skips its remaining stages.
+
+        Args:
+            items: Items to push, in order
+            fetch: Network stage: item -> fetched data
+            prepare: CPU stage: (item, fetched data) -> prepared data
+            upload: Network stage: (item, prepared data) -> result
+
+        Returns:
+            List of (item, result, error) tuples in input order; error is None
+            on success and result is None on failure
+        """
+        self.stats = PushPipelineStats(pages=len(items))
+        if not items:
+            return []
+
+        results: List[Tuple[T, Optional[R], Optional[Exception]]] = [
+            (item, None, None) for item in items
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.depth, thread_name_prefix='push-fetch') as fetch_pool, \
+                ThreadPoolExecutor(max_workers=self.upload_workers,
+                                   thread_name_prefix='push-upload') as upload_pool:
+            fetches: Deque[Future] = deque()
+            uploads: Deque[Tuple[int, Future]] = deque()
+            next_fetch = 0
+
+            for index, item in enumerate(items):
+                # Keep the page being prepared plus `depth` pages fetching ahead
+                while next_fetch < len(items) and next_fetch <= index + self.depth:
+                    fetches.append(fetch_pool.submit(fetch, items[next_fetch]))
+                    next_fetch += 1
+
+                self._sample(fetches, uploads)
+                fetch_future = fetches.popleft()
+
+                try:
+                    prepared = prepare(item, fetch_future.result())
+                except Exception as e:
+                    results[index] = (item, None, e)
+                    continue
+
+                # Bounded upload queue: wait for the oldest upload when full
+                while len(uploads) >= self.depth:
+                    self._collect(uploads.popleft(), items, results)
+                uploads.append((index, upload_pool.submit(upload, item, prepared)))
+
+            while uploads:
+                self._collect(uploads.popleft(), items, results)
+
+        logger.debug(
+            f"Push pipeline: {self.stats.pages} page(s), fetched ahead "
+            f"mean {self.stats.mean_fetched_ahead:.1f}/max {self.stats.max_fetched_ahead}, "
+            f"upload queue mean {self.stats.mean_upload_queue:.1f}/max {self.stats.max_upload_queue}"
+        )
+        return results
+
+    def _sample(self, fetches: Deque[Future], uploads: Deque[Tuple[int, Future]]) -> None:
+        """Record queue occupancy before a page is prepared.
+
+        Args:
+            fetches: Fetches submitted and not yet consumed
+            uploads: Uploads submitted and not yet collected
+        """
+        fetched_ahead = sum(1 for future in fetches if future.done())
+        upload_queue = sum(1 for _, future in uploads if not future.done())
+        self.stats.samples += 1
+        self.stats.fetched_ahead_total += fetched_ahead
+        self.stats.max_fetched_ahead = max(self.stats.max_fetched_ahead, fetched_ahead)
+        self.stats.upload_queue_total += upload_queue
+        self.stats.max_upload_queue = max(self.stats.max_upload_queue, upload_queue)
+
+    @staticmethod
+    def _collect(
+        upload: Tuple[int, Future],
+        items: List[T],
+        results: List[Tuple[T, Optional[R], Optional[Exception]]]
+    ) -> None:
+        """Wait for one upload and store its outcome.
+
+        Args:
+            upload: (item index, upload future)
+            items: All items
+            results: Result list to update
+        """
+        index, future = upload
+        try:
+            results[index] = (items[index], future.result(), None)
+        except Exception as e:
+            results[index] = (items[index], None, e)
@@ -0,0 +1,379 @@
+"""Shared index of local markdown files for one sync run.
+
+A bidirectional sync used to walk the local tree several times (tracked-page
+discovery before and after the sync, FileMapper._read_local_files, new-page
+discovery in dry-run), re-reading every file each time. WorkspaceIndex scans
+each space's local_path once with os.scandir, keeps each file's stat, and
+caches file content, content hash and page_id the first time any phase reads
+them. Raw bytes are only kept while a file is read, so a large tree holds one
+copy of each file's text.
+
+Entries are invalidated explicitly for paths the sync itself writes, moves or
+deletes (WorkspaceIndex.invalidate); everything else is served from the index.
+
+map_ordered runs per-file reads on a bounded thread pool, so latency-bound
+reads (network filesystems, cold page cache) overlap while results keep the
+scan order.
+"""
+
+import codecs
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from .frontmatter_handler import FrontmatterHandler
+
+logger = logging.getLogger(__name__)
+
+# Default number of threads reading local files concurrently
+DEFAULT_READ_WORKERS = 8
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def map_ordered(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_READ_WORKERS
+) -> List[Tuple[T, Optional[R], Optional[Exception]]]:
+    """Apply func to items on a bounded thread pool, preserving input order.
+
+    Exceptions raised by func are captured per item instead of aborting the
+    whole batch, so callers can skip failed files exactly as a sequential
+    loop with try/except would.
+
+    Args:
+        func: Function to call for each item
+        items: Items to process
+        max_workers: Maximum number of concurrent threads (1 runs inline)
+
+    Returns:
+        List of (item, result, error) tuples in input order; error is None on
+        success and result is None on failure
+    """
+    items = list(items)
+
+    def call(item: T) -> Tuple[T, Optional[R], Optional[Exception]]:
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        return [call(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='local-read') as executor:
+        return list(executor.map(call, items))
+
+
+class WorkspaceFile:
+    """One markdown file in the workspace index.
+
+    Attributes:
+        path: File path as produced by the scan (os.path.join(root, name))
+        stat: os.stat() result captured during the scan
+    """
+
+    __slots__ = ('path', 'stat', '_text', '_sha256', '_page_id', '_page_id_known')
+
+    def __init__(self, path: str, stat: os.stat_result):
+        self.path = path
+        self.stat = stat
+        self._text: Optional[str] = None
+        self._sha256: Optional[str] = None
+        # None is a valid page_id, so whether it was computed is kept apart
+        self._page_id: Optional[str] = None
+        self._page_id_known = False
+
+
+class WorkspaceIndex:
+    """Single-pass index of the markdown files under each space's local_path.
+
+    Thread-safe; all phases of one sync (and the CLI around it) share one
+    instance.
+
+    Example:
+        >>> index = WorkspaceIndex()
+        >>> for entry in index.files("./docs"):
+        ...     print(entry.path, index.get_page_id(entry.path))
+        >>> index.invalidate("./docs/new-page.md")  # after writing it
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._lock = threading.RLock()
+        # Root (as given) -> {absolute file path -> WorkspaceFile}, in scan order
+        self._roots: Dict[str, Dict[str, WorkspaceFile]] = {}
+
+    @staticmethod
+    def _key(path: str) -> str:
+        """Normalize a path for lookups."""
+        return os.path.abspath(os.fspath(path))
+
+    def _scan(self, root: str) -> Dict[str, WorkspaceFile]:
+        """Scan a directory tree once with os.scandir.
+
+        Visits directories in the same order as os.walk (files of a directory
+        before the files of its subdirectories) and, like os.walk, does not
+        follow symlinked directories and skips unreadable directories.
+
+        Args:
+            root: Directory to scan
+
+        Returns:
+            Mapping of absolute path to WorkspaceFile for every .md file
+        """
+        files: Dict[str, WorkspaceFile] = {}
+        pending = [root]
+
+        while pending:
+            directory = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+
+                        if is_dir:
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+
+                        if not entry.name.endswith('.md'):
+                            continue
+
+                        try:
+                            stat = entry.stat()
+                        except OSError as e:
+                            logger.warning(f"Failed to stat {entry.path}: {e}")
+                            continue
+                        files[self._key(entry.path)] = WorkspaceFile(entry.path, stat)
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory {directory}: {e}")
+                continue
+
+            # Reverse so the first subdirectory is popped (visited) first
+            pending.extend(reversed(subdirs))
+
+        logger.debug(f"Workspace scan of {root}: {len(files)} markdown file(s)")
+        return files
+
+    def files(self, root: str) -> List[WorkspaceFile]:
+        """Get all markdown files under root, scanning it on first use.
+
+        Args:
+            root: Space local_path
+
+        Returns:
+            List of WorkspaceFile in scan order (empty if root doesn't exist)
+        """
+        with self._lock:
+            if root not in self._roots:
+                self._roots[root] = self._scan(root) if os.path.isdir(root) else {}
+            return list(self._roots[root].values())
+
+    def _find(self, path: str) -> Optional[WorkspaceFile]:
+        """Find the indexed entry for a path (lock must be held)."""
+        key = self._key(path)
+        for files in self._roots.values():
+            entry = files.get(key)
+            if entry is not None:
+                return entry
+        return None
+
+    def get_stat(self, path: str) -> os.stat_result:
+        """Get the stat of a file as captured by the scan.
+
+        Args:
+            path: File path
+
+        Returns:
+            Cached os.stat_result, or a fresh os.stat() for unindexed paths
+
+        Raises:
+            OSError: If an unindexed path cannot be stat'ed
+        """
+        with self._lock:
+            entry = self._find(path)
+            if entry is not None:
+                return entry.stat
+        return os.stat(path)
+
+    def content_hash(self, path: str) -> str:
+        """Get the SHA-256 of a file's raw bytes, cached.
+
+        Args:
+            path: File path
+
+        Returns:
+            Hex digest of the file content
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with self._lock:
+            entry = self._find(path)
+            if entry is not None and entry._sha256 is not None:
+                return entry._sha256
+
+        with open(path, 'rb') as f:
+            sha256 = hashlib.sha256(f.read()).hexdigest()
+
+        with self._lock:
+            if entry is not None:
+                entry._sha256 = sha256
+        return sha256
+
+    def read_text(self, path: str) -> str:
+        """Read file content as text (UTF-8, universal newlines), cached.
+
+        The content hash is computed from the same read, so a later
+        content_hash() does not read the file again.
+
+        Args:
+            path: File path
+
+        Returns:
+            File content, identical to open(path, 'r', encoding='utf-8').read()
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid UTF-8
+        """
+        with self._lock:
+            entry = self._find(path)
+            if entry is not None and entry._text is not None:
+                return entry._text
+
+        with open(path, 'rb') as f:
+            raw = f.read()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        text = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+        with self._lock:
+            if entry is not None:
+                entry._sha256 = sha256
+                entry._text = text
+        return text
+
+    def _read_head(self, path: str) -> Tuple[str, bool]:
+        """Read the first PAGE_ID_SCAN_BYTES of a file as text.
+
+        Args:
+            path: File path
+
+        Returns:
+            Tuple of (text, truncated); a multi-byte character cut at the
+            boundary is dropped
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the prefix is not valid UTF-8
+        """
+        size = FrontmatterHandler.PAGE_ID_SCAN_BYTES
+        with open(path, 'rb') as f:
+            raw = f.read(size + 1)
+
+        truncated = len(raw) > size
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        text = decoder.decode(raw[:size], final=not truncated)
+        return text.replace('\r\n', '\n').replace('\r', '\n'), truncated
+
+    def get_page_id(self, path: str) -> Optional[str]:
+        """Get the page_id from a file's frontmatter, cached.
+
+        Only the first PAGE_ID_SCAN_BYTES are read unless the file content is
+        already cached or the frontmatter does not close within them.
+
+        Args:
+            path: File path
+
+        Returns:
+            Page ID, or None for files without a confluence_url
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid UTF-8
+        """
+        with self._lock:
+            entry = self._find(path)
+            if entry is not None and entry._page_id_known:
+                return entry._page_id
+            cached_text = entry._text if entry is not None else None
+
+        if cached_text is not None:
+            page_id = FrontmatterHandler.get_page_id(cached_text)
+        else:
+            head, truncated = self._read_head(path)
+            if not truncated or not head.startswith('---'):
+                # Whole file read, or no frontmatter at all
+                page_id = FrontmatterHandler.get_page_id(head)
+            else:
+                match = FrontmatterHandler.FRONTMATTER_PATTERN.match(head)
+                if match:
+                    page_id = FrontmatterHandler.get_page_id_from_frontmatter(match.group(1))
+                else:
+                    # Frontmatter longer than the scanned prefix
+                    page_id = FrontmatterHandler.get_page_id(self.read_text(path))
+
+        with self._lock:
+            if entry is not None:
+                entry._page_id = page_id
+                entry._page_id_known = True
+        return page_id
+
+    def get_page_ids(
+        self,
+        paths: Iterable[str],
+        max_workers: int = DEFAULT_READ_WORKERS
+    ) -> List[Tuple[str, Optional[str], Optional[Exception]]]:
+        """Get page_ids for many files, reading them concurrently.
+
+        Args:
+            paths: File paths
+            max_workers: Maximum number of concurrent reads
+
+        Returns:
+            List of (path, page_id, error) tuples in the order of paths
+        """
+        return map_ordered(self.get_page_id, paths, max_workers)
+
+    def invalidate(self, path: str) -> None:
+        """Refresh the entry for a path the sync wrote, moved or deleted.
+
+        The path is re-stat'ed: a deleted file is removed from the index, a
+        new file under a scanned root is added, and cached content is dropped.
+
+        Args:
+            path: File path (str or Path)
+        """
+        path = os.fspath(path)
+        key = self._key(path)
+
+        with self._lock:
+            for root, files in self._roots.items():
+                root_key = self._key(root)
+                if not key.startswith(root_key.rstrip(os.sep) + os.sep):
+                    continue
+
+                files.pop(key, None)
+                if key.endswith('.md'):
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    scan_path = os.path.join(root, os.path.relpath(key, root_key))
+                    files[key] = WorkspaceFile(scan_path, stat)
+
+    def clear(self) -> None:
+        """Drop all scanned roots (the next access rescans)."""
+        with self._lock:
+            self._roots.clear()
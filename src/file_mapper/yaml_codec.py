@@ -0,0 +1,68 @@
+"""Safe YAML loading with libyaml acceleration, and safe dumping.
+
+PyYAML's yaml.safe_load always uses the pure-Python scanner and parser.
+When PyYAML is built against libyaml, CSafeLoader runs the same safe schema
+through the C implementation, which is several times faster. This module
+loads with CSafeLoader when it is available and falls back to the
+pure-Python SafeLoader otherwise.
+
+Dumping always uses the pure-Python SafeDumper. The C emitter does not
+write the same text: with allow_unicode it escapes characters outside the
+Basic Multilingual Plane (an emoji becomes "\\U0001F600"), so frontmatter
+generated by it would no longer match existing baselines.
+
+Frontmatter, config and state files all go through these functions.
+"""
+
+from typing import Any, Optional
+
+import yaml
+
+from yaml import SafeDumper
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+    HAS_LIBYAML = False
+
+# Re-exported so callers only need this module
+YAMLError = yaml.YAMLError
+
+
+def safe_load(stream: str) -> Any:
+    """Parse a YAML document with the safe schema.
+
+    Equivalent to yaml.safe_load, using libyaml when available.
+
+    Args:
+        stream: YAML text
+
+    Returns:
+        Parsed Python object (None for an empty document)
+
+    Raises:
+        yaml.YAMLError: If the YAML is malformed
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Optional[Any] = None, **kwargs: Any) -> Optional[str]:
+    """Serialize data as YAML with the safe representer.
+
+    Equivalent to yaml.safe_dump (always the pure-Python emitter, see the
+    module docstring).
+
+    Args:
+        data: Object to serialize (plain dicts, lists and scalars)
+        stream: Optional file object to write to
+        **kwargs: yaml.dump options (default_flow_style, allow_unicode, sort_keys...)
+
+    Returns:
+        YAML text if stream is None, otherwise None
+
+    Raises:
+        yaml.representer.RepresenterError: If data contains unsupported types
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
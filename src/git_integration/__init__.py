@@ -4,6 +4,7 @@ This package provides conflict detection, three-way merge resolution, and
 synchronization capabilities for Confluence pages with local git repositories.
 """
 
+from src.git_integration.blob_reader import GitBlobReader
 from src.git_integration.conflict_detector import ConflictDetector
 from src.git_integration.errors import (
     CacheError,
@@ -16,6 +17,7 @@ from src.git_integration.merge_orchestrator import MergeOrchestrator
 from src.git_integration.merge_tool import MergeTool
 from src.git_integration.models import (
     CachedPage,
+    CacheStats,
     ConflictDetectionResult,
     ConflictInfo,
     LocalPage,
@@ -26,6 +28,7 @@ from src.git_integration.models import (
     ThreeWayMergeInputs,
 )
 from src.git_integration.xhtml_cache import XHTMLCache
+from src.git_integration.xhtml_pack_cache import XHTMLPackCache
 
 __all__ = [
     # Errors
@@ -35,12 +38,15 @@ __all__ = [
     'MergeToolError',
     # Components
     'GitRepository',
+    'GitBlobReader',
     'XHTMLCache',
+    'XHTMLPackCache',
     'ConflictDetector',
     'MergeOrchestrator',
     'MergeTool',
     # Models
     'CachedPage',
+    'CacheStats',
     'ConflictDetectionResult',
     'ConflictInfo',
     'LocalPage',
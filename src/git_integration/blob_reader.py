@@ -0,0 +1,244 @@
+"""Long-lived blob reader for the Confluence markdown mirror.
+
+This module provides the GitBlobReader class, which keeps a single
+`git cat-file --batch` process open and serves blob reads over its pipes.
+Reading many historical versions (e.g. base versions for dozens of conflicts)
+then costs one process spawn per run instead of one per blob.
+"""
+
+import logging
+import queue
+import subprocess
+import threading
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.git_integration.errors import GitRepositoryError
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for one cat-file response before restarting the process
+BLOB_READ_TIMEOUT = 10
+
+# A parsed response: (header fields, content), or None once stdout is closed
+_Response = Optional[Tuple[List[str], bytes]]
+
+
+class GitBlobReader:
+    """Serves blob reads from one persistent `git cat-file --batch` process.
+
+    The process is started lazily on the first read and restarted if it dies.
+    Requests are serialized with a lock, so one reader can be shared by the
+    threads of ConflictDetector.detect_conflicts. Responses are read on a
+    background thread so that a request can time out: a process that does
+    not answer within the timeout is killed and started again on the next
+    read. Content is decoded with universal newlines, like text-mode git
+    output.
+
+    Protocol (per request):
+        stdin:  "<sha>\\n"
+        stdout: "<sha> blob <size>\\n<content>\\n"  or  "<sha> missing\\n"
+
+    Example:
+        >>> with GitBlobReader(".confluence-sync/MYSPACE_md") as reader:
+        ...     content = reader.read("3b18e512dba79e4c8300dd08aeb37f8e728b8dad")
+    """
+
+    def __init__(self, repo_path: str, timeout: float = BLOB_READ_TIMEOUT):
+        """Initialize blob reader.
+
+        Args:
+            repo_path: Path to git repository
+            timeout: Seconds to wait for each blob before giving up
+        """
+        self.repo_path = repo_path
+        self.timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Union[_Response, Exception]]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GitBlobReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the cat-file process if it is not running.
+
+        Returns:
+            Running cat-file process
+
+        Raises:
+            GitRepositoryError: If git cannot be started
+        """
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+
+        try:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise GitRepositoryError(
+                repo_path=self.repo_path,
+                message="Git command not found. Please install git.",
+            ) from None
+        except OSError as e:
+            raise GitRepositoryError(
+                repo_path=self.repo_path,
+                message=f"Failed to start git cat-file: {e}",
+            ) from e
+
+        # Each process gets its own queue, so a response that arrives after
+        # a timeout can never be taken as the answer to a later request
+        self._responses = queue.Queue()
+        threading.Thread(
+            target=_read_responses,
+            args=(self._process.stdout, self._responses),
+            name="git-cat-file-reader",
+            daemon=True,
+        ).start()
+
+        logger.debug(f"Started git cat-file --batch for {self.repo_path}")
+        return self._process
+
+    def read(self, blob_sha: str) -> Optional[str]:
+        """Read a single blob.
+
+        Args:
+            blob_sha: Blob SHA (full or unambiguous prefix)
+
+        Returns:
+            Blob content decoded as UTF-8, or None if the object is missing
+
+        Raises:
+            GitRepositoryError: If the cat-file process fails
+        """
+        with self._lock:
+            return self._read_locked(blob_sha)
+
+    def read_many(self, blob_shas: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Read many blobs over the same pipe.
+
+        Args:
+            blob_shas: Blob SHAs to read
+
+        Returns:
+            Mapping of SHA to content (None for missing objects)
+
+        Raises:
+            GitRepositoryError: If the cat-file process fails
+        """
+        results: Dict[str, Optional[str]] = {}
+        with self._lock:
+            for blob_sha in blob_shas:
+                if blob_sha not in results:
+                    results[blob_sha] = self._read_locked(blob_sha)
+        return results
+
+    def _read_locked(self, blob_sha: str) -> Optional[str]:
+        """Perform one request/response round-trip (lock must be held)."""
+        process = self._ensure_started()
+        assert process.stdin is not None
+
+        try:
+            process.stdin.write(f"{blob_sha}\n".encode("ascii"))
+            process.stdin.flush()
+            response = self._responses.get(timeout=self.timeout)
+        except queue.Empty:
+            self._terminate()
+            raise GitRepositoryError(
+                repo_path=self.repo_path,
+                message=(
+                    f"Timed out reading blob {blob_sha[:8]} from git cat-file "
+                    f"after {self.timeout} seconds"
+                ),
+            ) from None
+        except OSError as e:
+            self._terminate()
+            raise GitRepositoryError(
+                repo_path=self.repo_path,
+                message=f"Failed to read blob {blob_sha[:8]} from git cat-file: {e}",
+            ) from e
+
+        if response is None or isinstance(response, Exception):
+            self._terminate()
+            reason = response or "git cat-file exited unexpectedly"
+            raise GitRepositoryError(
+                repo_path=self.repo_path,
+                message=f"Failed to read blob {blob_sha[:8]} from git cat-file: {reason}",
+            )
+
+        parts, content = response
+        if len(parts) != 3:
+            # "<sha> missing" or "<sha> ambiguous"
+            logger.warning(f"Blob {blob_sha[:8]} not found in repository")
+            return None
+
+        if parts[1] != "blob":
+            logger.warning(f"Object {blob_sha[:8]} is a {parts[1]}, not a blob")
+            return None
+
+        # Universal newlines, as the text-mode `git cat-file -p` reads gave
+        return content.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    def _terminate(self) -> None:
+        """Kill the cat-file process after a protocol error."""
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait()
+            except OSError:
+                pass
+            self._process = None
+
+    def close(self) -> None:
+        """Stop the cat-file process (it exits when stdin is closed)."""
+        with self._lock:
+            if self._process is None:
+                return
+
+            try:
+                if self._process.stdin is not None:
+                    self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._terminate()
+
+            self._process = None
+            logger.debug(f"Stopped git cat-file --batch for {self.repo_path}")
+
+
+def _read_responses(
+    stdout: IO[bytes],
+    responses: "queue.Queue[Union[_Response, Exception]]",
+) -> None:
+    """Parse cat-file responses into a queue until stdout closes.
+
+    Runs on the reader's background thread. Puts None after the last
+    response, or the exception if the output cannot be parsed.
+
+    Args:
+        stdout: Binary stdout of the cat-file process
+        responses: Queue the caller waits on
+    """
+    try:
+        while True:
+            header = stdout.readline()
+            if not header:
+                break
+
+            parts = header.decode("ascii", errors="replace").split()
+            content = b""
+            if len(parts) == 3:
+                content = stdout.read(int(parts[2]))
+                stdout.read(1)  # Trailing newline after content
+            responses.put((parts, content))
+    except (OSError, ValueError) as e:
+        responses.put(e)
+        return
+    responses.put(None)
@@ -36,6 +36,9 @@ class ConflictDetector:
     This class performs batch conflict detection across multiple pages using
     parallel API fetches. It leverages the XHTML cache to minimize API calls
     and retrieves base versions from the git repository for three-way merges.
+    Git reads from all worker threads share the repository's long-lived
+    cat-file reader, so checking dozens of conflicts spawns no extra git
+    processes.
 
     Example:
         >>> detector = ConflictDetector(page_ops, git_repo, cache)
@@ -229,14 +232,9 @@ class ConflictDetector:
                 message=f"Base version {local_version} not found in git history for page {page_id}",
             )
 
-        # 2. Fetch local version from git (should match local file)
-        # Using git as source of truth for consistency
-        local_markdown = self.git_repo.get_version(page_id, local_version)
-        if local_markdown is None:
-            raise GitRepositoryError(
-                repo_path=self.git_repo.repo_path,
-                message=f"Local version {local_version} not found in git history for page {page_id}",
-            )
+        # 2. Local version is the same git blob (should match local file);
+        # using git as source of truth for consistency, read only once
+        local_markdown = base_markdown
 
         # 3. Fetch remote version from Confluence (via cache)
         try:
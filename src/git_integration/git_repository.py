@@ -9,9 +9,11 @@ import logging
 import os
 import re
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 
+from src.git_integration.blob_reader import GitBlobReader
 from src.git_integration.errors import GitRepositoryError
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,15 @@ logger = logging.getLogger(__name__)
 # Git command timeout in seconds
 GIT_TIMEOUT = 10
 
+# Version index file, stored inside .git so it is never committed
+VERSION_INDEX_FILE = "confluence-sync-versions"
+
+# Commit subject written by commit_version (used to rebuild the index)
+VERSION_SUBJECT_PATTERN = re.compile(r"^Page (\S+): version (\d+)$")
+
+# Blob SHA git reports for a deleted file in --raw output
+NULL_SHA = "0" * 40
+
 
 class GitRepository:
     """Manages git repository for Confluence markdown mirror.
@@ -37,6 +48,15 @@ class GitRepository:
     Commit message format:
         "Page {page_id}: version {version}"
 
+    Version index:
+        Every committed (page_id, version) is recorded with its blob SHA in
+        .git/confluence-sync-versions (one "page_id version blob_sha" line per
+        commit, append-only). Lookups read the index instead of searching the
+        history, so they cost one blob read regardless of history length. The
+        index is rebuilt from commit messages if the file is missing. Blobs
+        are read through one long-lived `git cat-file --batch` process
+        (GitBlobReader); call close() when done to stop it.
+
     Example:
         >>> repo = GitRepository(".confluence-sync/MYSPACE_md")
         >>> repo.init_if_not_exists()
@@ -52,6 +72,19 @@ class GitRepository:
         """
         self.repo_path = repo_path
         self._ensure_absolute_path()
+        self._version_index: Optional[Dict[str, Dict[int, str]]] = None
+        self._index_lock = threading.Lock()
+        self._blob_reader = GitBlobReader(self.repo_path, timeout=GIT_TIMEOUT)
+
+    def __enter__(self) -> "GitRepository":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the background blob reader process (safe to call repeatedly)."""
+        self._blob_reader.close()
 
     def _ensure_absolute_path(self) -> None:
         """Convert repo_path to absolute path if relative."""
@@ -214,6 +247,11 @@ class GitRepository:
                 message=f"Git add timed out after {GIT_TIMEOUT} seconds",
             )
 
+        # Record the staged blob in the version index (valid even when the
+        # content is unchanged and git has nothing to commit)
+        blob_sha = self._get_staged_blob_sha(file_name)
+        self._record_version(page_id, version, blob_sha)
+
         # Commit file
         commit_message = message or f"Page {page_id}: version {version}"
 
@@ -283,31 +321,21 @@ class GitRepository:
                 message=f"Git rev-parse timed out after {GIT_TIMEOUT} seconds",
             )
 
-    def get_version(self, page_id: str, version: int) -> Optional[str]:
-        """Retrieve markdown for specific version from git history.
-
-        Searches git log for commit with matching page_id and version number,
-        then retrieves the file content at that commit.
+    def _get_staged_blob_sha(self, file_name: str) -> str:
+        """Get blob SHA of a file as currently staged in the git index.
 
         Args:
-            page_id: Confluence page ID
-            version: Version number to retrieve
+            file_name: File name relative to repository root
 
         Returns:
-            Markdown content, or None if version not found
+            Full blob SHA
 
         Raises:
             GitRepositoryError: If git command fails
         """
-        file_name = f"{page_id}.md"
-
-        # Search for commit with matching page and version
-        search_pattern = f"Page {page_id}: version {version}"
-
         try:
-            # Get commit SHA matching the version
             result = subprocess.run(
-                ["git", "log", "--all", "--grep", search_pattern, "--format=%H", "-n", "1"],
+                ["git", "rev-parse", f":{file_name}"],
                 cwd=self.repo_path,
                 capture_output=True,
                 text=True,
@@ -317,101 +345,251 @@ class GitRepository:
             if result.returncode != 0:
                 raise GitRepositoryError(
                     repo_path=self.repo_path,
-                    message=f"Failed to search git log for page {page_id} version {version}",
+                    message=f"Failed to resolve staged blob for {file_name}",
                     git_output=result.stderr,
                 )
 
-            commit_sha = result.stdout.strip()
+            return result.stdout.strip()
+
+        except subprocess.TimeoutExpired:
+            raise GitRepositoryError(
+                repo_path=self.repo_path,
+                message=f"Git rev-parse timed out after {GIT_TIMEOUT} seconds",
+            )
 
-            if not commit_sha:
-                logger.debug(f"Version {version} not found for page {page_id}")
-                return None
+    def _get_index_path(self) -> str:
+        """Get path of the persisted version index file."""
+        return os.path.join(self.repo_path, ".git", VERSION_INDEX_FILE)
+
+    def _load_version_index(self) -> Dict[str, Dict[int, str]]:
+        """Load the (page_id, version) -> blob SHA index, building it if needed.
+
+        The index is read from disk once per GitRepository instance. If no
+        index file exists yet (repository created by an older release), it is
+        rebuilt from commit history in a single git log pass and persisted.
+
+        Returns:
+            Mapping of page_id to {version: blob_sha}
+
+        Raises:
+            GitRepositoryError: If the index must be rebuilt and git log fails
+        """
+        with self._index_lock:
+            if self._version_index is not None:
+                return self._version_index
 
-            # Get file content at that commit
+            index_path = self._get_index_path()
+            if os.path.exists(index_path):
+                self._version_index = self._read_index_file(index_path)
+            else:
+                self._version_index = self._rebuild_version_index()
+                self._write_index_file(index_path, self._version_index)
+
+            return self._version_index
+
+    def _read_index_file(self, index_path: str) -> Dict[str, Dict[int, str]]:
+        """Parse the append-only index file (later lines win).
+
+        Args:
+            index_path: Path to the index file
+
+        Returns:
+            Mapping of page_id to {version: blob_sha}
+        """
+        index: Dict[str, Dict[int, str]] = {}
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) != 3 or not parts[1].isdigit():
+                        continue
+                    index.setdefault(parts[0], {})[int(parts[1])] = parts[2]
+        except OSError as e:
+            logger.warning(f"Failed to read version index {index_path}: {e}")
+            return self._rebuild_version_index()
+
+        logger.debug(f"Loaded version index with {len(index)} pages")
+        return index
+
+    def _write_index_file(
+        self, index_path: str, index: Dict[str, Dict[int, str]]
+    ) -> None:
+        """Persist a full index snapshot atomically.
+
+        Args:
+            index_path: Path to the index file
+            index: Mapping of page_id to {version: blob_sha}
+        """
+        if not os.path.isdir(os.path.dirname(index_path)):
+            return
+
+        temp_path = f"{index_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for page_id, versions in index.items():
+                    for version, blob_sha in versions.items():
+                        f.write(f"{page_id} {version} {blob_sha}\n")
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            # Non-critical: the index is rebuilt on the next run
+            logger.warning(f"Failed to write version index {index_path}: {e}")
+
+    def _rebuild_version_index(self) -> Dict[str, Dict[int, str]]:
+        """Rebuild the version index from commit history in one git log pass.
+
+        Commit subjects are parsed for "Page {page_id}: version {version}" and
+        the blob SHA of {page_id}.md is taken from --raw output. History is
+        walked newest first, so the newest commit for a version wins.
+
+        Returns:
+            Mapping of page_id to {version: blob_sha}
+
+        Raises:
+            GitRepositoryError: If git log fails
+        """
+        try:
             result = subprocess.run(
-                ["git", "show", f"{commit_sha}:{file_name}"],
+                ["git", "log", "--all", "--raw", "--no-abbrev", "--format=%x1e%s"],
                 cwd=self.repo_path,
                 capture_output=True,
                 text=True,
                 timeout=GIT_TIMEOUT,
             )
-
-            if result.returncode != 0:
-                # File might not exist at that commit
-                logger.warning(
-                    f"File {file_name} not found at commit {commit_sha[:8]}"
-                )
-                return None
-
-            return result.stdout
-
         except subprocess.TimeoutExpired:
             raise GitRepositoryError(
                 repo_path=self.repo_path,
-                message=f"Git command timed out after {GIT_TIMEOUT} seconds",
+                message=f"Git log timed out after {GIT_TIMEOUT} seconds",
             )
 
-    def get_latest_version_number(self, page_id: str) -> Optional[int]:
-        """Get latest version number committed for page.
+        if result.returncode != 0:
+            raise GitRepositoryError(
+                repo_path=self.repo_path,
+                message="Failed to search git log for version history",
+                git_output=result.stderr,
+            )
 
-        Parses commit messages to extract version numbers and returns the highest.
+        index: Dict[str, Dict[int, str]] = {}
+        for record in result.stdout.split("\x1e"):
+            lines = record.strip().split("\n")
+            match = VERSION_SUBJECT_PATTERN.match(lines[0])
+            if not match:
+                continue
+
+            page_id, version = match.group(1), int(match.group(2))
+            file_name = f"{page_id}.md"
+            for line in lines[1:]:
+                # :100644 100644 <old_sha> <new_sha> M\t<path>
+                if not line.startswith(":") or "\t" not in line:
+                    continue
+                meta, path = line.split("\t", 1)
+                blob_sha = meta.split()[3]
+                if path == file_name and blob_sha != NULL_SHA:
+                    index.setdefault(page_id, {}).setdefault(version, blob_sha)
+
+        logger.info(f"Rebuilt version index for {len(index)} pages from git history")
+        return index
+
+    def _record_version(self, page_id: str, version: int, blob_sha: str) -> None:
+        """Add a (page_id, version) entry to the in-memory and on-disk index.
 
         Args:
             page_id: Confluence page ID
+            version: Confluence version number
+            blob_sha: Blob SHA of the committed markdown
+        """
+        index = self._load_version_index()
+        with self._index_lock:
+            index.setdefault(page_id, {})[version] = blob_sha
+
+            index_path = self._get_index_path()
+            if not os.path.isdir(os.path.dirname(index_path)):
+                return
+            try:
+                with open(index_path, "a", encoding="utf-8") as f:
+                    f.write(f"{page_id} {version} {blob_sha}\n")
+            except OSError as e:
+                logger.warning(f"Failed to append to version index {index_path}: {e}")
+
+    def get_version(self, page_id: str, version: int) -> Optional[str]:
+        """Retrieve markdown for specific version from git history.
+
+        Looks up the blob SHA for (page_id, version) in the version index and
+        reads the blob through the shared cat-file process, without searching
+        the commit history or spawning git.
+
+        Args:
+            page_id: Confluence page ID
+            version: Version number to retrieve
 
         Returns:
-            Latest version number, or None if no commits
+            Markdown content, or None if version not found
 
         Raises:
-            GitRepositoryError: If git log fails
+            GitRepositoryError: If git command fails
         """
-        # Search for commits matching "Page {page_id}: version X"
-        search_pattern = f"Page {page_id}: version"
+        blob_sha = self._load_version_index().get(page_id, {}).get(version)
 
-        try:
-            result = subprocess.run(
-                ["git", "log", "--all", "--grep", search_pattern, "--format=%s"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=GIT_TIMEOUT,
-            )
+        if blob_sha is None:
+            logger.debug(f"Version {version} not found for page {page_id}")
+            return None
 
-            if result.returncode != 0:
-                raise GitRepositoryError(
-                    repo_path=self.repo_path,
-                    message=f"Failed to get version history for page {page_id}",
-                    git_output=result.stderr,
-                )
+        return self._blob_reader.read(blob_sha)
 
-            commit_messages = result.stdout.strip().split("\n")
+    def get_versions(
+        self, keys: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], Optional[str]]:
+        """Retrieve markdown for many (page_id, version) pairs in one pass.
 
-            if not commit_messages or commit_messages == [""]:
-                logger.debug(f"No commit history found for page {page_id}")
-                return None
+        All blobs are read over the same cat-file pipe, so the cost is one
+        index lookup and one pipe round-trip per version.
 
-            # Extract version numbers from commit messages
-            version_pattern = re.compile(rf"Page {re.escape(page_id)}: version (\d+)")
-            versions = []
+        Args:
+            keys: (page_id, version) pairs to retrieve
 
-            for msg in commit_messages:
-                match = version_pattern.search(msg)
-                if match:
-                    versions.append(int(match.group(1)))
+        Returns:
+            Mapping of (page_id, version) to markdown (None if not found)
 
-            if not versions:
-                logger.debug(f"No version numbers found in commits for page {page_id}")
-                return None
+        Raises:
+            GitRepositoryError: If git command fails
+        """
+        index = self._load_version_index()
+        keys = list(keys)
+
+        blob_shas = {
+            key: index.get(key[0], {}).get(key[1]) for key in keys
+        }
+        contents = self._blob_reader.read_many(
+            sha for sha in blob_shas.values() if sha is not None
+        )
 
-            latest = max(versions)
-            logger.debug(f"Latest version for page {page_id}: {latest}")
-            return latest
+        return {
+            key: contents.get(sha) if sha is not None else None
+            for key, sha in blob_shas.items()
+        }
 
-        except subprocess.TimeoutExpired:
-            raise GitRepositoryError(
-                repo_path=self.repo_path,
-                message=f"Git log timed out after {GIT_TIMEOUT} seconds",
-            )
+    def get_latest_version_number(self, page_id: str) -> Optional[int]:
+        """Get latest version number committed for page.
+
+        Returns the highest version recorded in the version index.
+
+        Args:
+            page_id: Confluence page ID
+
+        Returns:
+            Latest version number, or None if no commits
+
+        Raises:
+            GitRepositoryError: If the version index cannot be built
+        """
+        versions = self._load_version_index().get(page_id)
+
+        if not versions:
+            logger.debug(f"No commit history found for page {page_id}")
+            return None
+
+        latest = max(versions)
+        logger.debug(f"Latest version for page {page_id}: {latest}")
+        return latest
 
     def validate_repo(self) -> bool:
         """Check if repo is valid git repository.
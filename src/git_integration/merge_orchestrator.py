@@ -17,6 +17,7 @@ from src.git_integration.errors import GitRepositoryError, MergeConflictError
 from src.git_integration.git_repository import GitRepository
 from src.git_integration.merge_tool import MergeTool
 from src.git_integration.models import (
+    CacheStats,
     LocalPage,
     MergeResult,
     MergeStrategy,
@@ -113,6 +114,7 @@ class MergeOrchestrator:
             APIAccessError: If Confluence push fails
         """
         logger.info(f"Starting sync with strategy: {strategy.value}")
+        cache_start = self.cache.get_stats() if self.cache else None
         logger.info(f"Syncing {len(local_pages)} pages")
 
         # Handle force operations separately
@@ -234,6 +236,7 @@ class MergeOrchestrator:
             pages_failed=pages_failed,
             conflicts_resolved=conflicts_resolved,
             errors=errors,
+            cache_stats=self._cache_stats_since(cache_start),
         )
 
     def force_push(self, local_pages: list[LocalPage]) -> SyncResult:
@@ -261,6 +264,7 @@ class MergeOrchestrator:
             GitRepositoryError: If git commit fails
         """
         logger.info(f"Force pushing {len(local_pages)} pages to Confluence")
+        cache_start = self.cache.get_stats() if self.cache else None
 
         pages_synced = 0
         pages_failed = 0
@@ -334,6 +338,7 @@ class MergeOrchestrator:
             pages_failed=pages_failed,
             conflicts_resolved=0,
             errors=errors,
+            cache_stats=self._cache_stats_since(cache_start),
         )
 
     def force_pull(self, page_ids: list[str]) -> SyncResult:
@@ -360,6 +365,7 @@ class MergeOrchestrator:
             GitRepositoryError: If git commit fails
         """
         logger.info(f"Force pulling {len(page_ids)} pages from Confluence")
+        cache_start = self.cache.get_stats() if self.cache else None
 
         pages_synced = 0
         pages_failed = 0
@@ -434,8 +440,22 @@ class MergeOrchestrator:
             pages_failed=pages_failed,
             conflicts_resolved=0,
             errors=errors,
+            cache_stats=self._cache_stats_since(cache_start),
         )
 
+    def _cache_stats_since(self, start: Optional[CacheStats]) -> Optional[CacheStats]:
+        """Get the XHTML cache counters accumulated during this run.
+
+        Args:
+            start: Cache snapshot taken when the run started
+
+        Returns:
+            Counter differences, or None if there is no cache
+        """
+        if self.cache is None or start is None:
+            return None
+        return self.cache.get_stats().since(start)
+
     def _three_way_merge(
         self, base: str, local: str, remote: str
     ) -> MergeResult:
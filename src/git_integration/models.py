@@ -4,7 +4,7 @@ This module defines the data structures used throughout the git integration
 module for conflict detection, merging, and synchronization.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
@@ -132,6 +132,7 @@ class SyncResult:
         pages_failed: Number of pages that failed
         conflicts_resolved: Number of conflicts resolved
         errors: Error messages by page_id
+        cache_stats: XHTML cache counters for this run (None if no cache)
     """
 
     success: bool
@@ -139,6 +140,7 @@ class SyncResult:
     pages_failed: int
     conflicts_resolved: int
     errors: dict[str, str] = field(default_factory=dict)  # page_id -> error
+    cache_stats: Optional["CacheStats"] = None
 
 
 @dataclass
@@ -158,3 +160,46 @@ class CachedPage:
     xhtml: str
     last_modified: datetime
     cached_at: datetime
+
+
+@dataclass
+class CacheStats:
+    """XHTML cache counters.
+
+    Attributes:
+        hits: Lookups served from cache (memory or disk)
+        memory_hits: Lookups served from the in-memory LRU tier
+        disk_hits: Lookups served from disk
+        misses: Lookups not served from cache
+        evictions: Disk entries removed to stay within the byte budget
+        expired: Entries removed because they exceeded max age
+    """
+
+    hits: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expired: int = 0
+
+    def since(self, start: "CacheStats") -> "CacheStats":
+        """Get the counts accumulated after an earlier snapshot.
+
+        Args:
+            start: Snapshot taken at the start of the run
+
+        Returns:
+            New CacheStats with the difference of every counter
+        """
+        return CacheStats(**{
+            f.name: getattr(self, f.name) - getattr(start, f.name) for f in fields(self)
+        })
+
+    def merge(self, other: "CacheStats") -> None:
+        """Add another set of counters (e.g. of another space) into this one.
+
+        Args:
+            other: Counters to add
+        """
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
@@ -0,0 +1,149 @@
+"""Git-based change detection for local workspaces that are git repositories.
+
+When the synced folder lives in a git repository, git already knows which
+files changed. WorkspaceGit records a snapshot commit of the working tree at
+the end of each sync (without touching the user's branch, index or stash
+list) and later asks git which files differ from that snapshot, so local
+change detection does not depend on file mtimes, which checkouts and rebases
+rewrite.
+"""
+
+import logging
+import os
+import subprocess
+from typing import List, Optional, Set
+
+from src.git_integration.errors import GitRepositoryError
+from src.git_integration.git_repository import GIT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class WorkspaceGit:
+    """Queries the git repository that contains a local workspace.
+
+    Example:
+        >>> repo = WorkspaceGit.discover("./docs")
+        >>> snapshot = repo.snapshot()          # at the end of a sync
+        >>> repo.changed_files(snapshot, "./docs")  # at the start of the next
+        {'/home/me/project/docs/page.md'}
+    """
+
+    def __init__(self, root: str):
+        """Initialize for a repository root.
+
+        Args:
+            root: Absolute path of the repository work tree root
+        """
+        self.root = root
+
+    @classmethod
+    def discover(cls, path: str) -> Optional["WorkspaceGit"]:
+        """Find the git repository containing path.
+
+        Args:
+            path: Directory inside the work tree
+
+        Returns:
+            WorkspaceGit for the enclosing repository, or None if path is not
+            inside a git work tree (or git is not installed)
+        """
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--show-toplevel"],
+                cwd=path,
+                capture_output=True,
+                text=True,
+                timeout=GIT_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"git not usable for {path}: {e}")
+            return None
+
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        return cls(os.path.realpath(result.stdout.strip()))
+
+    def _run(self, args: List[str]) -> str:
+        """Run a git command in the repository.
+
+        Args:
+            args: git arguments (without "git")
+
+        Returns:
+            Command stdout
+
+        Raises:
+            GitRepositoryError: If the command fails or times out
+        """
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.root,
+                capture_output=True,
+                text=True,
+                timeout=GIT_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            raise GitRepositoryError(
+                repo_path=self.root,
+                message=f"git {args[0]} timed out after {GIT_TIMEOUT} seconds",
+            )
+
+        if result.returncode != 0:
+            raise GitRepositoryError(
+                repo_path=self.root,
+                message=f"git {args[0]} failed",
+                git_output=result.stderr,
+            )
+        return result.stdout
+
+    def snapshot(self) -> str:
+        """Record the current state of tracked files as a commit.
+
+        Uses `git stash create`, which writes a commit object for the working
+        tree without changing HEAD, the index, the work tree or the stash list.
+        A clean work tree yields HEAD itself.
+
+        Returns:
+            Commit SHA describing the current work tree
+
+        Raises:
+            GitRepositoryError: If the repository has no commits yet
+        """
+        sha = self._run(["stash", "create"]).strip()
+        if not sha:
+            sha = self._run(["rev-parse", "HEAD"]).strip()
+        return sha
+
+    def changed_files(self, since_commit: str, path: str) -> Set[str]:
+        """List files under path that differ from a snapshot commit.
+
+        Includes tracked files modified (staged or not) or deleted since the
+        commit and all untracked files, ignored ones included.
+
+        Args:
+            since_commit: Commit SHA from snapshot()
+            path: Directory to restrict the query to
+
+        Returns:
+            Set of absolute file paths
+
+        Raises:
+            GitRepositoryError: If the commit no longer exists or git fails
+        """
+        # Fails cleanly if the snapshot commit was garbage-collected
+        self._run(["cat-file", "-e", f"{since_commit}^{{commit}}"])
+
+        pathspec = os.path.relpath(os.path.realpath(path), self.root)
+        diff = self._run(
+            ["diff", "--name-only", "--no-renames", "-z", since_commit, "--", pathspec]
+        )
+        untracked = self._run(["ls-files", "--others", "-z", "--", pathspec])
+
+        changed = set()
+        for output in (diff, untracked):
+            for name in output.split('\0'):
+                if name:
+                    changed.add(os.path.join(self.root, name))
+        return changed
@@ -3,19 +3,39 @@
 This module provides the XHTMLCache class for caching XHTML content from
 Confluence pages to minimize API calls. It validates cached entries using
 last_modified timestamps and supports automatic cleanup of old entries.
+
+The cache has two tiers: a bounded in-memory LRU in front of the on-disk
+store. The disk store is kept within a total byte budget by evicting the
+least recently used entries, and expired entries can be removed by a
+background cleanup thread.
 """
 
+import dataclasses
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from src.git_integration.errors import CacheError
+from src.git_integration.models import CachedPage, CacheStats
 
 logger = logging.getLogger(__name__)
 
+# Default number of entries kept in the in-memory tier
+DEFAULT_MEMORY_ENTRIES = 256
+
+# Default total size budget for the on-disk tier (bytes)
+DEFAULT_MAX_DISK_BYTES = 100 * 1024 * 1024  # 100 MB
+
+# Default interval between background cleanup passes (seconds)
+DEFAULT_CLEANUP_INTERVAL = 3600
+
+CacheKey = tuple[str, int]
+
 
 class XHTMLCache:
     """Manages XHTML cache with timestamp validation.
@@ -28,6 +48,14 @@ class XHTMLCache:
     Cache validation is based on Confluence's last_modified timestamp. If the
     timestamp matches, the cached content is valid.
 
+    Tiers:
+        - Memory: up to max_memory_entries recently used entries (LRU)
+        - Disk: all entries, bounded by max_disk_bytes; when the budget is
+          exceeded the least recently used entries are evicted. Recency is
+          persisted via the .xhtml file mtime so it survives restarts; hits
+          only update the in-memory order, and the mtimes are written in a
+          batch by flush_recency (run by every cleanup pass).
+
     File structure:
         .confluence-sync/MYSPACE_xhtml/
           123456_v15.xhtml       # XHTML content
@@ -41,20 +69,43 @@ class XHTMLCache:
         >>> if xhtml is None:
         ...     # Cache miss - fetch from API
         ...     cache.put("123456", 15, xhtml_content, datetime.now())
+        >>> print(cache.get_stats().hits)
     """
 
-    def __init__(self, cache_dir: str, max_age_days: int = 7):
+    def __init__(
+        self,
+        cache_dir: str,
+        max_age_days: int = 7,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
         """Initialize XHTML cache.
 
         Args:
             cache_dir: Cache directory (e.g., .confluence-sync/MYSPACE_xhtml)
             max_age_days: Max age before re-fetch (default: 7 days)
+            max_memory_entries: Entries kept in the in-memory tier (0 disables it)
+            max_disk_bytes: Total size budget for the disk tier (0 = unbounded)
         """
         self.cache_dir = cache_dir
         self.max_age_days = max_age_days
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
         self._ensure_absolute_path()
         self._ensure_cache_dir_exists()
 
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[CacheKey, CachedPage]" = OrderedDict()
+        # Disk entries in LRU order (oldest first) -> size in bytes
+        self._disk_index: Optional["OrderedDict[CacheKey, int]"] = None
+        self._disk_bytes = 0
+        # Disk entries used since their mtime was last updated
+        self._recency_dirty: set[CacheKey] = set()
+        self._stats = CacheStats()
+
+        self._cleanup_thread: Optional[threading.Thread] = None
+        self._cleanup_stop = threading.Event()
+
     def _ensure_absolute_path(self) -> None:
         """Convert cache_dir to absolute path if relative."""
         if not os.path.isabs(self.cache_dir):
@@ -86,6 +137,19 @@ class XHTMLCache:
         meta_path = os.path.join(self.cache_dir, f"{base_name}.meta.json")
         return xhtml_path, meta_path
 
+    def get_stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters.
+
+        Returns:
+            Copy of the current CacheStats
+        """
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def _is_expired(self, cached_at: datetime) -> bool:
+        """Check whether an entry cached at cached_at exceeds max_age_days."""
+        return datetime.now() - cached_at > timedelta(days=self.max_age_days)
+
     def get(
         self,
         page_id: str,
@@ -95,9 +159,9 @@ class XHTMLCache:
         """Retrieve XHTML from cache if valid.
 
         Validates cache entry by:
-        1. Checking if files exist
+        1. Checking the memory tier, then whether files exist on disk
         2. Verifying last_modified matches Confluence timestamp
-        3. Ensuring cached_at is within max_age_days
+        3. Ensuring cached_at is within max_age_days (expired entries are removed)
 
         Args:
             page_id: Confluence page ID
@@ -107,6 +171,62 @@ class XHTMLCache:
         Returns:
             Cached XHTML if valid, None if cache miss
 
+        Raises:
+            CacheError: If cache file corrupted
+        """
+        key = (page_id, version)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            from_memory = entry is not None
+
+            if entry is None:
+                entry = self._read_disk_entry(page_id, version)
+                if entry is None:
+                    self._stats.misses += 1
+                    return None
+
+            # Validate last_modified matches
+            if entry.last_modified != last_modified:
+                logger.debug(
+                    f"Cache miss: last_modified mismatch for page {page_id} v{version}"
+                )
+                self._stats.misses += 1
+                return None
+
+            # Check max age
+            if self._is_expired(entry.cached_at):
+                age = datetime.now() - entry.cached_at
+                logger.debug(
+                    f"Cache miss: entry too old ({age.days} days) for page {page_id} v{version}"
+                )
+                self._remove_entry(key)
+                self._stats.expired += 1
+                self._stats.misses += 1
+                return None
+
+            self._stats.hits += 1
+            if from_memory:
+                self._stats.memory_hits += 1
+                self._memory.move_to_end(key)
+            else:
+                self._stats.disk_hits += 1
+                self._remember(entry)
+            self._touch_disk_entry(key)
+
+            logger.debug(f"Cache hit: page {page_id} v{version}")
+            return entry.xhtml
+
+    def _read_disk_entry(self, page_id: str, version: int) -> Optional[CachedPage]:
+        """Load an entry from disk.
+
+        Args:
+            page_id: Confluence page ID
+            version: Version number
+
+        Returns:
+            CachedPage, or None if files don't exist
+
         Raises:
             CacheError: If cache file corrupted
         """
@@ -131,35 +251,24 @@ class XHTMLCache:
                 message=f"Failed to read or parse metadata: {e}",
             )
 
-        # Validate last_modified matches
-        if cached_last_modified != last_modified:
-            logger.debug(
-                f"Cache miss: last_modified mismatch for page {page_id} v{version}"
-            )
-            return None
-
-        # Check max age
-        age = datetime.now() - cached_at
-        if age > timedelta(days=self.max_age_days):
-            logger.debug(
-                f"Cache miss: entry too old ({age.days} days) for page {page_id} v{version}"
-            )
-            return None
-
         # Load XHTML content
         try:
             with open(xhtml_path, "r", encoding="utf-8") as f:
                 xhtml = f.read()
-
-            logger.debug(f"Cache hit: page {page_id} v{version}")
-            return xhtml
-
         except OSError as e:
             raise CacheError(
                 cache_path=xhtml_path,
                 message=f"Failed to read XHTML content: {e}",
             )
 
+        return CachedPage(
+            page_id=page_id,
+            version=version,
+            xhtml=xhtml,
+            last_modified=cached_last_modified,
+            cached_at=cached_at,
+        )
+
     def put(
         self,
         page_id: str,
@@ -173,6 +282,9 @@ class XHTMLCache:
         - {page_id}_v{version}.xhtml: XHTML content
         - {page_id}_v{version}.meta.json: Metadata with last_modified and cached_at
 
+        The entry is also kept in the memory tier. If the disk tier exceeds
+        max_disk_bytes afterwards, least recently used entries are evicted.
+
         Args:
             page_id: Confluence page ID
             version: Version number
@@ -183,39 +295,256 @@ class XHTMLCache:
             CacheError: If write fails
         """
         xhtml_path, meta_path = self._get_cache_paths(page_id, version)
+        cached_at = datetime.now()
 
-        # Write XHTML content
-        try:
-            with open(xhtml_path, "w", encoding="utf-8") as f:
-                f.write(xhtml)
-        except OSError as e:
-            raise CacheError(
-                cache_path=xhtml_path,
-                message=f"Failed to write XHTML content: {e}",
+        with self._lock:
+            # Write XHTML content
+            try:
+                with open(xhtml_path, "w", encoding="utf-8") as f:
+                    f.write(xhtml)
+            except OSError as e:
+                raise CacheError(
+                    cache_path=xhtml_path,
+                    message=f"Failed to write XHTML content: {e}",
+                )
+
+            # Write metadata
+            metadata = {
+                "last_modified": last_modified.isoformat(),
+                "cached_at": cached_at.isoformat(),
+            }
+
+            try:
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump(metadata, f, indent=2)
+            except OSError as e:
+                # Try to clean up XHTML file if metadata write fails
+                try:
+                    os.remove(xhtml_path)
+                except OSError:
+                    pass
+
+                raise CacheError(
+                    cache_path=meta_path,
+                    message=f"Failed to write metadata: {e}",
+                )
+
+            key = (page_id, version)
+            self._remember(
+                CachedPage(
+                    page_id=page_id,
+                    version=version,
+                    xhtml=xhtml,
+                    last_modified=last_modified,
+                    cached_at=cached_at,
+                )
             )
 
-        # Write metadata
-        metadata = {
-            "last_modified": last_modified.isoformat(),
-            "cached_at": datetime.now().isoformat(),
-        }
+            disk_index = self._load_disk_index()
+            self._disk_bytes -= disk_index.pop(key, 0)
+            disk_index[key] = self._entry_size(xhtml_path, meta_path)
+            self._disk_bytes += disk_index[key]
+            self._enforce_disk_budget(keep=key)
+
+        logger.info(f"Cached page {page_id} v{version}")
 
+    def _remember(self, entry: CachedPage) -> None:
+        """Insert an entry in the memory tier, dropping the LRU entry if full."""
+        if self.max_memory_entries <= 0:
+            return
+
+        key = (entry.page_id, entry.version)
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _entry_size(xhtml_path: str, meta_path: str) -> int:
+        """Get combined on-disk size of an entry's files."""
+        size = 0
+        for path in (xhtml_path, meta_path):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size
+
+    def _load_disk_index(self) -> "OrderedDict[CacheKey, int]":
+        """Scan the cache directory once to build the disk LRU index.
+
+        Entries are ordered by .xhtml mtime (least recently used first).
+
+        Returns:
+            OrderedDict mapping (page_id, version) to entry size in bytes
+        """
+        if self._disk_index is not None:
+            return self._disk_index
+
+        entries = []
         try:
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            with os.scandir(self.cache_dir) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    if not name.endswith(".xhtml") or "_v" not in name:
+                        continue
+                    page_id, _, version_str = name[: -len(".xhtml")].rpartition("_v")
+                    if not version_str.isdigit():
+                        continue
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    _, meta_path = self._get_cache_paths(page_id, int(version_str))
+                    try:
+                        meta_size = os.path.getsize(meta_path)
+                    except OSError:
+                        meta_size = 0
+                    entries.append(
+                        (stat.st_mtime, (page_id, int(version_str)), stat.st_size + meta_size)
+                    )
         except OSError as e:
-            # Try to clean up XHTML file if metadata write fails
+            logger.warning(f"Failed to scan cache directory {self.cache_dir}: {e}")
+
+        entries.sort(key=lambda item: item[0])
+        self._disk_index = OrderedDict((key, size) for _, key, size in entries)
+        self._disk_bytes = sum(self._disk_index.values())
+        logger.debug(
+            f"Cache index loaded: {len(self._disk_index)} entries, {self._disk_bytes} bytes"
+        )
+        return self._disk_index
+
+    def _touch_disk_entry(self, key: CacheKey) -> None:
+        """Mark a disk entry as most recently used (mtime set by flush_recency)."""
+        disk_index = self._load_disk_index()
+        if key in disk_index:
+            disk_index.move_to_end(key)
+        else:
+            xhtml_path, meta_path = self._get_cache_paths(*key)
+            disk_index[key] = self._entry_size(xhtml_path, meta_path)
+            self._disk_bytes += disk_index[key]
+        self._recency_dirty.add(key)
+
+    def flush_recency(self) -> None:
+        """Persist the LRU order of entries used since the last flush.
+
+        Sets the .xhtml mtime of each such entry, oldest use first, so the
+        order is rebuilt after a restart.
+        """
+        with self._lock:
+            if not self._recency_dirty:
+                return
+            dirty = self._recency_dirty
+            self._recency_dirty = set()
+            used = [key for key in self._load_disk_index() if key in dirty]
+
+        for key in used:
+            xhtml_path, _ = self._get_cache_paths(*key)
             try:
-                os.remove(xhtml_path)
+                os.utime(xhtml_path)
             except OSError:
                 pass
 
-            raise CacheError(
-                cache_path=meta_path,
-                message=f"Failed to write metadata: {e}",
-            )
+    def _enforce_disk_budget(self, keep: Optional[CacheKey] = None) -> None:
+        """Evict least recently used disk entries until within max_disk_bytes.
 
-        logger.info(f"Cached page {page_id} v{version}")
+        Args:
+            keep: Entry that must not be evicted (the one just written)
+        """
+        if self.max_disk_bytes <= 0:
+            return
+
+        disk_index = self._load_disk_index()
+        while self._disk_bytes > self.max_disk_bytes:
+            victim = next((key for key in disk_index if key != keep), None)
+            if victim is None:
+                break
+            self._remove_entry(victim)
+            self._stats.evictions += 1
+            logger.debug(f"Evicted cache entry for page {victim[0]} v{victim[1]}")
+
+    def _remove_entry(self, key: CacheKey) -> None:
+        """Remove one entry from both tiers (lock must be held)."""
+        self._memory.pop(key, None)
+        self._recency_dirty.discard(key)
+
+        disk_index = self._load_disk_index()
+        self._disk_bytes -= disk_index.pop(key, 0)
+
+        for path in self._get_cache_paths(*key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to delete cache file {path}: {e}")
+
+    def cleanup_expired(self) -> int:
+        """Remove all entries older than max_age_days from both tiers.
+
+        Entries whose metadata cannot be read are removed as well.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            for key in list(self._load_disk_index()):
+                _, meta_path = self._get_cache_paths(*key)
+                try:
+                    with open(meta_path, "r", encoding="utf-8") as f:
+                        cached_at = datetime.fromisoformat(json.load(f)["cached_at"])
+                    expired = self._is_expired(cached_at)
+                except (OSError, json.JSONDecodeError, KeyError, ValueError):
+                    expired = True
+
+                if expired:
+                    self._remove_entry(key)
+                    self._stats.expired += 1
+                    removed += 1
+
+        self.flush_recency()
+        if removed:
+            logger.info(f"Cache cleanup: removed {removed} expired entries")
+        return removed
+
+    def start_background_cleanup(
+        self, interval_seconds: float = DEFAULT_CLEANUP_INTERVAL
+    ) -> None:
+        """Start a daemon thread that runs cleanup_expired periodically.
+
+        The first pass runs immediately. Calling this while a cleanup thread is
+        already running is a no-op.
+
+        Args:
+            interval_seconds: Seconds between cleanup passes
+        """
+        if self._cleanup_thread is not None and self._cleanup_thread.is_alive():
+            return
+
+        self._cleanup_stop.clear()
+
+        def _run() -> None:
+            while not self._cleanup_stop.is_set():
+                try:
+                    self.cleanup_expired()
+                except Exception as e:
+                    logger.warning(f"Background cache cleanup failed: {e}")
+                self._cleanup_stop.wait(interval_seconds)
+
+        self._cleanup_thread = threading.Thread(
+            target=_run, name="xhtml-cache-cleanup", daemon=True
+        )
+        self._cleanup_thread.start()
+        logger.debug(f"Started background cache cleanup every {interval_seconds}s")
+
+    def stop_background_cleanup(self) -> None:
+        """Stop the background cleanup thread if running and flush recency."""
+        self._cleanup_stop.set()
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join(timeout=5)
+            self._cleanup_thread = None
+        self.flush_recency()
 
     def invalidate(self, page_id: str) -> None:
         """Delete all cache entries for page.
@@ -228,13 +557,22 @@ class XHTMLCache:
         pattern = f"{page_id}_v*"
         cache_path = Path(self.cache_dir)
 
-        deleted_count = 0
-        for file_path in cache_path.glob(pattern):
-            try:
-                file_path.unlink()
-                deleted_count += 1
-            except OSError as e:
-                logger.warning(f"Failed to delete cache file {file_path}: {e}")
+        with self._lock:
+            for key in [key for key in self._memory if key[0] == page_id]:
+                del self._memory[key]
+            self._recency_dirty = {key for key in self._recency_dirty if key[0] != page_id}
+
+            disk_index = self._load_disk_index()
+            for key in [key for key in disk_index if key[0] == page_id]:
+                self._disk_bytes -= disk_index.pop(key)
+
+            deleted_count = 0
+            for file_path in cache_path.glob(pattern):
+                try:
+                    file_path.unlink()
+                    deleted_count += 1
+                except OSError as e:
+                    logger.warning(f"Failed to delete cache file {file_path}: {e}")
 
         if deleted_count > 0:
             logger.info(f"Invalidated {deleted_count} cache entries for page {page_id}")
@@ -248,15 +586,21 @@ class XHTMLCache:
         """
         cache_path = Path(self.cache_dir)
 
-        deleted_count = 0
-        for file_path in cache_path.glob("*"):
-            if file_path.is_file() and (
-                file_path.suffix == ".xhtml" or file_path.name.endswith(".meta.json")
-            ):
-                try:
-                    file_path.unlink()
-                    deleted_count += 1
-                except OSError as e:
-                    logger.warning(f"Failed to delete cache file {file_path}: {e}")
+        with self._lock:
+            self._memory.clear()
+            self._recency_dirty.clear()
+            self._disk_index = OrderedDict()
+            self._disk_bytes = 0
+
+            deleted_count = 0
+            for file_path in cache_path.glob("*"):
+                if file_path.is_file() and (
+                    file_path.suffix == ".xhtml" or file_path.name.endswith(".meta.json")
+                ):
+                    try:
+                        file_path.unlink()
+                        deleted_count += 1
+                    except OSError as e:
+                        logger.warning(f"Failed to delete cache file {file_path}: {e}")
 
         logger.info(f"Cleared cache: deleted {deleted_count} files")
@@ -0,0 +1,491 @@
+"""Single-file XHTML cache store for Confluence pages.
+
+This module provides XHTMLPackCache, an alternative storage format for
+XHTMLCache. Instead of two small files per page version, all entries live in
+one append-only pack file of zlib-compressed records. An in-memory index maps
+(page_id, version) to the record offset and metadata, so lookups are a dict
+lookup plus a single seek/read without touching per-entry JSON.
+"""
+
+import dataclasses
+import logging
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime, timedelta
+from typing import BinaryIO, NamedTuple, Optional
+
+from src.git_integration.errors import CacheError
+from src.git_integration.models import CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Pack file name inside the cache directory
+PACK_FILE_NAME = "xhtml.pack"
+
+# Record header: magic, kind, version, key length, metadata length, payload length
+RECORD_MAGIC = b"XPK1"
+RECORD_HEADER = struct.Struct(">4sBIHHI")
+
+# Record kinds
+RECORD_PUT = 1
+RECORD_DELETE = 2  # Tombstone for one version of a page (all versions if 0)
+
+# Compact automatically once dead records make up this share of the pack
+COMPACTION_GARBAGE_RATIO = 0.5
+
+# ...but only when the pack holds at least this many dead bytes
+COMPACTION_MIN_GARBAGE_BYTES = 1024 * 1024  # 1 MB
+
+
+class PackIndexEntry(NamedTuple):
+    """Location and metadata of one live record in the pack file.
+
+    offset and length locate the compressed payload; record_size is the
+    whole record (header, key, metadata and payload) as counted in the pack
+    size.
+    """
+
+    offset: int
+    length: int
+    last_modified: datetime
+    cached_at: datetime
+    record_size: int
+
+
+class XHTMLPackCache:
+    """Manages an XHTML cache stored in a single append-only pack file.
+
+    Public API mirrors XHTMLCache (get/put/invalidate/clear_all/
+    cleanup_expired/get_stats), so either store can be passed as the cache of
+    MergeOrchestrator and ConflictDetector.
+
+    Record layout (big-endian):
+        header:  magic(4) kind(1) version(4) key_len(2) meta_len(2) payload_len(4)
+        key:     page_id (UTF-8)
+        meta:    "<last_modified ISO>|<cached_at ISO>" (UTF-8, PUT only)
+        payload: zlib-compressed XHTML (PUT only)
+
+    The index is rebuilt on open by scanning record headers (payloads are
+    skipped with a seek). A partially written record at the tail (e.g. after a
+    crash) is truncated. Invalidations and expired entries dropped by get()
+    append tombstones; compact() rewrites the pack with live records only.
+
+    File structure:
+        .confluence-sync/MYSPACE_xhtml/
+          xhtml.pack
+
+    Example:
+        >>> cache = XHTMLPackCache(".confluence-sync/MYSPACE_xhtml")
+        >>> xhtml = cache.get("123456", 15, last_modified)
+        >>> if xhtml is None:
+        ...     cache.put("123456", 15, xhtml_content, last_modified)
+        >>> cache.close()
+    """
+
+    def __init__(self, cache_dir: str, max_age_days: int = 7):
+        """Initialize pack cache and load its index.
+
+        Args:
+            cache_dir: Cache directory (e.g., .confluence-sync/MYSPACE_xhtml)
+            max_age_days: Max age before re-fetch (default: 7 days)
+
+        Raises:
+            CacheError: If the directory or pack file cannot be opened
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_age_days = max_age_days
+        self.pack_path = os.path.join(self.cache_dir, PACK_FILE_NAME)
+
+        self._lock = threading.RLock()
+        self._index: dict[tuple[str, int], PackIndexEntry] = {}
+        self._pack_size = 0
+        self._live_bytes = 0
+        self._stats = CacheStats()
+        self._file: Optional[BinaryIO] = None
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            raise CacheError(
+                cache_path=self.cache_dir,
+                message=f"Failed to create cache directory: {e}",
+            ) from e
+
+        self._open()
+
+    def __enter__(self) -> "XHTMLPackCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _open(self) -> None:
+        """Open the pack file and rebuild the index from record headers."""
+        try:
+            self._file = open(self.pack_path, "a+b")
+        except OSError as e:
+            raise CacheError(
+                cache_path=self.pack_path,
+                message=f"Failed to open pack file: {e}",
+            ) from e
+
+        self._load_index()
+
+    def _require_file(self) -> BinaryIO:
+        """Get the open pack file.
+
+        Raises:
+            CacheError: If the cache has been closed
+        """
+        if self._file is None or self._file.closed:
+            raise CacheError(cache_path=self.pack_path, message="Pack cache is closed")
+        return self._file
+
+    def _load_index(self) -> None:
+        """Scan record headers and rebuild the in-memory index."""
+        index: dict[tuple[str, int], PackIndexEntry] = {}
+        f = self._require_file()
+        f.seek(0, os.SEEK_END)
+        file_size = f.tell()
+        offset = 0
+
+        while offset < file_size:
+            f.seek(offset)
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                break
+
+            magic, kind, version, key_len, meta_len, payload_len = RECORD_HEADER.unpack(
+                header
+            )
+            record_size = RECORD_HEADER.size + key_len + meta_len + payload_len
+            if magic != RECORD_MAGIC or offset + record_size > file_size:
+                break
+
+            try:
+                page_id = f.read(key_len).decode("utf-8")
+                meta = f.read(meta_len).decode("utf-8")
+            except UnicodeDecodeError:
+                break
+
+            if kind == RECORD_DELETE:
+                for key in [
+                    key for key in index if key[0] == page_id and version in (0, key[1])
+                ]:
+                    del index[key]
+            elif kind == RECORD_PUT:
+                try:
+                    last_modified_str, cached_at_str = meta.split("|", 1)
+                    index[(page_id, version)] = PackIndexEntry(
+                        offset=offset + RECORD_HEADER.size + key_len + meta_len,
+                        length=payload_len,
+                        last_modified=datetime.fromisoformat(last_modified_str),
+                        cached_at=datetime.fromisoformat(cached_at_str),
+                        record_size=record_size,
+                    )
+                except ValueError:
+                    break
+            else:
+                break
+
+            offset += record_size
+
+        if offset < file_size:
+            logger.warning(
+                f"Truncating damaged pack tail at offset {offset} "
+                f"({file_size - offset} bytes) in {self.pack_path}"
+            )
+            f.truncate(offset)
+
+        self._index = index
+        self._pack_size = offset
+        self._live_bytes = sum(entry.record_size for entry in index.values())
+        logger.debug(f"Pack index loaded: {len(index)} entries, {offset} bytes")
+
+    def _append(self, kind: int, page_id: str, version: int, meta: str, payload: bytes) -> int:
+        """Append one record to the pack.
+
+        Returns:
+            Offset of the record payload
+
+        Raises:
+            CacheError: If the write fails
+        """
+        key = page_id.encode("utf-8")
+        meta_bytes = meta.encode("utf-8")
+        header = RECORD_HEADER.pack(
+            RECORD_MAGIC, kind, version, len(key), len(meta_bytes), len(payload)
+        )
+        f = self._require_file()
+
+        try:
+            f.seek(0, os.SEEK_END)
+            f.write(header + key + meta_bytes + payload)
+            f.flush()
+        except OSError as e:
+            # Drop any partial record so the pack stays parseable
+            try:
+                f.truncate(self._pack_size)
+            except OSError:
+                pass
+            raise CacheError(
+                cache_path=self.pack_path,
+                message=f"Failed to append to pack file: {e}",
+            ) from e
+
+        payload_offset = self._pack_size + len(header) + len(key) + len(meta_bytes)
+        self._pack_size = payload_offset + len(payload)
+        return payload_offset
+
+    def get_stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters.
+
+        Returns:
+            Copy of the current CacheStats
+        """
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def get(
+        self,
+        page_id: str,
+        version: int,
+        last_modified: datetime,
+    ) -> Optional[str]:
+        """Retrieve XHTML from cache if valid.
+
+        Args:
+            page_id: Confluence page ID
+            version: Version number
+            last_modified: Confluence last_modified timestamp
+
+        Returns:
+            Cached XHTML if valid, None if cache miss
+
+        Raises:
+            CacheError: If the record cannot be read or decompressed
+        """
+        key = (page_id, version)
+
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None or entry.last_modified != last_modified:
+                self._stats.misses += 1
+                return None
+
+            if datetime.now() - entry.cached_at > timedelta(days=self.max_age_days):
+                logger.debug(f"Cache miss: entry too old for page {page_id} v{version}")
+                self._drop_expired(key)
+                self._stats.expired += 1
+                self._stats.misses += 1
+                return None
+
+            f = self._require_file()
+            try:
+                f.seek(entry.offset)
+                payload = f.read(entry.length)
+                xhtml = zlib.decompress(payload).decode("utf-8")
+            except (OSError, zlib.error, UnicodeDecodeError) as e:
+                raise CacheError(
+                    cache_path=self.pack_path,
+                    message=f"Failed to read record for page {page_id} v{version}: {e}",
+                ) from e
+
+            self._stats.hits += 1
+            self._stats.disk_hits += 1
+
+        logger.debug(f"Cache hit: page {page_id} v{version}")
+        return xhtml
+
+    def _drop_expired(self, key: tuple[str, int]) -> None:
+        """Unindex an expired entry and record it with a tombstone (lock must be held).
+
+        A failed tombstone write is only logged: the entry is expired anyway,
+        so after a reopen it would be dropped again.
+        """
+        self._live_bytes -= self._index.pop(key).record_size
+        try:
+            self._append(RECORD_DELETE, key[0], key[1], "", b"")
+        except CacheError as e:
+            logger.warning(f"Failed to record expiry of page {key[0]} v{key[1]}: {e}")
+
+    def put(
+        self,
+        page_id: str,
+        version: int,
+        xhtml: str,
+        last_modified: datetime,
+    ) -> None:
+        """Store XHTML in cache by appending a compressed record.
+
+        Args:
+            page_id: Confluence page ID
+            version: Version number
+            xhtml: XHTML content to cache
+            last_modified: Confluence last_modified timestamp
+
+        Raises:
+            CacheError: If write fails
+        """
+        cached_at = datetime.now()
+        payload = zlib.compress(xhtml.encode("utf-8"))
+        meta = f"{last_modified.isoformat()}|{cached_at.isoformat()}"
+
+        with self._lock:
+            record_start = self._pack_size
+            offset = self._append(RECORD_PUT, page_id, version, meta, payload)
+            entry = PackIndexEntry(
+                offset=offset,
+                length=len(payload),
+                last_modified=last_modified,
+                cached_at=cached_at,
+                record_size=self._pack_size - record_start,
+            )
+
+            previous = self._index.get((page_id, version))
+            if previous is not None:
+                self._live_bytes -= previous.record_size
+            self._index[(page_id, version)] = entry
+            self._live_bytes += entry.record_size
+
+            self._maybe_compact()
+
+        logger.info(f"Cached page {page_id} v{version}")
+
+    def invalidate(self, page_id: str) -> None:
+        """Delete all cache entries for page.
+
+        Appends a tombstone record; space is reclaimed by compact().
+
+        Args:
+            page_id: Confluence page ID
+        """
+        with self._lock:
+            keys = [key for key in self._index if key[0] == page_id]
+            if not keys:
+                logger.debug(f"No cache entries found for page {page_id}")
+                return
+
+            self._append(RECORD_DELETE, page_id, 0, "", b"")
+            for key in keys:
+                self._live_bytes -= self._index.pop(key).record_size
+
+        logger.info(f"Invalidated {len(keys)} cache entries for page {page_id}")
+
+    def clear_all(self) -> None:
+        """Delete all cache entries (all pages)."""
+        with self._lock:
+            count = len(self._index)
+            try:
+                self._require_file().truncate(0)
+            except OSError as e:
+                raise CacheError(
+                    cache_path=self.pack_path,
+                    message=f"Failed to truncate pack file: {e}",
+                ) from e
+            self._index = {}
+            self._pack_size = 0
+            self._live_bytes = 0
+
+        logger.info(f"Cleared cache: deleted {count} entries")
+
+    def cleanup_expired(self) -> int:
+        """Remove all entries older than max_age_days and compact the pack.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            cutoff = datetime.now() - timedelta(days=self.max_age_days)
+            expired = [key for key, entry in self._index.items() if entry.cached_at < cutoff]
+            for key in expired:
+                self._live_bytes -= self._index.pop(key).record_size
+            self._stats.expired += len(expired)
+
+            if expired:
+                self.compact()
+
+        if expired:
+            logger.info(f"Cache cleanup: removed {len(expired)} expired entries")
+        return len(expired)
+
+    def _maybe_compact(self) -> None:
+        """Compact when dead records dominate the pack (lock must be held)."""
+        garbage = self._pack_size - self._live_bytes
+        if (
+            garbage >= COMPACTION_MIN_GARBAGE_BYTES
+            and garbage > self._pack_size * COMPACTION_GARBAGE_RATIO
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the pack with live records only.
+
+        The new pack is written to a temporary file and atomically swapped in.
+
+        Raises:
+            CacheError: If the rewrite fails
+        """
+        tmp_path = f"{self.pack_path}.tmp"
+
+        with self._lock:
+            old_size = self._pack_size
+            f = self._require_file()
+            new_index: dict[tuple[str, int], PackIndexEntry] = {}
+            try:
+                with open(tmp_path, "wb") as out:
+                    position = 0
+                    for (page_id, version), entry in sorted(
+                        self._index.items(), key=lambda item: item[1].offset
+                    ):
+                        f.seek(entry.offset)
+                        payload = f.read(entry.length)
+                        key = page_id.encode("utf-8")
+                        meta = (
+                            f"{entry.last_modified.isoformat()}|{entry.cached_at.isoformat()}"
+                        ).encode("utf-8")
+                        out.write(
+                            RECORD_HEADER.pack(
+                                RECORD_MAGIC, RECORD_PUT, version, len(key), len(meta), len(payload)
+                            )
+                        )
+                        out.write(key)
+                        out.write(meta)
+                        payload_offset = position + RECORD_HEADER.size + len(key) + len(meta)
+                        out.write(payload)
+                        new_position = payload_offset + len(payload)
+                        new_index[(page_id, version)] = entry._replace(
+                            offset=payload_offset, record_size=new_position - position
+                        )
+                        position = new_position
+                    out.flush()
+                    os.fsync(out.fileno())
+
+                f.close()
+                os.replace(tmp_path, self.pack_path)
+            except OSError as e:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise CacheError(
+                    cache_path=self.pack_path,
+                    message=f"Failed to compact pack file: {e}",
+                ) from e
+            finally:
+                if f.closed:
+                    self._file = open(self.pack_path, "a+b")
+
+            self._index = new_index
+            self._pack_size = position
+            self._live_bytes = sum(entry.record_size for entry in new_index.values())
+
+        logger.info(f"Compacted pack file: {old_size} -> {position} bytes")
+
+    def close(self) -> None:
+        """Close the pack file."""
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self._file.close()
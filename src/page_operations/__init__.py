@@ -33,6 +33,7 @@ from .adf_models import (
     AdfNodeType,
     AdfOperation,
     AdfUpdateResult,
+    PreparedAdfUpdate,
 )
 from .adf_parser import AdfParser
 from .adf_editor import AdfEditor
@@ -69,4 +70,5 @@ __all__ = [
     "AdfNodeType",
     "AdfOperation",
     "AdfUpdateResult",
+    "PreparedAdfUpdate",
 ]
@@ -9,6 +9,7 @@ import copy
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
+from .adf_index import AdfDocumentIndex
 from .adf_models import (
     AdfDocument,
     AdfNode,
@@ -63,8 +64,11 @@ class AdfEditor:
         if local_id_map is None:
             local_id_map = self._build_content_to_id_map(adf_doc)
 
+        # One index for all operations, kept current as they edit the copy
+        index = AdfDocumentIndex(modified, local_id_map)
+
         for op in operations:
-            success = self._apply_single_operation(modified, op, local_id_map)
+            success = self._apply_single_operation(modified, op, index)
             if success:
                 success_count += 1
                 logger.debug(f"Applied operation: {op.op_type.value}")
@@ -81,14 +85,14 @@ class AdfEditor:
         self,
         doc: AdfDocument,
         op: SurgicalOperation,
-        local_id_map: Dict[str, str],
+        index: AdfDocumentIndex,
     ) -> bool:
         """Apply a single operation to the document.
 
         Args:
             doc: Document to modify (in-place)
             op: Operation to apply
-            local_id_map: Content to localId mapping
+            index: Lookup index of the document
 
         Returns:
             True if operation succeeded, False otherwise
@@ -96,25 +100,25 @@ class AdfEditor:
         op_type = op.op_type
 
         if op_type == OperationType.UPDATE_TEXT:
-            return self._update_text(doc, op, local_id_map)
+            return self._update_text(doc, op, index)
 
         elif op_type == OperationType.DELETE_BLOCK:
-            return self._delete_block(doc, op, local_id_map)
+            return self._delete_block(doc, op, index)
 
         elif op_type == OperationType.INSERT_BLOCK:
-            return self._insert_block(doc, op, local_id_map)
+            return self._insert_block(doc, op, index)
 
         elif op_type == OperationType.CHANGE_HEADING_LEVEL:
-            return self._change_heading_level(doc, op, local_id_map)
+            return self._change_heading_level(doc, op, index)
 
         elif op_type == OperationType.TABLE_UPDATE_CELL:
-            return self._table_update_cell(doc, op, local_id_map)
+            return self._table_update_cell(doc, op, index)
 
         elif op_type == OperationType.TABLE_INSERT_ROW:
-            return self._table_insert_row(doc, op, local_id_map)
+            return self._table_insert_row(doc, op, index)
 
         elif op_type == OperationType.TABLE_DELETE_ROW:
-            return self._table_delete_row(doc, op, local_id_map)
+            return self._table_delete_row(doc, op, index)
 
         else:
             logger.warning(f"Unsupported operation type: {op_type}")
@@ -124,33 +128,27 @@ class AdfEditor:
         self,
         doc: AdfDocument,
         op: SurgicalOperation,
-        local_id_map: Dict[str, str],
+        index: AdfDocumentIndex,
     ) -> bool:
         """Update text content in a node.
 
         Args:
             doc: Document to modify
             op: UPDATE_TEXT operation
-            local_id_map: Content to localId mapping
+            index: Lookup index of the document
 
         Returns:
             True if update succeeded
         """
         # Find target node by content → localId
-        local_id = local_id_map.get(op.target_content)
-
-        if not local_id:
-            # Try partial match
-            local_id = self._find_id_by_partial_content(
-                local_id_map, op.target_content
-            )
+        local_id = self._resolve_local_id(index, op.target_content)
 
         if not local_id:
             logger.debug(f"No localId found for content: {op.target_content[:50]}...")
             return False
 
         # Find the node
-        node = doc.find_by_local_id(local_id)
+        node = index.find(local_id)
         if not node:
             logger.debug(f"Node not found for localId: {local_id}")
             return False
@@ -161,98 +159,90 @@ class AdfEditor:
             return False
 
         # Update the text content
-        return self._replace_node_text(node, op.new_content)
+        if not self._replace_node_text(node, op.new_content):
+            return False
+        index.node_changed(node)
+        # Later inserts anchor on the block's new text
+        if op.new_content and op.new_content.strip():
+            index.add_text(op.new_content, local_id)
+        return True
 
     def _delete_block(
         self,
         doc: AdfDocument,
         op: SurgicalOperation,
-        local_id_map: Dict[str, str],
+        index: AdfDocumentIndex,
     ) -> bool:
         """Delete a block node from the document.
 
         Args:
             doc: Document to modify
             op: DELETE_BLOCK operation
-            local_id_map: Content to localId mapping
+            index: Lookup index of the document
 
         Returns:
             True if deletion succeeded
         """
-        local_id = local_id_map.get(op.target_content)
-
-        if not local_id:
-            local_id = self._find_id_by_partial_content(
-                local_id_map, op.target_content
-            )
+        local_id = self._resolve_local_id(index, op.target_content)
 
         if not local_id:
             return False
 
         # Find and remove from parent
-        return self._remove_node_by_id(doc, local_id)
+        return self._remove_node_by_id(doc, local_id, index)
 
     def _insert_block(
         self,
         doc: AdfDocument,
         op: SurgicalOperation,
-        local_id_map: Dict[str, str],
+        index: AdfDocumentIndex,
     ) -> bool:
         """Insert a new block after a target node.
 
         Args:
             doc: Document to modify
             op: INSERT_BLOCK operation
-            local_id_map: Content to localId mapping
+            index: Lookup index of the document
 
         Returns:
             True if insertion succeeded
         """
         # Find the anchor node (insert after this)
-        anchor_local_id = local_id_map.get(op.after_content)
-
-        if not anchor_local_id:
-            anchor_local_id = self._find_id_by_partial_content(
-                local_id_map, op.after_content
-            )
+        anchor_local_id = self._resolve_local_id(index, op.after_content)
 
         if not anchor_local_id:
             # Insert at end if no anchor found
             logger.debug("No anchor found, inserting at end")
             new_node = self._create_paragraph_node(op.new_content)
-            doc.content.append(new_node)
+            index.insert_top_level(len(doc.content), new_node)
+            self._index_inserted_text(index, new_node, op.new_content)
             return True
 
         # Find anchor and insert after it
-        return self._insert_after_node(doc, anchor_local_id, op.new_content)
+        return self._insert_after_node(doc, anchor_local_id, op.new_content, index)
 
     def _change_heading_level(
         self,
         doc: AdfDocument,
         op: SurgicalOperation,
-        local_id_map: Dict[str, str],
+        index: AdfDocumentIndex,
     ) -> bool:
         """Change the level of a heading.
 
         Args:
             doc: Document to modify
             op: CHANGE_HEADING_LEVEL operation
-            local_id_map: Content to localId mapping
+            index: Lookup index of the document
 
         Returns:
             True if change succeeded
         """
-        local_id = local_id_map.get(op.target_content)
-
-        if not local_id:
-            local_id = self._find_id_by_partial_content(
-                local_id_map, op.target_content
-            )
+        local_id = self._resolve_local_id(index, op.target_content)
 
         if not local_id:
             return False
 
-        node = doc.find_by_local_id(local_id)
+        node = index.find(local_id)
         if not node:
             return False
 
@@ -268,20 +258,20 @@ class AdfEditor:
         self,
         doc: AdfDocument,
         op: SurgicalOperation,
-        local_id_map: Dict[str, str],
+        index: AdfDocumentIndex,
     ) -> bool:
         """Update a cell in a table.
 
         Args:
             doc: Document to modify
             op: TABLE_UPDATE_CELL operation
-            local_id_map: Content to localId mapping
+            index: Lookup index of the document
 
         Returns:
             True if update succeeded
         """
         # Find table node
-        table_node = self._find_table_by_content(doc, op.target_content)
+        table_node = self._find_table_by_content(doc, op.target_content, index)
 
         if not table_node:
             logger.debug(f"Table not found for content: {op.target_content[:30]}...")
@@ -308,13 +298,16 @@ class AdfEditor:
             return False
 
         # Replace cell content
-        return self._replace_node_text(cell_node, op.new_content)
+        if not self._replace_node_text(cell_node, op.new_content):
+            return False
+        index.node_changed(table_node)
+        return True
 
     def _table_insert_row(
         self,
         doc: AdfDocument,
         op: SurgicalOperation,
-        local_id_map: Dict[str, str],
+        index: AdfDocumentIndex,
     ) -> bool:
         """Insert a row into a table.
 
@@ -324,13 +317,13 @@ class AdfEditor:
         Args:
             doc: Document to modify
             op: TABLE_INSERT_ROW operation
-            local_id_map: Content to localId mapping
+            index: Lookup index of the document
 
         Returns:
             True if insertion succeeded
         """
         # Find table
-        table_node = self._find_table_by_content(doc, op.target_content)
+        table_node = self._find_table_by_content(doc, op.target_content, index)
 
         if not table_node:
             logger.debug("Table not found for insert row operation")
@@ -368,6 +361,7 @@ class AdfEditor:
         insert_idx = max(0, min(insert_idx, len(table_node.content)))
 
         table_node.content.insert(insert_idx, new_row)
+        index.node_changed(table_node)
         logger.debug(f"Inserted row at index {insert_idx}")
         return True
 
@@ -375,7 +369,7 @@ class AdfEditor:
         self,
         doc: AdfDocument,
         op: SurgicalOperation,
-        local_id_map: Dict[str, str],
+        index: AdfDocumentIndex,
     ) -> bool:
         """Delete a row from a table by matching its content.
 
@@ -385,12 +379,12 @@ class AdfEditor:
         Args:
             doc: Document to modify
             op: TABLE_DELETE_ROW operation
-            local_id_map: Content to localId mapping
+            index: Lookup index of the document
 
         Returns:
             True if deletion succeeded
         """
-        table_node = self._find_table_by_content(doc, op.target_content)
+        table_node = self._find_table_by_content(doc, op.target_content, index)
 
         if not table_node:
             logger.debug("Table not found for delete row operation")
@@ -403,6 +397,7 @@ class AdfEditor:
             row_idx = self._find_row_by_content(table_node, row_content)
             if row_idx is not None:
                 table_node.content.pop(row_idx)
+                index.node_changed(table_node)
                 logger.debug(f"Deleted row at index {row_idx} (found by content)")
                 return True
 
@@ -410,6 +405,7 @@ class AdfEditor:
         row_idx = op.row_index
         if row_idx < len(table_node.content):
             table_node.content.pop(row_idx)
+            index.node_changed(table_node)
             logger.debug(f"Deleted row at index {row_idx} (fallback)")
             return True
 
@@ -541,27 +537,36 @@ class AdfEditor:
         Returns:
             LocalId if found, None otherwise
         """
-        target_words = set(target.lower().split())
-        if not target_words:
-            return None
+        return AdfDocumentIndex(AdfDocument(), content_map).find_similar_text(target, threshold)
 
-        best_match = None
-        best_score = 0.0
+    def _resolve_local_id(self, index: AdfDocumentIndex, content: str) -> Optional[str]:
+        """Find the localId of a node by its text content.
 
-        for content, local_id in content_map.items():
-            content_words = set(content.lower().split())
-            if not content_words:
-                continue
+        Args:
+            index: Lookup index of the document
+            content: Content from the markdown diff
+
+        Returns:
+            LocalId of the exact text match, else of the best partial match
+            (see _find_id_by_partial_content), or None
+        """
+        if not content:
+            return None
+        return index.find_text(content) or index.find_similar_text(content)
 
-            # Calculate word overlap
-            overlap = len(target_words & content_words)
-            score = overlap / min(len(target_words), len(content_words))
+    def _index_inserted_text(self, index: AdfDocumentIndex, node: AdfNode, content: str) -> None:
+        """Make an inserted block findable by later operations.
 
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = local_id
+        Consecutive inserted blocks anchor on each other, so each one must
+        be found by its text once inserted.
 
-        return best_match
+        Args:
+            index: Lookup index of the document
+            node: Inserted block
+            content: Text the block was inserted with
+        """
+        if node.local_id and content and content.strip():
+            index.add_text(content, node.local_id)
 
     def _replace_node_text(self, node: AdfNode, new_text: str) -> bool:
         """Replace text content within a node.
@@ -715,54 +720,70 @@ class AdfEditor:
 
         return replaced
 
-    def _remove_node_by_id(self, doc: AdfDocument, local_id: str) -> bool:
-        """Remove a node from the document by its localId.
+    def _remove_node_by_id(
+        self,
+        doc: AdfDocument,
+        local_id: str,
+        index: Optional[AdfDocumentIndex] = None,
+    ) -> bool:
+        """Remove a top-level node from the document by its localId.
+
+        Nested nodes are not removed: deleting e.g. the only paragraph of a
+        table cell would leave invalid ADF.
 
         Args:
             doc: Document to modify
             local_id: LocalId of node to remove
+            index: Lookup index of the document (built if not given)
 
         Returns:
             True if removal succeeded
         """
-        # Check top-level nodes
-        for i, node in enumerate(doc.content):
-            if node.local_id == local_id:
-                # Don't remove macros
-                if node.node_type in MACRO_NODE_TYPES:
-                    logger.warning(f"Refusing to delete macro: {local_id}")
-                    return False
-                doc.content.pop(i)
-                return True
+        if index is None:
+            index = AdfDocumentIndex(doc)
 
-            # Check nested nodes (recursive removal not implemented for safety)
-            # Would need parent tracking to implement properly
+        node = index.find(local_id)
+        if node is None or not index.is_top_level(node):
+            return False
 
-        return False
+        # Don't remove macros
+        if node.node_type in MACRO_NODE_TYPES:
+            logger.warning(f"Refusing to delete macro: {local_id}")
+            return False
+        return index.remove(node)
 
     def _insert_after_node(
         self,
         doc: AdfDocument,
         anchor_id: str,
         content: str,
+        index: Optional[AdfDocumentIndex] = None,
     ) -> bool:
-        """Insert a new paragraph after a node.
+        """Insert a new paragraph after a top-level node.
 
         Args:
             doc: Document to modify
             anchor_id: LocalId of anchor node
             content: Text content for new paragraph
+            index: Lookup index of the document (built if not given)
 
         Returns:
             True if insertion succeeded
         """
-        for i, node in enumerate(doc.content):
-            if node.local_id == anchor_id:
-                new_node = self._create_paragraph_node(content)
-                doc.content.insert(i + 1, new_node)
-                return True
+        if index is None:
+            index = AdfDocumentIndex(doc)
 
-        return False
+        anchor = index.find(anchor_id)
+        if anchor is None or not index.is_top_level(anchor):
+            return False
+        position = index.position(anchor)
+        if position is None:
+            return False
+
+        new_node = self._create_paragraph_node(content)
+        index.insert_top_level(position + 1, new_node)
+        self._index_inserted_text(index, new_node, content)
+        return True
 
     def _create_paragraph_node(self, text: str) -> AdfNode:
         """Create a new paragraph node with text content.
@@ -842,6 +863,7 @@ class AdfEditor:
         self,
         doc: AdfDocument,
         content: str,
+        index: Optional[AdfDocumentIndex] = None,
     ) -> Optional[AdfNode]:
         """Find a table node by its content.
 
@@ -851,28 +873,26 @@ class AdfEditor:
         Args:
             doc: Document to search
             content: Content to match (from first cell or table overall)
+            index: Lookup index of the document, which caches each table's
+                normalized text (built if not given)
 
         Returns:
             Table AdfNode if found, None otherwise
         """
+        if index is None:
+            index = AdfDocumentIndex(doc)
+
         # Normalize the target content
         normalized_content = " ".join(content.lower().split())
-
-        for node in doc.content:
-            if node.type == "table":
-                table_text = node.get_text_content()
-                normalized_table = " ".join(table_text.lower().split())
-
-                # Check if normalized content is in normalized table text
-                if normalized_content in normalized_table:
-                    return node
-
-                # Also try checking if first few words match (handles truncated content)
-                content_words = normalized_content.split()[:5]
-                if content_words:
-                    content_prefix = " ".join(content_words)
-                    if content_prefix in normalized_table:
-                        return node
+        # Also try checking if first few words match (handles truncated content)
+        content_prefix = " ".join(normalized_content.split()[:5])
+
+        for node, normalized_table in index.tables():
+            # Check if normalized content is in normalized table text
+            if normalized_content in normalized_table:
+                return node
+            if content_prefix and content_prefix in normalized_table:
+                return node
 
         return None
 
@@ -0,0 +1,265 @@
+"""Lookup index over an ADF document for surgical editing.
+
+AdfEditor resolves every operation to a node: by the text it had in the
+markdown diff (exact, then by word overlap), then by localId, and table
+operations by the table's text. Walking the tree for each of those makes
+k operations on an n-node document cost O(k·n). AdfDocumentIndex is built
+once per apply_operations call and kept up to date as operations insert,
+remove and rewrite nodes, so each lookup is a dictionary access.
+"""
+
+import logging
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .adf_models import AdfDocument, AdfNode
+
+logger = logging.getLogger(__name__)
+
+
+class AdfDocumentIndex:
+    """localId, parent and text lookups for one AdfDocument.
+
+    The index only sees changes made through its own methods; an editor
+    that mutates the tree must report them (insert_top_level, remove,
+    node_changed).
+
+    Example:
+        >>> index = AdfDocumentIndex(doc, {"Intro text": "para-1"})
+        >>> node = index.find(index.find_text("Intro text"))
+        >>> index.parent(node) is None   # top-level block
+        True
+    """
+
+    def __init__(self, doc: AdfDocument, content_map: Optional[Dict[str, str]] = None):
+        """Index a document.
+
+        Args:
+            doc: Document to index (later edits must go through the index)
+            content_map: Text content → localId mapping to seed the text
+                lookups with (not modified)
+        """
+        self.doc = doc
+        # localId -> node (first in document order, like find_by_local_id)
+        self._nodes: Dict[str, AdfNode] = {}
+        # localId -> parent node (None for top-level blocks)
+        self._parents: Dict[str, Optional[AdfNode]] = {}
+        # Text content -> localId, plus word -> texts containing it
+        self._texts: Dict[str, str] = {}
+        self._text_order: Dict[str, int] = {}
+        self._text_word_counts: Dict[str, int] = {}
+        self._words: Dict[str, Set[str]] = {}
+        # Top-level tables in document order, with their normalized text
+        self._tables: List[AdfNode] = []
+        self._table_text: Dict[int, str] = {}
+
+        for node in doc.content:
+            self._add_subtree(node, None)
+            if node.type == "table":
+                self._tables.append(node)
+        for content, local_id in (content_map or {}).items():
+            self.add_text(content, local_id)
+
+    # --- localId and parent lookups ---
+
+    def find(self, local_id: Optional[str]) -> Optional[AdfNode]:
+        """Get the node with a localId.
+
+        Args:
+            local_id: localId to look up
+
+        Returns:
+            The node, or None if no node in the document has that localId
+        """
+        if not local_id:
+            return None
+        return self._nodes.get(local_id)
+
+    def parent(self, node: AdfNode) -> Optional[AdfNode]:
+        """Get the parent of an indexed node.
+
+        Args:
+            node: Node with a localId
+
+        Returns:
+            Parent node, or None for a top-level block
+        """
+        return self._parents.get(node.local_id) if node.local_id else None
+
+    def is_top_level(self, node: AdfNode) -> bool:
+        """Check whether an indexed node is a direct child of the document.
+
+        Args:
+            node: Node with a localId
+
+        Returns:
+            True for a top-level block
+        """
+        return (
+            node.local_id is not None
+            and self._nodes.get(node.local_id) is node
+            and self._parents.get(node.local_id) is None
+        )
+
+    def position(self, node: AdfNode) -> Optional[int]:
+        """Get the index of a top-level block in doc.content.
+
+        Args:
+            node: Top-level block
+
+        Returns:
+            Position in doc.content, or None if the node is not there
+        """
+        for i, candidate in enumerate(self.doc.content):
+            if candidate is node:
+                return i
+        return None
+
+    # --- Tree changes ---
+
+    def insert_top_level(self, position: int, node: AdfNode) -> None:
+        """Insert a block into doc.content and index it.
+
+        Args:
+            position: Index in doc.content to insert at
+            node: Block to insert
+        """
+        self.doc.content.insert(position, node)
+        self._add_subtree(node, None)
+        if node.type == "table":
+            self._tables = [n for n in self.doc.content if n.type == "table"]
+
+    def remove(self, node: AdfNode) -> bool:
+        """Remove a top-level block from doc.content and unindex it.
+
+        Text entries pointing at the removed localIds are kept, so a later
+        operation on the removed text fails instead of matching another node.
+
+        Args:
+            node: Top-level block to remove
+
+        Returns:
+            True if the block was found and removed
+        """
+        position = self.position(node)
+        if position is None:
+            return False
+        self.doc.content.pop(position)
+        self._remove_subtree(node)
+        if node.type == "table":
+            self._tables = [table for table in self._tables if table is not node]
+            self._table_text.pop(id(node), None)
+        return True
+
+    def node_changed(self, node: AdfNode) -> None:
+        """Re-index a node whose descendants were replaced or edited.
+
+        Args:
+            node: Edited node (e.g. after its text or table rows changed)
+        """
+        parent = self._parents.get(node.local_id) if node.local_id else None
+        self._add_subtree(node, parent)
+        if parent is None:
+            self._table_text.pop(id(node), None)
+        else:
+            # Nested edit: the enclosing table is not tracked, recompute all
+            self._table_text.clear()
+
+    # --- Text lookups ---
+
+    def add_text(self, content: str, local_id: str) -> None:
+        """Map text content to a localId (later mappings of a text win).
+
+        Args:
+            content: Text content of the node
+            local_id: localId of the node
+        """
+        if content not in self._texts:
+            words = set(content.lower().split())
+            self._text_order[content] = len(self._text_order)
+            self._text_word_counts[content] = len(words)
+            for word in words:
+                self._words.setdefault(word, set()).add(content)
+        self._texts[content] = local_id
+
+    def find_text(self, content: str) -> Optional[str]:
+        """Get the localId mapped to exactly this text.
+
+        Args:
+            content: Text content
+
+        Returns:
+            localId, or None if the text is not mapped
+        """
+        return self._texts.get(content)
+
+    def find_similar_text(self, target: str, threshold: float = 0.8) -> Optional[str]:
+        """Find the localId of the mapped text with the most word overlap.
+
+        Only texts sharing a word with the target are scored; the score is
+        shared words / words of the shorter text, and the first mapped text
+        wins a tie.
+
+        Args:
+            target: Text to look for
+            threshold: Minimum score for a match
+
+        Returns:
+            localId of the best match, or None if none reaches the threshold
+        """
+        target_words = set(target.lower().split())
+        if not target_words:
+            return None
+
+        overlaps: Dict[str, int] = {}
+        for word in target_words:
+            for content in self._words.get(word, ()):
+                overlaps[content] = overlaps.get(content, 0) + 1
+
+        best_match = None
+        best_score = 0.0
+        for content in sorted(overlaps, key=self._text_order.__getitem__):
+            score = overlaps[content] / min(len(target_words), self._text_word_counts[content])
+            if score > best_score and score >= threshold:
+                best_score = score
+                best_match = self._texts[content]
+
+        return best_match
+
+    def tables(self) -> Iterator[Tuple[AdfNode, str]]:
+        """Iterate over the top-level tables with their normalized text.
+
+        Yields:
+            (table node, lowercase text with collapsed whitespace), in
+            document order
+        """
+        for table in self._tables:
+            text = self._table_text.get(id(table))
+            if text is None:
+                text = " ".join(table.get_text_content().lower().split())
+                self._table_text[id(table)] = text
+            yield table, text
+
+    # --- Internals ---
+
+    def _add_subtree(self, node: AdfNode, parent: Optional[AdfNode]) -> None:
+        """Index a node and its descendants."""
+        stack: List[Tuple[AdfNode, Optional[AdfNode]]] = [(node, parent)]
+        while stack:
+            current, current_parent = stack.pop()
+            local_id = current.local_id
+            if local_id and self._nodes.get(local_id, current) is current:
+                self._nodes[local_id] = current
+                self._parents[local_id] = current_parent
+            # Reversed so that the first node with a duplicate localId wins
+            stack.extend((child, current) for child in reversed(current.content))
+
+    def _remove_subtree(self, node: AdfNode) -> None:
+        """Unindex a node and its descendants."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            local_id = current.local_id
+            if local_id and self._nodes.get(local_id) is current:
+                del self._nodes[local_id]
+                del self._parents[local_id]
+            stack.extend(current.content)
@@ -360,3 +360,50 @@ class AdfUpdateResult:
     modified_adf: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     fallback_used: bool = False
+
+
+@dataclass
+class PreparedAdfUpdate:
+    """A surgical update that has been computed but not yet uploaded.
+
+    Produced by PageOperations.prepare_surgical_adf_update and consumed by
+    PageOperations.upload_surgical_adf_update, so the CPU-bound diffing and
+    the network upload can run in different pipeline stages.
+
+    Attributes:
+        page_id: Page to update
+        title: Page title (sent unchanged with the upload)
+        version: Page version the update was computed from
+        result: Final result when there is nothing to upload (no changes,
+            invalid ADF); the remaining fields are then unused
+        adf_content: Modified ADF document to upload
+        xhtml: Storage-format body for a full replacement (adf_content is None)
+        operations_applied: Number of operations applied (1 for a full replacement)
+        operations_failed: Number of operations that failed
+        fallback_used: True if the update is a full replacement
+        note: Message kept in the error field of a successful result
+    """
+
+    page_id: str
+    title: str
+    version: int
+    result: Optional[AdfUpdateResult] = None
+    adf_content: Optional[Dict[str, Any]] = None
+    xhtml: Optional[str] = None
+    operations_applied: int = 0
+    operations_failed: int = 0
+    fallback_used: bool = False
+    note: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Check that an update to upload carries exactly one body.
+
+        Raises:
+            ValueError: If result is None and not exactly one of adf_content
+                and xhtml is set
+        """
+        if self.result is None and (self.adf_content is None) == (self.xhtml is None):
+            raise ValueError(
+                f"Prepared update of page {self.page_id} needs exactly one of "
+                "adf_content and xhtml"
+            )
@@ -6,13 +6,44 @@ applied to XHTML while preserving Confluence-specific elements.
 """
 
 import logging
-from typing import List, Optional, Set
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 from .models import BlockType, ContentBlock, OperationType, SurgicalOperation
+from .sequence_alignment import align_sequences, pair_moved_items, unpaired_gaps
 
 logger = logging.getLogger(__name__)
 
 
+class BlockFingerprint:
+    """Comparison data of one block, computed once per analysis.
+
+    Attributes:
+        block: The block itself
+        key: Block key (see DiffAnalyzer._block_key)
+        normalized: Content with whitespace collapsed
+        words: Lowercase words of the content, for similarity scoring
+        row_keys: Normalized rows of a table (see DiffAnalyzer._normalize_row),
+            empty for other blocks
+    """
+
+    __slots__ = ('block', 'key', 'normalized', 'words', 'row_keys')
+
+    def __init__(
+        self,
+        block: ContentBlock,
+        key: str,
+        normalized: str,
+        words: FrozenSet[str],
+        row_keys: Tuple[str, ...] = (),
+    ):
+        self.block = block
+        self.key = key
+        self.normalized = normalized
+        self.words = words
+        self.row_keys = row_keys
+
+
 class DiffAnalyzer:
     """Analyzes differences between original and modified content blocks.
 
@@ -47,9 +78,16 @@ class DiffAnalyzer:
     ) -> List[SurgicalOperation]:
         """Analyze differences and generate surgical operations.
 
-        Compares original and modified blocks using a two-pass approach:
-        1. First pass: Exact content matches (no change needed)
-        2. Second pass: Position-based matching for changes
+        Compares original and modified blocks in three steps:
+        1. Alignment: the block keys of both sides are aligned on a longest
+           common subsequence (Myers diff), so unchanged blocks stay paired
+           even when blocks are inserted or deleted before them
+        2. Moved blocks: an unaligned block whose exact content is still
+           unaligned on the other side needs no operation (surgical
+           operations cannot move blocks)
+        3. Gaps: between two aligned blocks, remaining blocks are paired by
+           similarity, then by position within the gap (UPDATE); what is
+           left over is an INSERT or DELETE
 
         Args:
             original_blocks: Blocks from original XHTML content
@@ -62,134 +100,68 @@ class DiffAnalyzer:
 
         # Debug logging for block analysis
         logger.debug(f"Analyzing {len(original_blocks)} original blocks vs {len(modified_blocks)} modified blocks")
-        for i, block in enumerate(original_blocks):
-            logger.debug(f"  Original[{i}]: {block.block_type.value}, rows={len(block.rows) if block.rows else 'N/A'}, content[:50]={block.content[:50] if block.content else 'empty'}...")
-        for i, block in enumerate(modified_blocks):
-            logger.debug(f"  Modified[{i}]: {block.block_type.value}, rows={len(block.rows) if block.rows else 'N/A'}, content[:50]={block.content[:50] if block.content else 'empty'}...")
-
-        # Create content-based lookup for original blocks
-        orig_by_content = {}
-        for block in original_blocks:
-            key = self._block_key(block)
-            orig_by_content[key] = block
-
-        # Track which original blocks are matched
-        matched_originals: Set[str] = set()
-
-        # First pass: exact content matches (these don't need operations)
-        for mod_block in modified_blocks:
-            key = self._block_key(mod_block)
-            if key in orig_by_content:
-                matched_originals.add(key)
-
-        # Second pass: position-based matching for unmatched blocks
-        mod_non_macro = [b for b in modified_blocks if b.block_type != BlockType.MACRO]
-        orig_non_macro = [b for b in original_blocks if b.block_type != BlockType.MACRO]
-
-        for i, mod_block in enumerate(mod_non_macro):
-            key = self._block_key(mod_block)
-            if key in matched_originals:
-                # Already matched exactly - no operation needed
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, block in enumerate(original_blocks):
+                logger.debug(f"  Original[{i}]: {block.block_type.value}, rows={len(block.rows) if block.rows else 'N/A'}, content[:50]={block.content[:50] if block.content else 'empty'}...")
+            for i, block in enumerate(modified_blocks):
+                logger.debug(f"  Modified[{i}]: {block.block_type.value}, rows={len(block.rows) if block.rows else 'N/A'}, content[:50]={block.content[:50] if block.content else 'empty'}...")
+
+        # Macros are never modified, so they take no part in the diff.
+        # Keys, normalized text and word sets are computed once per block.
+        orig_non_macro = [
+            self._fingerprint(b) for b in original_blocks if b.block_type != BlockType.MACRO
+        ]
+        mod_non_macro = [
+            self._fingerprint(b) for b in modified_blocks if b.block_type != BlockType.MACRO
+        ]
+        orig_keys = [f.key for f in orig_non_macro]
+        mod_keys = [f.key for f in mod_non_macro]
+
+        # Step 1: unchanged blocks, aligned in order
+        anchors = align_sequences(orig_keys, mod_keys)
+        orig_done = {i for i, _ in anchors}
+        mod_done = {j for _, j in anchors}
+
+        # Step 2: blocks that moved keep their content - no operation
+        for i, j in pair_moved_items(orig_keys, mod_keys, anchors):
+            orig_done.add(i)
+            mod_done.add(j)
+
+        # Step 3: pair the remaining blocks within each gap between anchors
+        pairs: Dict[int, int] = {}  # modified index -> original index
+        for orig_gap, mod_gap in unpaired_gaps(
+            len(orig_keys), len(mod_keys), anchors, orig_done, mod_done
+        ):
+            pairs.update(self._match_gap(orig_non_macro, orig_gap, mod_non_macro, mod_gap))
+        orig_done.update(pairs.values())
+
+        for j, mod_print in enumerate(mod_non_macro):
+            if j in mod_done:
                 continue
 
-            # Try to find original block at same position
-            if i < len(orig_non_macro):
-                orig_block = orig_non_macro[i]
-                orig_key = self._block_key(orig_block)
-
-                if orig_key not in matched_originals:
-                    # Same position, different content = UPDATE
-                    matched_originals.add(orig_key)
-
-                    if (
-                        orig_block.block_type == BlockType.HEADING
-                        and mod_block.block_type == BlockType.HEADING
-                    ):
-                        # Heading change
-                        if mod_block.level != orig_block.level:
-                            operations.append(
-                                SurgicalOperation(
-                                    op_type=OperationType.CHANGE_HEADING_LEVEL,
-                                    target_content=orig_block.content,
-                                    new_content=mod_block.content,
-                                    old_level=orig_block.level,
-                                    new_level=mod_block.level,
-                                )
-                            )
-                        elif self._normalize_content(mod_block.content) != self._normalize_content(orig_block.content):
-                            operations.append(
-                                SurgicalOperation(
-                                    op_type=OperationType.UPDATE_TEXT,
-                                    target_content=orig_block.content,
-                                    new_content=mod_block.content,
-                                )
-                            )
-                    elif (
-                        orig_block.block_type == BlockType.TABLE
-                        and mod_block.block_type == BlockType.TABLE
-                    ):
-                        # Table change - use row-level operations for surgical updates
-                        if self._table_content_matches(orig_block, mod_block):
-                            logger.debug(f"Tables identical, skipping (orig_rows={len(orig_block.rows or [])}, mod_rows={len(mod_block.rows or [])})")
-                            continue
-                        # Generate row-level operations (insert/delete/update)
-                        logger.debug(f"Tables differ, generating row operations (orig_rows={len(orig_block.rows or [])}, mod_rows={len(mod_block.rows or [])})")
-                        table_ops = self._analyze_table_changes(orig_block, mod_block)
-                        logger.debug(f"Generated {len(table_ops)} table operations: {[op.op_type.value for op in table_ops]}")
-                        operations.extend(table_ops)
-                    else:
-                        # General text update - skip if either content is empty
-                        if (orig_block.content and orig_block.content.strip() and
-                            mod_block.content and mod_block.content.strip()):
-                            operations.append(
-                                SurgicalOperation(
-                                    op_type=OperationType.UPDATE_TEXT,
-                                    target_content=orig_block.content,
-                                    new_content=mod_block.content,
-                                )
-                            )
-                    continue
-
-            # No position match found - check for similar block
-            similar = self._find_similar_block(mod_block, original_blocks, matched_originals)
-            if similar:
-                similar_key = self._block_key(similar)
-                matched_originals.add(similar_key)
-                logger.debug(f"Similar block found for {mod_block.block_type.value} via fallback, generating UPDATE_TEXT")
-                # For tables, use row-level operations instead of UPDATE_TEXT
-                if mod_block.block_type == BlockType.TABLE and similar.block_type == BlockType.TABLE:
-                    if not self._table_content_matches(similar, mod_block):
-                        table_ops = self._analyze_table_changes(similar, mod_block)
-                        operations.extend(table_ops)
-                else:
-                    operations.append(
-                        SurgicalOperation(
-                            op_type=OperationType.UPDATE_TEXT,
-                            target_content=similar.content,
-                            new_content=mod_block.content,
-                        )
-                    )
+            if j in pairs:
+                operations.extend(self._update_operations(orig_non_macro[pairs[j]], mod_print))
                 continue
 
             # No match found - this is an INSERT
             # Find the previous block to insert after
             after_content = ""
-            if i > 0:
-                prev_block = mod_non_macro[i - 1]
+            if j > 0:
+                prev_block = mod_non_macro[j - 1].block
                 after_content = prev_block.content
 
             operations.append(
                 SurgicalOperation(
                     op_type=OperationType.INSERT_BLOCK,
-                    new_content=mod_block.content,
+                    new_content=mod_print.block.content,
                     after_content=after_content,
                 )
             )
 
         # Check for deletions (original blocks not matched)
-        for orig_block in original_blocks:
-            key = self._block_key(orig_block)
-            if key not in matched_originals and orig_block.block_type != BlockType.MACRO:
+        for i, orig_print in enumerate(orig_non_macro):
+            if i not in orig_done:
+                orig_block = orig_print.block
                 # Skip blocks with empty content - can't target them for deletion
                 if not orig_block.content or not orig_block.content.strip():
                     logger.debug(f"Skipping DELETE for block with empty content (type={orig_block.block_type})")
@@ -201,9 +173,152 @@ class DiffAnalyzer:
                     )
                 )
 
-        logger.debug(f"DiffAnalyzer generated {len(operations)} operations")
+        logger.debug(
+            f"DiffAnalyzer generated {len(operations)} operations "
+            f"({len(anchors)} blocks aligned unchanged)"
+        )
         return operations
 
+    def _match_gap(
+        self,
+        orig_prints: List[BlockFingerprint],
+        orig_indices: List[int],
+        mod_prints: List[BlockFingerprint],
+        mod_indices: List[int],
+    ) -> Dict[int, int]:
+        """Pair the changed blocks of one gap between aligned blocks.
+
+        Each modified block is paired with the most similar original block
+        of the gap (same rules as _find_similar_block). Candidates come from
+        an inverted index of the original blocks' words, so only blocks
+        sharing at least one word are scored. Blocks still unpaired are then
+        paired by position within the gap: same position, different content
+        is an UPDATE.
+
+        Args:
+            orig_prints: All original (non-macro) block fingerprints
+            orig_indices: Indices of the gap's unmatched original blocks
+            mod_prints: All modified (non-macro) block fingerprints
+            mod_indices: Indices of the gap's unmatched modified blocks
+
+        Returns:
+            Dict mapping modified block index to original block index
+        """
+        if not orig_indices or not mod_indices:
+            return {}
+
+        # Word -> original blocks of the gap containing it, in page order
+        word_index: Dict[str, List[int]] = {}
+        for i in orig_indices:
+            for word in orig_prints[i].words:
+                word_index.setdefault(word, []).append(i)
+
+        pairs: Dict[int, int] = {}
+        free_orig = set(orig_indices)
+
+        for j in mod_indices:
+            mod_print = mod_prints[j]
+            if not mod_print.words:
+                continue
+            # Shared word count per candidate
+            overlaps: Counter = Counter()
+            for word in mod_print.words:
+                overlaps.update(word_index.get(word, ()))
+
+            best_match = None
+            best_score = 0.0
+            # Page order keeps the first of equally similar blocks, as before
+            for i in sorted(overlaps):
+                if i not in free_orig:
+                    continue
+                orig_print = orig_prints[i]
+                if not self._comparable(orig_print.block, mod_print.block):
+                    continue
+                # Same score as _word_similarity, from the shared word count
+                score = overlaps[i] / min(len(orig_print.words), len(mod_print.words))
+                if score > best_score and score > 0.3:  # 30% threshold
+                    best_score = score
+                    best_match = i
+            if best_match is not None:
+                logger.debug(f"Similar block found for {mod_print.block.block_type.value} in gap")
+                pairs[j] = best_match
+                free_orig.discard(best_match)
+
+        free_mod = [j for j in mod_indices if j not in pairs]
+        remaining_orig = [i for i in orig_indices if i in free_orig]
+        for j, i in zip(free_mod, remaining_orig, strict=False):
+            pairs[j] = i
+        return pairs
+
+    def _update_operations(
+        self,
+        orig_print: BlockFingerprint,
+        mod_print: BlockFingerprint,
+    ) -> List[SurgicalOperation]:
+        """Generate the operations that turn one block into its modified version.
+
+        Args:
+            orig_print: Fingerprint of the original block
+            mod_print: Fingerprint of the modified block paired with it
+
+        Returns:
+            Operations for the change (empty if nothing needs changing)
+        """
+        orig_block = orig_print.block
+        mod_block = mod_print.block
+        if (
+            orig_block.block_type == BlockType.HEADING
+            and mod_block.block_type == BlockType.HEADING
+        ):
+            # Heading change
+            if mod_block.level != orig_block.level:
+                return [
+                    SurgicalOperation(
+                        op_type=OperationType.CHANGE_HEADING_LEVEL,
+                        target_content=orig_block.content,
+                        new_content=mod_block.content,
+                        old_level=orig_block.level,
+                        new_level=mod_block.level,
+                    )
+                ]
+            if mod_print.normalized != orig_print.normalized:
+                return [
+                    SurgicalOperation(
+                        op_type=OperationType.UPDATE_TEXT,
+                        target_content=orig_block.content,
+                        new_content=mod_block.content,
+                    )
+                ]
+            return []
+
+        if (
+            orig_block.block_type == BlockType.TABLE
+            and mod_block.block_type == BlockType.TABLE
+        ):
+            # Table change - use row-level operations for surgical updates
+            if orig_print.row_keys == mod_print.row_keys:
+                logger.debug(f"Tables identical, skipping (orig_rows={len(orig_block.rows or [])}, mod_rows={len(mod_block.rows or [])})")
+                return []
+            # Generate row-level operations (insert/delete/update)
+            logger.debug(f"Tables differ, generating row operations (orig_rows={len(orig_block.rows or [])}, mod_rows={len(mod_block.rows or [])})")
+            table_ops = self._analyze_table_changes(
+                orig_block, mod_block, orig_print.row_keys, mod_print.row_keys
+            )
+            logger.debug(f"Generated {len(table_ops)} table operations: {[op.op_type.value for op in table_ops]}")
+            return table_ops
+
+        # General text update - skip if either content is empty
+        if (orig_block.content and orig_block.content.strip() and
+                mod_block.content and mod_block.content.strip()):
+            return [
+                SurgicalOperation(
+                    op_type=OperationType.UPDATE_TEXT,
+                    target_content=orig_block.content,
+                    new_content=mod_block.content,
+                )
+            ]
+        return []
+
     def _block_key(self, block: ContentBlock) -> str:
         """Create a unique key for a block based on type and content.
 
@@ -219,9 +334,18 @@ class DiffAnalyzer:
         Returns:
             String key combining type, level (for headings), and content info
         """
-        # Normalize whitespace for consistent matching
-        normalized_content = self._normalize_content(block.content)
+        return self._make_block_key(block, self._normalize_content(block.content))
+
+    def _make_block_key(self, block: ContentBlock, normalized_content: str) -> str:
+        """Create a block key from already-normalized content.
 
+        Args:
+            block: ContentBlock to create key for
+            normalized_content: block.content with whitespace collapsed
+
+        Returns:
+            Block key (see _block_key)
+        """
         if block.block_type == BlockType.HEADING:
             return f"{block.block_type.value}:L{block.level}:{normalized_content[:100]}"
 
@@ -239,6 +363,27 @@ class DiffAnalyzer:
         # For other blocks, use first 100 chars (normalized)
         return f"{block.block_type.value}:{normalized_content[:100]}"
 
+    def _fingerprint(self, block: ContentBlock) -> BlockFingerprint:
+        """Compute the comparison data of a block in one pass.
+
+        Args:
+            block: ContentBlock to fingerprint
+
+        Returns:
+            BlockFingerprint with key, normalized content, words and row keys
+        """
+        normalized = self._normalize_content(block.content)
+        row_keys: Tuple[str, ...] = ()
+        if block.block_type == BlockType.TABLE:
+            row_keys = tuple(self._normalize_row(row) for row in (block.rows or []))
+        return BlockFingerprint(
+            block=block,
+            key=self._make_block_key(block, normalized),
+            normalized=normalized,
+            words=frozenset(normalized.lower().split()),
+            row_keys=row_keys,
+        )
+
     def _find_similar_block(
         self,
         mod_block: ContentBlock,
@@ -267,13 +412,8 @@ class DiffAnalyzer:
                 continue
 
             # Must be same general type
-            if orig.block_type != mod_block.block_type:
-                # Exception: allow heading-to-heading regardless of level
-                if not (
-                    orig.block_type == BlockType.HEADING
-                    and mod_block.block_type == BlockType.HEADING
-                ):
-                    continue
+            if not self._comparable(orig, mod_block):
+                continue
 
             # Calculate similarity
             score = self._similarity(orig.content, mod_block.content)
@@ -283,6 +423,18 @@ class DiffAnalyzer:
 
         return best_match
 
+    def _comparable(self, orig: ContentBlock, mod: ContentBlock) -> bool:
+        """Check whether two blocks may be fuzzy-matched.
+
+        Args:
+            orig: Original block
+            mod: Modified block
+
+        Returns:
+            True if both have the same type (headings match at any level)
+        """
+        return orig.block_type == mod.block_type
+
     def _similarity(self, s1: str, s2: str) -> float:
         """Calculate word overlap similarity between two strings.
 
@@ -293,12 +445,29 @@ class DiffAnalyzer:
         Returns:
             Similarity score from 0.0 to 1.0
         """
-        if not s1 or not s2:
-            return 0.0
+        return self._word_similarity(self._word_set(s1), self._word_set(s2))
 
-        words1 = set(s1.lower().split())
-        words2 = set(s2.lower().split())
+    def _word_set(self, content: str) -> Set[str]:
+        """Get the lowercase words of a string for similarity scoring.
 
+        Args:
+            content: Block content
+
+        Returns:
+            Set of lowercase words (empty for empty content)
+        """
+        return set(content.lower().split()) if content else set()
+
+    def _word_similarity(self, words1: Set[str], words2: Set[str]) -> float:
+        """Calculate word overlap similarity between two word sets.
+
+        Args:
+            words1: Words of the first string
+            words2: Words of the second string
+
+        Returns:
+            Similarity score from 0.0 to 1.0
+        """
         if not words1 or not words2:
             return 0.0
 
@@ -349,12 +518,18 @@ class DiffAnalyzer:
         Returns:
             Normalized pipe-delimited string
         """
-        normalized_cells = []
-        for cell in row:
-            # Normalize: lowercase, collapse whitespace, strip
-            normalized = " ".join(str(cell).lower().split())
-            normalized_cells.append(normalized)
-        return "|".join(normalized_cells)
+        return "|".join(self._normalize_cells(row))
+
+    def _normalize_cells(self, row: List[str]) -> List[str]:
+        """Normalize the cells of a table row for comparison.
+
+        Args:
+            row: List of cell strings
+
+        Returns:
+            Cells lowercased with whitespace collapsed and stripped
+        """
+        return [" ".join(str(cell).lower().split()) for cell in row]
 
     def _row_to_pipe_format(self, row: List[str]) -> str:
         """Convert a row to pipe-delimited format for storage.
@@ -371,15 +546,26 @@ class DiffAnalyzer:
         self,
         orig: ContentBlock,
         mod: ContentBlock,
+        orig_row_keys: Optional[Sequence[str]] = None,
+        mod_row_keys: Optional[Sequence[str]] = None,
     ) -> List[SurgicalOperation]:
         """Analyze changes between two tables at the row level.
 
-        Detects row insertions, deletions, and cell updates by comparing
-        normalized row content.
+        Rows are aligned on a longest common subsequence of their normalized
+        content (see sequence_alignment), so inserting or deleting a row
+        leaves every other row matched and yields a single row operation.
+        Rows that only moved need no operation. Between two aligned rows,
+        a modified row is paired with the original row of the same gap
+        whose cells match best (at least half of them): that is a cell
+        update. Remaining rows are deleted or inserted. The cost is close to
+        linear in the row count unless most rows changed.
 
         Args:
             orig: Original table block
             mod: Modified table block
+            orig_row_keys: Normalized original rows (_normalize_row), if
+                already computed
+            mod_row_keys: Normalized modified rows, if already computed
 
         Returns:
             List of table-specific surgical operations
@@ -387,83 +573,73 @@ class DiffAnalyzer:
         operations = []
         orig_rows = orig.rows or []
         mod_rows = mod.rows or []
-
-        # Build normalized lookup for original rows
-        # Key: normalized row content, Value: (index, original row)
-        orig_normalized = {}
-        for i, row in enumerate(orig_rows):
-            key = self._normalize_row(row)
-            orig_normalized[key] = (i, row)
-
-        # Build normalized lookup for modified rows
-        mod_normalized = {}
-        for i, row in enumerate(mod_rows):
-            key = self._normalize_row(row)
-            mod_normalized[key] = (i, row)
-
-        # Track matched rows
-        matched_orig_keys = set()
-        matched_mod_keys = set()
-
-        # First pass: exact matches (no operation needed)
-        for mod_key in mod_normalized:
-            if mod_key in orig_normalized:
-                matched_orig_keys.add(mod_key)
-                matched_mod_keys.add(mod_key)
-
-        # Second pass: find similar rows (cell content updates within a row)
-        for mod_key, (mod_idx, mod_row) in mod_normalized.items():
-            if mod_key in matched_mod_keys:
+        if orig_row_keys is None:
+            orig_row_keys = [self._normalize_row(row) for row in orig_rows]
+        if mod_row_keys is None:
+            mod_row_keys = [self._normalize_row(row) for row in mod_rows]
+
+        # Unchanged rows (aligned in order, or moved): no operation needed
+        aligned = align_sequences(orig_row_keys, mod_row_keys)
+        matched_orig = {i for i, _ in aligned}
+        matched_mod = {j for _, j in aligned}
+        for i, j in pair_moved_items(orig_row_keys, mod_row_keys, aligned):
+            matched_orig.add(i)
+            matched_mod.add(j)
+
+        # Changed rows: find a similar row in the same gap (cell content updates)
+        for orig_gap, mod_gap in unpaired_gaps(
+            len(orig_rows), len(mod_rows), aligned, matched_orig, matched_mod
+        ):
+            if not orig_gap or not mod_gap:
                 continue
-
-            # Try to find a similar row in original (same position, most content matches)
-            best_match_key = None
-            best_match_score = 0.0
-
-            for orig_key, (orig_idx, orig_row) in orig_normalized.items():
-                if orig_key in matched_orig_keys:
-                    continue
-
-                # Calculate cell-by-cell similarity
-                if len(orig_row) == len(mod_row):
+            orig_cells = {i: self._normalize_cells(orig_rows[i]) for i in orig_gap}
+            for gap_pos, mod_idx in enumerate(mod_gap):
+                mod_row = mod_rows[mod_idx]
+                mod_cells = self._normalize_cells(mod_row)
+                best_match = None
+                best_match_score = 0.0
+
+                for orig_pos, orig_idx in enumerate(orig_gap):
+                    if orig_idx in matched_orig or len(orig_cells[orig_idx]) != len(mod_cells):
+                        continue
                     matching_cells = sum(
-                        1 for o, m in zip(orig_row, mod_row)
-                        if " ".join(str(o).lower().split()) == " ".join(str(m).lower().split())
+                        1 for o, m in zip(orig_cells[orig_idx], mod_cells, strict=False) if o == m
                     )
-                    score = matching_cells / len(orig_row) if orig_row else 0
+                    score = matching_cells / len(mod_cells) if mod_cells else 0
 
-                    # Prefer same position if scores are equal
-                    position_bonus = 0.01 if orig_idx == mod_idx else 0
+                    # Prefer same position within the gap if scores are equal
+                    position_bonus = 0.01 if orig_pos == gap_pos else 0
                     score += position_bonus
 
                     if score > best_match_score and score >= 0.5:  # At least 50% cells match
                         best_match_score = score
-                        best_match_key = orig_key
+                        best_match = orig_idx
+
+                if best_match is None:
+                    continue
 
-            if best_match_key:
                 # This is a row update (some cells changed)
-                matched_orig_keys.add(best_match_key)
-                matched_mod_keys.add(mod_key)
-                orig_idx, orig_row = orig_normalized[best_match_key]
+                matched_orig.add(best_match)
+                matched_mod.add(mod_idx)
 
                 # Generate cell update operations for changed cells
-                for cell_idx, (orig_cell, mod_cell) in enumerate(zip(orig_row, mod_row)):
-                    orig_norm = " ".join(str(orig_cell).lower().split())
-                    mod_norm = " ".join(str(mod_cell).lower().split())
-                    if orig_norm != mod_norm:
+                for cell_idx, (orig_cell, mod_cell) in enumerate(
+                    zip(orig_cells[best_match], mod_cells, strict=False)
+                ):
+                    if orig_cell != mod_cell:
                         operations.append(
                             SurgicalOperation(
                                 op_type=OperationType.TABLE_UPDATE_CELL,
                                 target_content=orig.content,  # Table content for finding table
-                                new_content=str(mod_cell).strip(),
-                                row_index=orig_idx,
+                                new_content=str(mod_row[cell_idx]).strip(),
+                                row_index=best_match,
                                 cell_index=cell_idx,
                             )
                         )
 
         # Deletions: original rows not matched
-        for orig_key, (orig_idx, orig_row) in orig_normalized.items():
-            if orig_key not in matched_orig_keys:
+        for orig_idx, orig_row in enumerate(orig_rows):
+            if orig_idx not in matched_orig:
                 row_content = self._row_to_pipe_format(orig_row)
                 is_empty_row = not row_content.replace("|", "").strip()
                 if is_empty_row:
@@ -478,8 +654,8 @@ class DiffAnalyzer:
                 )
 
         # Insertions: modified rows not matched
-        for mod_key, (mod_idx, mod_row) in mod_normalized.items():
-            if mod_key not in matched_mod_keys:
+        for mod_idx, mod_row in enumerate(mod_rows):
+            if mod_idx not in matched_mod:
                 row_content = self._row_to_pipe_format(mod_row)
                 # Find the row before this one for positioning
                 after_content = ""
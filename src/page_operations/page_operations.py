@@ -8,7 +8,7 @@ surgical XHTML updates.
 import logging
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from ..confluence_client.api_wrapper import APIWrapper
 from ..confluence_client.auth import Authenticator
@@ -30,7 +30,7 @@ from .surgical_editor import SurgicalEditor
 from .content_parser import ContentParser
 from .diff_analyzer import DiffAnalyzer
 from .macro_preserver import MacroPreserver
-from .adf_models import AdfDocument, AdfNodeType, AdfUpdateResult
+from .adf_models import AdfDocument, AdfNodeType, AdfUpdateResult, PreparedAdfUpdate
 from .adf_parser import AdfParser, adf_block_type_to_content_block_type
 from .adf_editor import AdfEditor
 
@@ -825,6 +825,7 @@ class PageOperations:
         page_id: str,
         new_markdown_content: str,
         baseline_markdown: str = None,
+        prepared: Optional[PreparedAdfUpdate] = None,
     ) -> AdfUpdateResult:
         """Update a page using ADF surgical operations with baseline-centric diffing.
 
@@ -842,11 +843,22 @@ class PageOperations:
         - This eliminates parser mismatch issues (XHTML vs markdown)
         - ADF is only used as the target for applying changes, not for diffing
 
+        Version conflicts are handled optimistically: the upload carries the
+        version fetched in step 1, and Confluence rejects it with 409 if the
+        page changed in between. The update is then retried through
+        _retry_on_version_conflict, which re-fetches the page and re-applies
+        the operations to its current ADF. No separate version check is made
+        before the upload.
+
         Args:
             page_id: Confluence page ID
             new_markdown_content: New markdown content for the page
             baseline_markdown: Baseline markdown from last sync (required for
                 accurate diffing). If None, falls back to full replacement.
+            prepared: Update already computed from fetch_page_adf and
+                prepare_surgical_adf_update (push pipeline). Steps 1-6 are
+                skipped for the first attempt; a version conflict retries
+                from a fresh fetch as usual.
 
         Returns:
             AdfUpdateResult with success status and details
@@ -855,11 +867,71 @@ class PageOperations:
             PageNotFoundError: If page doesn't exist
             APIAccessError: If API call fails
         """
+        pending = [prepared] if prepared is not None else []
+
+        def attempt() -> AdfUpdateResult:
+            if pending:
+                return self.upload_surgical_adf_update(pending.pop())
+            return self._update_page_surgical_adf_once(
+                page_id, new_markdown_content, baseline_markdown
+            )
+
+        return self._retry_on_version_conflict(attempt)
+
+    def _update_page_surgical_adf_once(
+        self,
+        page_id: str,
+        new_markdown_content: str,
+        baseline_markdown: Optional[str],
+    ) -> AdfUpdateResult:
+        """Make one attempt at an ADF surgical update.
+
+        Fetches the page, applies the baseline-vs-new operations and uploads
+        the result with the fetched version (see update_page_surgical_adf).
+
+        Args:
+            page_id: Confluence page ID
+            new_markdown_content: New markdown content for the page
+            baseline_markdown: Baseline markdown from last sync, or None for
+                full replacement
+
+        Returns:
+            AdfUpdateResult; a stale version shows up as success=False with a
+            "Version conflict" error
+        """
         logger.debug(f"Performing ADF surgical update for page: {page_id}")
 
         # Step 1: Fetch current page in ADF format (needed for applying operations)
+        adf_response = self.fetch_page_adf(page_id)
+        if isinstance(adf_response, AdfUpdateResult):
+            return adf_response
+
+        # Steps 2-6: Diff and apply operations
+        prepared = self.prepare_surgical_adf_update(
+            page_id, adf_response, new_markdown_content, baseline_markdown
+        )
+
+        # Step 7: Upload
+        return self.upload_surgical_adf_update(prepared)
+
+    def fetch_page_adf(self, page_id: str) -> Union[Dict[str, Any], AdfUpdateResult]:
+        """Fetch a page in ADF format for a surgical update (network only).
+
+        First stage of update_page_surgical_adf, exposed so that a push
+        pipeline can fetch ahead while earlier pages are still being diffed.
+
+        Args:
+            page_id: Confluence page ID
+
+        Returns:
+            The get_page_adf response, or a failed AdfUpdateResult if the page
+            does not exist
+
+        Raises:
+            APIAccessError: If API call fails
+        """
         try:
-            adf_response = self.api.get_page_adf(page_id)
+            return self.api.get_page_adf(page_id)
         except PageNotFoundError:
             logger.error(f"  Page not found: {page_id}")
             return AdfUpdateResult(
@@ -871,10 +943,39 @@ class PageOperations:
                 error=f"Page {page_id} not found",
             )
 
+    def prepare_surgical_adf_update(
+        self,
+        page_id: str,
+        adf_response: Dict[str, Any],
+        new_markdown_content: str,
+        baseline_markdown: Optional[str],
+    ) -> PreparedAdfUpdate:
+        """Compute the content to upload for a surgical update (no network).
+
+        Second stage of update_page_surgical_adf: parses the fetched ADF,
+        diffs baseline against new markdown and applies the operations, or
+        converts the markdown for a full replacement.
+
+        Args:
+            page_id: Confluence page ID
+            adf_response: Response of fetch_page_adf
+            new_markdown_content: New markdown content for the page
+            baseline_markdown: Baseline markdown from last sync, or None for
+                full replacement
+
+        Returns:
+            PreparedAdfUpdate with the body to upload, or with a final result
+            if there is nothing to upload
+        """
         # Extract ADF content and version
         title = adf_response.get("title", "")
         current_version = adf_response.get("version", {}).get("number", 1)
 
+        def finished(result: AdfUpdateResult) -> PreparedAdfUpdate:
+            return PreparedAdfUpdate(
+                page_id=page_id, title=title, version=current_version, result=result
+            )
+
         adf_body = adf_response.get("body", {}).get("atlas_doc_format", {})
         adf_value = adf_body.get("value", "{}")
 
@@ -884,28 +985,28 @@ class PageOperations:
             adf_json = json.loads(adf_value) if isinstance(adf_value, str) else adf_value
         except json.JSONDecodeError as e:
             logger.error(f"  Failed to parse ADF JSON: {e}")
-            return AdfUpdateResult(
+            return finished(AdfUpdateResult(
                 success=False,
                 page_id=page_id,
                 old_version=current_version,
                 new_version=current_version,
                 operations_applied=0,
                 error=f"Invalid ADF JSON: {e}",
-            )
+            ))
 
         # Step 2: Parse ADF document (for applying operations later)
         try:
             adf_doc = self.adf_parser.parse_document(adf_json)
         except ValueError as e:
             logger.error(f"  Failed to parse ADF document: {e}")
-            return AdfUpdateResult(
+            return finished(AdfUpdateResult(
                 success=False,
                 page_id=page_id,
                 old_version=current_version,
                 new_version=current_version,
                 operations_applied=0,
                 error=f"Invalid ADF structure: {e}",
-            )
+            ))
 
         # Count macros before
         macros_before = self.adf_editor.count_macros(adf_doc)
@@ -918,34 +1019,15 @@ class PageOperations:
         # If no baseline provided, fall back to full replacement
         if baseline_markdown is None:
             logger.debug(f"  No baseline provided for page {page_id} - using full replacement")
-            xhtml = self.converter.markdown_to_xhtml(new_markdown_content)
-            try:
-                result = self.api.update_page(
-                    page_id=page_id,
-                    title=title,
-                    body=xhtml,
-                    version=current_version,
-                )
-                new_version = result.get("version", {}).get("number", current_version + 1)
-                return AdfUpdateResult(
-                    success=True,
-                    page_id=page_id,
-                    old_version=current_version,
-                    new_version=new_version,
-                    operations_applied=1,
-                    fallback_used=True,
-                    error="No baseline provided - used full replacement",
-                )
-            except APIAccessError as e:
-                return AdfUpdateResult(
-                    success=False,
-                    page_id=page_id,
-                    old_version=current_version,
-                    new_version=current_version,
-                    operations_applied=0,
-                    error=str(e),
-                    fallback_used=True,
-                )
+            return PreparedAdfUpdate(
+                page_id=page_id,
+                title=title,
+                version=current_version,
+                xhtml=self.converter.markdown_to_xhtml(new_markdown_content),
+                operations_applied=1,
+                fallback_used=True,
+                note="No baseline provided - used full replacement",
+            )
 
         # Extract blocks from BASELINE markdown (not ADF!)
         # This is the key fix: compare markdown-to-markdown, not ADF-to-markdown
@@ -980,14 +1062,14 @@ class PageOperations:
 
         if not operations:
             logger.debug(f"  No changes detected for page {page_id}")
-            return AdfUpdateResult(
+            return finished(AdfUpdateResult(
                 success=True,
                 page_id=page_id,
                 old_version=current_version,
                 new_version=current_version,
                 operations_applied=0,
                 modified_adf=adf_json,
-            )
+            ))
 
         logger.debug(f"  Generated {len(operations)} surgical operations")
 
@@ -1003,22 +1085,68 @@ class PageOperations:
         )
 
         # Check if we need to fall back to full replacement
-        use_full_replacement = False
         if failure_count >= len(operations) / 2:
             logger.warning(
                 f"  {failure_count}/{len(operations)} ADF operations failed - "
                 f"falling back to full replacement"
             )
-            use_full_replacement = True
-
-        if use_full_replacement:
             # Fall back to XHTML-based full replacement
             logger.debug("  Falling back to XHTML full replacement")
-            xhtml = self.converter.markdown_to_xhtml(new_markdown_content)
+            return PreparedAdfUpdate(
+                page_id=page_id,
+                title=title,
+                version=current_version,
+                xhtml=self.converter.markdown_to_xhtml(new_markdown_content),
+                operations_applied=1,
+                operations_failed=failure_count,
+                fallback_used=True,
+            )
+
+        # Verify macro preservation
+        macros_after = self.adf_editor.count_macros(modified_adf)
+        if macros_after != macros_before:
+            logger.warning(
+                f"  Macro count changed: {macros_before} → {macros_after}"
+            )
+
+        # Convert modified ADF back to dict for upload
+        logger.debug(f"  {success_count}/{len(operations)} operations succeeded")
+        return PreparedAdfUpdate(
+            page_id=page_id,
+            title=title,
+            version=current_version,
+            adf_content=modified_adf.to_dict(),
+            operations_applied=success_count,
+            operations_failed=failure_count,
+        )
+
+    def upload_surgical_adf_update(self, prepared: PreparedAdfUpdate) -> AdfUpdateResult:
+        """Upload a prepared surgical update (network only).
+
+        Last stage of update_page_surgical_adf. The upload carries the
+        version the update was prepared from; Confluence answers 409 if the
+        page changed since, which is returned as a "Version conflict" error.
+
+        Args:
+            prepared: Result of prepare_surgical_adf_update
+
+        Returns:
+            AdfUpdateResult with success status and details
+        """
+        if prepared.result is not None:
+            return prepared.result
+
+        page_id = prepared.page_id
+        current_version = prepared.version
+
+        if prepared.adf_content is None:
+            # Full replacement with XHTML (PreparedAdfUpdate guarantees a body)
+            xhtml = prepared.xhtml
+            assert xhtml is not None
             try:
                 result = self.api.update_page(
                     page_id=page_id,
-                    title=title,
+                    title=prepared.title,
                     body=xhtml,
                     version=current_version,
                 )
@@ -1028,9 +1156,10 @@ class PageOperations:
                     page_id=page_id,
                     old_version=current_version,
                     new_version=new_version,
-                    operations_applied=1,
-                    operations_failed=failure_count,
+                    operations_applied=prepared.operations_applied,
+                    operations_failed=prepared.operations_failed,
                     fallback_used=True,
+                    error=prepared.note,
                 )
             except APIAccessError as e:
                 return AdfUpdateResult(
@@ -1039,54 +1168,23 @@ class PageOperations:
                     old_version=current_version,
                     new_version=current_version,
                     operations_applied=0,
-                    operations_failed=failure_count,
+                    operations_failed=prepared.operations_failed,
                     error=str(e),
                     fallback_used=True,
                 )
 
-        # Verify macro preservation
-        macros_after = self.adf_editor.count_macros(modified_adf)
-        if macros_after != macros_before:
-            logger.warning(
-                f"  Macro count changed: {macros_before} → {macros_after}"
-            )
-
-        # Convert modified ADF back to dict for upload
-        modified_adf_dict = modified_adf.to_dict()
-
-        # Step 7: Check version conflict before upload
-        try:
-            page_data = self.api.get_page_by_id(page_id, expand="version")
-            latest_version = page_data.get("version", {}).get("number", 0)
-
-            if latest_version != current_version:
-                logger.error(
-                    f"  Version conflict: expected {current_version}, found {latest_version}"
-                )
-                return AdfUpdateResult(
-                    success=False,
-                    page_id=page_id,
-                    old_version=current_version,
-                    new_version=latest_version,
-                    operations_applied=0,
-                    error=f"Version conflict: page was modified (v{current_version} → v{latest_version})",
-                )
-        except Exception as e:
-            logger.warning(f"  Could not verify version: {e}")
-
-        # Step 8: Upload modified ADF
+        # Upload modified ADF (Confluence answers 409 if current_version is stale)
         try:
             result = self.api.update_page_adf(
                 page_id=page_id,
-                title=title,
-                adf_content=modified_adf_dict,
+                title=prepared.title,
+                adf_content=prepared.adf_content,
                 version=current_version,
             )
             new_version = result.get("version", {}).get("number", current_version + 1)
 
             logger.debug(
-                f"  ADF surgical update complete: v{current_version} → v{new_version} "
-                f"({success_count}/{len(operations)} operations succeeded)"
+                f"  ADF surgical update complete: v{current_version} → v{new_version}"
             )
 
             return AdfUpdateResult(
@@ -1094,15 +1192,15 @@ class PageOperations:
                 page_id=page_id,
                 old_version=current_version,
                 new_version=new_version,
-                operations_applied=success_count,
-                operations_failed=failure_count,
-                modified_adf=modified_adf_dict,
+                operations_applied=prepared.operations_applied,
+                operations_failed=prepared.operations_failed,
+                modified_adf=prepared.adf_content,
             )
 
         except APIAccessError as e:
             error_msg = str(e).lower()
             if "conflict" in error_msg or "version" in error_msg:
-                logger.error(f"  Version conflict during ADF upload: {e}")
+                logger.warning(f"  Version conflict during ADF upload: {e}")
             else:
                 logger.error(f"  API error during ADF upload: {e}")
             return AdfUpdateResult(
@@ -1111,7 +1209,7 @@ class PageOperations:
                 old_version=current_version,
                 new_version=current_version,
                 operations_applied=0,
-                operations_failed=failure_count,
+                operations_failed=prepared.operations_failed,
                 error=str(e),
             )
 
@@ -1205,13 +1303,22 @@ class PageOperations:
     def update_page_parent(
         self,
         page_id: str,
-        parent_id: Optional[str]
+        parent_id: Optional[str],
+        version: Optional[int] = None,
+        title: Optional[str] = None
     ) -> UpdateResult:
         """Update the parent of a page.
 
+        When the caller already knows the page's current version and title
+        (e.g. from the page hierarchy), the page is moved in one request
+        without fetching or resending its body. If that version turns out to
+        be stale, the move is retried from a fresh fetch.
+
         Args:
             page_id: Confluence page ID
             parent_id: New parent page ID. None to move to space root.
+            version: Current page version, if known
+            title: Current page title, if known
 
         Returns:
             UpdateResult with success status and new version
@@ -1226,6 +1333,36 @@ class PageOperations:
         else:
             logger.debug("  New parent: (space root)")
 
+        if version is not None and title is not None:
+            try:
+                result = self.api.move_page(
+                    page_id=page_id,
+                    title=title,
+                    parent_id=parent_id,
+                    version=version,
+                )
+                new_version = result.get("version", {}).get("number", version + 1)
+                logger.debug(f"  Updated parent: v{version} → v{new_version}")
+                return UpdateResult(
+                    success=True,
+                    page_id=page_id,
+                    old_version=version,
+                    new_version=new_version,
+                    operations_applied=1,  # One operation: parent update
+                )
+            except APIAccessError as e:
+                if "version conflict" not in str(e).lower():
+                    logger.error(f"  Failed to update parent: {e}")
+                    return UpdateResult(
+                        success=False,
+                        page_id=page_id,
+                        old_version=version,
+                        new_version=version,
+                        operations_applied=0,
+                        error=str(e),
+                    )
+                logger.info(f"  Version {version} of page {page_id} is stale - re-fetching")
+
         # Fetch current page to get title, body, and version
         try:
             page_data = self.api.get_page_by_id(
@@ -0,0 +1,224 @@
+"""Longest-common-subsequence alignment of two sequences.
+
+DiffAnalyzer aligns the blocks of the original and modified page on their
+block keys (and the rows of a changed table on their normalized cells)
+before it looks for edits, so an inserted or deleted block or row does not
+shift everything after it out of position. The alignment is Myers'
+O(ND) difference algorithm (linear-space "middle snake" bisection), which
+runs in near-linear time when the two sequences differ in few places.
+"""
+
+from typing import Hashable, Iterator, List, Optional, Sequence, Set, Tuple
+
+
+def align_sequences(
+    a: Sequence[Hashable],
+    b: Sequence[Hashable],
+) -> List[Tuple[int, int]]:
+    """Align two sequences on a longest common subsequence.
+
+    Example:
+        >>> align_sequences(["h", "p1", "p2"], ["h", "new", "p1", "p2"])
+        [(0, 0), (1, 2), (2, 3)]
+
+    Args:
+        a: First sequence (e.g. original block keys)
+        b: Second sequence (e.g. modified block keys)
+
+    Returns:
+        (index in a, index in b) pairs of equal elements, increasing in both
+        indices; every element not in a pair was deleted from a or inserted
+        into b
+    """
+    # Compare small integers instead of the (possibly long) keys
+    ids: dict = {}
+    a_ids = [ids.setdefault(item, len(ids)) for item in a]
+    b_ids = [ids.setdefault(item, len(ids)) for item in b]
+
+    # Items found on one side only can never be paired. Dropping them first
+    # keeps the search small when most items changed (e.g. a reworded page).
+    shared = set(a_ids) & set(b_ids)
+    a_kept = [i for i, item in enumerate(a_ids) if item in shared]
+    b_kept = [j for j, item in enumerate(b_ids) if item in shared]
+
+    pairs: List[Tuple[int, int]] = []
+    _align([a_ids[i] for i in a_kept], [b_ids[j] for j in b_kept], 0, 0, pairs)
+    return [(a_kept[i], b_kept[j]) for i, j in pairs]
+
+
+def _align(
+    a: List[int],
+    b: List[int],
+    a_offset: int,
+    b_offset: int,
+    pairs: List[Tuple[int, int]],
+) -> None:
+    """Append the LCS pairs of a and b (offset into the full sequences).
+
+    Args:
+        a: Part of the first sequence
+        b: Part of the second sequence
+        a_offset: Index of a[0] in the first sequence
+        b_offset: Index of b[0] in the second sequence
+        pairs: Output list, appended to in increasing order
+    """
+    # Common prefix and suffix are matched without search
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    pairs.extend((a_offset + i, b_offset + i) for i in range(prefix))
+
+    a_mid = a[prefix:len(a) - suffix]
+    b_mid = b[prefix:len(b) - suffix]
+    if a_mid and b_mid and not set(a_mid).isdisjoint(b_mid):
+        split = _bisect(a_mid, b_mid)
+        if split is not None:
+            x, y = split
+            _align(a_mid[:x], b_mid[:y], a_offset + prefix, b_offset + prefix, pairs)
+            _align(a_mid[x:], b_mid[y:], a_offset + prefix + x, b_offset + prefix + y, pairs)
+
+    pairs.extend(
+        (a_offset + len(a) - suffix + i, b_offset + len(b) - suffix + i)
+        for i in range(suffix)
+    )
+
+
+def _bisect(a: List[int], b: List[int]) -> Optional[Tuple[int, int]]:
+    """Find a split point on a shortest edit path (Myers' middle snake).
+
+    Runs the forward and reverse searches for D-paths at the same time
+    until they overlap; the overlap lies on an optimal path, so the two
+    halves can be aligned independently.
+
+    Args:
+        a: First sequence (no common prefix or suffix with b)
+        b: Second sequence
+
+    Returns:
+        (x, y) split point, or None if a and b have nothing in common
+    """
+    n, m = len(a), len(b)
+    max_d = (n + m + 1) // 2
+    v_offset = max_d
+    v_length = 2 * max_d + 2
+    v1 = [-1] * v_length
+    v2 = [-1] * v_length
+    v1[v_offset + 1] = 0
+    v2[v_offset + 1] = 0
+    delta = n - m
+    # With an odd delta the paths meet during a forward step, otherwise reverse
+    front = delta % 2 != 0
+    # Diagonals that ran off the grid are skipped in later rounds
+    k1_start = k1_end = k2_start = k2_end = 0
+
+    for d in range(max_d):
+        # Forward search
+        for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+            k1_offset = v_offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[x1] == b[y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 > n:
+                k1_end += 2
+            elif y1 > m:
+                k1_start += 2
+            elif front:
+                k2_offset = v_offset + delta - k1
+                if 0 <= k2_offset < v_length and v2[k2_offset] != -1:
+                    if x1 >= n - v2[k2_offset]:
+                        return x1, y1
+
+        # Reverse search
+        for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+            k2_offset = v_offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[-x2 - 1] == b[-y2 - 1]:
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > n:
+                k2_end += 2
+            elif y2 > m:
+                k2_start += 2
+            elif not front:
+                k1_offset = v_offset + delta - k2
+                if 0 <= k1_offset < v_length and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    y1 = v_offset + x1 - k1_offset
+                    if x1 >= n - x2:
+                        return x1, y1
+
+    return None
+
+
+def pair_moved_items(
+    a: Sequence[Hashable],
+    b: Sequence[Hashable],
+    pairs: List[Tuple[int, int]],
+) -> List[Tuple[int, int]]:
+    """Pair equal items that align_sequences left unpaired (moved items).
+
+    Args:
+        a: First sequence
+        b: Second sequence
+        pairs: Result of align_sequences(a, b)
+
+    Returns:
+        (index in a, index in b) pairs of equal unpaired items, each item
+        used at most once and in order of appearance
+    """
+    a_paired = {i for i, _ in pairs}
+    b_paired = {j for _, j in pairs}
+    unpaired_a: dict = {}
+    for i, item in enumerate(a):
+        if i not in a_paired:
+            unpaired_a.setdefault(item, []).append(i)
+
+    moved: List[Tuple[int, int]] = []
+    for j, item in enumerate(b):
+        if j not in b_paired and unpaired_a.get(item):
+            moved.append((unpaired_a[item].pop(0), j))
+    return moved
+
+
+def unpaired_gaps(
+    len_a: int,
+    len_b: int,
+    pairs: List[Tuple[int, int]],
+    a_done: Set[int],
+    b_done: Set[int],
+) -> Iterator[Tuple[List[int], List[int]]]:
+    """Yield the unpaired indices between consecutive aligned pairs.
+
+    Args:
+        len_a: Length of the first sequence
+        len_b: Length of the second sequence
+        pairs: Result of align_sequences (increasing in both indices)
+        a_done: Indices of the first sequence to leave out
+        b_done: Indices of the second sequence to leave out
+
+    Yields:
+        (indices in a, indices in b) for each gap, in sequence order
+    """
+    a_start = b_start = 0
+    for a_end, b_end in list(pairs) + [(len_a, len_b)]:
+        yield (
+            [i for i in range(a_start, a_end) if i not in a_done],
+            [j for j in range(b_start, b_end) if j not in b_done],
+        )
+        a_start, b_start = a_end + 1, b_end + 1
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -454,6 +455,26 @@ class TestDeleteConfluencePages(TestDeletionHandler):
         assert "789" in result
         assert mock_page_operations.delete_page.call_count == 2
 
+    def test_delete_concurrent(self, handler, mock_page_operations):
+        """With max_workers, pages are deleted at once and failures stay per page."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def delete_page(page_id):
+            barrier.wait()  # Deadlocks unless all three deletions run at once
+            if page_id == "2":
+                raise Exception("API error")
+
+        mock_page_operations.delete_page.side_effect = delete_page
+        deletions = [
+            DeletionInfo(page_id=str(i), title=f"Page {i}",
+                         local_path=Path(f"docs/{i}.md"), direction="local_to_confluence")
+            for i in range(1, 4)
+        ]
+
+        result = handler.delete_confluence_pages(deletions, dryrun=False, max_workers=3)
+
+        assert result == ["1", "3"]
+
     def test_delete_no_page_operations(self, handler_no_deps):
         """Raise CLIError when page_operations is not provided."""
         # Arrange
@@ -76,6 +76,7 @@ class TestSyncCommand:
             single_file=None,
             update_timestamp=True,
             cli_exclude_page_ids=None,
+            resume=False,
         )
 
     @patch('src.cli.main.SyncCommand')
@@ -99,6 +100,7 @@ class TestSyncCommand:
             single_file=None,
             update_timestamp=True,
             cli_exclude_page_ids=None,
+            resume=False,
         )
 
     @patch('src.cli.main.SyncCommand')
@@ -122,6 +124,7 @@ class TestSyncCommand:
             single_file=None,
             update_timestamp=True,
             cli_exclude_page_ids=None,
+            resume=False,
         )
 
     @patch('src.cli.main.SyncCommand')
@@ -145,6 +148,7 @@ class TestSyncCommand:
             single_file=None,
             update_timestamp=True,
             cli_exclude_page_ids=None,
+            resume=False,
         )
 
     @patch('src.cli.main.SyncCommand')
@@ -168,6 +172,7 @@ class TestSyncCommand:
             single_file="docs/page.md",
             update_timestamp=False,  # False when single_file provided
             cli_exclude_page_ids=None,
+            resume=False,
         )
 
     @patch('src.cli.main.SyncCommand')
@@ -205,6 +210,52 @@ class TestSyncCommand:
         mock_output_cls.assert_called_once_with(verbosity=0, no_color=True)
 
 
+    @patch('src.cli.main.WatchCommand')
+    @patch('src.cli.main.SyncCommand')
+    @patch('src.cli.main.OutputHandler')
+    def test_sync_with_watch_flag(self, mock_output, mock_sync_cmd, mock_watch_cmd):
+        """Sync with --watch runs WatchCommand with the shared SyncCommand."""
+        mock_watch_cmd.return_value.run.return_value = ExitCode.SUCCESS
+
+        result = runner.invoke(app, ["--watch", "--watch-interval", "30"])
+
+        assert result.exit_code == ExitCode.SUCCESS
+        mock_watch_cmd.assert_called_once_with(
+            mock_sync_cmd.return_value, remote_poll_interval=30.0
+        )
+        mock_sync_cmd.return_value.run.assert_not_called()
+
+    @patch('src.cli.main.WatchCommand')
+    @patch('src.cli.main.SyncCommand')
+    @patch('src.cli.main.OutputHandler')
+    def test_watch_rejects_dry_run(self, mock_output, mock_sync_cmd, mock_watch_cmd):
+        """--watch cannot be combined with --dry-run."""
+        result = runner.invoke(app, ["--watch", "--dry-run"])
+
+        assert result.exit_code == ExitCode.GENERAL_ERROR
+        mock_watch_cmd.assert_not_called()
+
+    @patch('src.cli.main.SyncCommand')
+    @patch('src.cli.main.OutputHandler')
+    def test_sync_with_resume_flag(self, mock_output, mock_sync_cmd):
+        """--resume is passed through to SyncCommand.run()."""
+        mock_sync_cmd.return_value.run.return_value = ExitCode.SUCCESS
+
+        result = runner.invoke(app, ["--resume"])
+
+        assert result.exit_code == ExitCode.SUCCESS
+        assert mock_sync_cmd.return_value.run.call_args.kwargs['resume'] is True
+
+    @patch('src.cli.main.SyncCommand')
+    @patch('src.cli.main.OutputHandler')
+    def test_resume_rejects_force_push(self, mock_output, mock_sync_cmd):
+        """--resume cannot be combined with --force-push."""
+        result = runner.invoke(app, ["--resume", "--force-push"])
+
+        assert result.exit_code == ExitCode.GENERAL_ERROR
+        mock_sync_cmd.return_value.run.assert_not_called()
+
+
 class TestInitCommand:
     """Test cases for --init option."""
 
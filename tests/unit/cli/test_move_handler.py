@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -570,6 +571,43 @@ class TestMoveConfluencePages(TestMoveHandler):
             parent_id=None
         )
 
+    def test_move_confluence_pages_parents_first(self, handler_with_page_ops, temp_dir):
+        """A page moves after its new parent, with the version from remote_pages."""
+        handler = handler_with_page_ops
+        order = []
+        lock = threading.Lock()
+
+        def update_page_parent(**kwargs):
+            with lock:
+                order.append(kwargs["page_id"])
+            return {"success": True}
+
+        handler.page_operations.update_page_parent = Mock(side_effect=update_page_parent)
+        parents = {"child": "parent", "parent": "root", "other": "root"}
+        moves = [
+            MoveInfo(page_id, page_id.title(), Path(f"old/{page_id}.md"),
+                     Path(temp_dir) / f"{page_id}.md", "local_to_confluence")
+            for page_id in ("child", "parent", "other")
+        ]
+        remote_pages = {"child": {"title": "Child", "version": 4}}
+
+        with patch.object(
+            handler, 'resolve_parent_page_id',
+            side_effect=lambda path: parents[Path(path).stem]
+        ):
+            result = handler.move_confluence_pages(
+                moves, dryrun=False, remote_pages=remote_pages, max_workers=2
+            )
+
+        assert result == ["child", "parent", "other"]
+        assert order.index("parent") < order.index("child")
+        handler.page_operations.update_page_parent.assert_any_call(
+            page_id="child", parent_id="parent", version=4, title="Child"
+        )
+        handler.page_operations.update_page_parent.assert_any_call(
+            page_id="other", parent_id="root"
+        )
+
 
 class TestResolveParentPageId(TestMoveHandler):
     """Test cases for resolve_parent_page_id method."""
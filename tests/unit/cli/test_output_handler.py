@@ -579,6 +579,47 @@ class TestOutputHandlerPrintDryrunSummary:
         assert any("Conflicts detected" in str(call) for call in calls)
 
 
+class TestOutputHandlerPrintSyncPlan:
+    """Test cases for print_sync_plan() method."""
+
+    @patch('src.cli.output.Console')
+    def test_print_sync_plan_groups_actions(self, mock_console_class):
+        """print_sync_plan() lists actions under one heading per kind."""
+        from src.file_mapper.models import PlannedAction, SyncPlan
+
+        handler = OutputHandler()
+        handler.console = Mock()
+        plan = SyncPlan()
+        plan.add(PlannedAction("delete:local:1", "delete", page_id="1", path="docs/old.md",
+                               detail="local"))
+        plan.add(PlannedAction("update:2", "update", page_id="2", path="docs/a.md"))
+        plan.add(PlannedAction("pull:3", "pull", page_id="3", path="docs/b.md"))
+        plan.add(PlannedAction("merge:4", "merge", page_id="4", path="docs/c.md"))
+
+        handler.print_sync_plan(plan)
+
+        calls = [str(call) for call in handler.console.print.call_args_list]
+        assert any("Would delete (1 page(s))" in call for call in calls)
+        assert any("docs/old.md (local)" in call for call in calls)
+        assert any("Would push (1 page(s))" in call for call in calls)
+        assert any("Would pull (1 page(s))" in call for call in calls)
+        assert any("Conflicts to merge (1 page(s))" in call for call in calls)
+        assert not any("Already in sync" in call for call in calls)
+
+    @patch('src.cli.output.Console')
+    def test_print_sync_plan_empty(self, mock_console_class):
+        """print_sync_plan() shows 'in sync' message for an empty plan."""
+        from src.file_mapper.models import SyncPlan
+
+        handler = OutputHandler()
+        handler.console = Mock()
+
+        handler.print_sync_plan(SyncPlan())
+
+        calls = [str(call) for call in handler.console.print.call_args_list]
+        assert any("Already in sync" in call for call in calls)
+
+
 class TestOutputHandlerColorControl:
     """Test cases for color control with no_color flag."""
 
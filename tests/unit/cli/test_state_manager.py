@@ -370,6 +370,27 @@ class TestStateManagerRoundTrip:
         loaded3 = StateManager.load(str(state_file))
         assert loaded3.last_synced is None
 
+    def test_round_trip_with_workspace_commits(self, tmp_path):
+        """Save and load state keeps git workspace snapshot commits."""
+        state_file = tmp_path / "state.yaml"
+        original_state = SyncState(
+            last_synced="2024-01-15T10:30:00Z",
+            workspace_commits={"/home/me/project": "a" * 40}
+        )
+
+        StateManager.save(str(state_file), original_state)
+        loaded_state = StateManager.load(str(state_file))
+
+        assert loaded_state.workspace_commits == {"/home/me/project": "a" * 40}
+
+    def test_workspace_commits_omitted_when_empty(self, tmp_path):
+        """Save should not write workspace_commits unless git detection recorded any."""
+        state_file = tmp_path / "state.yaml"
+
+        StateManager.save(str(state_file), SyncState(last_synced="2024-01-15T10:30:00Z"))
+
+        assert 'workspace_commits' not in yaml.safe_load(state_file.read_text())
+
 
 class TestStateManagerParseState:
     """Test cases for StateManager._parse_state() private method."""
@@ -0,0 +1,161 @@
+"""Unit tests for cli.state_store module."""
+
+import sqlite3
+
+import pytest
+
+from src.cli.config import StateManager
+from src.cli.errors import StateError
+from src.cli.models import PageRecord, SyncState
+from src.cli.state_store import StateStore
+
+
+def _state():
+    return SyncState(
+        last_synced="2024-01-15T10:30:00+00:00",
+        tracked_pages={"1": "docs/a.md", "2": "docs/b.md"},
+        workspace_commits={"/repo": "abc123"},
+        page_records={"1": PageRecord(version=3, content_hash="h1", last_synced="t1")},
+    )
+
+
+class TestStateStore:
+    """Test cases for StateStore."""
+
+    def test_round_trip(self, tmp_path):
+        """save() then load() should return an equal SyncState."""
+        store = StateStore(str(tmp_path / "state.db"))
+        store.save(_state())
+
+        loaded = store.load()
+
+        assert loaded.last_synced == "2024-01-15T10:30:00+00:00"
+        assert loaded.tracked_pages == {"1": "docs/a.md", "2": "docs/b.md"}
+        assert loaded.workspace_commits == {"/repo": "abc123"}
+        assert loaded.page_records["1"] == PageRecord(3, "h1", "t1")
+        assert loaded.page_records["2"] == PageRecord()
+
+    def test_missing_database_is_fresh_state(self, tmp_path):
+        """load() should return a fresh state without creating the database."""
+        store = StateStore(str(tmp_path / "state.db"))
+
+        assert store.load() == SyncState()
+        assert not store.exists()
+
+    def test_save_writes_only_changed_rows(self, tmp_path):
+        """save() should upsert changed pages, delete removed ones and skip the rest."""
+        db_path = str(tmp_path / "state.db")
+        store = StateStore(db_path)
+        store.save(_state())
+
+        state = store.load()
+        state.tracked_pages["2"] = "docs/moved.md"
+        del state.tracked_pages["1"]
+        state.tracked_pages["3"] = "docs/c.md"
+
+        statements = []
+        original_connect = sqlite3.connect
+
+        def tracing_connect(*args, **kwargs):
+            conn = original_connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("src.cli.state_store.sqlite3.connect", tracing_connect)
+            store.save(state)
+
+        page_writes = [s for s in statements if "INTO pages" in s or "FROM pages WHERE" in s]
+        assert len(page_writes) == 3
+        assert store.load().tracked_pages == {"2": "docs/moved.md", "3": "docs/c.md"}
+
+    def test_update_page_leaves_other_rows(self, tmp_path):
+        """update_page() should change one row and keep global state."""
+        store = StateStore(str(tmp_path / "state.db"))
+        store.save(_state())
+
+        store.update_page("2", "docs/b.md", PageRecord(version=7, content_hash="h2"))
+
+        loaded = store.load()
+        assert loaded.page_records["2"].version == 7
+        assert loaded.page_records["1"] == PageRecord(3, "h1", "t1")
+        assert loaded.last_synced == "2024-01-15T10:30:00+00:00"
+
+    def test_corrupted_database_raises_state_error(self, tmp_path):
+        """load() should raise StateError for a file that is not a database."""
+        db_path = tmp_path / "state.db"
+        db_path.write_bytes(b"not a sqlite database" * 100)
+
+        with pytest.raises(StateError):
+            StateStore(str(db_path)).load()
+
+    def test_unknown_schema_version_raises_state_error(self, tmp_path):
+        """load() should refuse databases written by a newer schema."""
+        db_path = str(tmp_path / "state.db")
+        StateStore(db_path).save(_state())
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE meta SET value = '99' WHERE key = 'schema_version'")
+        conn.close()
+
+        with pytest.raises(StateError, match="schema version"):
+            StateStore(db_path).load()
+
+
+class TestStateManagerStoreBackend:
+    """Test cases for StateManager with .db state paths."""
+
+    def test_is_store_path(self):
+        """is_store_path() should select the store by extension."""
+        assert StateManager.is_store_path(".confluence-sync/state.db")
+        assert StateManager.is_store_path("state.sqlite")
+        assert not StateManager.is_store_path(".confluence-sync/state.yaml")
+
+    def test_save_and_load_use_store(self, tmp_path):
+        """save()/load() with a .db path should go through StateStore."""
+        db_path = str(tmp_path / "state.db")
+
+        StateManager.save(db_path, _state())
+
+        assert StateStore(db_path).exists()
+        assert StateManager.load(db_path).tracked_pages == _state().tracked_pages
+
+    def test_migrates_legacy_yaml(self, tmp_path):
+        """load() should import state.yaml into a new state.db and set the YAML aside."""
+        yaml_path = tmp_path / "state.yaml"
+        db_path = tmp_path / "state.db"
+        StateManager.save(str(yaml_path), _state())
+
+        state = StateManager.load(str(db_path))
+
+        assert state.tracked_pages == {"1": "docs/a.md", "2": "docs/b.md"}
+        assert state.workspace_commits == {"/repo": "abc123"}
+        assert StateStore(str(db_path)).load().last_synced == "2024-01-15T10:30:00+00:00"
+        assert not yaml_path.exists()
+        assert (tmp_path / "state.yaml.migrated").exists()
+
+    def test_existing_database_wins_over_yaml(self, tmp_path):
+        """load() should not re-import state.yaml once state.db exists."""
+        db_path = str(tmp_path / "state.db")
+        StateManager.save(db_path, SyncState(last_synced="2025-01-01T00:00:00+00:00"))
+        StateManager.save(str(tmp_path / "state.yaml"), _state())
+
+        assert StateManager.load(db_path).last_synced == "2025-01-01T00:00:00+00:00"
+
+    def test_invalid_legacy_yaml_is_not_migrated(self, tmp_path):
+        """load() should raise for a corrupted state.yaml and leave it in place."""
+        yaml_path = tmp_path / "state.yaml"
+        yaml_path.write_text("last_synced: [unclosed")
+
+        with pytest.raises(StateError):
+            StateManager.load(str(tmp_path / "state.db"))
+
+        assert yaml_path.exists()
+        assert not (tmp_path / "state.db").exists()
+
+    def test_record_page_is_noop_for_yaml(self, tmp_path):
+        """record_page() should not create files for YAML state paths."""
+        yaml_path = tmp_path / "state.yaml"
+
+        StateManager.record_page(str(yaml_path), "1", "docs/a.md", PageRecord(version=2))
+
+        assert not yaml_path.exists()
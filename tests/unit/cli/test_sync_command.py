@@ -14,7 +14,7 @@ from src.confluence_client.errors import (
     APIAccessError,
 )
 from src.file_mapper.errors import ConfigError
-from src.file_mapper.models import SyncConfig, SpaceConfig, SyncResult
+from src.file_mapper.models import SyncConfig, SpaceConfig, SyncPlan, SyncResult
 
 
 class TestSyncCommandInitialization:
@@ -25,7 +25,7 @@ class TestSyncCommandInitialization:
         sync_cmd = SyncCommand()
 
         assert sync_cmd.config_path == ".confluence-sync/config.yaml"
-        assert sync_cmd.state_path == ".confluence-sync/state.yaml"
+        assert sync_cmd.state_path == ".confluence-sync/state.db"
         assert sync_cmd.output_handler is not None
         assert sync_cmd.state_manager is not None
         assert sync_cmd.authenticator is None
@@ -426,11 +426,13 @@ class TestSyncCommandDryRunMode:
             moved_in_confluence=[],
             moved_locally=[]
         )
+        mock_file_mapper = Mock()
+        mock_file_mapper.plan_sync.return_value = SyncPlan()
 
         return {
             'output_handler': Mock(),
             'state_manager': Mock(),
-            'file_mapper': Mock(),
+            'file_mapper': mock_file_mapper,
             'change_detector': mock_change_detector,
             'merge_orchestrator': Mock(),
             'authenticator': Mock(),
@@ -492,7 +494,7 @@ class TestSyncCommandDryRunMode:
                 mock_dependencies['output_handler'].info.assert_any_call(
                     "Dry run mode - previewing changes..."
                 )
-                mock_dependencies['output_handler'].print_dryrun_summary.assert_called_once()
+                mock_dependencies['output_handler'].print_sync_plan.assert_called_once()
 
     def test_dry_run_does_not_update_state(
         self, tmp_path, mock_dependencies, sample_config, sample_state
@@ -559,7 +561,7 @@ class TestSyncCommandDryRunMode:
     def test_dry_run_calls_display_summary_with_counts(
         self, tmp_path, mock_dependencies, sample_config, sample_state
     ):
-        """Dry run calls display_dry_run_summary with correct counts."""
+        """Dry run prints the (empty) sync plan."""
         # Arrange
         config_path = tmp_path / "config.yaml"
         state_path = tmp_path / "state.yaml"
@@ -585,10 +587,8 @@ class TestSyncCommandDryRunMode:
                 sync_cmd.run(dry_run=True)
 
                 # Assert
-                mock_dependencies['output_handler'].print_dryrun_summary.assert_called_once_with(
-                    to_push=[],
-                    to_pull=[],
-                    conflicts=[],
+                mock_dependencies['output_handler'].print_sync_plan.assert_called_once_with(
+                    SyncPlan()
                 )
 
     def test_get_remote_pages_excludes_parent_when_configured(self, tmp_path, mock_dependencies):
@@ -1313,3 +1313,108 @@ class TestSyncCommandValidation:
         print_calls = [str(call) for call in mock_dependencies['output_handler'].print.call_args_list]
         assert any("confluence-sync --init" in str(call) for call in print_calls)
 
+
+
+class TestSyncCommandGitChangeDetection:
+    """Test cases for git-based local change detection."""
+
+    def _config(self, local_path):
+        return SyncConfig(
+            spaces=[SpaceConfig(space_key="TEST", parent_page_id="1", local_path=str(local_path))],
+            local_change_detection="git",
+        )
+
+    def test_not_a_repository_falls_back_to_mtime(self, tmp_path):
+        """_detect_git_changes should return None outside a git repository."""
+        sync_cmd = SyncCommand(output_handler=Mock())
+
+        assert sync_cmd._detect_git_changes(self._config(tmp_path), SyncState()) is None
+
+    def test_changes_since_recorded_snapshot(self, tmp_path):
+        """Recorded snapshots should let the next sync list only changed files."""
+        import os
+        import subprocess
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("# A\n")
+        (docs / "b.md").write_text("# B\n")
+        git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(git + ["add", "."], cwd=tmp_path, check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+        sync_cmd = SyncCommand(output_handler=Mock())
+        config = self._config(docs)
+        state = SyncState(last_synced="2024-01-15T10:30:00Z")
+
+        assert sync_cmd._detect_git_changes(config, state) is None
+
+        sync_cmd._record_workspace_commits(config, state)
+        (docs / "b.md").write_text("# B edited\n")
+
+        assert sync_cmd._detect_git_changes(config, state) == {
+            os.path.join(os.path.realpath(tmp_path), "docs", "b.md")
+        }
+
+
+class TestSyncCommandPageRecords:
+    """Test cases for per-page records kept by the SQLite state store."""
+
+    def test_records_hash_and_keeps_unchanged(self, tmp_path):
+        """_update_page_records should only replace records of changed files."""
+        from src.cli.models import PageRecord
+
+        (tmp_path / "a.md").write_text("# A\n")
+        (tmp_path / "b.md").write_text("# B\n")
+        sync_cmd = SyncCommand(output_handler=Mock(), state_path=str(tmp_path / "state.db"))
+        state = SyncState(
+            last_synced="2024-02-01T00:00:00+00:00",
+            tracked_pages={"1": str(tmp_path / "a.md"), "2": str(tmp_path / "b.md")},
+        )
+        sync_cmd._update_page_records(state)
+        record_a = state.page_records["1"]
+        assert record_a.last_synced == "2024-02-01T00:00:00+00:00"
+
+        state.page_records["2"] = PageRecord(version=5, content_hash="stale", last_synced="old")
+        state.last_synced = "2024-03-01T00:00:00+00:00"
+        sync_cmd._update_page_records(state)
+
+        assert state.page_records["1"] is record_a
+        # Changed without a version reported by this run: not the stale 5
+        assert state.page_records["2"].version is None
+        assert state.page_records["2"].last_synced == "2024-03-01T00:00:00+00:00"
+        assert state.page_records["2"].content_hash != "stale"
+
+    def test_records_version_from_synced_pages(self, tmp_path):
+        """_update_page_records should store the version a push or pull reported."""
+        from src.cli.models import PageRecord
+        from src.file_mapper.models import PageAction
+
+        (tmp_path / "a.md").write_text("# A\n")
+        sync_cmd = SyncCommand(output_handler=Mock(), state_path=str(tmp_path / "state.db"))
+        state = SyncState(
+            last_synced="2024-02-01T00:00:00+00:00",
+            tracked_pages={"1": str(tmp_path / "a.md")},
+        )
+        sync_cmd._update_page_records(state)
+        state.page_records["1"] = PageRecord(
+            version=3, content_hash=state.page_records["1"].content_hash, last_synced="old"
+        )
+
+        # Same content, but pushed again as version 4
+        sync_cmd._record_synced_version(
+            PageAction(page_id="1", file_path="a.md", action="push", content_hash="h", version=4)
+        )
+        sync_cmd._update_page_records(state)
+
+        assert state.page_records["1"].version == 4
+
+    def test_yaml_state_skips_hashing(self, tmp_path):
+        """_update_page_records should leave state alone for YAML state files."""
+        (tmp_path / "a.md").write_text("# A\n")
+        sync_cmd = SyncCommand(output_handler=Mock(), state_path=str(tmp_path / "state.yaml"))
+        state = SyncState(tracked_pages={"1": str(tmp_path / "a.md")})
+
+        sync_cmd._update_page_records(state)
+
+        assert state.page_records == {}
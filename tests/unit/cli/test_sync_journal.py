@@ -0,0 +1,96 @@
+"""Unit tests for cli.sync_journal module."""
+
+import json
+
+from src.cli.sync_journal import SyncJournal
+from src.file_mapper.models import PageAction
+
+
+def _action(page_id="123", version=8):
+    return PageAction(
+        page_id=page_id, file_path=f"docs/{page_id}.md", action="push",
+        content_hash="abc", version=version
+    )
+
+
+class TestSyncJournal:
+    """Test cases for SyncJournal."""
+
+    def test_round_trip(self, tmp_path):
+        """load() should return the recorded phases and pages."""
+        journal = SyncJournal(str(tmp_path / "journal.jsonl"))
+        journal.start()
+        journal.record_phase("deletions")
+        journal.record_page(_action("1"))
+        journal.record_page(_action("2", version=None))
+
+        phases, pages = journal.load()
+
+        assert phases == {"deletions"}
+        assert pages["1"] == _action("1")
+        assert pages["2"].version is None
+
+    def test_latest_entry_wins(self, tmp_path):
+        """load() should keep the last entry recorded for a page."""
+        journal = SyncJournal(str(tmp_path / "journal.jsonl"))
+        journal.start()
+        journal.record_page(_action("1", version=3))
+        journal.record_page(_action("1", version=4))
+
+        assert journal.load()[1]["1"].version == 4
+
+    def test_missing_journal(self, tmp_path):
+        """load() should return nothing when no journal exists."""
+        journal = SyncJournal(str(tmp_path / "journal.jsonl"))
+
+        assert not journal.exists()
+        assert journal.load() == (set(), {})
+
+    def test_torn_last_line_ignored(self, tmp_path):
+        """load() should skip a partially written last line."""
+        path = tmp_path / "journal.jsonl"
+        journal = SyncJournal(str(path))
+        journal.start()
+        journal.record_page(_action("1"))
+        with open(path, "a") as f:
+            f.write('{"type":"page","page_id":"2","act')
+
+        phases, pages = journal.load()
+
+        assert set(pages) == {"1"}
+
+    def test_resume_appends_after_torn_line(self, tmp_path):
+        """start(resume=True) should keep entries and not glue onto a torn line."""
+        path = tmp_path / "journal.jsonl"
+        journal = SyncJournal(str(path))
+        journal.start()
+        journal.record_page(_action("1"))
+        with open(path, "a") as f:
+            f.write('{"type":"pa')
+
+        journal.start(resume=True)
+        journal.record_page(_action("3"))
+
+        assert set(journal.load()[1]) == {"1", "3"}
+        last = path.read_text().splitlines()[-1]
+        assert json.loads(last)["page_id"] == "3"
+
+    def test_start_without_resume_discards(self, tmp_path):
+        """start() should drop entries from an earlier run."""
+        journal = SyncJournal(str(tmp_path / "journal.jsonl"))
+        journal.start()
+        journal.record_page(_action("1"))
+
+        journal.start()
+
+        assert journal.load() == (set(), {})
+
+    def test_complete_removes_journal(self, tmp_path):
+        """complete() should delete the journal file."""
+        journal = SyncJournal(str(tmp_path / "state" / "journal.jsonl"))
+        journal.start()
+        assert journal.exists()
+
+        journal.complete()
+
+        assert not journal.exists()
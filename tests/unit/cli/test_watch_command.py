@@ -0,0 +1,220 @@
+"""Unit tests for cli.watch_command module."""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from src.cli.models import ExitCode
+from src.cli.watch_command import WatchCommand
+from src.file_mapper.models import SpaceConfig, SyncConfig
+
+
+URL = "https://example.atlassian.net/wiki/spaces/TEAM/pages/{page_id}"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def docs(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "tracked.md").write_text(f"---\nconfluence_url: {URL.format(page_id=111)}\n---\n# A\n")
+    return docs
+
+
+@pytest.fixture
+def sync_command():
+    sync_command = Mock()
+    sync_command.run.return_value = ExitCode.SUCCESS
+    sync_command.push_local_edit.return_value = 8
+    sync_command.get_api_wrapper.return_value.search_by_cql.return_value = {'results': []}
+    return sync_command
+
+
+@pytest.fixture
+def watch(docs, sync_command):
+    clock = FakeClock()
+    watch = WatchCommand(
+        sync_command, debounce_seconds=2.0, remote_poll_interval=60.0,
+        use_watchdog=False, clock=clock
+    )
+    watch._config = SyncConfig(spaces=[
+        SpaceConfig(space_key="TEAM", parent_page_id="100", local_path=str(docs),
+                    exclude_page_ids=["999"])
+    ])
+    watch._signatures = watch._snapshot()
+    watch._last_scan = watch._signatures
+    watch.clock = clock
+    return watch
+
+
+def _cql_results(*pages):
+    return {'results': [
+        {'content': {'id': page_id, 'version': {'number': version}}} for page_id, version in pages
+    ]}
+
+
+class TestWatchCommandLocalBatches:
+    """Test cases for debounced local change batches."""
+
+    def test_modified_tracked_file_is_pushed(self, watch, sync_command, docs):
+        """_process_batch should push an edited tracked file through push_local_edit."""
+        path = docs / "tracked.md"
+        path.write_text(f"---\nconfluence_url: {URL.format(page_id=111)}\n---\n# A edited\n")
+
+        watch._process_batch({os.path.abspath(path)})
+
+        sync_command.push_local_edit.assert_called_once()
+        assert sync_command.push_local_edit.call_args[0][0] == os.path.abspath(path)
+        sync_command.run.assert_not_called()
+        assert watch._known_versions["111"] == 8
+
+    def test_remotely_changed_page_triggers_full_sync(self, watch, sync_command, docs):
+        """_process_batch should run a full sync instead of pushing over a remote edit."""
+        path = docs / "tracked.md"
+        path.write_text(f"---\nconfluence_url: {URL.format(page_id=111)}\n---\n# A edited\n")
+        sync_command.push_local_edit.return_value = None
+
+        watch._process_batch({os.path.abspath(path)})
+
+        sync_command.push_local_edit.assert_called_once()
+        sync_command.run.assert_called_once_with()
+        assert "111" not in watch._known_versions
+
+    def test_unchanged_file_is_ignored(self, watch, sync_command, docs):
+        """_process_batch should ignore events for files whose signature is unchanged."""
+        watch._process_batch({os.path.abspath(docs / "tracked.md")})
+
+        sync_command.push_local_edit.assert_not_called()
+        sync_command.run.assert_not_called()
+
+    def test_new_file_triggers_full_sync(self, watch, sync_command, docs):
+        """_process_batch should run a full sync for files without a page_id."""
+        path = docs / "new.md"
+        path.write_text("# New page\n")
+
+        watch._process_batch({os.path.abspath(path)})
+
+        sync_command.push_local_edit.assert_not_called()
+        sync_command.run.assert_called_once_with()
+
+    def test_deleted_file_triggers_full_sync(self, watch, sync_command, docs):
+        """_process_batch should run a full sync when a tracked file is removed."""
+        path = docs / "tracked.md"
+        path.unlink()
+
+        watch._process_batch({os.path.abspath(path)})
+
+        sync_command.run.assert_called_once_with()
+
+    def test_push_failure_does_not_stop_batch(self, watch, sync_command, docs):
+        """_process_batch should report failures and continue with the next file."""
+        (docs / "other.md").write_text(f"---\nconfluence_url: {URL.format(page_id=222)}\n---\n# B\n")
+        watch._signatures = watch._snapshot()
+        for name in ("tracked.md", "other.md"):
+            (docs / name).write_text((docs / name).read_text() + "more\n")
+        sync_command.push_local_edit.side_effect = [Exception("boom"), 9]
+
+        watch._process_batch({os.path.abspath(docs / "tracked.md"), os.path.abspath(docs / "other.md")})
+
+        assert sync_command.push_local_edit.call_count == 2
+        sync_command.output_handler.error.assert_called_once()
+
+    def test_changes_are_debounced(self, watch, sync_command, docs):
+        """_run_cycle should only sync after the debounce period without new changes."""
+        watch._next_remote_poll = float('inf')
+        path = docs / "tracked.md"
+        path.write_text(f"---\nconfluence_url: {URL.format(page_id=111)}\n---\n# v2\n")
+
+        watch._run_cycle()
+        assert watch._pending
+        sync_command.push_local_edit.assert_not_called()
+
+        watch.clock.now += 1.0
+        watch._run_cycle()
+        sync_command.push_local_edit.assert_not_called()
+
+        watch.clock.now += 2.0
+        watch._run_cycle()
+        sync_command.push_local_edit.assert_called_once()
+        assert not watch._pending
+
+
+class TestWatchCommandRemotePoll:
+    """Test cases for the remote lastmodified poll."""
+
+    def test_cql_query(self, watch):
+        """_build_remote_cql should restrict to the space tree and a lastmodified window."""
+        cql = watch._build_remote_cql(watch._config.spaces[0])
+
+        assert 'space = "TEAM"' in cql
+        assert "ancestor = 100" in cql
+        assert 'lastmodified >= now("-2m")' in cql
+
+    def test_cql_window_covers_time_since_last_successful_poll(self, watch, sync_command):
+        """_build_remote_cql should reach back to the last successful poll, however late."""
+        api = sync_command.get_api_wrapper.return_value
+        space = watch._config.spaces[0]
+        watch._poll_remote()
+
+        # A long full sync delayed the next poll by five minutes
+        watch.clock.now += 300
+        assert 'lastmodified >= now("-6m")' in watch._build_remote_cql(space)
+
+        # A failed poll does not move the window forward
+        api.search_by_cql.side_effect = Exception("offline")
+        watch._poll_remote()
+        watch.clock.now += 60
+        assert 'lastmodified >= now("-7m")' in watch._build_remote_cql(space)
+
+        api.search_by_cql.side_effect = None
+        watch._poll_remote()
+        assert 'lastmodified >= now("-1m")' in watch._build_remote_cql(space)
+
+    def test_new_remote_version_detected(self, watch, sync_command):
+        """_poll_remote should report pages with versions not seen before."""
+        api = sync_command.get_api_wrapper.return_value
+        api.search_by_cql.return_value = _cql_results(("111", 5))
+        assert watch._poll_remote(prime=True) is False
+
+        assert watch._poll_remote() is False
+
+        api.search_by_cql.return_value = _cql_results(("111", 6))
+        assert watch._poll_remote() is True
+
+    def test_own_push_not_reported(self, watch, sync_command):
+        """_poll_remote should ignore versions created by this watch process."""
+        watch._known_versions["111"] = 8
+        sync_command.get_api_wrapper.return_value.search_by_cql.return_value = _cql_results(
+            ("111", 8), ("999", 3)
+        )
+
+        assert watch._poll_remote() is False
+
+    def test_poll_failure_is_not_fatal(self, watch, sync_command):
+        """_poll_remote should log API errors and report no changes."""
+        sync_command.get_api_wrapper.return_value.search_by_cql.side_effect = Exception("offline")
+
+        assert watch._poll_remote() is False
+
+    def test_remote_change_triggers_full_sync(self, watch, sync_command):
+        """_run_cycle should run a full sync when the remote poll finds changes."""
+        sync_command.get_api_wrapper.return_value.search_by_cql.return_value = _cql_results(
+            ("111", 6)
+        )
+        watch._next_remote_poll = watch.clock.now
+        watch._next_local_poll = float('inf')
+
+        watch._run_cycle()
+
+        sync_command.run.assert_called_once_with()
+        assert watch._next_remote_poll == watch.clock.now + 60.0
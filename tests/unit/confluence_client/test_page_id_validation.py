@@ -210,3 +210,19 @@ class TestPageIDValidation:
 
         assert "Invalid page_id format" in str(exc_info.value)
         mock_client.update.assert_not_called()
+
+    def test_move_page_validates_input(self, api_wrapper, mocker):
+        """Integration test: move_page validates page and parent IDs."""
+        mock_client = mocker.Mock()
+        mocker.patch.object(api_wrapper, '_get_client', return_value=mock_client)
+
+        with pytest.raises(ValueError) as exc_info:
+            api_wrapper.move_page(
+                page_id="123",
+                title="Test",
+                parent_id="456' OR '1'='1",
+                version=1
+            )
+
+        assert "Invalid page_id format" in str(exc_info.value)
+        mock_client._session.put.assert_not_called()
@@ -0,0 +1,85 @@
+"""Unit tests for confluence_client.rate_limiter module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.confluence_client.rate_limiter import RateLimiter, get_rate_limiter
+from src.confluence_client.retry_logic import retry_on_rate_limit
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    @patch('src.confluence_client.rate_limiter.time.sleep')
+    @patch('src.confluence_client.rate_limiter.time.monotonic', return_value=100.0)
+    def test_paces_requests(self, mock_monotonic, mock_sleep):
+        """acquire() should space request starts by 1/requests_per_second."""
+        limiter = RateLimiter(requests_per_second=4)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5]
+
+    @patch('src.confluence_client.rate_limiter.time.sleep')
+    def test_unpaced_by_default(self, mock_sleep):
+        """Without a rate, acquire() should never wait."""
+        limiter = RateLimiter()
+
+        for _ in range(5):
+            limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @patch('src.confluence_client.rate_limiter.time.sleep')
+    @patch('src.confluence_client.rate_limiter.time.monotonic', return_value=100.0)
+    def test_pause_holds_requests_until_resume(self, mock_monotonic, mock_sleep):
+        """A pause should hold back acquire() until it expires or is resumed."""
+        limiter = RateLimiter()
+
+        until = limiter.pause(2)
+        limiter.acquire()
+        limiter.resume(until)
+        limiter.acquire()
+
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch('src.confluence_client.rate_limiter.time.sleep')
+    @patch('src.confluence_client.rate_limiter.time.monotonic', return_value=100.0)
+    def test_resume_keeps_longer_cooldown_of_another_thread(self, mock_monotonic, mock_sleep):
+        """resume() should not cancel a longer pause set by another caller."""
+        limiter = RateLimiter()
+
+        short = limiter.pause(1)
+        limiter.pause(4)
+        limiter.resume(short)
+        limiter.acquire()
+
+        mock_sleep.assert_called_once_with(4.0)
+
+    def test_negative_rate_rejected(self):
+        """A negative rate should raise ValueError."""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_second=-1)
+
+
+class TestSharedRateLimiter:
+    """Test cases for the limiter shared by retry_on_rate_limit."""
+
+    @patch('src.confluence_client.retry_logic.time.sleep')
+    def test_rate_limit_pauses_and_resumes_shared_limiter(self, mock_sleep):
+        """A 429 should pause the shared limiter until the retry succeeds."""
+        limiter = get_rate_limiter()
+        seen = []
+
+        def call():
+            seen.append(limiter._cooldown_until > 0)
+            if len(seen) == 1:
+                raise Exception("HTTP 429 Too Many Requests")
+            return "ok"
+
+        assert retry_on_rate_limit(call) == "ok"
+
+        assert seen == [False, True]
+        assert limiter._cooldown_until == 0.0
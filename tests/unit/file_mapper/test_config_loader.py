@@ -78,6 +78,165 @@ spaces:
         assert result.force_pull is False  # Default
         assert result.force_push is False  # Default
         assert result.temp_dir == ".confluence-sync/temp"  # Default
+        assert result.cache_dir == ".confluence-sync"  # Default
+
+    def test_load_config_with_cache_disabled(self, tmp_path):
+        """Load configuration with cache_dir explicitly set to null."""
+        config_file = tmp_path / "config.yaml"
+        config_content = """
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+cache_dir: null
+"""
+        config_file.write_text(config_content)
+
+        result = ConfigLoader.load(str(config_file))
+
+        assert result.cache_dir is None
+
+    def test_load_config_with_git_change_detection(self, tmp_path):
+        """Load configuration with local_change_detection set to git."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+local_change_detection: git
+""")
+
+        result = ConfigLoader.load(str(config_file))
+
+        assert result.local_change_detection == "git"
+
+    def test_load_config_with_invalid_change_detection_raises_error(self, tmp_path):
+        """Load configuration with an unknown local_change_detection mode."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+local_change_detection: inotify
+""")
+
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader.load(str(config_file))
+
+        assert "local_change_detection" in str(exc_info.value)
+
+    def test_load_config_with_concurrency(self, tmp_path):
+        """Load configuration with concurrency, defaulting to 1."""
+        config_file = tmp_path / "config.yaml"
+        base = """
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+"""
+        config_file.write_text(base)
+        assert ConfigLoader.load(str(config_file)).concurrency == 1
+
+        config_file.write_text(base + "concurrency: 4\n")
+        assert ConfigLoader.load(str(config_file)).concurrency == 4
+
+    def test_load_config_with_invalid_concurrency_raises_error(self, tmp_path):
+        """Load configuration with concurrency below 1."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+concurrency: 0
+""")
+
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader.load(str(config_file))
+
+        assert "concurrency" in str(exc_info.value)
+
+    def test_load_config_with_requests_per_second(self, tmp_path):
+        """Load configuration with request pacing, rejecting negative rates."""
+        config_file = tmp_path / "config.yaml"
+        base = """
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+"""
+        config_file.write_text(base)
+        assert ConfigLoader.load(str(config_file)).requests_per_second == 0
+
+        config_file.write_text(base + "requests_per_second: 12.5\n")
+        assert ConfigLoader.load(str(config_file)).requests_per_second == 12.5
+
+        config_file.write_text(base + "requests_per_second: -1\n")
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader.load(str(config_file))
+        assert "requests_per_second" in str(exc_info.value)
+
+    def test_load_config_with_push_pipeline_depth(self, tmp_path):
+        """Load configuration with a push pipeline depth, rejecting negative depths."""
+        config_file = tmp_path / "config.yaml"
+        base = """
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+"""
+        config_file.write_text(base)
+        assert ConfigLoader.load(str(config_file)).push_pipeline_depth == 0
+
+        config_file.write_text(base + "push_pipeline_depth: 4\n")
+        assert ConfigLoader.load(str(config_file)).push_pipeline_depth == 4
+
+        config_file.write_text(base + "push_pipeline_depth: -2\n")
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader.load(str(config_file))
+        assert "push_pipeline_depth" in str(exc_info.value)
+
+    def test_load_config_with_space_concurrency(self, tmp_path):
+        """Load configuration with a space concurrency limit, rejecting values below 1."""
+        config_file = tmp_path / "config.yaml"
+        base = """
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+"""
+        config_file.write_text(base)
+        assert ConfigLoader.load(str(config_file)).space_concurrency == 1
+
+        config_file.write_text(base + "space_concurrency: 4\n")
+        assert ConfigLoader.load(str(config_file)).space_concurrency == 4
+
+        config_file.write_text(base + "space_concurrency: 0\n")
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader.load(str(config_file))
+        assert "space_concurrency" in str(exc_info.value)
+
+    def test_load_config_with_cache_format(self, tmp_path):
+        """Load configuration with a cache format, rejecting unknown formats."""
+        config_file = tmp_path / "config.yaml"
+        base = """
+spaces:
+  - space_key: TEST
+    parent_page_id: "111111"
+    local_path: ./test
+"""
+        config_file.write_text(base)
+        assert ConfigLoader.load(str(config_file)).cache_format == "files"
+
+        config_file.write_text(base + "cache_format: pack\n")
+        assert ConfigLoader.load(str(config_file)).cache_format == "pack"
+
+        config_file.write_text(base + "cache_format: sqlite\n")
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader.load(str(config_file))
+        assert "cache_format" in str(exc_info.value)
 
     def test_load_valid_config_without_exclude_page_ids(self, tmp_path):
         """Load valid configuration without exclude_page_ids field."""
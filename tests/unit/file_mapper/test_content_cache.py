@@ -0,0 +1,73 @@
+"""Unit tests for file_mapper.content_cache module."""
+
+import os
+
+import pytest
+
+from src.file_mapper.content_cache import PageContentCache
+
+
+WHEN = '2024-01-15T10:30:00.000Z'
+
+
+class TestPageContentCache:
+    """Test cases for PageContentCache."""
+
+    def test_init_creates_space_directories(self, tmp_path):
+        """PageContentCache should create xhtml and markdown stores per space."""
+        PageContentCache(str(tmp_path), 'TEAM')
+
+        assert os.path.isdir(tmp_path / 'TEAM_xhtml')
+        assert os.path.isdir(tmp_path / 'TEAM_markdown')
+
+    def test_put_and_get_round_trip(self, tmp_path):
+        """PageContentCache should return stored XHTML and markdown."""
+        cache = PageContentCache(str(tmp_path), 'TEAM')
+
+        cache.put('123', 5, WHEN, '<p>Hi</p>', 'Hi')
+
+        assert cache.get_xhtml('123', 5, WHEN) == '<p>Hi</p>'
+        assert cache.get_markdown('123', 5, WHEN) == 'Hi'
+
+    def test_get_misses_on_different_timestamp(self, tmp_path):
+        """PageContentCache should miss when version.when differs."""
+        cache = PageContentCache(str(tmp_path), 'TEAM')
+        cache.put('123', 5, WHEN, '<p>Hi</p>', 'Hi')
+
+        assert cache.get_markdown('123', 5, '2024-01-16T10:30:00.000Z') is None
+
+    def test_invalid_timestamp_is_never_cached(self, tmp_path):
+        """PageContentCache should ignore entries without a parseable timestamp."""
+        cache = PageContentCache(str(tmp_path), 'TEAM')
+
+        cache.put('123', 5, '', '<p>Hi</p>', 'Hi')
+
+        assert cache.get_markdown('123', 5, '') is None
+        assert os.listdir(tmp_path / 'TEAM_markdown') == []
+
+    def test_corrupted_entry_is_treated_as_miss(self, tmp_path):
+        """PageContentCache should drop unreadable entries instead of raising."""
+        cache = PageContentCache(str(tmp_path), 'TEAM')
+        cache.put('123', 5, WHEN, '<p>Hi</p>', 'Hi')
+        (tmp_path / 'TEAM_markdown' / '123_v5.meta.json').write_text('{broken')
+        cache = PageContentCache(str(tmp_path), 'TEAM')
+
+        assert cache.get_markdown('123', 5, WHEN) is None
+        assert not (tmp_path / 'TEAM_markdown' / '123_v5.xhtml').exists()
+
+    def test_pack_format_round_trip(self, tmp_path):
+        """With the pack format, both stores live in one pack file each."""
+        cache = PageContentCache(str(tmp_path), 'TEAM', cache_format='pack')
+
+        cache.put('123', 5, WHEN, '<p>Hi</p>', 'Hi')
+        cache.flush()
+
+        assert cache.get_xhtml('123', 5, WHEN) == '<p>Hi</p>'
+        assert cache.get_markdown('123', 5, WHEN) == 'Hi'
+        assert os.listdir(tmp_path / 'TEAM_xhtml') == ['xhtml.pack']
+        assert os.listdir(tmp_path / 'TEAM_markdown') == ['xhtml.pack']
+
+    def test_unknown_format_rejected(self, tmp_path):
+        """PageContentCache should raise ValueError for an unknown format."""
+        with pytest.raises(ValueError):
+            PageContentCache(str(tmp_path), 'TEAM', cache_format='sqlite')
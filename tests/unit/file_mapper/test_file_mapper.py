@@ -3,12 +3,14 @@
 import os
 import tempfile
 import shutil
+import threading
 import pytest
 from unittest.mock import Mock, patch, call, mock_open
 from datetime import datetime
 
 from src.file_mapper.file_mapper import FileMapper, CONFLICT_MARKER_PATTERN
-from src.file_mapper.models import PageNode, LocalPage, SpaceConfig, SyncConfig
+from src.file_mapper.local_manifest import LazyLocalPage
+from src.file_mapper.models import PageNode, LocalPage, SpaceConfig, SyncConfig, SyncResult
 from src.file_mapper.errors import FilesystemError, ConfigError
 from src.confluence_client.errors import PageNotFoundError, InvalidCredentialsError
 
@@ -165,6 +167,61 @@ class TestFileMapperSyncSpaces:
         # Should not call _sync_space
         mock_sync_space.assert_not_called()
 
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_sync_spaces_concurrent(self, mock_api_class, mock_hierarchy_class):
+        """With space_concurrency, spaces run at once, each with its own base path."""
+        mapper = FileMapper(create_mock_auth())
+        spaces = [
+            create_space_config(space_key=f'S{i}', parent_page_id=str(100 + i), local_path=f'/docs/s{i}')
+            for i in range(3)
+        ]
+        sync_config = create_sync_config(spaces=spaces)
+        sync_config.space_concurrency = 3
+        sync_config.concurrency = 6
+        barrier = threading.Barrier(3, timeout=5)
+        seen = {}
+        lock = threading.Lock()
+
+        def sync_space(self, space_config, space_sync_config):
+            barrier.wait()  # Deadlocks unless all three spaces run at once
+            with lock:
+                seen[space_config.space_key] = (
+                    self._base_path, space_sync_config.concurrency, space_sync_config.temp_dir
+                )
+            return SyncResult(pushed_count=1, conflict_page_ids=[space_config.space_key])
+
+        with patch.object(FileMapper, '_sync_space', autospec=True, side_effect=sync_space):
+            result = mapper.sync_spaces(sync_config)
+
+        assert result.pushed_count == 3
+        assert result.conflict_page_ids == ['S0', 'S1', 'S2']
+        assert seen['S1'] == ('/docs/s1', 2, os.path.join('.test-temp', 'space-1'))
+        assert len({temp_dir for _, _, temp_dir in seen.values()}) == 3
+        assert mapper._base_path == ""
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_sync_spaces_concurrent_failure_keeps_other_spaces(self, mock_api_class, mock_hierarchy_class):
+        """A failed space is re-raised after the other spaces finish."""
+        mapper = FileMapper(create_mock_auth())
+        spaces = [create_space_config(space_key=f'S{i}', parent_page_id=str(100 + i)) for i in range(3)]
+        sync_config = create_sync_config(spaces=spaces)
+        sync_config.space_concurrency = 2
+        synced = []
+
+        def sync_space(self, space_config, space_sync_config):
+            if space_config.space_key == 'S0':
+                raise PageNotFoundError('100')
+            synced.append(space_config.space_key)
+            return SyncResult(pulled_count=1)
+
+        with patch.object(FileMapper, '_sync_space', autospec=True, side_effect=sync_space):
+            with pytest.raises(PageNotFoundError):
+                mapper.sync_spaces(sync_config)
+
+        assert sorted(synced) == ['S1', 'S2']
+
 
 class TestFileMapperDetectSyncDirection:
     """Test cases for FileMapper._detect_sync_direction() method."""
@@ -416,7 +473,14 @@ class TestFileMapperReadLocalFiles:
         md_file2.write_text("# Invalid")
 
         page1 = create_local_page(str(md_file1), '123', '# Valid')
-        mock_frontmatter.parse.side_effect = [page1, Exception("Invalid frontmatter")]
+
+        def parse(file_path, content):
+            # Files are read on a thread pool, so dispatch on the path, not call order
+            if file_path == str(md_file2):
+                raise Exception("Invalid frontmatter")
+            return page1
+
+        mock_frontmatter.parse.side_effect = parse
 
         # Should not raise exception, just log and skip
         result = mapper._read_local_files(str(tmp_path))
@@ -446,6 +510,181 @@ class TestFileMapperReadLocalFiles:
                     assert 'Permission denied' in exc_info.value.reason
 
 
+class TestFileMapperReadLocalFilesManifest:
+    """Test cases for FileMapper._read_local_files() with a local manifest."""
+
+    URL = "https://example.atlassian.net/wiki/spaces/TEST/pages/123"
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_unchanged_files_are_not_reparsed(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """_read_local_files should serve unchanged files from the manifest."""
+        from src.file_mapper.local_manifest import LazyLocalPage, LocalFileManifest
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        md_file = docs / "page.md"
+        md_file.write_text(f"---\nconfluence_url: {self.URL}\n---\n# Page\n")
+        manifest_path = str(tmp_path / "manifest.json")
+        mapper = FileMapper(create_mock_auth())
+
+        first = LocalFileManifest(manifest_path)
+        mapper._read_local_files(str(docs), manifest=first)
+        first.save()
+
+        with patch('src.file_mapper.file_mapper.FrontmatterHandler') as mock_frontmatter:
+            result = mapper._read_local_files(
+                str(docs), manifest=LocalFileManifest(manifest_path)
+            )
+            mock_frontmatter.parse.assert_not_called()
+
+        page = result[str(md_file)]
+        assert isinstance(page, LazyLocalPage)
+        assert page.page_id == '123'
+        assert page.space_key == 'TEST'
+        assert page.content == "# Page\n"
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_modified_files_are_reparsed(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """_read_local_files should parse files whose stat changed."""
+        from src.file_mapper.local_manifest import LazyLocalPage, LocalFileManifest
+
+        md_file = tmp_path / "page.md"
+        md_file.write_text("# Draft\n")
+        manifest = LocalFileManifest(str(tmp_path / "manifest.json"))
+        mapper = FileMapper(create_mock_auth())
+        mapper._read_local_files(str(tmp_path), manifest=manifest)
+
+        md_file.write_text(f"---\nconfluence_url: {self.URL}\n---\n# Draft, published\n")
+        result = mapper._read_local_files(str(tmp_path), manifest=manifest)
+
+        page = result[str(md_file)]
+        assert not isinstance(page, LazyLocalPage)
+        assert page.page_id == '123'
+        assert page.content == "# Draft, published\n"
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_touched_file_reuses_metadata(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """_read_local_files should skip the YAML parse when only mtime changed."""
+        from src.file_mapper.local_manifest import LocalFileManifest
+
+        md_file = tmp_path / "page.md"
+        md_file.write_text(f"---\nconfluence_url: {self.URL}\n---\n# Page\n")
+        manifest = LocalFileManifest(str(tmp_path / "manifest.json"))
+        mapper = FileMapper(create_mock_auth())
+        mapper._read_local_files(str(tmp_path), manifest=manifest)
+        stat = os.stat(md_file)
+        os.utime(md_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch('src.file_mapper.file_mapper.FrontmatterHandler.parse') as mock_parse:
+            result = mapper._read_local_files(str(tmp_path), manifest=manifest)
+            mock_parse.assert_not_called()
+
+        assert result[str(md_file)].page_id == '123'
+        assert result[str(md_file)].content == "# Page\n"
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_deleted_files_are_pruned(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """_read_local_files should drop manifest entries of deleted files."""
+        from src.file_mapper.local_manifest import LocalFileManifest
+
+        (tmp_path / "a.md").write_text("# A\n")
+        (tmp_path / "b.md").write_text("# B\n")
+        manifest = LocalFileManifest(str(tmp_path / "manifest.json"))
+        mapper = FileMapper(create_mock_auth())
+        mapper._read_local_files(str(tmp_path), manifest=manifest)
+
+        (tmp_path / "b.md").unlink()
+        mapper._read_local_files(str(tmp_path), manifest=manifest)
+
+        assert manifest.get("a.md") is not None
+        assert manifest.get("b.md") is None
+
+
+
+class TestFileMapperReadLocalFilesParallel:
+    """Test cases for concurrent reading in FileMapper._read_local_files()."""
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_parallel_result_order_matches_sequential(
+        self, mock_api_class, mock_hierarchy_class, tmp_path
+    ):
+        """_read_local_files should return the same pages in the same order for any pool size."""
+        for i in range(20):
+            subdir = tmp_path / f"dir{i % 3}"
+            subdir.mkdir(exist_ok=True)
+            (subdir / f"page{i}.md").write_text(f"# Page {i}\n")
+        mapper = FileMapper(create_mock_auth())
+
+        sequential = mapper._read_local_files(str(tmp_path), max_workers=1)
+        parallel = mapper._read_local_files(str(tmp_path), max_workers=8)
+
+        assert list(parallel) == list(sequential)
+        assert [p.content for p in parallel.values()] == [p.content for p in sequential.values()]
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_parallel_skips_invalid_files(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """_read_local_files should skip unreadable or oversized files and keep the rest."""
+        (tmp_path / "good.md").write_text("# Good\n")
+        (tmp_path / "binary.md").write_bytes(b"\xff\xfe\x00bad")
+        (tmp_path / "big.md").write_text("x" * 100)
+        mapper = FileMapper(create_mock_auth())
+        original_validate = mapper._validate_file_size
+
+        def validate(file_path):
+            if file_path.endswith("big.md"):
+                original_validate(file_path, max_size=10)
+            original_validate(file_path)
+
+        with patch.object(mapper, '_validate_file_size', side_effect=validate):
+            result = mapper._read_local_files(str(tmp_path), max_workers=4)
+
+        assert list(result) == [str(tmp_path / "good.md")]
+
+
+class TestFileMapperIsLocallyModified:
+    """Test cases for FileMapper._is_locally_modified() fast filters."""
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_git_candidates_replace_mtime_check(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """Files git doesn't report are unchanged even with a newer mtime."""
+        md_file = tmp_path / "page.md"
+        md_file.write_text("# Page\n")
+        page = LocalPage(file_path=str(md_file), page_id="123", content="# Page\n")
+        get_baseline = Mock(return_value="old content")
+        config = create_sync_config(last_synced="2000-01-01T00:00:00+00:00", get_baseline=get_baseline)
+        config.locally_changed_paths = set()
+        mapper = FileMapper(create_mock_auth())
+
+        assert mapper._is_locally_modified(str(md_file), page, config) is False
+        get_baseline.assert_not_called()
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_git_candidate_goes_to_baseline_check(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """Files git reports as changed are confirmed against the baseline."""
+        md_file = tmp_path / "page.md"
+        md_file.write_text("# Page\n")
+        os.utime(md_file, (1, 1))
+        page = LocalPage(
+            file_path=str(md_file), page_id="123", content="# Page\n",
+            space_key="TEST", confluence_base_url="https://example.atlassian.net/wiki"
+        )
+        config = create_sync_config(
+            last_synced="2024-01-01T00:00:00+00:00", get_baseline=Mock(return_value="old content")
+        )
+        config.locally_changed_paths = {os.path.realpath(md_file)}
+        mapper = FileMapper(create_mock_auth())
+
+        assert mapper._is_locally_modified(str(md_file), page, config) is True
+
+
 class TestFileMapperBuildFileListFromHierarchy:
     """Test cases for FileMapper._build_file_list_from_hierarchy() method."""
 
@@ -878,6 +1117,76 @@ class TestFileMapperSyncSpace:
         mock_bidirectional.assert_called_once()
 
 
+    @patch.object(FileMapper, '_pull_from_confluence')
+    @patch.object(FileMapper, '_read_local_files')
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_sync_space_reports_content_cache_stats_of_run(self, mock_api_class, mock_hierarchy_class, mock_read_local, mock_pull, tmp_path):
+        """_sync_space should report the cache lookups of this run only, from one reused cache."""
+        mapper = FileMapper(create_mock_auth())
+        mock_read_local.return_value = {}
+        mock_pull.return_value = 0
+        space_config = create_space_config()
+        sync_config = create_sync_config()
+        sync_config.cache_dir = str(tmp_path)
+
+        def build_hierarchy(**kwargs):
+            # One cache lookup per run
+            kwargs['content_cache'].get_markdown('456', 1, '2026-01-30T12:00:00')
+            return create_page_node('123', 'Root')
+        mapper._hierarchy_builder.build_hierarchy = Mock(side_effect=build_hierarchy)
+
+        first = mapper._sync_space(space_config, sync_config)
+        second = mapper._sync_space(space_config, sync_config)
+
+        assert first.cache_stats.misses == 1
+        assert second.cache_stats.misses == 1
+        calls = mapper._hierarchy_builder.build_hierarchy.call_args_list
+        content_cache = calls[0].kwargs['content_cache']
+        assert calls[1].kwargs['content_cache'] is content_cache
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_content_cache_uses_configured_format(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """cache_format: pack should give discovery pack-file stores."""
+        from src.git_integration.xhtml_pack_cache import XHTMLPackCache
+        mapper = FileMapper(create_mock_auth())
+        sync_config = create_sync_config()
+        sync_config.cache_dir = str(tmp_path)
+        sync_config.cache_format = 'pack'
+
+        content_cache = mapper._get_content_cache(create_space_config(), sync_config)
+
+        assert isinstance(content_cache.markdown, XHTMLPackCache)
+        assert isinstance(content_cache.xhtml, XHTMLPackCache)
+
+    @patch.object(FileMapper, '_pull_from_confluence')
+    @patch.object(FileMapper, '_read_local_files')
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_sync_space_cleans_content_cache_after_discovery(self, mock_api_class, mock_hierarchy_class, mock_read_local, mock_pull, tmp_path):
+        """Expired cache entries are removed once per sync, after discovery, without threads."""
+        mapper = FileMapper(create_mock_auth())
+        mock_read_local.return_value = {}
+        mock_pull.return_value = 0
+        sync_config = create_sync_config()
+        sync_config.cache_dir = str(tmp_path)
+        events = []
+
+        def build_hierarchy(**kwargs):
+            events.append('discovery')
+            kwargs['content_cache'].cleanup_expired = Mock(
+                side_effect=lambda: events.append('cleanup') or 0
+            )
+            return create_page_node('123', 'Root')
+        mapper._hierarchy_builder.build_hierarchy = Mock(side_effect=build_hierarchy)
+        threads_before = threading.active_count()
+
+        mapper._sync_space(create_space_config(), sync_config)
+
+        assert events == ['discovery', 'cleanup']
+        assert threading.active_count() == threads_before
+
 class TestFileMapperBuildLocalHierarchy:
     """Test cases for FileMapper._build_local_hierarchy() method."""
 
@@ -1292,6 +1601,140 @@ class TestFileMapperPushHierarchyToConfluence:
         assert len(files_to_update) == 2
 
 
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_push_hierarchy_creates_levels_concurrently(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """A level's pages are created at once; children go under the created IDs."""
+        mapper = FileMapper(create_mock_auth())
+        mapper._sync_print = Mock()
+        for name in ('A', 'B', 'C'):
+            (tmp_path / f"{name}.md").write_text(f"# {name}\n")
+        (tmp_path / "B").mkdir()
+        (tmp_path / "B" / "Child.md").write_text("# Child\n")
+        barrier = threading.Barrier(3, timeout=5)
+
+        def create_page(space_key, title, markdown_content, parent_id):
+            from src.page_operations.models import CreateResult
+            if parent_id == 'root-1':
+                barrier.wait()  # Deadlocks unless the whole first level is created at once
+            return CreateResult(success=True, page_id=f"id-{title}", space_key=space_key,
+                                title=title, version=1)
+
+        mock_page_ops = Mock()
+        mock_page_ops.create_page.side_effect = create_page
+        hierarchy = {
+            '__root__': [str(tmp_path / f"{name}.md") for name in ('A', 'B', 'C')],
+            'B': [str(tmp_path / "B" / "Child.md")],
+        }
+        sync_config = create_sync_config()
+        sync_config.concurrency = 3
+        files_to_update = []
+
+        # Worker threads create their own PageOperations
+        with patch.object(mapper, '_get_confluence_base_url', return_value='https://example.atlassian.net/wiki'), \
+                patch('src.file_mapper.file_mapper.PageOperations', return_value=mock_page_ops):
+            mapper._push_hierarchy_to_confluence(
+                hierarchy=hierarchy,
+                page_ops=mock_page_ops,
+                space_config=create_space_config(local_path=str(tmp_path)),
+                sync_config=sync_config,
+                files_to_update=files_to_update,
+                parent_page_id='root-1'
+            )
+
+        assert [os.path.basename(path) for path, _ in files_to_update] == [
+            'A.md', 'B.md', 'C.md', 'Child.md'
+        ]
+        child_call = [c for c in mock_page_ops.create_page.call_args_list
+                      if c.kwargs['title'] == 'Child'][0]
+        assert child_call.kwargs['parent_id'] == 'id-B'
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_push_hierarchy_same_title_siblings_are_deterministic(
+        self, mock_api_class, mock_hierarchy_class, tmp_path
+    ):
+        """With several workers, the later same-titled sibling always gets the fallback title."""
+        from src.page_operations.models import CreateResult
+        mapper = FileMapper(create_mock_auth())
+        mapper._sync_print = Mock()
+        (tmp_path / "Overview.md").write_text("# Shared Title\nFirst\n")
+        (tmp_path / "Summary.md").write_text("# Shared Title\nSecond\n")
+        existing = set()
+        lock = threading.Lock()
+
+        def create_page(space_key, title, markdown_content, parent_id):
+            with lock:
+                if title in existing:
+                    return CreateResult(success=False, page_id="taken", space_key=space_key,
+                                        title=title, error=f"Page '{title}' already exists")
+                existing.add(title)
+            return CreateResult(success=True, page_id=f"id-{title}", space_key=space_key,
+                                title=title, version=1)
+
+        mock_page_ops = Mock()
+        mock_page_ops.create_page.side_effect = create_page
+        sync_config = create_sync_config()
+        sync_config.concurrency = 2
+        files_to_update = []
+
+        with patch.object(mapper, '_get_confluence_base_url', return_value='https://example.atlassian.net/wiki'), \
+                patch('src.file_mapper.file_mapper.PageOperations', return_value=mock_page_ops):
+            mapper._push_hierarchy_to_confluence(
+                hierarchy={'__root__': [str(tmp_path / "Overview.md"), str(tmp_path / "Summary.md")]},
+                page_ops=mock_page_ops,
+                space_config=create_space_config(local_path=str(tmp_path)),
+                sync_config=sync_config,
+                files_to_update=files_to_update,
+                parent_page_id='root-1'
+            )
+
+        titles = [c.kwargs['title'] for c in mock_page_ops.create_page.call_args_list]
+        assert titles == ['Shared Title', 'Shared Title', 'Summary']
+        assert 'id-Summary' in dict(files_to_update)[str(tmp_path / "Summary.md")]
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_push_rounds_serialize_same_title_under_different_parents(
+        self, mock_api_class, mock_hierarchy_class
+    ):
+        """Titles are unique per space, so same-titled new pages never share a round."""
+        mapper = FileMapper(create_mock_auth())
+        level = [('a/Notes.md', 'parent-a'), ('b/Notes.md', 'parent-b'), ('b/Other.md', 'parent-b')]
+        local_pages = [
+            create_local_page(file_path, None, f"# {title}\n")
+            for (file_path, _), title in zip(level, ('Notes', 'notes', 'Other'), strict=True)
+        ]
+
+        rounds = mapper._push_rounds(level, local_pages, create_sync_config())
+
+        assert rounds == [[0, 2], [1]]
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_per_thread_page_ops(self, mock_api_class, mock_hierarchy_class):
+        """The caller keeps its PageOperations; each worker thread gets its own."""
+        mapper = FileMapper(create_mock_auth())
+        caller_page_ops = Mock()
+        seen = []
+
+        with patch('src.file_mapper.file_mapper.PageOperations', side_effect=lambda: Mock()):
+            thread_page_ops = mapper._per_thread_page_ops(caller_page_ops)
+
+            def worker():
+                seen.append((thread_page_ops(), thread_page_ops()))
+
+            threads = [threading.Thread(target=worker) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert thread_page_ops() is caller_page_ops
+        assert all(first is second for first, second in seen)
+        assert len({id(first) for first, _ in seen} | {id(caller_page_ops)}) == 3
+
+
 class TestFileMapperOrphanDirectoryHandling:
     """Test cases for orphan directory handling in _build_local_hierarchy().
 
@@ -1555,6 +1998,27 @@ class TestFileMapperPushCountAccuracy:
         # Should return 2, not 3
         assert result == 2, f"Should return actual pushed count (2), got {result}"
 
+    @patch('src.file_mapper.file_mapper.PageOperations')
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_push_failure_still_writes_created_page_ids(self, mock_api_class, mock_hierarchy_class, mock_page_ops_class):
+        """Pages created before a failure should still get their page_id written back."""
+        mapper = FileMapper(create_mock_auth())
+        local_pages = {'/test/Page1.md': create_local_page('/test/Page1.md', None, '# Page1')}
+
+        def mock_push_hier(**kwargs):
+            kwargs['files_to_update'].append(('/test/Page1.md', 'content1'))
+            raise RuntimeError("create failed")
+
+        with patch.object(mapper, '_build_local_hierarchy', return_value={'__root__': []}), \
+                patch.object(mapper, '_push_hierarchy_to_confluence', side_effect=mock_push_hier), \
+                patch.object(mapper, '_write_files_atomic') as mock_write:
+            with pytest.raises(RuntimeError):
+                mapper._push_to_confluence(local_pages, create_space_config(local_path='/test'),
+                                           create_sync_config())
+
+        assert mock_write.call_args.kwargs['files_to_write'] == [('/test/Page1.md', 'content1')]
+
     @patch('src.file_mapper.file_mapper.PageOperations')
     @patch('src.file_mapper.file_mapper.HierarchyBuilder')
     @patch('src.file_mapper.file_mapper.APIWrapper')
@@ -1631,6 +2095,330 @@ class TestFileMapperBidirectionalSync:
                 assert len(result.conflict_page_ids) == 0
 
 
+class TestFileMapperPlanning:
+    """Test cases for sync planning and plan execution."""
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_plan_bidirectional_kinds_and_paths(self, mock_api_class, mock_hierarchy_class):
+        """_plan_bidirectional should plan merges, updates and pulls with local paths."""
+        mapper = FileMapper(create_mock_auth())
+        child = create_page_node('456', 'Child Page', parent_id='123')
+        hierarchy = create_page_node('123', 'Root', children=[child])
+        local_pages = {
+            '/test/Root.md': create_local_page('/test/Root.md', '123', '# Root edited'),
+            '/test/Other.md': create_local_page('/test/Other.md', '789', '# Other edited'),
+        }
+
+        plan = mapper._plan_bidirectional(
+            hierarchy, local_pages, create_space_config(local_path='/test'), create_sync_config()
+        )
+
+        assert [a.action_id for a in plan.of_kind('merge')] == ['merge:123']
+        assert plan.of_kind('merge')[0].path == '/test/Root.md'
+        assert [(a.page_id, a.title) for a in plan.of_kind('update')] == [('789', 'Other edited')]
+        # Pull paths are the ones _pull_from_confluence writes
+        written = []
+        mapper._build_file_list_from_hierarchy(
+            node=hierarchy, parent_path='/test', files_to_write=written,
+            space_config=create_space_config(local_path='/test'), page_ids_filter={'456'}
+        )
+        assert [a.path for a in plan.of_kind('pull')] == [path for path, _ in written]
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_plan_skips_files_unreadable_since_scan(self, mock_api_class, mock_hierarchy_class, tmp_path):
+        """A manifest page whose file vanished must not be planned as an (empty) update."""
+        mapper = FileMapper(create_mock_auth())
+        vanished = str(tmp_path / 'Gone.md')
+        local_pages = {vanished: LazyLocalPage(vanished, '789', 'TEST')}
+        config = create_sync_config(force_push=True, get_baseline=Mock(return_value="# Gone\n"))
+
+        push_plan = mapper._plan_push(local_pages, create_space_config(local_path=str(tmp_path)), config)
+        bidirectional_plan = mapper._plan_bidirectional(
+            create_page_node('123', 'Root'), local_pages,
+            create_space_config(local_path=str(tmp_path)), create_sync_config(get_baseline=config.get_baseline)
+        )
+
+        assert push_plan.actions == []
+        assert bidirectional_plan.of_kind('update') == []
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_plan_push_parents_before_children(self, mock_api_class, mock_hierarchy_class):
+        """_plan_push should make a page depend on the page of its parent directory."""
+        mapper = FileMapper(create_mock_auth())
+        local_pages = {
+            '/test/Guide/Setup.md': create_local_page('/test/Guide/Setup.md', None, '# Setup'),
+            '/test/Guide.md': create_local_page('/test/Guide.md', '55', '# Guide'),
+        }
+
+        plan = mapper._plan_push(local_pages, create_space_config(local_path='/test'),
+                                 create_sync_config(force_push=True))
+
+        setup = plan.of_kind('create')[0]
+        assert setup.depends_on == ['update:55']
+        assert [[a.action_id for a in wave] for wave in plan.waves()] == [
+            ['update:55'], ['create:/test/Guide/Setup.md']
+        ]
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_plan_sync_does_not_write(self, mock_api_class, mock_hierarchy_class):
+        """plan_sync should discover and plan without pushing or pulling."""
+        mapper = FileMapper(create_mock_auth())
+        mapper._sync_print = Mock()
+        hierarchy = create_page_node('123', 'Root', children=[create_page_node('456', 'Child')])
+        mapper._hierarchy_builder.build_hierarchy.return_value = hierarchy
+        local_pages = {'/test/Page.md': create_local_page('/test/Page.md', '789', '# Page')}
+
+        with patch.object(mapper, '_read_local_files', return_value=local_pages), \
+                patch.object(mapper, '_update_modified_pages') as mock_update, \
+                patch.object(mapper, '_pull_from_confluence') as mock_pull:
+            plan = mapper.plan_sync(create_sync_config(spaces=[create_space_config(local_path='/test')]))
+
+        assert plan.counts() == {'update': 1, 'pull': 2}
+        mock_update.assert_not_called()
+        mock_pull.assert_not_called()
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_concurrent_execution_batches_updates(self, mock_api_class, mock_hierarchy_class):
+        """With concurrency, updates go out as one batch with a worker temp directory."""
+        mapper = FileMapper(create_mock_auth())
+        hierarchy = create_page_node('1', 'Root')
+        local_pages = {
+            f'/test/P{i}.md': create_local_page(f'/test/P{i}.md', str(100 + i), f'# P{i}')
+            for i in range(4)
+        }
+        sync_config = create_sync_config(temp_dir='/tmp/sync-temp')
+        sync_config.concurrency = 2
+        sync_config.get_baseline = Mock(return_value=None)
+        seen = []
+
+        def update(pages, space_config, worker_config):
+            seen.append((sorted(pages), worker_config.temp_dir))
+
+        with patch.object(mapper, '_update_modified_pages', side_effect=update), \
+                patch.object(mapper, '_is_remotely_modified', return_value=False):
+            result = mapper._bidirectional_sync(
+                hierarchy, local_pages, create_space_config(local_path='/test'), sync_config
+            )
+
+        assert result.pushed_count == 4
+        assert [len(pages) for pages, _ in seen] == [4]
+        assert seen[0][1].startswith('/tmp/sync-temp/worker-')
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_update_modified_pages_concurrent(self, mock_api_class, mock_hierarchy_class):
+        """Pages are pushed concurrently and frontmatter is written in one batch."""
+        mapper = FileMapper(create_mock_auth())
+        mapper._sync_print = Mock()
+        local_pages = {
+            f'/test/P{i}.md': create_local_page(f'/test/P{i}.md', str(100 + i), f'# P{i}')
+            for i in range(3)
+        }
+        sync_config = create_sync_config()
+        sync_config.concurrency = 3
+        barrier = threading.Barrier(3, timeout=5)
+
+        def update(page_id, new_markdown_content, baseline_markdown):
+            barrier.wait()  # Deadlocks unless all three pages are pushed at once
+            return Mock(success=True, new_version=2, operations_applied=1)
+
+        with patch('src.file_mapper.file_mapper.PageOperations') as mock_page_ops_class, \
+                patch.object(mapper, '_write_files_atomic') as mock_write, \
+                patch.object(mapper, '_get_confluence_base_url', return_value='https://example.atlassian.net/wiki'):
+            mock_page_ops_class.return_value.update_page_surgical_adf.side_effect = update
+            mapper._update_modified_pages(local_pages, create_space_config(), sync_config)
+
+        mock_write.assert_called_once()
+        written = mock_write.call_args.kwargs['files_to_write']
+        assert [path for path, _ in written] == ['/test/P0.md', '/test/P1.md', '/test/P2.md']
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_update_modified_pages_failure_keeps_other_pages(self, mock_api_class, mock_hierarchy_class):
+        """A failed page is re-raised after the other pages are pushed and written."""
+        mapper = FileMapper(create_mock_auth())
+        mapper._sync_print = Mock()
+        local_pages = {
+            f'/test/P{i}.md': create_local_page(f'/test/P{i}.md', str(100 + i), f'# P{i}')
+            for i in range(3)
+        }
+        sync_config = create_sync_config()
+        sync_config.concurrency = 2
+
+        def update(page_id, new_markdown_content, baseline_markdown):
+            if page_id == '101':
+                raise RuntimeError("upload failed")
+            return Mock(success=True, new_version=2, operations_applied=1)
+
+        with patch('src.file_mapper.file_mapper.PageOperations') as mock_page_ops_class, \
+                patch.object(mapper, '_write_files_atomic') as mock_write, \
+                patch.object(mapper, '_get_confluence_base_url', return_value='https://example.atlassian.net/wiki'):
+            mock_page_ops_class.return_value.update_page_surgical_adf.side_effect = update
+            with pytest.raises(RuntimeError, match="upload failed"):
+                mapper._update_modified_pages(local_pages, create_space_config(), sync_config)
+
+        written = mock_write.call_args.kwargs['files_to_write']
+        assert [path for path, _ in written] == ['/test/P0.md', '/test/P2.md']
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_update_modified_pages_pipelined(self, mock_api_class, mock_hierarchy_class):
+        """With push_pipeline_depth set, pages are fetched, prepared and uploaded in stages."""
+        mapper = FileMapper(create_mock_auth())
+        mapper._sync_print = Mock()
+        local_pages = {
+            f'/test/P{i}.md': create_local_page(f'/test/P{i}.md', str(100 + i), f'# P{i}')
+            for i in range(3)
+        }
+        sync_config = create_sync_config()
+        sync_config.push_pipeline_depth = 2
+
+        with patch('src.file_mapper.file_mapper.PageOperations') as mock_page_ops_class, \
+                patch.object(mapper, '_write_files_atomic') as mock_write, \
+                patch.object(mapper, '_get_confluence_base_url', return_value='https://example.atlassian.net/wiki'):
+            page_ops = mock_page_ops_class.return_value
+            page_ops.fetch_page_adf.side_effect = lambda page_id: {'id': page_id}
+            page_ops.prepare_surgical_adf_update.side_effect = (
+                lambda page_id, adf_response, new_md, baseline: f'prepared-{page_id}'
+            )
+            page_ops.update_page_surgical_adf.return_value = Mock(
+                success=True, new_version=2, operations_applied=1
+            )
+            mapper._update_modified_pages(local_pages, create_space_config(), sync_config)
+
+        prepared = [call.kwargs['prepared'] for call in page_ops.update_page_surgical_adf.call_args_list]
+        assert sorted(prepared) == ['prepared-100', 'prepared-101', 'prepared-102']
+        written = mock_write.call_args.kwargs['files_to_write']
+        assert [path for path, _ in written] == ['/test/P0.md', '/test/P1.md', '/test/P2.md']
+        assert mapper.push_pipeline_stats.pages == 3
+
+
+class TestFileMapperSyncJournalHooks:
+    """Test cases for on_page_synced notifications and resumed runs."""
+
+    URL = "https://example.atlassian.net/wiki/spaces/TEST/pages/{page_id}"
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_push_notifies_with_new_version(self, mock_api_class, mock_hierarchy_class):
+        """_update_modified_pages should report each successful push."""
+        mapper = FileMapper(create_mock_auth())
+        mapper._sync_print = Mock()
+        local_page = create_local_page('/test/Page.md', '123', '# Page v2')
+        sync_config = create_sync_config()
+        sync_config.on_page_synced = Mock()
+
+        with patch('src.file_mapper.file_mapper.PageOperations') as mock_page_ops_class, \
+                patch.object(mapper, '_write_files_atomic'), \
+                patch.object(mapper, '_get_confluence_base_url', return_value='https://example.atlassian.net/wiki'):
+            mock_page_ops_class.return_value.update_page_surgical_adf.return_value = Mock(
+                success=True, new_version=9, operations_applied=1
+            )
+            mapper._update_modified_pages({'/test/Page.md': local_page}, create_space_config(), sync_config)
+
+        sync_config.on_page_synced.assert_called_once()
+        action, content = sync_config.on_page_synced.call_args[0]
+        assert (action.page_id, action.action, action.version) == ('123', 'push', 9)
+        assert content.endswith('# Page v2')
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_pull_notifies_with_remote_version(self, mock_api_class, mock_hierarchy_class):
+        """_pull_from_confluence should report each written page."""
+        mapper = FileMapper(create_mock_auth())
+        mapper._sync_print = Mock()
+        hierarchy = create_page_node('123', 'Root')
+        hierarchy.version = 4
+        content = f"---\nconfluence_url: {self.URL.format(page_id=123)}\n---\n# Root\n"
+        sync_config = create_sync_config()
+        sync_config.on_page_synced = Mock()
+
+        def build_files(**kwargs):
+            kwargs['files_to_write'].append(('/test/Root.md', content))
+
+        with patch.object(mapper, '_build_file_list_from_hierarchy', side_effect=build_files), \
+                patch.object(mapper, '_write_files_atomic'):
+            mapper._pull_from_confluence(
+                hierarchy, create_space_config(local_path='/test'), sync_config, {'123'}
+            )
+
+        action, written = sync_config.on_page_synced.call_args[0]
+        assert (action.page_id, action.action, action.version) == ('123', 'pull', 4)
+        assert written == content
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_callback_failure_does_not_stop_sync(self, mock_api_class, mock_hierarchy_class):
+        """_notify_page_synced should log callback errors instead of raising."""
+        mapper = FileMapper(create_mock_auth())
+        sync_config = create_sync_config()
+        sync_config.on_page_synced = Mock(side_effect=OSError("disk full"))
+
+        mapper._notify_page_synced(sync_config, '123', '/test/Page.md', 'push', '# Page')
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_resumed_run_skips_applied_pages(self, mock_api_class, mock_hierarchy_class):
+        """_bidirectional_sync should not push or pull pages the interrupted run applied."""
+        import hashlib
+        from src.file_mapper.models import PageAction
+        from src.file_mapper.frontmatter_handler import FrontmatterHandler
+
+        mapper = FileMapper(create_mock_auth())
+        hierarchy = create_page_node('456', 'Remote Page')
+        hierarchy.version = 7
+        local_page = create_local_page('/test/Page.md', '123', '# Pushed Page')
+        local_page.space_key = 'TEST'
+        local_page.confluence_base_url = 'https://example.atlassian.net/wiki'
+        pushed = FrontmatterHandler.generate(local_page)
+        sync_config = create_sync_config()
+        sync_config.completed_pages = {
+            '123': PageAction('123', '/test/Page.md', 'push',
+                              hashlib.sha256(pushed.encode('utf-8')).hexdigest(), 3),
+            '456': PageAction('456', '/test/Remote Page.md', 'pull', 'other', 7),
+        }
+
+        with patch.object(mapper, '_update_modified_pages') as mock_update, \
+                patch.object(mapper, '_pull_from_confluence') as mock_pull:
+            result = mapper._bidirectional_sync(
+                hierarchy, {'/test/Page.md': local_page}, create_space_config(), sync_config
+            )
+
+        mock_update.assert_not_called()
+        mock_pull.assert_not_called()
+        assert result.pushed_count == 0
+
+    @patch('src.file_mapper.file_mapper.HierarchyBuilder')
+    @patch('src.file_mapper.file_mapper.APIWrapper')
+    def test_resumed_run_syncs_pages_changed_again(self, mock_api_class, mock_hierarchy_class):
+        """Pages edited after the interrupted run applied them should sync again."""
+        from src.file_mapper.models import PageAction
+
+        mapper = FileMapper(create_mock_auth())
+        hierarchy = create_page_node('456', 'Remote Page')
+        hierarchy.version = 8
+        sync_config = create_sync_config()
+        sync_config.completed_pages = {
+            '123': PageAction('123', '/test/Page.md', 'push', 'stale-hash', 3),
+            '456': PageAction('456', '/test/Remote Page.md', 'pull', 'h', 7),
+        }
+
+        with patch.object(mapper, '_update_modified_pages') as mock_update, \
+                patch.object(mapper, '_pull_from_confluence') as mock_pull:
+            mapper._bidirectional_sync(
+                hierarchy, {'/test/Page.md': create_local_page('/test/Page.md', '123', '# Edited')},
+                create_space_config(), sync_config
+            )
+
+        mock_update.assert_called_once()
+        mock_pull.assert_called_once()
+
+
 class TestConflictMarkerDetection:
     """Tests for conflict marker detection in file content."""
 
@@ -10,6 +10,8 @@ Note: LocalPage uses model with:
 Frontmatter uses page_id format only.
 """
 
+from unittest.mock import patch
+
 import pytest
 import yaml
 
@@ -443,3 +445,65 @@ Content"""
         assert match is None
 
 
+
+
+class TestFrontmatterHandlerGetPageId:
+    """Test cases for FrontmatterHandler.get_page_id() fast path."""
+
+    URL = "https://example.atlassian.net/wiki/spaces/TEAM/pages/123456"
+
+    def _yaml_page_id(self, content):
+        """Reference result: full YAML parse (the pre-fast-path behaviour)."""
+        try:
+            frontmatter, _ = FrontmatterHandler.extract_frontmatter_and_content(content)
+        except FrontmatterError:
+            return None
+        if frontmatter.get('confluence_url'):
+            return FrontmatterHandler.parse_confluence_url(str(frontmatter['confluence_url']))[1]
+        return None
+
+    @pytest.mark.parametrize("frontmatter", [
+        "confluence_url: {url}",
+        "confluence_url: {url}/My-Page",
+        "title: Notes\nconfluence_url: {url}\ntags: draft",
+        "# comment\nconfluence_url: {url}\n\n",
+        "confluence_url: '{url}'",
+        'confluence_url: "{url}"',
+        "confluence_url: {url}  # linked page",
+        "confluence_url: https://old.example.com/x\nconfluence_url: {url}",
+        "confluence_url:",
+        "confluence_url: null",
+        "confluence_url: 12345",
+        "title: Notes",
+        "title: a: b\nconfluence_url: {url}",
+        "tags: [a, b]\nconfluence_url: {url}",
+        "meta:\n  owner: me\nconfluence_url: {url}",
+        "confluence_url: >\n  {url}",
+        "- item",
+        "just text",
+        "  ",
+    ])
+    def test_matches_yaml_parse(self, frontmatter):
+        """get_page_id() should agree with a full YAML parse."""
+        content = f"---\n{frontmatter.format(url=self.URL)}\n---\n# Body\n"
+
+        assert FrontmatterHandler.get_page_id(content) == self._yaml_page_id(content)
+
+    def test_simple_frontmatter_skips_yaml(self):
+        """get_page_id() should not parse YAML for simple frontmatter."""
+        content = f"---\nconfluence_url: {self.URL}\ntitle: Page\n---\n# Body\n"
+
+        with patch('src.file_mapper.frontmatter_handler.yaml_codec.safe_load') as mock_load:
+            assert FrontmatterHandler.get_page_id(content) == "123456"
+
+        mock_load.assert_not_called()
+
+    def test_complex_frontmatter_falls_back_to_yaml(self):
+        """get_page_id() should parse nested frontmatter with YAML."""
+        content = f"---\nmeta:\n  owner: me\nconfluence_url: {self.URL}\n---\n# Body\n"
+
+        assert FrontmatterHandler.get_page_id(content) == "123456"
+
+    def test_no_frontmatter(self):
+        """get_page_id() should return None without frontmatter."""
+        assert FrontmatterHandler.get_page_id("# Just a page\n") is None
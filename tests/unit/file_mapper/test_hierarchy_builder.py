@@ -478,3 +478,202 @@ class TestHierarchyBuilder:
             # Should log info and debug messages
             mock_logger.info.assert_called()
             mock_logger.debug.assert_called()
+
+
+class TestHierarchyBuilderContentCache:
+    """Test cases for HierarchyBuilder with a PageContentCache."""
+
+    def _page(self, page_id, title, version=1, body=None):
+        data = create_page_data(page_id, title)
+        data['version']['number'] = version
+        if body is not None:
+            data['body'] = {'storage': {'value': body}}
+        return data
+
+    @patch('src.file_mapper.hierarchy_builder.MarkdownConverter')
+    @patch('src.file_mapper.hierarchy_builder.APIWrapper')
+    def test_cold_cache_downloads_bodies_and_populates_cache(
+        self, mock_wrapper_class, mock_converter_class, tmp_path
+    ):
+        """build_hierarchy should fetch bodies on miss and fill the cache."""
+        from src.file_mapper.content_cache import PageContentCache
+
+        mock_api = Mock()
+        mock_wrapper_class.return_value = mock_api
+        mock_converter_class.return_value.xhtml_to_markdown.side_effect = (
+            lambda xhtml: f"md:{xhtml}"
+        )
+        mock_api.get_page_by_id.side_effect = [
+            self._page('1', 'Root'),
+            self._page('1', 'Root', body='<p>root</p>'),
+        ]
+        mock_api.get_page_child_by_type.side_effect = [
+            {'results': [self._page('2', 'Child')]},
+            {'results': [self._page('2', 'Child', body='<p>child</p>')]},
+            {'results': []},
+        ]
+        cache = PageContentCache(str(tmp_path), 'TEST')
+
+        root = HierarchyBuilder(Mock()).build_hierarchy('1', 'TEST', content_cache=cache)
+
+        assert root.markdown_content == 'md:<p>root</p>'
+        assert root.children[0].markdown_content == 'md:<p>child</p>'
+        assert cache.get_markdown('2', 1, '2024-01-01T00:00:00.000Z') == 'md:<p>child</p>'
+        assert cache.get_xhtml('2', 1, '2024-01-01T00:00:00.000Z') == '<p>child</p>'
+        assert mock_api.get_page_child_by_type.call_args_list[0] == call(
+            page_id='1', child_type='page', expand='version,space'
+        )
+
+    @patch('src.file_mapper.hierarchy_builder.MarkdownConverter')
+    @patch('src.file_mapper.hierarchy_builder.APIWrapper')
+    def test_warm_cache_skips_body_download_and_conversion(
+        self, mock_wrapper_class, mock_converter_class, tmp_path
+    ):
+        """build_hierarchy should reuse cached markdown for unchanged versions."""
+        from src.file_mapper.content_cache import PageContentCache
+
+        mock_api = Mock()
+        mock_wrapper_class.return_value = mock_api
+        mock_converter = mock_converter_class.return_value
+        mock_api.get_page_by_id.return_value = self._page('1', 'Root')
+        mock_api.get_page_child_by_type.side_effect = [
+            {'results': [self._page('2', 'Child')]},
+            {'results': []},
+        ]
+        cache = PageContentCache(str(tmp_path), 'TEST')
+        when = '2024-01-01T00:00:00.000Z'
+        cache.put('1', 1, when, '<p>root</p>', 'cached root')
+        cache.put('2', 1, when, '<p>child</p>', 'cached child')
+
+        root = HierarchyBuilder(Mock()).build_hierarchy('1', 'TEST', content_cache=cache)
+
+        assert root.markdown_content == 'cached root'
+        assert root.children[0].markdown_content == 'cached child'
+        mock_api.get_page_by_id.assert_called_once_with(
+            page_id='1', expand='version,space,ancestors'
+        )
+        assert mock_api.get_page_child_by_type.call_count == 2
+        mock_converter.xhtml_to_markdown.assert_not_called()
+
+    @patch('src.file_mapper.hierarchy_builder.MarkdownConverter')
+    @patch('src.file_mapper.hierarchy_builder.APIWrapper')
+    def test_pack_cache_round_trip_across_runs(
+        self, mock_wrapper_class, mock_converter_class, tmp_path
+    ):
+        """Discovery should fill a pack-format cache and reuse it in the next run."""
+        from src.file_mapper.content_cache import PageContentCache
+
+        mock_api = Mock()
+        mock_wrapper_class.return_value = mock_api
+        mock_converter = mock_converter_class.return_value
+        mock_converter.xhtml_to_markdown.side_effect = lambda xhtml: f"md:{xhtml}"
+        mock_api.get_page_by_id.side_effect = [
+            self._page('1', 'Root'),
+            self._page('1', 'Root', body='<p>root</p>'),
+            self._page('1', 'Root'),
+        ]
+        mock_api.get_page_child_by_type.side_effect = [
+            {'results': [self._page('2', 'Child')]},
+            {'results': [self._page('2', 'Child', body='<p>child</p>')]},
+            {'results': []},
+            {'results': [self._page('2', 'Child')]},
+            {'results': []},
+        ]
+
+        HierarchyBuilder(Mock()).build_hierarchy(
+            '1', 'TEST', content_cache=PageContentCache(str(tmp_path), 'TEST', cache_format='pack')
+        )
+        mock_converter.xhtml_to_markdown.reset_mock()
+        # A new cache object reads the entries back from the pack files
+        root = HierarchyBuilder(Mock()).build_hierarchy(
+            '1', 'TEST', content_cache=PageContentCache(str(tmp_path), 'TEST', cache_format='pack')
+        )
+
+        assert root.markdown_content == 'md:<p>root</p>'
+        assert root.children[0].markdown_content == 'md:<p>child</p>'
+        mock_converter.xhtml_to_markdown.assert_not_called()
+        assert (tmp_path / 'TEST_markdown' / 'xhtml.pack').exists()
+
+    @patch('src.file_mapper.hierarchy_builder.MarkdownConverter')
+    @patch('src.file_mapper.hierarchy_builder.APIWrapper')
+    def test_new_version_is_downloaded(
+        self, mock_wrapper_class, mock_converter_class, tmp_path
+    ):
+        """build_hierarchy should re-download a page whose version changed."""
+        from src.file_mapper.content_cache import PageContentCache
+
+        mock_api = Mock()
+        mock_wrapper_class.return_value = mock_api
+        mock_converter_class.return_value.xhtml_to_markdown.return_value = 'fresh'
+        mock_api.get_page_by_id.side_effect = [
+            self._page('1', 'Root', version=2),
+            self._page('1', 'Root', version=2, body='<p>v2</p>'),
+        ]
+        mock_api.get_page_child_by_type.return_value = {'results': []}
+        cache = PageContentCache(str(tmp_path), 'TEST')
+        cache.put('1', 1, '2024-01-01T00:00:00.000Z', '<p>v1</p>', 'stale')
+
+        root = HierarchyBuilder(Mock()).build_hierarchy('1', 'TEST', content_cache=cache)
+
+        assert root.markdown_content == 'fresh'
+        assert cache.get_markdown('1', 2, '2024-01-01T00:00:00.000Z') == 'fresh'
+
+    @patch('src.file_mapper.hierarchy_builder.MarkdownConverter')
+    @patch('src.file_mapper.hierarchy_builder.APIWrapper')
+    def test_single_miss_fetches_only_that_page(
+        self, mock_wrapper_class, mock_converter_class, tmp_path
+    ):
+        """build_hierarchy should download just the missed child, not the whole level."""
+        from src.file_mapper.content_cache import PageContentCache
+
+        mock_api = Mock()
+        mock_wrapper_class.return_value = mock_api
+        mock_converter_class.return_value.xhtml_to_markdown.return_value = 'new'
+        mock_api.get_page_by_id.side_effect = [
+            self._page('1', 'Root'),
+            self._page('4', 'New', body='<p>new</p>'),
+        ]
+        mock_api.get_page_child_by_type.side_effect = [
+            {'results': [self._page('2', 'A'), self._page('3', 'B'), self._page('4', 'New')]},
+            {'results': []},
+            {'results': []},
+            {'results': []},
+        ]
+        cache = PageContentCache(str(tmp_path), 'TEST')
+        when = '2024-01-01T00:00:00.000Z'
+        for page_id in ('1', '2', '3'):
+            cache.put(page_id, 1, when, '<p>old</p>', f'cached {page_id}')
+
+        root = HierarchyBuilder(Mock()).build_hierarchy('1', 'TEST', content_cache=cache)
+
+        assert [child.markdown_content for child in root.children] == [
+            'cached 2', 'cached 3', 'new'
+        ]
+        assert mock_api.get_page_by_id.call_args_list[1] == call(
+            page_id='4', expand='version,space,body.storage'
+        )
+        # One listing per level, no re-listing with bodies
+        assert mock_api.get_page_child_by_type.call_count == 4
+
+    @patch('src.file_mapper.hierarchy_builder.MarkdownConverter')
+    @patch('src.file_mapper.hierarchy_builder.APIWrapper')
+    def test_metadata_only_never_downloads_bodies(self, mock_wrapper_class, mock_converter_class):
+        """build_hierarchy(metadata_only=True) should list pages without bodies."""
+        mock_api = Mock()
+        mock_wrapper_class.return_value = mock_api
+        mock_api.get_page_by_id.return_value = self._page('1', 'Root')
+        mock_api.get_page_child_by_type.side_effect = [
+            {'results': [self._page('2', 'Child', version=7)]},
+            {'results': []},
+        ]
+
+        root = HierarchyBuilder(Mock()).build_hierarchy('1', 'TEST', metadata_only=True)
+
+        assert root.children[0].version == 7
+        assert root.markdown_content == root.children[0].markdown_content == ''
+        mock_api.get_page_by_id.assert_called_once_with(
+            page_id='1', expand='version,space,ancestors'
+        )
+        for child_call in mock_api.get_page_child_by_type.call_args_list:
+            assert child_call.kwargs['expand'] == 'version,space'
+        mock_converter_class.return_value.xhtml_to_markdown.assert_not_called()
@@ -0,0 +1,131 @@
+"""Unit tests for file_mapper.local_manifest module."""
+
+import json
+import os
+
+import pytest
+
+from src.file_mapper.errors import FilesystemError
+from src.file_mapper.local_manifest import (
+    MANIFEST_FORMAT_VERSION,
+    LazyLocalPage,
+    LocalFileManifest,
+)
+from src.file_mapper.models import LocalPage
+
+
+URL = "https://example.atlassian.net/wiki/spaces/TEAM/pages/123"
+
+
+class TestLocalFileManifest:
+    """Test cases for LocalFileManifest."""
+
+    def _record(self, manifest, tmp_path, name="page.md", content="# Page"):
+        file_path = tmp_path / name
+        file_path.write_text(content)
+        page = LocalPage(
+            file_path=str(file_path),
+            page_id="123",
+            content=content,
+            space_key="TEAM",
+            confluence_base_url="https://example.atlassian.net/wiki",
+        )
+        manifest.record(name, os.stat(file_path), "abc", page)
+        return file_path
+
+    def test_missing_manifest_is_empty(self, tmp_path):
+        """LocalFileManifest should start empty when no file exists."""
+        manifest = LocalFileManifest(str(tmp_path / "manifest.json"))
+
+        assert len(manifest) == 0
+
+    def test_lookup_matches_unchanged_stat(self, tmp_path):
+        """LocalFileManifest.lookup() should return entry while stat is unchanged."""
+        manifest = LocalFileManifest(str(tmp_path / "manifest.json"))
+        file_path = self._record(manifest, tmp_path)
+
+        entry = manifest.lookup("page.md", os.stat(file_path))
+
+        assert entry is not None
+        assert entry.page_id == "123"
+        assert entry.space_key == "TEAM"
+
+    def test_lookup_misses_after_modification(self, tmp_path):
+        """LocalFileManifest.lookup() should miss when size or mtime changed."""
+        manifest = LocalFileManifest(str(tmp_path / "manifest.json"))
+        file_path = self._record(manifest, tmp_path)
+
+        file_path.write_text("# Page, edited")
+
+        assert manifest.lookup("page.md", os.stat(file_path)) is None
+        assert manifest.get("page.md") is not None
+
+    def test_lookup_content_matches_recorded_hash(self, tmp_path):
+        """lookup_content() should find a touched file by its unchanged hash."""
+        manifest = LocalFileManifest(str(tmp_path / "manifest.json"))
+        self._record(manifest, tmp_path)
+
+        assert manifest.lookup_content("page.md", "abc").page_id == "123"
+        assert manifest.lookup_content("page.md", "def") is None
+        assert manifest.lookup_content("other.md", "abc") is None
+
+    def test_save_and_reload(self, tmp_path):
+        """LocalFileManifest.save() should persist entries for the next run."""
+        manifest_path = str(tmp_path / "cache" / "manifest.json")
+        manifest = LocalFileManifest(manifest_path)
+        file_path = self._record(manifest, tmp_path)
+        manifest.save()
+
+        reloaded = LocalFileManifest(manifest_path)
+
+        assert reloaded.lookup("page.md", os.stat(file_path)).sha256 == "abc"
+
+    def test_retain_drops_deleted_files(self, tmp_path):
+        """LocalFileManifest.retain() should remove entries not seen in the scan."""
+        manifest = LocalFileManifest(str(tmp_path / "manifest.json"))
+        self._record(manifest, tmp_path, "a.md")
+        self._record(manifest, tmp_path, "b.md")
+
+        manifest.retain(["a.md"])
+
+        assert manifest.get("a.md") is not None
+        assert manifest.get("b.md") is None
+
+    def test_corrupted_or_outdated_manifest_is_ignored(self, tmp_path):
+        """LocalFileManifest should ignore unreadable or old-format files."""
+        bad_path = tmp_path / "bad.json"
+        bad_path.write_text("{not json")
+        old_path = tmp_path / "old.json"
+        old_path.write_text(json.dumps({"version": MANIFEST_FORMAT_VERSION + 1, "files": {}}))
+
+        assert len(LocalFileManifest(str(bad_path))) == 0
+        assert len(LocalFileManifest(str(old_path))) == 0
+
+
+class TestLazyLocalPage:
+    """Test cases for LazyLocalPage."""
+
+    def test_content_read_on_first_access(self, tmp_path):
+        """LazyLocalPage.content should strip frontmatter from the file."""
+        file_path = tmp_path / "page.md"
+        file_path.write_text(f"---\nconfluence_url: {URL}\n---\n# Page\n")
+
+        page = LazyLocalPage(str(file_path), "123", "TEAM", "https://example.atlassian.net/wiki")
+
+        assert page.page_id == "123"
+        assert page.content == "# Page\n"
+
+    def test_content_can_be_assigned(self, tmp_path):
+        """LazyLocalPage.content should accept assignment like LocalPage."""
+        page = LazyLocalPage(str(tmp_path / "missing.md"), None)
+
+        page.content = "# New"
+
+        assert page.content == "# New"
+
+    def test_unreadable_file_raises(self, tmp_path):
+        """LazyLocalPage.content should raise instead of returning empty content."""
+        page = LazyLocalPage(str(tmp_path / "missing.md"), "123")
+
+        with pytest.raises(FilesystemError, match="missing.md"):
+            page.content
@@ -0,0 +1,166 @@
+"""Unit tests for SyncPlan and file_mapper.plan_executor module."""
+
+import threading
+
+import pytest
+
+from src.file_mapper.models import PlannedAction, SyncPlan
+from src.file_mapper.plan_executor import PlanExecutor
+
+
+def _plan(*actions):
+    plan = SyncPlan()
+    for action_id, kind, depends_on in actions:
+        plan.add(PlannedAction(action_id=action_id, kind=kind, depends_on=list(depends_on)))
+    return plan
+
+
+class TestSyncPlan:
+    """Test cases for SyncPlan."""
+
+    def test_waves_put_parents_first(self):
+        """waves() should place every action after its dependencies."""
+        plan = _plan(
+            ("create:child", "create", ["create:parent"]),
+            ("create:parent", "create", []),
+            ("update:1", "update", []),
+            ("create:grandchild", "create", ["create:child"]),
+        )
+
+        waves = [[a.action_id for a in wave] for wave in plan.waves()]
+
+        assert waves == [
+            ["create:parent", "update:1"],
+            ["create:child"],
+            ["create:grandchild"],
+        ]
+
+    def test_waves_reject_cycles_and_unknown_dependencies(self):
+        """waves() should raise ValueError for unusable dependencies."""
+        with pytest.raises(ValueError, match="cycle"):
+            _plan(("a", "create", ["b"]), ("b", "create", ["a"])).waves()
+        with pytest.raises(ValueError, match="unknown action"):
+            _plan(("a", "create", ["missing"])).waves()
+
+    def test_add_rejects_duplicates_and_unknown_kinds(self):
+        """add() should refuse a reused action_id or an unknown kind."""
+        plan = _plan(("pull:1", "pull", []))
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            plan.add(PlannedAction(action_id="pull:1", kind="pull"))
+        with pytest.raises(ValueError, match="Unknown action kind"):
+            plan.add(PlannedAction(action_id="x", kind="rename"))
+
+    def test_constructor_actions_are_checked_for_duplicates(self):
+        """Actions passed to the constructor count for the duplicate check."""
+        plan = SyncPlan(actions=[PlannedAction(action_id="pull:1", kind="pull")])
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            plan.add(PlannedAction(action_id="pull:1", kind="pull"))
+        with pytest.raises(ValueError, match="Duplicate"):
+            SyncPlan(actions=[PlannedAction("a", "pull"), PlannedAction("a", "pull")])
+
+    def test_round_trip(self):
+        """from_dict(to_dict()) should rebuild an equal plan."""
+        plan = SyncPlan()
+        plan.add(PlannedAction("create:docs/a.md", "create", space_key="TEAM",
+                               path="docs/a.md", title="A"))
+        plan.add(PlannedAction("pull:2", "pull", page_id="2", path="docs/a/b.md",
+                               depends_on=["create:docs/a.md"]))
+
+        assert SyncPlan.from_dict(plan.to_dict()) == plan
+        assert plan.counts() == {"create": 1, "pull": 1}
+
+
+class TestPlanExecutor:
+    """Test cases for PlanExecutor."""
+
+    def test_sequential_batches_per_kind(self):
+        """With one worker, each kind of a wave is one batch, waves in order."""
+        calls = []
+        plan = _plan(
+            ("update:1", "update", []),
+            ("pull:2", "pull", []),
+            ("update:3", "update", []),
+            ("pull:4", "pull", ["update:1"]),
+        )
+
+        applied = PlanExecutor().execute(plan, {
+            "update": lambda actions: calls.append([a.action_id for a in actions]),
+            "pull": lambda actions: calls.append([a.action_id for a in actions]),
+        })
+
+        assert applied == 4
+        assert calls == [["update:1", "update:3"], ["pull:2"], ["pull:4"]]
+
+    def test_concurrent_chunks(self):
+        """With several workers, a batch is split and the chunks run concurrently."""
+        barrier = threading.Barrier(3, timeout=5)
+        chunks = []
+        lock = threading.Lock()
+
+        def handler(actions):
+            barrier.wait()  # Deadlocks unless all three chunks run at once
+            with lock:
+                chunks.append([a.action_id for a in actions])
+
+        plan = _plan(*[(f"pull:{i}", "pull", []) for i in range(7)])
+
+        applied = PlanExecutor(max_workers=3).execute(plan, {"pull": handler})
+
+        assert applied == 7
+        assert sorted(len(chunk) for chunk in chunks) == [2, 2, 3]
+        assert sorted(a for chunk in chunks for a in chunk) == [f"pull:{i}" for i in range(7)]
+
+    def test_whole_batch_kinds_are_not_split(self):
+        """Kinds in whole_batch_kinds reach their handler as one batch per wave."""
+        calls = []
+        lock = threading.Lock()
+
+        def handler(actions):
+            with lock:
+                calls.append((actions[0].kind, len(actions)))
+
+        plan = _plan(*[(f"update:{i}", "update", []) for i in range(4)],
+                     *[(f"pull:{i}", "pull", []) for i in range(4)])
+
+        PlanExecutor(max_workers=2).execute(
+            plan, {"update": handler, "pull": handler}, whole_batch_kinds={"update"}
+        )
+
+        assert sorted(calls) == [("pull", 2), ("pull", 2), ("update", 4)]
+
+    def test_error_stops_later_waves(self):
+        """A handler error should finish the wave, skip later waves and re-raise."""
+        calls = []
+
+        def create(actions):
+            calls.append([a.action_id for a in actions])
+            if actions[0].action_id == "create:b":
+                raise RuntimeError("create failed")
+
+        plan = _plan(
+            ("create:a", "create", []),
+            ("create:b", "create", []),
+            ("create:c", "create", ["create:b"]),
+        )
+
+        with pytest.raises(RuntimeError, match="create failed"):
+            PlanExecutor(max_workers=2).execute(plan, {"create": create})
+
+        assert sorted(calls) == [["create:a"], ["create:b"]]
+
+    def test_missing_handler_raises_before_running(self):
+        """execute() should check handlers before applying anything."""
+        calls = []
+        plan = _plan(("update:1", "update", []), ("delete:2", "delete", []))
+
+        with pytest.raises(ValueError, match="delete"):
+            PlanExecutor().execute(plan, {"update": calls.append})
+
+        assert calls == []
+
+    def test_invalid_worker_count(self):
+        """PlanExecutor should require at least one worker."""
+        with pytest.raises(ValueError):
+            PlanExecutor(max_workers=0)
@@ -0,0 +1,150 @@
+"""Unit tests for file_mapper.push_pipeline module."""
+
+import threading
+
+import pytest
+
+from src.file_mapper.models import PushPipelineStats
+from src.file_mapper.push_pipeline import PushPipeline
+
+
+class TestPushPipeline:
+    """Test cases for PushPipeline."""
+
+    def test_results_in_input_order(self):
+        """run() should return one result per item, in input order."""
+        pipeline = PushPipeline(depth=3, upload_workers=2)
+
+        results = pipeline.run(
+            list(range(10)),
+            fetch=lambda item: item * 2,
+            prepare=lambda item, fetched: fetched + 1,
+            upload=lambda item, prepared: prepared * 10,
+        )
+
+        assert results == [(i, (i * 2 + 1) * 10, None) for i in range(10)]
+        assert pipeline.stats.pages == 10
+        assert pipeline.stats.samples == 10
+
+    def test_prepare_runs_on_calling_thread_in_order(self):
+        """prepare should run on the caller's thread, one item at a time in order."""
+        prepared = []
+
+        def prepare(item, fetched):
+            prepared.append((item, threading.current_thread()))
+            return fetched
+
+        PushPipeline(depth=2).run(
+            list(range(5)), fetch=lambda item: item, prepare=prepare,
+            upload=lambda item, data: data,
+        )
+
+        assert [item for item, _ in prepared] == list(range(5))
+        assert {thread for _, thread in prepared} == {threading.current_thread()}
+
+    def test_fetches_overlap_prepare(self):
+        """Later items should be fetched while an earlier item is prepared."""
+        fetched_while_preparing = threading.Event()
+        started = set()
+        lock = threading.Lock()
+
+        def fetch(item):
+            with lock:
+                started.add(item)
+                if item == 2:
+                    fetched_while_preparing.set()
+            return item
+
+        def prepare(item, fetched):
+            if item == 0:
+                # Item 0 is still being prepared: items 1 and 2 fetch ahead
+                assert fetched_while_preparing.wait(timeout=5)
+            return fetched
+
+        pipeline = PushPipeline(depth=2)
+        results = pipeline.run([0, 1, 2, 3], fetch=fetch, prepare=prepare,
+                               upload=lambda item, data: data)
+
+        assert [result for _, result, _ in results] == [0, 1, 2, 3]
+        assert started == {0, 1, 2, 3}
+
+    def test_upload_queue_is_bounded(self):
+        """No more than `depth` uploads should be pending at once."""
+        release = threading.Event()
+        pending = []
+        peak = []
+        lock = threading.Lock()
+
+        def upload(item, data):
+            with lock:
+                pending.append(item)
+                peak.append(len(pending))
+            release.wait(timeout=5)
+            with lock:
+                pending.remove(item)
+            return data
+
+        def prepare(item, fetched):
+            if item == 2:
+                # Two uploads are pending; the next append must wait for one
+                release.set()
+            return fetched
+
+        pipeline = PushPipeline(depth=2, upload_workers=4)
+        pipeline.run(list(range(6)), fetch=lambda item: item, prepare=prepare, upload=upload)
+
+        assert max(peak) <= 2
+        assert pipeline.stats.max_upload_queue <= 2
+
+    def test_errors_are_per_item(self):
+        """An error in any stage should fail only its item."""
+        def fetch(item):
+            if item == 1:
+                raise RuntimeError("fetch failed")
+            return item
+
+        def prepare(item, fetched):
+            if item == 2:
+                raise ValueError("bad content")
+            return fetched
+
+        def upload(item, data):
+            if item == 3:
+                raise RuntimeError("upload failed")
+            return data
+
+        results = PushPipeline(depth=2).run(list(range(5)), fetch=fetch, prepare=prepare, upload=upload)
+
+        assert [result for _, result, _ in results] == [0, None, None, None, 4]
+        assert [str(error) if error else None for _, _, error in results] == [
+            None, "fetch failed", "bad content", "upload failed", None
+        ]
+
+    def test_empty_items(self):
+        """run() with no items should return nothing."""
+        assert PushPipeline(depth=1).run([], fetch=None, prepare=None, upload=None) == []
+
+    def test_invalid_sizes(self):
+        """depth and upload_workers must be at least 1."""
+        with pytest.raises(ValueError):
+            PushPipeline(depth=0)
+        with pytest.raises(ValueError):
+            PushPipeline(depth=1, upload_workers=0)
+
+
+class TestPushPipelineStats:
+    """Test cases for PushPipelineStats."""
+
+    def test_means_and_merge(self):
+        """merge() should add totals and keep maxima."""
+        stats = PushPipelineStats(pages=2, samples=2, fetched_ahead_total=3,
+                                  max_fetched_ahead=2, upload_queue_total=1, max_upload_queue=1)
+        stats.merge(PushPipelineStats(pages=2, samples=2, fetched_ahead_total=1,
+                                      max_fetched_ahead=1, upload_queue_total=3, max_upload_queue=2))
+
+        assert stats.pages == 4
+        assert stats.mean_fetched_ahead == 1.0
+        assert stats.mean_upload_queue == 1.0
+        assert stats.max_fetched_ahead == 2
+        assert stats.max_upload_queue == 2
+        assert PushPipelineStats().mean_fetched_ahead == 0.0
@@ -0,0 +1,212 @@
+"""Unit tests for file_mapper.workspace_index module."""
+
+import hashlib
+import os
+import threading
+import time
+from unittest.mock import patch
+
+from src.file_mapper.workspace_index import WorkspaceIndex, map_ordered
+
+
+URL = "https://example.atlassian.net/wiki/spaces/TEAM/pages/123"
+
+
+def _walk_md(root):
+    """Markdown files in os.walk order (what the old scans produced)."""
+    paths = []
+    for dirpath, _, files in os.walk(root):
+        paths.extend(os.path.join(dirpath, f) for f in files if f.endswith('.md'))
+    return paths
+
+
+class TestWorkspaceIndex:
+    """Test cases for WorkspaceIndex."""
+
+    def _tree(self, tmp_path):
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "c").mkdir()
+        (tmp_path / "root.md").write_text("# Root")
+        (tmp_path / "notes.txt").write_text("ignored")
+        (tmp_path / "a" / "one.md").write_text(f"---\nconfluence_url: {URL}\n---\n# One")
+        (tmp_path / "a" / "b" / "two.md").write_text("# Two")
+        (tmp_path / "c" / "three.md").write_text("# Three")
+        return str(tmp_path)
+
+    def test_files_match_os_walk(self, tmp_path):
+        """files() should list the same .md paths in the same order as os.walk."""
+        root = self._tree(tmp_path)
+
+        paths = [entry.path for entry in WorkspaceIndex().files(root)]
+
+        assert paths == _walk_md(root)
+
+    def test_files_nonexistent_root(self, tmp_path):
+        """files() should return an empty list for a missing root."""
+        assert WorkspaceIndex().files(str(tmp_path / "missing")) == []
+
+    def test_tree_scanned_once(self, tmp_path):
+        """Repeated files() calls should not rescan the tree."""
+        root = self._tree(tmp_path)
+        index = WorkspaceIndex()
+        index.files(root)
+
+        with patch('src.file_mapper.workspace_index.os.scandir') as mock_scandir:
+            index.files(root)
+
+        mock_scandir.assert_not_called()
+
+    def test_content_and_page_id_cached(self, tmp_path):
+        """read_text() and get_page_id() should read each file only once."""
+        root = self._tree(tmp_path)
+        index = WorkspaceIndex()
+        path = os.path.join(root, "a", "one.md")
+        index.files(root)
+
+        assert index.read_text(path).endswith("# One")
+        assert index.get_page_id(path) == "123"
+        os.remove(path)
+
+        assert index.get_page_id(path) == "123"
+        assert index.read_text(path).endswith("# One")
+
+    def test_page_id_reads_only_file_head(self, tmp_path):
+        """get_page_id() should not read the body of a large file."""
+        path = tmp_path / "big.md"
+        path.write_text(f"---\nconfluence_url: {URL}\n---\n" + "body\n" * 10000)
+        index = WorkspaceIndex()
+        index.files(str(tmp_path))
+
+        with patch.object(index, 'read_text') as mock_read_text:
+            assert index.get_page_id(str(path)) == "123"
+
+        mock_read_text.assert_not_called()
+
+    def test_page_id_with_frontmatter_longer_than_head(self, tmp_path):
+        """get_page_id() should read the whole file if frontmatter exceeds the scanned prefix."""
+        path = tmp_path / "long.md"
+        padding = "".join(f"field{i}: value {i}\n" for i in range(1000))
+        path.write_text(f"---\n{padding}confluence_url: {URL}\n---\n# Long")
+
+        assert WorkspaceIndex().get_page_id(str(path)) == "123"
+
+    def test_read_text_normalizes_newlines(self, tmp_path):
+        """read_text() should match text-mode reads (universal newlines)."""
+        path = tmp_path / "crlf.md"
+        path.write_bytes(b"# Title\r\nline\r\n")
+
+        assert WorkspaceIndex().read_text(str(path)) == "# Title\nline\n"
+
+    def test_content_hash_shares_read_with_text(self, tmp_path):
+        """content_hash() should hash the raw bytes without re-reading a read file."""
+        path = tmp_path / "crlf.md"
+        path.write_bytes(b"# Title\r\nline\r\n")
+        index = WorkspaceIndex()
+        index.files(str(tmp_path))
+
+        index.read_text(str(path))
+        path.unlink()
+
+        assert index.content_hash(str(path)) == hashlib.sha256(b"# Title\r\nline\r\n").hexdigest()
+        assert not hasattr(index.files(str(tmp_path))[0], '_raw')
+
+    def test_invalidate_refreshes_content(self, tmp_path):
+        """invalidate() should drop cached content of a rewritten file."""
+        root = self._tree(tmp_path)
+        index = WorkspaceIndex()
+        path = os.path.join(root, "root.md")
+        index.files(root)
+        assert index.read_text(path) == "# Root"
+
+        with open(path, 'w') as f:
+            f.write(f"---\nconfluence_url: {URL}\n---\n# Root v2")
+        index.invalidate(path)
+
+        assert index.read_text(path).endswith("# Root v2")
+        assert index.get_page_id(path) == "123"
+
+    def test_invalidate_adds_and_removes(self, tmp_path):
+        """invalidate() should track files created or deleted by the sync."""
+        root = self._tree(tmp_path)
+        index = WorkspaceIndex()
+        index.files(root)
+
+        new_path = os.path.join(root, "c", "new.md")
+        with open(new_path, 'w') as f:
+            f.write("# New")
+        index.invalidate(new_path)
+        old_path = os.path.join(root, "a", "b", "two.md")
+        os.remove(old_path)
+        index.invalidate(old_path)
+
+        paths = [entry.path for entry in index.files(root)]
+        assert new_path in paths
+        assert old_path not in paths
+
+    def test_clear_rescans(self, tmp_path):
+        """clear() should make the next files() call rescan the tree."""
+        root = self._tree(tmp_path)
+        index = WorkspaceIndex()
+        index.files(root)
+        (tmp_path / "later.md").write_text("# Later")
+
+        index.clear()
+
+        assert os.path.join(root, "later.md") in [e.path for e in index.files(root)]
+
+
+class TestMapOrdered:
+    """Test cases for map_ordered()."""
+
+    def test_preserves_input_order(self):
+        """map_ordered() should return results in input order regardless of timing."""
+        def slow_for_small(n):
+            time.sleep(0.001 * (10 - n))
+            return n * 2
+
+        results = map_ordered(slow_for_small, range(10), max_workers=4)
+
+        assert [r for _, r, _ in results] == [n * 2 for n in range(10)]
+
+    def test_captures_errors_per_item(self):
+        """map_ordered() should report an exception for the failing item only."""
+        def fail_on_two(n):
+            if n == 2:
+                raise ValueError("bad")
+            return n
+
+        results = map_ordered(fail_on_two, [1, 2, 3], max_workers=3)
+
+        assert [(item, result) for item, result, _ in results] == [(1, 1), (2, None), (3, 3)]
+        assert isinstance(results[1][2], ValueError)
+        assert results[0][2] is None
+
+    def test_bounded_concurrency(self):
+        """map_ordered() should never run more than max_workers calls at once."""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def track(_):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.005)
+            with lock:
+                active[0] -= 1
+
+        map_ordered(track, range(20), max_workers=3)
+
+        assert peak[0] <= 3
+
+    def test_get_page_ids(self, tmp_path):
+        """WorkspaceIndex.get_page_ids() should return page_ids in path order."""
+        (tmp_path / "a.md").write_text(f"---\nconfluence_url: {URL}\n---\n# A")
+        (tmp_path / "b.md").write_text("# B")
+        index = WorkspaceIndex()
+        paths = [str(tmp_path / "a.md"), str(tmp_path / "b.md"), str(tmp_path / "gone.md")]
+
+        results = index.get_page_ids(paths)
+
+        assert [(p, pid) for p, pid, _ in results[:2]] == [(paths[0], "123"), (paths[1], None)]
+        assert isinstance(results[2][2], OSError)
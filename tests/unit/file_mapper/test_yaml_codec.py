@@ -0,0 +1,99 @@
+"""Unit tests for file_mapper.yaml_codec module."""
+
+import importlib
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.file_mapper import yaml_codec
+from src.file_mapper.errors import FrontmatterError
+from src.file_mapper.frontmatter_handler import FrontmatterHandler
+from src.file_mapper.models import LocalPage
+
+
+DOCUMENTS = [
+    "confluence_url: https://example.atlassian.net/wiki/spaces/TEAM/pages/123\n",
+    "title: 'Quoted: value'\ntags: [a, b, c]\nnested:\n  key: value\n  list:\n    - 1\n    - 2.5\n",
+    "date: 2024-01-15\nflag: yes\nempty:\nnull_value: ~\n",
+    "unicode: \"Zürich — ✓\"\nmultiline: |\n  line one\n  line two\n",
+    "",
+]
+
+DATA = [
+    {'last_synced': '2024-01-15T10:30:00Z', 'tracked_pages': {'1': 'docs/a.md', '2': 'docs/ü.md'}},
+    {'spaces': [{'space_key': 'TEAM', 'exclude_page_ids': []}], 'page_limit': 100,
+     'force_pull': False, 'cache_dir': None},
+    {'confluence_url': 'https://example.atlassian.net/wiki/spaces/T/pages/1', 'title': 'a: b'},
+    {'title': 'Launch 😀 plan', 'tags': ['𝔘nicode', 'Zürich']},
+]
+
+
+@pytest.fixture
+def pure_python_codec():
+    """yaml_codec reloaded as if PyYAML had no libyaml bindings."""
+    with patch.dict(yaml.__dict__):
+        yaml.__dict__.pop('CSafeLoader', None)
+        yaml.__dict__.pop('CSafeDumper', None)
+        yield importlib.reload(yaml_codec)
+    importlib.reload(yaml_codec)
+
+
+class TestYamlCodec:
+    """Test cases for the libyaml-backed YAML codec."""
+
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    def test_load_matches_safe_load(self, document):
+        """safe_load() should return what yaml.safe_load returns."""
+        assert yaml_codec.safe_load(document) == yaml.safe_load(document)
+
+    @pytest.mark.parametrize("data", DATA)
+    def test_dump_matches_safe_dump(self, data):
+        """safe_dump() should produce the same text as yaml.safe_dump."""
+        options = dict(default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+        assert yaml_codec.safe_dump(data, **options) == yaml.safe_dump(data, **options)
+
+    def test_astral_plane_characters_written_literally(self):
+        """safe_dump() should keep characters outside the BMP unescaped, like yaml.safe_dump."""
+        data = {'title': 'Launch 😀 plan'}
+
+        generated = yaml_codec.safe_dump(data, default_flow_style=False, allow_unicode=True)
+
+        assert generated == "title: Launch 😀 plan\n"
+
+    def test_generate_keeps_emoji_frontmatter_unchanged(self):
+        """FrontmatterHandler.generate() should reproduce existing emoji frontmatter byte for byte."""
+        url = 'https://example.atlassian.net/wiki/spaces/TEAM/pages/1'
+        content = f"---\nconfluence_url: {url}\ntitle: Launch 😀 plan\n---\n# Body\n"
+        page = LocalPage(
+            file_path='page.md', page_id='1', content=content, space_key='TEAM',
+            confluence_base_url='https://example.atlassian.net/wiki'
+        )
+
+        assert FrontmatterHandler.generate(page) == content
+
+    def test_invalid_yaml_raises_yaml_error(self):
+        """safe_load() should raise yaml.YAMLError for malformed documents."""
+        with pytest.raises(yaml.YAMLError):
+            yaml_codec.safe_load("key: [unclosed")
+
+    def test_unsafe_tags_rejected(self):
+        """safe_load() should refuse Python object tags like yaml.safe_load."""
+        with pytest.raises(yaml_codec.YAMLError):
+            yaml_codec.safe_load("!!python/object/apply:os.system ['true']")
+
+    def test_fallback_without_libyaml(self, pure_python_codec):
+        """Without libyaml the codec should use the pure-Python classes."""
+        assert pure_python_codec.HAS_LIBYAML is False
+        assert pure_python_codec.SafeLoader is yaml.SafeLoader
+        assert pure_python_codec.safe_load(DOCUMENTS[1]) == yaml.safe_load(DOCUMENTS[1])
+
+    def test_depth_guard_still_applies(self):
+        """FrontmatterHandler should still reject frontmatter nested past MAX_YAML_DEPTH."""
+        depth = FrontmatterHandler.MAX_YAML_DEPTH + 2
+        nested = "".join(f"{'  ' * i}k{i}:\n" for i in range(depth)) + f"{'  ' * depth}leaf\n"
+        content = f"---\n{nested}---\n# Body\n"
+
+        with pytest.raises(FrontmatterError, match="maximum depth"):
+            FrontmatterHandler.parse("deep.md", content)
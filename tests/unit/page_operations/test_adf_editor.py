@@ -1122,3 +1122,93 @@ class TestAdfEditorHelperMethods:
         assert len(node.content) == 1
         assert node.content[0].type == "text"
         assert node.content[0].text == "Test content"
+
+
+class TestAdfEditorIndexedLookups:
+    """Test that operations see the edits made by earlier operations."""
+
+    @pytest.fixture
+    def editor(self):
+        return AdfEditor()
+
+    @pytest.fixture
+    def doc(self):
+        return AdfParser().parse_document({
+            "type": "doc",
+            "version": 1,
+            "content": [
+                {
+                    "type": "paragraph",
+                    "attrs": {"localId": "para-1"},
+                    "content": [{"type": "text", "text": "First paragraph"}]
+                },
+                {
+                    "type": "paragraph",
+                    "attrs": {"localId": "para-2"},
+                    "content": [{"type": "text", "text": "Last paragraph"}]
+                }
+            ]
+        })
+
+    def test_consecutive_inserts_stay_in_order(self, editor, doc):
+        """A block inserted after a just-inserted block should follow it."""
+        operations = [
+            SurgicalOperation(
+                op_type=OperationType.INSERT_BLOCK,
+                new_content="New one",
+                after_content="First paragraph",
+            ),
+            SurgicalOperation(
+                op_type=OperationType.INSERT_BLOCK,
+                new_content="New two",
+                after_content="New one",
+            ),
+        ]
+
+        modified, success, failure = editor.apply_operations(doc, operations)
+
+        assert (success, failure) == (2, 0)
+        assert [node.get_text_content() for node in modified.content] == [
+            "First paragraph", "New one", "New two", "Last paragraph"
+        ]
+
+    def test_insert_after_updated_block(self, editor, doc):
+        """An insert anchored on a block's new text should follow that block."""
+        operations = [
+            SurgicalOperation(
+                op_type=OperationType.UPDATE_TEXT,
+                target_content="First paragraph",
+                new_content="Intro rewritten",
+            ),
+            SurgicalOperation(
+                op_type=OperationType.INSERT_BLOCK,
+                new_content="Inserted",
+                after_content="Intro rewritten",
+            ),
+        ]
+
+        modified, success, _ = editor.apply_operations(doc, operations)
+
+        assert success == 2
+        assert [node.get_text_content() for node in modified.content] == [
+            "Intro rewritten", "Inserted", "Last paragraph"
+        ]
+
+    def test_deleted_block_is_not_found_again(self, editor, doc):
+        """Operations on a deleted block's text should fail, not hit another node."""
+        operations = [
+            SurgicalOperation(
+                op_type=OperationType.DELETE_BLOCK,
+                target_content="First paragraph",
+            ),
+            SurgicalOperation(
+                op_type=OperationType.UPDATE_TEXT,
+                target_content="First paragraph",
+                new_content="Changed",
+            ),
+        ]
+
+        modified, success, failure = editor.apply_operations(doc, operations)
+
+        assert (success, failure) == (1, 1)
+        assert [node.get_text_content() for node in modified.content] == ["Last paragraph"]
@@ -0,0 +1,109 @@
+"""Unit tests for ADF document index module."""
+
+import pytest
+from src.page_operations.adf_index import AdfDocumentIndex
+from src.page_operations.adf_models import AdfNode
+from src.page_operations.adf_parser import AdfParser
+
+
+class TestAdfDocumentIndex:
+    """Test suite for AdfDocumentIndex class."""
+
+    @pytest.fixture
+    def doc(self):
+        """Document with a paragraph, a list and a table."""
+        return AdfParser().parse_document({
+            "type": "doc",
+            "version": 1,
+            "content": [
+                {
+                    "type": "paragraph",
+                    "attrs": {"localId": "para-1"},
+                    "content": [{"type": "text", "text": "Release notes for the team"}]
+                },
+                {
+                    "type": "bulletList",
+                    "attrs": {"localId": "list-1"},
+                    "content": [
+                        {
+                            "type": "listItem",
+                            "attrs": {"localId": "item-1"},
+                            "content": [
+                                {
+                                    "type": "paragraph",
+                                    "attrs": {"localId": "para-2"},
+                                    "content": [{"type": "text", "text": "Nested item"}]
+                                }
+                            ]
+                        }
+                    ]
+                },
+                {
+                    "type": "table",
+                    "attrs": {"localId": "table-1"},
+                    "content": [
+                        {
+                            "type": "tableRow",
+                            "content": [
+                                {
+                                    "type": "tableCell",
+                                    "content": [
+                                        {
+                                            "type": "paragraph",
+                                            "content": [{"type": "text", "text": "Version  One"}]
+                                        }
+                                    ]
+                                }
+                            ]
+                        }
+                    ]
+                }
+            ]
+        })
+
+    def test_find_and_parent(self, doc):
+        """Nodes should be found by localId, with their parent."""
+        index = AdfDocumentIndex(doc)
+
+        nested = index.find("para-2")
+        assert nested is doc.content[1].content[0].content[0]
+        assert index.parent(nested) is doc.content[1].content[0]
+        assert not index.is_top_level(nested)
+        assert index.is_top_level(index.find("para-1"))
+        assert index.find("missing") is None
+
+    def test_insert_and_remove_update_the_index(self, doc):
+        """Tree changes made through the index should be visible at once."""
+        index = AdfDocumentIndex(doc)
+        new_node = AdfNode(type="paragraph", attrs={"localId": "para-new"})
+
+        index.insert_top_level(1, new_node)
+        assert doc.content[1] is new_node
+        assert index.find("para-new") is new_node
+        assert index.position(new_node) == 1
+
+        assert index.remove(index.find("list-1")) is True
+        assert index.find("list-1") is None
+        assert index.find("para-2") is None
+        assert [node.local_id for node in doc.content] == ["para-1", "para-new", "table-1"]
+
+    def test_text_lookups(self, doc):
+        """Exact and word-overlap text lookups should return localIds."""
+        index = AdfDocumentIndex(doc, {"Release notes for the team": "para-1"})
+        index.add_text("Nested item", "para-2")
+
+        assert index.find_text("Nested item") == "para-2"
+        assert index.find_similar_text("release notes for team") == "para-1"
+        assert index.find_similar_text("unrelated words") is None
+
+    def test_table_text_is_recomputed_after_change(self, doc):
+        """node_changed should drop a table's cached text."""
+        index = AdfDocumentIndex(doc)
+        table = index.find("table-1")
+
+        assert list(index.tables()) == [(table, "version one")]
+
+        table.content[0].content[0].content[0].content[0].text = "Version Two"
+        index.node_changed(table)
+
+        assert list(index.tables()) == [(table, "version two")]
@@ -0,0 +1,77 @@
+"""Unit tests for page_operations.sequence_alignment module."""
+
+import random
+
+from src.page_operations.sequence_alignment import (
+    align_sequences,
+    pair_moved_items,
+    unpaired_gaps,
+)
+
+
+def _lcs_length(a, b):
+    """Reference LCS length by dynamic programming."""
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+class TestAlignSequences:
+    """Test cases for align_sequences."""
+
+    def test_insert_keeps_following_items_aligned(self):
+        """An inserted item should not shift the alignment of later items."""
+        pairs = align_sequences(["h", "p1", "p2"], ["h", "new", "p1", "p2"])
+
+        assert pairs == [(0, 0), (1, 2), (2, 3)]
+
+    def test_empty_and_disjoint(self):
+        """Sequences without common items should have no pairs."""
+        assert align_sequences([], ["a"]) == []
+        assert align_sequences(["a"], []) == []
+        assert align_sequences(["a", "b"], ["c", "d"]) == []
+
+    def test_matches_reference_lcs(self):
+        """Pairs should be a valid common subsequence of maximal length."""
+        rng = random.Random(7)
+        for _ in range(300):
+            a = [rng.randrange(5) for _ in range(rng.randrange(15))]
+            b = [rng.randrange(5) for _ in range(rng.randrange(15))]
+
+            pairs = align_sequences(a, b)
+
+            assert all(a[i] == b[j] for i, j in pairs)
+            assert all(p[0] < q[0] and p[1] < q[1] for p, q in zip(pairs, pairs[1:], strict=False))
+            assert len(pairs) == _lcs_length(a, b)
+
+    def test_long_sequences_with_few_edits(self):
+        """Few edits in a long sequence should align every unchanged item."""
+        a = [f"block {i}" for i in range(5000)]
+        b = a[:100] + ["inserted"] + a[100:2500] + a[2501:]
+
+        pairs = align_sequences(a, b)
+
+        assert len(pairs) == 4999
+
+
+class TestAlignmentHelpers:
+    """Test cases for pair_moved_items and unpaired_gaps."""
+
+    def test_pair_moved_items(self):
+        """Equal items left out of the alignment should be paired once each."""
+        a = ["x", "y", "z", "z"]
+        b = ["z", "x", "y", "w"]
+        pairs = align_sequences(a, b)
+
+        assert pairs == [(0, 1), (1, 2)]
+        assert pair_moved_items(a, b, pairs) == [(2, 0)]
+
+    def test_unpaired_gaps(self):
+        """Gaps should list the unpaired indices between aligned pairs."""
+        gaps = list(unpaired_gaps(5, 4, [(1, 0), (3, 2)], {4}, set()))
+
+        assert gaps == [([0], []), ([2], [1]), ([], [3])]
@@ -0,0 +1,106 @@
+"""Unit tests for git_integration.blob_reader module."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.git_integration.blob_reader import GitBlobReader
+from src.git_integration.errors import GitRepositoryError
+from tests.helpers.git_test_utils import cleanup_git_repo, create_temp_git_repo
+
+
+def _hash_object(repo_path, content: bytes) -> str:
+    """Write a blob to the repository and return its SHA."""
+    result = subprocess.run(
+        ["git", "hash-object", "-w", "--stdin"],
+        cwd=repo_path,
+        input=content,
+        capture_output=True,
+        check=True,
+    )
+    return result.stdout.decode().strip()
+
+
+@pytest.fixture
+def repo_path():
+    """Temporary git repository, removed after the test."""
+    path = create_temp_git_repo()
+    yield path
+    cleanup_git_repo(path)
+
+
+class TestGitBlobReader:
+    """Test cases for GitBlobReader."""
+
+    def test_read_returns_blob_content(self, repo_path):
+        """read should return the exact blob content, including UTF-8 text."""
+        sha = _hash_object(repo_path, "# Café\n\nBody\n".encode("utf-8"))
+
+        with GitBlobReader(str(repo_path)) as reader:
+            assert reader.read(sha) == "# Café\n\nBody\n"
+
+    def test_read_missing_returns_none(self, repo_path):
+        """read should return None for objects that don't exist."""
+        with GitBlobReader(str(repo_path)) as reader:
+            assert reader.read("0123456789abcdef0123456789abcdef01234567") is None
+
+    def test_reuses_single_process_for_many_reads(self, repo_path):
+        """Many reads should be served by one cat-file process."""
+        shas = [_hash_object(repo_path, f"page {i}".encode()) for i in range(20)]
+
+        with GitBlobReader(str(repo_path)) as reader:
+            with patch("subprocess.Popen", wraps=subprocess.Popen) as mock_popen:
+                results = reader.read_many(shas)
+                for sha in shas:
+                    reader.read(sha)
+
+        assert mock_popen.call_count == 1
+        assert [results[sha] for sha in shas] == [f"page {i}" for i in range(20)]
+
+    def test_restarts_after_close(self, repo_path):
+        """Reader should transparently restart its process after close()."""
+        sha = _hash_object(repo_path, b"content")
+        reader = GitBlobReader(str(repo_path))
+
+        assert reader.read(sha) == "content"
+        reader.close()
+        assert reader.read(sha) == "content"
+        reader.close()
+
+    def test_git_not_found_raises_error(self, repo_path):
+        """Missing git executable should raise GitRepositoryError."""
+        reader = GitBlobReader(str(repo_path))
+
+        with patch("subprocess.Popen", side_effect=FileNotFoundError):
+            with pytest.raises(GitRepositoryError) as exc_info:
+                reader.read("abc")
+
+        assert "Git command not found" in str(exc_info.value)
+
+    def test_crlf_content_uses_universal_newlines(self, repo_path):
+        """CRLF and CR line endings should be read as LF, like text-mode git output."""
+        sha = _hash_object(repo_path, b"# Title\r\n\r\nBody\rEnd\r\n")
+
+        with GitBlobReader(str(repo_path)) as reader:
+            assert reader.read(sha) == "# Title\n\nBody\nEnd\n"
+
+    def test_stuck_process_times_out_and_restarts(self, repo_path):
+        """A process that never answers should be killed and replaced on the next read."""
+        sha = _hash_object(repo_path, b"content")
+        reader = GitBlobReader(str(repo_path), timeout=0.2)
+        real_popen = subprocess.Popen
+        # Reads stdin and never writes a response
+        stuck = [sys.executable, "-c", "import sys; sys.stdin.read()"]
+
+        with patch(
+            "subprocess.Popen",
+            side_effect=lambda args, **kwargs: real_popen(stuck, **kwargs),
+        ):
+            with pytest.raises(GitRepositoryError) as exc_info:
+                reader.read(sha)
+
+        assert "Timed out" in str(exc_info.value)
+        assert reader.read(sha) == "content"
+        reader.close()
@@ -497,3 +497,181 @@ class TestDiffAnalyzerWhitespaceNormalization:
         assert len(operations) == 1
         assert operations[0].op_type == OperationType.TABLE_UPDATE_CELL
         assert operations[0].new_content == "Done"
+
+
+class TestDiffAnalyzerAlignment:
+    """Test cases for LCS alignment of blocks in DiffAnalyzer.analyze."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create a DiffAnalyzer instance."""
+        return DiffAnalyzer()
+
+    def test_insert_at_top_is_single_insert(self, analyzer):
+        """A block inserted before unchanged blocks should only be inserted."""
+        original = [
+            ContentBlock(BlockType.PARAGRAPH, "First paragraph", index=0),
+            ContentBlock(BlockType.PARAGRAPH, "Second paragraph", index=1),
+            ContentBlock(BlockType.PARAGRAPH, "Third paragraph", index=2),
+        ]
+        modified = [
+            ContentBlock(BlockType.HEADING, "Intro", level=1, index=0),
+            ContentBlock(BlockType.PARAGRAPH, "First paragraph", index=1),
+            ContentBlock(BlockType.PARAGRAPH, "Second paragraph", index=2),
+            ContentBlock(BlockType.PARAGRAPH, "Third paragraph", index=3),
+        ]
+
+        operations = analyzer.analyze(original, modified)
+
+        assert len(operations) == 1
+        assert operations[0].op_type == OperationType.INSERT_BLOCK
+        assert operations[0].new_content == "Intro"
+        assert operations[0].after_content == ""
+
+    def test_delete_in_middle_is_single_delete(self, analyzer):
+        """A deleted block between unchanged blocks should only be deleted."""
+        original = [
+            ContentBlock(BlockType.PARAGRAPH, "Alpha", index=0),
+            ContentBlock(BlockType.PARAGRAPH, "Beta", index=1),
+            ContentBlock(BlockType.PARAGRAPH, "Gamma", index=2),
+        ]
+        modified = [
+            ContentBlock(BlockType.PARAGRAPH, "Alpha", index=0),
+            ContentBlock(BlockType.PARAGRAPH, "Gamma", index=1),
+        ]
+
+        operations = analyzer.analyze(original, modified)
+
+        assert len(operations) == 1
+        assert operations[0].op_type == OperationType.DELETE_BLOCK
+        assert operations[0].target_content == "Beta"
+
+    def test_edits_are_paired_within_their_gap(self, analyzer):
+        """Changed blocks should be paired with the original block of the same gap."""
+        original = [
+            ContentBlock(BlockType.PARAGRAPH, "Intro text", index=0),
+            ContentBlock(BlockType.HEADING, "Anchor one", level=2, index=1),
+            ContentBlock(BlockType.PARAGRAPH, "Old middle", index=2),
+            ContentBlock(BlockType.HEADING, "Anchor two", level=2, index=3),
+            ContentBlock(BlockType.PARAGRAPH, "Old end", index=4),
+        ]
+        modified = [
+            ContentBlock(BlockType.PARAGRAPH, "Intro text", index=0),
+            ContentBlock(BlockType.HEADING, "Anchor one", level=2, index=1),
+            ContentBlock(BlockType.PARAGRAPH, "New middle", index=2),
+            ContentBlock(BlockType.HEADING, "Anchor two", level=2, index=3),
+            ContentBlock(BlockType.PARAGRAPH, "New end", index=4),
+        ]
+
+        operations = analyzer.analyze(original, modified)
+
+        updates = [(op.target_content, op.new_content) for op in operations]
+        assert updates == [("Old middle", "New middle"), ("Old end", "New end")]
+        assert all(op.op_type == OperationType.UPDATE_TEXT for op in operations)
+
+    def test_moved_block_produces_no_operation(self, analyzer):
+        """A block that only moved should not be deleted and re-inserted."""
+        original = [
+            ContentBlock(BlockType.PARAGRAPH, "Alpha", index=0),
+            ContentBlock(BlockType.PARAGRAPH, "Beta", index=1),
+            ContentBlock(BlockType.PARAGRAPH, "Gamma", index=2),
+        ]
+        modified = [
+            ContentBlock(BlockType.PARAGRAPH, "Gamma", index=0),
+            ContentBlock(BlockType.PARAGRAPH, "Alpha", index=1),
+            ContentBlock(BlockType.PARAGRAPH, "Beta", index=2),
+        ]
+
+        assert analyzer.analyze(original, modified) == []
+
+
+class TestDiffAnalyzerFingerprints:
+    """Test cases for block fingerprints and the word index."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create a DiffAnalyzer instance."""
+        return DiffAnalyzer()
+
+    def test_fingerprint_matches_per_block_helpers(self, analyzer):
+        """A fingerprint should hold the same key, text and words as the helpers compute."""
+        table = ContentBlock(BlockType.TABLE, "A  B", rows=[["A ", " B"]], index=0)
+        paragraph = ContentBlock(BlockType.PARAGRAPH, "Some   Mixed case  text", index=1)
+
+        for block in (table, paragraph):
+            fingerprint = analyzer._fingerprint(block)
+            assert fingerprint.key == analyzer._block_key(block)
+            assert fingerprint.normalized == analyzer._normalize_content(block.content)
+            assert fingerprint.words == analyzer._word_set(block.content)
+
+        assert analyzer._fingerprint(table).row_keys == ("a|b",)
+        assert analyzer._fingerprint(paragraph).row_keys == ()
+
+    def test_match_gap_picks_most_similar_block(self, analyzer):
+        """The indexed search should pair each block with its most similar original."""
+        original = [
+            ContentBlock(BlockType.PARAGRAPH, "alpha beta gamma delta", index=0),
+            ContentBlock(BlockType.PARAGRAPH, "one two three four", index=1),
+            ContentBlock(BlockType.HEADING, "one two three four", level=2, index=2),
+        ]
+        modified = [
+            ContentBlock(BlockType.PARAGRAPH, "one two three five", index=0),
+            ContentBlock(BlockType.PARAGRAPH, "alpha beta gamma epsilon", index=1),
+        ]
+        orig_prints = [analyzer._fingerprint(b) for b in original]
+        mod_prints = [analyzer._fingerprint(b) for b in modified]
+
+        pairs = analyzer._match_gap(orig_prints, [0, 1, 2], mod_prints, [0, 1])
+
+        assert pairs == {0: 1, 1: 0}
+
+
+class TestDiffAnalyzerTableAlignment:
+    """Test cases for row-level LCS alignment in table diffs."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create a DiffAnalyzer instance."""
+        return DiffAnalyzer()
+
+    @staticmethod
+    def _table(rows):
+        content = " ".join(cell for row in rows for cell in row)
+        return ContentBlock(BlockType.TABLE, content, rows=rows, index=0)
+
+    def test_row_inserted_in_large_table_is_single_insert(self, analyzer):
+        """Inserting a row mid-table should not update the rows after it."""
+        rows = [["Release", "Status"]] + [[f"v{i}", "shipped"] for i in range(300)]
+        modified_rows = rows[:150] + [["v-new", "planned"]] + rows[150:]
+
+        operations = analyzer.analyze([self._table(rows)], [self._table(modified_rows)])
+
+        assert len(operations) == 1
+        assert operations[0].op_type == OperationType.TABLE_INSERT_ROW
+        assert operations[0].new_content == "v-new|planned"
+        assert operations[0].row_index == 150
+        assert operations[0].after_content == "v148|shipped"
+
+    def test_duplicate_row_deleted(self, analyzer):
+        """Deleting one of two identical rows should produce one delete."""
+        rows = [["Name", "Value"], ["a", "1"], ["a", "1"], ["b", "2"]]
+        modified_rows = [["Name", "Value"], ["a", "1"], ["b", "2"]]
+
+        operations = analyzer.analyze([self._table(rows)], [self._table(modified_rows)])
+
+        assert len(operations) == 1
+        assert operations[0].op_type == OperationType.TABLE_DELETE_ROW
+        assert operations[0].new_content == "a|1"
+
+    def test_cell_update_after_inserted_row(self, analyzer):
+        """A cell change after an inserted row should target the original row index."""
+        rows = [["Name", "Value"], ["a", "1"], ["b", "2"], ["c", "3"]]
+        modified_rows = [["Name", "Value"], ["new", "0"], ["a", "1"], ["b", "2"], ["c", "30"]]
+
+        operations = analyzer.analyze([self._table(rows)], [self._table(modified_rows)])
+
+        op_summary = sorted((op.op_type.value, op.row_index, op.new_content) for op in operations)
+        assert op_summary == [
+            (OperationType.TABLE_INSERT_ROW.value, 1, "new|0"),
+            (OperationType.TABLE_UPDATE_CELL.value, 3, "30"),
+        ]
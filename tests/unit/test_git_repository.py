@@ -8,7 +8,11 @@ from unittest.mock import MagicMock, Mock, patch, call
 import pytest
 
 from src.git_integration.errors import GitRepositoryError
-from src.git_integration.git_repository import GitRepository, GIT_TIMEOUT
+from src.git_integration.git_repository import (
+    GIT_TIMEOUT,
+    VERSION_INDEX_FILE,
+    GitRepository,
+)
 
 
 class TestGitRepositoryInit:
@@ -106,9 +110,12 @@ class TestCommitVersion:
         # Arrange
         repo = GitRepository("/tmp/test_repo")
 
+        repo._version_index = {}
+
         # Mock successful git add and git commit
         mock_run.side_effect = [
             MagicMock(returncode=0, stderr="", stdout=""),  # git add
+            MagicMock(returncode=0, stderr="", stdout="blob123\n"),  # git rev-parse :file
             MagicMock(returncode=0, stderr="", stdout=""),  # git commit
             MagicMock(returncode=0, stderr="", stdout="abc123def456"),  # git rev-parse HEAD
         ]
@@ -133,8 +140,13 @@ class TestCommitVersion:
         assert add_call[1]["cwd"] == repo.repo_path
         assert add_call[1]["timeout"] == GIT_TIMEOUT
 
+        # Verify staged blob was resolved and recorded in the version index
+        blob_call = mock_run.call_args_list[1]
+        assert blob_call[0][0] == ["git", "rev-parse", ":123456.md"]
+        assert repo._version_index == {"123456": {15: "blob123"}}
+
         # Verify git commit was called with correct message
-        commit_call = mock_run.call_args_list[1]
+        commit_call = mock_run.call_args_list[2]
         assert commit_call[0][0] == ["git", "commit", "-m", "Page 123456: version 15"]
         assert commit_call[1]["cwd"] == repo.repo_path
 
@@ -147,8 +159,10 @@ class TestCommitVersion:
         """commit_version should accept custom commit message."""
         # Arrange
         repo = GitRepository("/tmp/test_repo")
+        repo._version_index = {}
         mock_run.side_effect = [
             MagicMock(returncode=0, stderr="", stdout=""),  # git add
+            MagicMock(returncode=0, stderr="", stdout="blob123"),  # git rev-parse :file
             MagicMock(returncode=0, stderr="", stdout=""),  # git commit
             MagicMock(returncode=0, stderr="", stdout="sha123"),  # git rev-parse
         ]
@@ -163,7 +177,7 @@ class TestCommitVersion:
         )
 
         # Assert
-        commit_call = mock_run.call_args_list[1]
+        commit_call = mock_run.call_args_list[2]
         assert commit_call[0][0] == ["git", "commit", "-m", "Custom commit message"]
 
     @patch("subprocess.run")
@@ -172,11 +186,13 @@ class TestCommitVersion:
         """UT-GR-09: commit_version should raise GitRepositoryError on git failure."""
         # Arrange
         repo = GitRepository("/tmp/test_repo")
+        repo._version_index = {}
         mock_open.return_value.__enter__.return_value = MagicMock()
 
         # git add succeeds, git commit fails
         mock_run.side_effect = [
             MagicMock(returncode=0, stderr="", stdout=""),  # git add
+            MagicMock(returncode=0, stderr="", stdout="blob123"),  # git rev-parse :file
             MagicMock(returncode=1, stderr="fatal: unable to commit", stdout=""),  # git commit
         ]
 
@@ -213,11 +229,13 @@ class TestCommitVersion:
         """commit_version should handle 'nothing to commit' gracefully."""
         # Arrange
         repo = GitRepository("/tmp/test_repo")
+        repo._version_index = {}
         mock_open.return_value.__enter__.return_value = MagicMock()
 
         # git add succeeds, git commit says nothing to commit
         mock_run.side_effect = [
             MagicMock(returncode=0, stderr="", stdout=""),  # git add
+            MagicMock(returncode=0, stderr="", stdout="blob123"),  # git rev-parse :file
             MagicMock(returncode=1, stderr="nothing to commit, working tree clean", stdout=""),  # git commit
             MagicMock(returncode=0, stderr="", stdout="current_sha"),  # git rev-parse HEAD
         ]
@@ -228,21 +246,21 @@ class TestCommitVersion:
         # Assert - should return current HEAD SHA
         assert sha == "current_sha"
 
+        # Version is still indexed so it can be retrieved later
+        assert repo._version_index == {"123456": {1: "blob123"}}
+
 
 class TestGetVersion:
     """Test cases for get_version method."""
 
     @patch("subprocess.run")
     def test_get_version_found(self, mock_run):
-        """UT-GR-04: get_version should call git log and return markdown content."""
+        """UT-GR-04: get_version should look up the index and return blob content."""
         # Arrange
         repo = GitRepository("/tmp/test_repo")
-
-        # Mock git log to find commit, then git show to get content
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stderr="", stdout="abc123def456\n"),  # git log
-            MagicMock(returncode=0, stderr="", stdout="# Test Content\n\nBody text"),  # git show
-        ]
+        repo._version_index = {"123456": {15: "blob15"}}
+        repo._blob_reader = MagicMock()
+        repo._blob_reader.read.return_value = "# Test Content\n\nBody text"
 
         # Act
         content = repo.get_version("123456", 15)
@@ -250,43 +268,33 @@ class TestGetVersion:
         # Assert
         assert content == "# Test Content\n\nBody text"
 
-        # Verify git log was called correctly
-        log_call = mock_run.call_args_list[0]
-        assert "git" in log_call[0][0]
-        assert "log" in log_call[0][0]
-        assert "--grep" in log_call[0][0]
-        assert "Page 123456: version 15" in log_call[0][0]
-
-        # Verify git show was called with commit SHA
-        show_call = mock_run.call_args_list[1]
-        assert show_call[0][0] == ["git", "show", "abc123def456:123456.md"]
+        # Verify a single blob read, no history search
+        repo._blob_reader.read.assert_called_once_with("blob15")
+        mock_run.assert_not_called()
 
     @patch("subprocess.run")
     def test_get_version_not_found(self, mock_run):
         """UT-GR-05: get_version should return None when version not found."""
         # Arrange
         repo = GitRepository("/tmp/test_repo")
-
-        # Mock git log returning empty (no matching commit)
-        mock_run.return_value = MagicMock(returncode=0, stderr="", stdout="")
+        repo._version_index = {"123456": {15: "blob15"}}
+        repo._blob_reader = MagicMock()
 
         # Act
         content = repo.get_version("123456", 999)
 
         # Assert
         assert content is None
+        mock_run.assert_not_called()
+        repo._blob_reader.read.assert_not_called()
 
-    @patch("subprocess.run")
-    def test_get_version_file_not_at_commit(self, mock_run):
-        """get_version should return None if file doesn't exist at commit."""
+    def test_get_version_blob_missing(self):
+        """get_version should return None if the indexed blob doesn't exist."""
         # Arrange
         repo = GitRepository("/tmp/test_repo")
-
-        # Mock git log finds commit, but git show fails (file not at that commit)
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stderr="", stdout="abc123\n"),  # git log
-            MagicMock(returncode=128, stderr="fatal: path not in commit", stdout=""),  # git show
-        ]
+        repo._version_index = {"123456": {15: "blob15"}}
+        repo._blob_reader = MagicMock()
+        repo._blob_reader.read.return_value = None
 
         # Act
         content = repo.get_version("123456", 15)
@@ -294,6 +302,34 @@ class TestGetVersion:
         # Assert
         assert content is None
 
+    @patch("subprocess.run")
+    def test_get_version_rebuilds_index_from_history(self, mock_run):
+        """get_version should build the index from git log when no index file exists."""
+        # Arrange
+        repo = GitRepository("/tmp/test_repo")
+        blob_v2 = "b" * 40
+        blob_v1 = "a" * 40
+        log_output = (
+            "\x1ePage 123456: version 2\n\n"
+            f":100644 100644 {blob_v1} {blob_v2} M\t123456.md\n"
+            "\x1ePage 123456: version 1\n\n"
+            f":000000 100644 {'0' * 40} {blob_v1} A\t123456.md\n"
+            "\x1eInitial commit: Add README\n\n"
+            f":000000 100644 {'0' * 40} {'c' * 40} A\tREADME.md\n"
+        )
+        mock_run.return_value = MagicMock(returncode=0, stderr="", stdout=log_output)
+        repo._blob_reader = MagicMock()
+        repo._blob_reader.read.return_value = "# Version 1"
+
+        # Act
+        content = repo.get_version("123456", 1)
+
+        # Assert
+        assert content == "# Version 1"
+        assert repo._version_index == {"123456": {1: blob_v1, 2: blob_v2}}
+        mock_run.assert_called_once()
+        repo._blob_reader.read.assert_called_once_with(blob_v1)
+
     @patch("subprocess.run")
     def test_get_version_git_log_failure(self, mock_run):
         """get_version should raise GitRepositoryError on git log failure."""
@@ -327,35 +363,63 @@ class TestGetVersion:
 
         assert "timed out" in str(exc_info.value)
 
+    def test_get_version_reads_persisted_index(self, tmp_path):
+        """get_version should load the index file without touching git log."""
+        # Arrange
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / VERSION_INDEX_FILE).write_text(
+            "123456 1 old\n123456 2 blob2\n123456 1 blob1\nmalformed\n"
+        )
+        repo = GitRepository(str(tmp_path))
+        repo._blob_reader = MagicMock()
+        repo._blob_reader.read.return_value = "# V1"
+
+        # Act
+        with patch("subprocess.run") as mock_run:
+            content = repo.get_version("123456", 1)
+
+        # Assert - later lines win, one blob read
+        assert content == "# V1"
+        mock_run.assert_not_called()
+        repo._blob_reader.read.assert_called_once_with("blob1")
+
+
+class TestGetVersions:
+    """Test cases for get_versions bulk method."""
+
+    def test_get_versions_reads_all_blobs_in_one_batch(self):
+        """get_versions should resolve every key and read blobs in one batch."""
+        # Arrange
+        repo = GitRepository("/tmp/test_repo")
+        repo._version_index = {"111": {1: "sha1", 2: "sha2"}, "222": {5: "sha5"}}
+        repo._blob_reader = MagicMock()
+        repo._blob_reader.read_many.return_value = {"sha1": "# One", "sha5": "# Five"}
+
+        # Act
+        result = repo.get_versions([("111", 1), ("222", 5), ("333", 1)])
+
+        # Assert
+        assert result == {("111", 1): "# One", ("222", 5): "# Five", ("333", 1): None}
+        repo._blob_reader.read_many.assert_called_once()
+        assert list(repo._blob_reader.read_many.call_args[0][0]) == ["sha1", "sha5"]
+
 
 class TestGetLatestVersionNumber:
     """Test cases for get_latest_version_number method."""
 
     @patch("subprocess.run")
     def test_get_latest_version_number(self, mock_run):
-        """UT-GR-10: get_latest_version_number should parse commit messages and return highest."""
+        """UT-GR-10: get_latest_version_number should return highest indexed version."""
         # Arrange
         repo = GitRepository("/tmp/test_repo")
-
-        # Mock git log returning multiple commit messages
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stderr="",
-            stdout="Page 123456: version 5\nPage 123456: version 3\nPage 123456: version 10\n"
-        )
+        repo._version_index = {"123456": {5: "s5", 3: "s3", 10: "s10"}}
 
         # Act
         latest = repo.get_latest_version_number("123456")
 
         # Assert
         assert latest == 10
-
-        # Verify git log was called with correct grep pattern
-        call_args = mock_run.call_args[0][0]
-        assert "git" in call_args
-        assert "log" in call_args
-        assert "--grep" in call_args
-        assert "Page 123456: version" in call_args
+        mock_run.assert_not_called()
 
     @patch("subprocess.run")
     def test_get_latest_version_number_no_commits(self, mock_run):
@@ -372,7 +436,7 @@ class TestGetLatestVersionNumber:
 
     @patch("subprocess.run")
     def test_get_latest_version_number_no_matching_pattern(self, mock_run):
-        """get_latest_version_number should return None if no version numbers found."""
+        """get_latest_version_number should return None if no version commits found."""
         # Arrange
         repo = GitRepository("/tmp/test_repo")
 
@@ -380,7 +444,7 @@ class TestGetLatestVersionNumber:
         mock_run.return_value = MagicMock(
             returncode=0,
             stderr="",
-            stdout="Initial commit\nSome other commit\n"
+            stdout="\x1eInitial commit\n\x1eSome other commit\n"
         )
 
         # Act
@@ -397,7 +461,7 @@ class TestGetLatestVersionNumber:
         mock_run.return_value = MagicMock(
             returncode=0,
             stderr="",
-            stdout="Page 123456: version 42\n"
+            stdout=f"\x1ePage 123456: version 42\n\n:000000 100644 {'0' * 40} {'a' * 40} A\t123456.md\n"
         )
 
         # Act
@@ -421,7 +485,7 @@ class TestGetLatestVersionNumber:
         with pytest.raises(GitRepositoryError) as exc_info:
             repo.get_latest_version_number("123456")
 
-        assert "Failed to get version history" in str(exc_info.value)
+        assert "Failed to search git log" in str(exc_info.value)
 
     @patch("subprocess.run")
     def test_get_latest_version_number_timeout(self, mock_run):
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, Mock, patch, mock_open, call
 from src.git_integration.errors import GitRepositoryError, MergeConflictError
 from src.git_integration.merge_orchestrator import MergeOrchestrator
 from src.git_integration.models import (
+    CacheStats,
     ConflictDetectionResult,
     ConflictInfo,
     LocalPage,
@@ -432,6 +433,19 @@ class TestForcePull(TestMergeOrchestrator):
         assert len(result.errors) == 0
 
 
+    def test_force_pull_reports_cache_stats_of_this_run(self, orchestrator, mock_cache):
+        """cache_stats should count only the lookups made during this run."""
+        # Arrange - the cache already served 5 hits before the run
+        mock_cache.get_stats.side_effect = [CacheStats(hits=5), CacheStats(hits=7, misses=1)]
+
+        with patch("builtins.open", mock_open()):
+            # Act
+            result = orchestrator.force_pull(["123456"])
+
+        # Assert
+        assert result.cache_stats == CacheStats(hits=2, misses=1)
+
+
 class TestPartialFailureRollback(TestMergeOrchestrator):
     """Test cases for partial failure handling (UT-MO-06)."""
 
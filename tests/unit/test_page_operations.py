@@ -4,7 +4,7 @@ Tests cover:
 - get_page_snapshot (basic, with version, with labels)
 - apply_operations (UPDATE_TEXT, DELETE_BLOCK, TABLE operations)
 - update_page_surgical (success, version conflict)
-- update_page_surgical_adf (success path)
+- update_page_surgical_adf (success path, optimistic version conflict retry)
 - create_page (with/without parent_id, duplicate handling)
 - update_page_content
 - update_page_parent
@@ -469,6 +469,52 @@ class TestUpdatePageSurgicalAdf:
 
         assert result.success is True
 
+    def test_update_page_surgical_adf_skips_version_check_get(self, ops, mock_api, sample_adf):
+        """update_page_surgical_adf should upload without a separate version GET."""
+        mock_api.get_page_adf.return_value = {
+            "title": "Test Page",
+            "version": {"number": 1},
+            "body": {"atlas_doc_format": {"value": json.dumps(sample_adf)}}
+        }
+        mock_api.update_page_adf.return_value = {"version": {"number": 2}}
+
+        result = ops.update_page_surgical_adf(
+            page_id="12345",
+            new_markdown_content="Modified World",
+            baseline_markdown="Hello World"
+        )
+
+        assert result.success is True
+        mock_api.get_page_by_id.assert_not_called()
+        assert mock_api.get_page_adf.call_count == 1
+
+    @patch('src.page_operations.page_operations.time.sleep')
+    def test_update_page_surgical_adf_retries_on_409(self, mock_sleep, ops, mock_api, sample_adf):
+        """A 409 from the upload should re-fetch the page and retry with its new version."""
+        mock_api.get_page_adf.side_effect = [
+            {
+                "title": "Test Page",
+                "version": {"number": version},
+                "body": {"atlas_doc_format": {"value": json.dumps(sample_adf)}}
+            }
+            for version in (1, 2)
+        ]
+        mock_api.update_page_adf.side_effect = [
+            APIAccessError("Version conflict updating page 12345 (version 1 is stale)"),
+            {"version": {"number": 3}},
+        ]
+
+        result = ops.update_page_surgical_adf(
+            page_id="12345",
+            new_markdown_content="Modified World",
+            baseline_markdown="Hello World"
+        )
+
+        assert result.success is True
+        assert (result.old_version, result.new_version) == (2, 3)
+        assert [c.kwargs['version'] for c in mock_api.update_page_adf.call_args_list] == [1, 2]
+        mock_sleep.assert_called_once_with(1.0)
+
     def test_update_page_surgical_adf_no_baseline_uses_fallback(self, ops, mock_api, sample_adf):
         """update_page_surgical_adf without baseline should use full replacement."""
         mock_api.get_page_adf.return_value = {
@@ -710,6 +756,41 @@ class TestUpdatePageParent:
         call_kwargs = mock_api.update_page.call_args[1]
         assert call_kwargs["ancestors"] == []
 
+    def test_update_page_parent_with_known_version(self, ops, mock_api):
+        """A known version and title should move the page without fetching it."""
+        mock_api.move_page.return_value = {"version": {"number": 5}}
+
+        result = ops.update_page_parent(
+            page_id="12345", parent_id="new_parent", version=4, title="Page"
+        )
+
+        assert result.success is True
+        assert result.new_version == 5
+        mock_api.get_page_by_id.assert_not_called()
+        mock_api.move_page.assert_called_once_with(
+            page_id="12345", title="Page", parent_id="new_parent", version=4
+        )
+
+    def test_update_page_parent_stale_version_refetches(self, ops, mock_api):
+        """A version conflict on the direct move should fall back to a fetch."""
+        mock_api.move_page.side_effect = APIAccessError(
+            "Version conflict moving page 12345 (version 4 is stale)"
+        )
+        mock_api.get_page_by_id.return_value = {
+            "title": "Page",
+            "body": {"storage": {"value": "<p>Content</p>"}},
+            "version": {"number": 6}
+        }
+        mock_api.update_page.return_value = {"version": {"number": 7}}
+
+        result = ops.update_page_parent(
+            page_id="12345", parent_id="new_parent", version=4, title="Page"
+        )
+
+        assert result.success is True
+        assert result.new_version == 7
+        assert mock_api.update_page.call_args[1]["version"] == 6
+
 
 class TestDeletePage:
     """Tests for delete_page method."""
@@ -16,7 +16,7 @@ from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, PropertyMock
 
 from src.cli.sync_command import SyncCommand
-from src.cli.models import ExitCode
+from src.cli.models import DeletionInfo, DeletionResult, ExitCode, MoveResult, PageRecord, SyncState
 from src.cli.errors import CLIError, ConfigNotFoundError
 from src.confluence_client.errors import (
     InvalidCredentialsError,
@@ -24,6 +24,7 @@ from src.confluence_client.errors import (
     APIAccessError,
 )
 from src.file_mapper.errors import ConfigError
+from src.file_mapper.models import PlannedAction, SpaceConfig, SyncConfig, SyncPlan
 
 
 class TestSyncCommandRun:
@@ -480,11 +481,11 @@ class TestDryRun:
 
     def test_dry_run_does_not_modify(self, sync_cmd):
         """_run_dry_run should preview changes without applying."""
-        sync_cmd.change_detector.detect_changes.return_value = Mock(
-            local_changes=["file1.md"],
-            remote_changes=["page1"],
-            conflicts=[]
-        )
+        sync_cmd.change_detector.detect_deletions.return_value = DeletionResult()
+        sync_cmd.change_detector.detect_moves.return_value = MoveResult()
+        plan = SyncPlan()
+        plan.add(PlannedAction("update:1", "update", page_id="1", path="file1.md"))
+        sync_cmd.file_mapper.plan_sync.return_value = plan
         sync_cmd._discover_tracked_pages = Mock(return_value={"page1": {}})
         sync_cmd._get_remote_pages = Mock(return_value={"page1": {}})
 
@@ -494,9 +495,35 @@ class TestDryRun:
         result = sync_cmd._run_dry_run(config, state, None)
 
         assert result == ExitCode.SUCCESS
+        sync_cmd.output_handler.print_sync_plan.assert_called_once_with(plan)
+        sync_cmd.file_mapper.sync_spaces.assert_not_called()
         # Verify state was NOT saved
         sync_cmd.state_manager.save.assert_not_called()
 
+    def test_dry_run_plan_drops_content_for_deleted_pages(self, sync_cmd):
+        """_build_sync_plan should not pull a page a real run deletes first."""
+        sync_cmd.change_detector.detect_deletions.return_value = DeletionResult(
+            deleted_locally=[DeletionInfo(page_id="2", title="Gone", local_path=None,
+                                          direction="local_to_confluence")]
+        )
+        sync_cmd.change_detector.detect_moves.return_value = MoveResult()
+        content = SyncPlan()
+        content.add(PlannedAction("pull:2", "pull", page_id="2", path="docs/gone.md"))
+        content.add(PlannedAction("merge:3", "merge", page_id="3", path="docs/both.md"))
+        sync_cmd.file_mapper.plan_sync.return_value = content
+        sync_cmd._discover_tracked_pages = Mock(return_value={})
+        sync_cmd._get_remote_pages = Mock(return_value={"2": {}})
+
+        config = Mock(spaces=[], force_push=False, force_pull=False)
+        state = Mock(last_synced=None, tracked_pages={"2": "docs/gone.md"})
+
+        result = sync_cmd._run_dry_run(config, state, None)
+
+        plan = sync_cmd.output_handler.print_sync_plan.call_args[0][0]
+        assert [a.action_id for a in plan.actions] == ["delete:confluence:2", "merge:3"]
+        assert plan.actions[0].path == "docs/gone.md"
+        assert result == ExitCode.CONFLICTS
+
 
 class TestSingleFileSync:
     """Tests for single file sync mode."""
@@ -555,6 +582,79 @@ class TestSingleFileSync:
         sync_cmd._sync_single_file.assert_called_once()
 
 
+
+class TestPushLocalEdit:
+    """Tests for pushing a single edited file in watch mode."""
+
+    URL = "https://example.atlassian.net/wiki/spaces/TEST/pages/123"
+
+    @pytest.fixture
+    def sync_cmd(self, tmp_path):
+        """Create SyncCommand with mocked dependencies and an API wrapper."""
+        cmd = SyncCommand(
+            state_path=str(tmp_path / "state.db"),
+            output_handler=Mock(),
+            state_manager=Mock(),
+            file_mapper=Mock(),
+            baseline_manager=Mock(),
+            authenticator=Mock(),
+        )
+        cmd.baseline_manager.is_initialized.return_value = True
+        cmd.get_api_wrapper = Mock()
+        cmd.get_api_wrapper.return_value.get_page_by_id.return_value = {'version': {'number': 5}}
+        return cmd
+
+    @pytest.fixture
+    def edited_file(self, tmp_path):
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        path = docs / "page.md"
+        path.write_text(f"---\nconfluence_url: {self.URL}\n---\n# Page\n")
+        return path
+
+    @pytest.fixture
+    def config(self, edited_file):
+        return SyncConfig(spaces=[
+            SpaceConfig(space_key="TEST", parent_page_id="1", local_path=str(edited_file.parent))
+        ])
+
+    def test_remote_change_skips_push(self, sync_cmd, edited_file, config):
+        """push_local_edit should not push when Confluence moved past the synced version."""
+        state = SyncState(page_records={"123": PageRecord(version=4)})
+
+        result = sync_cmd.push_local_edit(str(edited_file), config, state)
+
+        assert result is None
+        sync_cmd.file_mapper.push_modified_pages.assert_not_called()
+        sync_cmd.state_manager.record_page.assert_not_called()
+
+    def test_unknown_synced_version_skips_push(self, sync_cmd, edited_file, config):
+        """push_local_edit should not push when no version was recorded for the page."""
+        result = sync_cmd.push_local_edit(str(edited_file), config, SyncState())
+
+        assert result is None
+        sync_cmd.file_mapper.push_modified_pages.assert_not_called()
+
+    def test_unchanged_remote_pushes_surgically(self, sync_cmd, edited_file, config):
+        """push_local_edit should push through FileMapper and record the new version."""
+        state = SyncState(page_records={"123": PageRecord(version=5)})
+
+        def push(local_pages, space_config, push_config):
+            page = local_pages[str(edited_file)]
+            sync_cmd._synced_versions[page.page_id] = 6
+            assert push_config.workspace is None
+
+        sync_cmd.file_mapper.push_modified_pages.side_effect = push
+
+        result = sync_cmd.push_local_edit(str(edited_file), config, state)
+
+        assert result == 6
+        space_config = sync_cmd.file_mapper.push_modified_pages.call_args[0][1]
+        assert space_config.space_key == "TEST"
+        record = sync_cmd.state_manager.record_page.call_args[0][3]
+        assert record.version == 6
+
+
 class TestErrorHandling:
     """Tests for error handling in SyncCommand."""
 
@@ -737,3 +837,97 @@ spaces:
 
         assert cmd.file_mapper is mock_file_mapper
         assert cmd.change_detector is mock_change_detector
+
+
+class TestSyncJournalResume:
+    """Tests for the sync journal and --resume in bidirectional sync."""
+
+    @pytest.fixture
+    def sync_cmd(self, tmp_path):
+        """SyncCommand with mocked dependencies and a journal in tmp_path."""
+        cmd = SyncCommand(
+            config_path=str(tmp_path / "config.yaml"),
+            state_path=str(tmp_path / "state.yaml"),
+            output_handler=Mock(),
+            state_manager=Mock(),
+            file_mapper=Mock(),
+            change_detector=Mock(),
+            merge_orchestrator=Mock(),
+            deletion_handler=Mock(),
+            move_handler=Mock(),
+            authenticator=Mock(),
+            ancestor_resolver=Mock(),
+            baseline_manager=Mock(),
+            conflict_resolver=Mock(),
+        )
+        cmd.baseline_manager.is_initialized.return_value = True
+        cmd.change_detector.detect_deletions.return_value = Mock(
+            deleted_in_confluence=[], deleted_locally=[]
+        )
+        cmd.change_detector.detect_moves.return_value = Mock(
+            moved_in_confluence=[], moved_locally=[]
+        )
+        cmd.file_mapper.sync_spaces.return_value = Mock(conflict_page_ids=[])
+        cmd._discover_tracked_pages = Mock(return_value={})
+        cmd._get_remote_pages = Mock(return_value={})
+        cmd._update_baseline_repository = Mock()
+        return cmd
+
+    def _action(self, page_id="1"):
+        from src.file_mapper.models import PageAction
+        return PageAction(page_id=page_id, file_path="docs/a.md", action="push",
+                          content_hash="h", version=5)
+
+    def test_successful_sync_removes_journal(self, sync_cmd):
+        """A finished sync should leave no journal behind."""
+        config = Mock(spaces=[], force_push=False, force_pull=False)
+
+        sync_cmd._run_bidirectional_sync(config, Mock(last_synced=None, tracked_pages={}))
+
+        assert config.on_page_synced == sync_cmd._on_page_synced
+        assert not sync_cmd.journal.exists()
+
+    def test_interrupted_sync_keeps_journal(self, sync_cmd):
+        """A failing sync should leave the journal with the applied work."""
+        def push_then_fail(config):
+            config.on_page_synced(self._action(), "---\n---\n# A\n")
+            raise RuntimeError("429 retries exhausted")
+        sync_cmd.file_mapper.sync_spaces.side_effect = push_then_fail
+        config = Mock(spaces=[], force_push=False, force_pull=False)
+
+        with pytest.raises(RuntimeError):
+            sync_cmd._run_bidirectional_sync(config, Mock(last_synced=None, tracked_pages={}))
+
+        phases, pages = sync_cmd.journal.load()
+        assert phases == {"deletions", "moves"}
+        assert set(pages) == {"1"}
+        # Baseline committed right away, not at the end of the run
+        sync_cmd.baseline_manager.update_baseline.assert_called_once_with("1", "---\n---\n# A\n")
+
+    def test_resume_skips_applied_phases_and_pages(self, sync_cmd):
+        """resume=True should skip recorded phases and pass applied pages to FileMapper."""
+        sync_cmd.journal.start()
+        sync_cmd.journal.record_phase("deletions")
+        sync_cmd.journal.record_page(self._action("7"))
+        config = Mock(spaces=[], force_push=False, force_pull=False)
+
+        result = sync_cmd._run_bidirectional_sync(
+            config, Mock(last_synced=None, tracked_pages={}), resume=True
+        )
+
+        assert result == ExitCode.SUCCESS
+        sync_cmd.change_detector.detect_deletions.assert_not_called()
+        sync_cmd.change_detector.detect_moves.assert_called_once()
+        assert set(config.completed_pages) == {"7"}
+
+    def test_without_resume_old_journal_is_discarded(self, sync_cmd):
+        """A plain run should warn about an interrupted run and start over."""
+        sync_cmd.journal.start()
+        sync_cmd.journal.record_phase("deletions")
+        config = Mock(spaces=[], force_push=False, force_pull=False)
+
+        sync_cmd._run_bidirectional_sync(config, Mock(last_synced=None, tracked_pages={}))
+
+        sync_cmd.output_handler.warning.assert_called_once()
+        sync_cmd.change_detector.detect_deletions.assert_called_once()
+        assert config.completed_pages is None
@@ -0,0 +1,109 @@
+"""Unit tests for git_integration.workspace_git module."""
+
+import os
+import subprocess
+
+import pytest
+
+from src.git_integration.errors import GitRepositoryError
+from src.git_integration.workspace_git import WorkspaceGit
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, capture_output=True, text=True, check=True,
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Git repository with a committed docs folder."""
+    root = tmp_path / "project"
+    docs = root / "docs"
+    docs.mkdir(parents=True)
+    (docs / "a.md").write_text("# A\n")
+    (docs / "b.md").write_text("# B\n")
+    (root / "README.md").write_text("readme\n")
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "initial")
+    return root
+
+
+class TestWorkspaceGit:
+    """Test cases for WorkspaceGit."""
+
+    def test_discover_outside_repository(self, tmp_path):
+        """discover() should return None outside a git work tree."""
+        assert WorkspaceGit.discover(str(tmp_path)) is None
+
+    def test_discover_from_subdirectory(self, repo):
+        """discover() should find the repository root from a subdirectory."""
+        workspace = WorkspaceGit.discover(str(repo / "docs"))
+
+        assert workspace.root == os.path.realpath(repo)
+
+    def test_snapshot_of_clean_tree_is_head(self, repo):
+        """snapshot() should return HEAD for a clean work tree."""
+        head = _git(repo, "rev-parse", "HEAD").strip()
+
+        assert WorkspaceGit(str(repo)).snapshot() == head
+
+    def test_snapshot_leaves_repository_untouched(self, repo):
+        """snapshot() of a dirty tree should not change HEAD, status or stash list."""
+        (repo / "docs" / "a.md").write_text("# A edited\n")
+        head = _git(repo, "rev-parse", "HEAD")
+        status = _git(repo, "status", "--porcelain")
+
+        sha = WorkspaceGit(str(repo)).snapshot()
+
+        assert sha != head.strip()
+        assert _git(repo, "rev-parse", "HEAD") == head
+        assert _git(repo, "status", "--porcelain") == status
+        assert _git(repo, "stash", "list") == ""
+
+    def test_changed_files(self, repo):
+        """changed_files() should report modified, deleted and untracked files under path."""
+        workspace = WorkspaceGit(os.path.realpath(repo))
+        snapshot = workspace.snapshot()
+        docs = os.path.realpath(repo / "docs")
+
+        (repo / "docs" / "a.md").write_text("# A edited\n")
+        (repo / "docs" / "b.md").unlink()
+        (repo / "docs" / "new.md").write_text("# New\n")
+        (repo / "README.md").write_text("outside docs\n")
+
+        changed = workspace.changed_files(snapshot, str(repo / "docs"))
+
+        assert changed == {
+            os.path.join(docs, "a.md"),
+            os.path.join(docs, "b.md"),
+            os.path.join(docs, "new.md"),
+        }
+
+    def test_touched_file_not_reported(self, repo):
+        """changed_files() should ignore files whose mtime changed but content didn't."""
+        workspace = WorkspaceGit(os.path.realpath(repo))
+        snapshot = workspace.snapshot()
+        os.utime(repo / "docs" / "a.md", (1, 1))
+
+        assert workspace.changed_files(snapshot, str(repo / "docs")) == set()
+
+    def test_changes_relative_to_dirty_snapshot(self, repo):
+        """changed_files() should compare against the uncommitted snapshot state."""
+        (repo / "docs" / "a.md").write_text("# A pulled\n")
+        workspace = WorkspaceGit(os.path.realpath(repo))
+        snapshot = workspace.snapshot()
+
+        assert workspace.changed_files(snapshot, str(repo / "docs")) == set()
+
+        (repo / "docs" / "a.md").write_text("# A edited after sync\n")
+        assert workspace.changed_files(snapshot, str(repo / "docs")) == {
+            os.path.join(os.path.realpath(repo), "docs", "a.md")
+        }
+
+    def test_unknown_commit_raises(self, repo):
+        """changed_files() should raise GitRepositoryError for a missing snapshot."""
+        with pytest.raises(GitRepositoryError):
+            WorkspaceGit(str(repo)).changed_files("0" * 40, str(repo / "docs"))
@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
@@ -361,3 +362,171 @@ class TestXHTMLCacheInitialization:
         with pytest.raises(CacheError) as exc_info:
             XHTMLCache(invalid_cache_dir)
         assert "Failed to create cache directory" in str(exc_info.value)
+
+
+class TestXHTMLCacheTiers:
+    """Test cases for the memory tier, disk budget and statistics."""
+
+    def test_get_served_from_memory_after_put(self):
+        """XHTMLCache.get() should serve a freshly put entry from memory."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Arrange
+            cache = XHTMLCache(cache_dir)
+            last_modified = datetime(2026, 1, 30, 12, 0, 0)
+            cache.put("123456", 15, "<p>Hello</p>", last_modified)
+
+            # Act
+            result = cache.get("123456", 15, last_modified)
+
+            # Assert
+            assert result == "<p>Hello</p>"
+            stats = cache.get_stats()
+            assert stats.hits == 1
+            assert stats.memory_hits == 1
+            assert stats.disk_hits == 0
+
+    def test_disk_hit_promotes_entry_to_memory(self):
+        """XHTMLCache.get() should promote a disk hit into the memory tier."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Arrange - entry written by another cache instance
+            last_modified = datetime(2026, 1, 30, 12, 0, 0)
+            XHTMLCache(cache_dir).put("123456", 15, "<p>Hello</p>", last_modified)
+            cache = XHTMLCache(cache_dir)
+
+            # Act
+            first = cache.get("123456", 15, last_modified)
+            second = cache.get("123456", 15, last_modified)
+
+            # Assert
+            assert first == second == "<p>Hello</p>"
+            stats = cache.get_stats()
+            assert stats.disk_hits == 1
+            assert stats.memory_hits == 1
+
+    def test_memory_tier_is_bounded(self):
+        """XHTMLCache should keep at most max_memory_entries in memory."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Arrange
+            cache = XHTMLCache(cache_dir, max_memory_entries=2)
+            last_modified = datetime(2026, 1, 30, 12, 0, 0)
+
+            # Act
+            for version in range(1, 4):
+                cache.put("123456", version, f"<p>v{version}</p>", last_modified)
+
+            # Assert - oldest entry falls back to disk
+            assert cache.get("123456", 1, last_modified) == "<p>v1</p>"
+            stats = cache.get_stats()
+            assert stats.disk_hits == 1
+            assert stats.memory_hits == 0
+
+    def test_disk_budget_evicts_least_recently_used(self):
+        """XHTMLCache.put() should evict LRU entries when over max_disk_bytes."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Arrange - budget fits roughly two entries
+            cache = XHTMLCache(cache_dir, max_disk_bytes=2 * 1200)
+            last_modified = datetime(2026, 1, 30, 12, 0, 0)
+            content = "x" * 1000
+            cache.put("111", 1, content, last_modified)
+            cache.put("222", 1, content, last_modified)
+            cache.get("111", 1, last_modified)  # 111 is now most recently used
+
+            # Act
+            cache.put("333", 1, content, last_modified)
+
+            # Assert
+            assert not os.path.exists(os.path.join(cache_dir, "222_v1.xhtml"))
+            assert os.path.exists(os.path.join(cache_dir, "111_v1.xhtml"))
+            assert os.path.exists(os.path.join(cache_dir, "333_v1.xhtml"))
+            assert cache.get("222", 1, last_modified) is None
+            assert cache.get_stats().evictions == 1
+
+    def test_hits_do_not_touch_files_until_flush(self):
+        """XHTMLCache.get() should persist recency only in flush_recency()."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Arrange - entry written by another cache instance, mtime in the past
+            last_modified = datetime(2026, 1, 30, 12, 0, 0)
+            XHTMLCache(cache_dir).put("123456", 15, "<p>Hello</p>", last_modified)
+            xhtml_path = os.path.join(cache_dir, "123456_v15.xhtml")
+            os.utime(xhtml_path, (1_000_000, 1_000_000))
+            cache = XHTMLCache(cache_dir)
+
+            # Act
+            with patch("src.git_integration.xhtml_cache.os.utime") as mock_utime:
+                cache.get("123456", 15, last_modified)
+                cache.get("123456", 15, last_modified)
+            mock_utime.assert_not_called()
+            cache.flush_recency()
+
+            # Assert
+            assert os.path.getmtime(xhtml_path) > 1_000_000
+
+    def test_stats_since_snapshot(self):
+        """CacheStats.since() should report only the counts after the snapshot."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = XHTMLCache(cache_dir)
+            cache.get("123456", 1, datetime.now())
+            start = cache.get_stats()
+
+            cache.get("123456", 2, datetime.now())
+
+            run_stats = cache.get_stats().since(start)
+            assert run_stats.misses == 1
+            assert run_stats.hits == 0
+
+    def test_miss_is_counted(self):
+        """XHTMLCache.get() should count misses."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = XHTMLCache(cache_dir)
+
+            assert cache.get("123456", 1, datetime.now()) is None
+
+            assert cache.get_stats().misses == 1
+
+
+class TestXHTMLCacheCleanup:
+    """Test cases for expired entry cleanup."""
+
+    def _put_old_entry(self, cache, page_id, version):
+        old_cached_at = datetime.now() - timedelta(days=8)
+        with patch("src.git_integration.xhtml_cache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = old_cached_at
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            cache.put(page_id, version, "<p>Old</p>", datetime(2026, 1, 30))
+
+    def test_cleanup_expired_removes_only_old_entries(self):
+        """XHTMLCache.cleanup_expired() should delete entries past max_age_days."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Arrange
+            cache = XHTMLCache(cache_dir, max_age_days=7)
+            self._put_old_entry(cache, "111", 1)
+            cache.put("222", 1, "<p>New</p>", datetime(2026, 1, 30))
+
+            # Act
+            removed = cache.cleanup_expired()
+
+            # Assert
+            assert removed == 1
+            assert not os.path.exists(os.path.join(cache_dir, "111_v1.xhtml"))
+            assert not os.path.exists(os.path.join(cache_dir, "111_v1.meta.json"))
+            assert os.path.exists(os.path.join(cache_dir, "222_v1.xhtml"))
+            assert cache.get_stats().expired == 1
+
+    def test_background_cleanup_runs_and_stops(self):
+        """XHTMLCache.start_background_cleanup() should run a cleanup pass."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Arrange
+            cache = XHTMLCache(cache_dir, max_age_days=7)
+            self._put_old_entry(cache, "111", 1)
+
+            # Act
+            cache.start_background_cleanup(interval_seconds=60)
+            for _ in range(100):
+                if cache.get_stats().expired:
+                    break
+                time.sleep(0.01)
+            cache.stop_background_cleanup()
+
+            # Assert
+            assert cache.get_stats().expired == 1
+            assert not os.path.exists(os.path.join(cache_dir, "111_v1.xhtml"))
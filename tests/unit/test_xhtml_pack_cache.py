@@ -0,0 +1,227 @@
+"""Unit tests for git_integration.xhtml_pack_cache module."""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.git_integration.errors import CacheError
+from src.git_integration.xhtml_pack_cache import PACK_FILE_NAME, XHTMLPackCache
+
+
+LAST_MODIFIED = datetime(2026, 1, 30, 12, 0, 0)
+
+
+class TestXHTMLPackCacheGetPut:
+    """Test cases for XHTMLPackCache.get() and put()."""
+
+    def test_put_then_get_returns_content(self):
+        """XHTMLPackCache.get() should return content stored by put()."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("123456", 15, "<p>Hello</p>", LAST_MODIFIED)
+
+                assert cache.get("123456", 15, LAST_MODIFIED) == "<p>Hello</p>"
+                assert cache.get_stats().hits == 1
+
+    def test_single_pack_file_is_used(self):
+        """XHTMLPackCache should store all entries in one pack file."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                for version in range(1, 6):
+                    cache.put("123456", version, f"<p>v{version}</p>", LAST_MODIFIED)
+
+            assert os.listdir(cache_dir) == [PACK_FILE_NAME]
+
+    def test_content_is_compressed(self):
+        """XHTMLPackCache should store compressed payloads."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            xhtml = "<p>repetitive content</p>" * 1000
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("123456", 1, xhtml, LAST_MODIFIED)
+
+            assert os.path.getsize(os.path.join(cache_dir, PACK_FILE_NAME)) < len(xhtml) / 10
+
+    def test_get_miss_on_timestamp_mismatch(self):
+        """XHTMLPackCache.get() should miss when last_modified differs."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("123456", 15, "<p>Hello</p>", LAST_MODIFIED)
+
+                result = cache.get("123456", 15, LAST_MODIFIED + timedelta(hours=1))
+
+                assert result is None
+                assert cache.get_stats().misses == 1
+
+    def test_get_miss_when_expired(self):
+        """XHTMLPackCache.get() should miss when the entry is too old."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir, max_age_days=7) as cache:
+                old_cached_at = datetime.now() - timedelta(days=8)
+                with patch("src.git_integration.xhtml_pack_cache.datetime") as mock_datetime:
+                    mock_datetime.now.return_value = old_cached_at
+                    cache.put("123456", 15, "<p>Old</p>", LAST_MODIFIED)
+
+                assert cache.get("123456", 15, LAST_MODIFIED) is None
+                assert cache.get_stats().expired == 1
+
+    def test_expired_entry_is_tombstoned(self):
+        """An entry get() drops for expiry should stay dropped after reopen."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir, max_age_days=7) as cache:
+                old_cached_at = datetime.now() - timedelta(days=8)
+                with patch("src.git_integration.xhtml_pack_cache.datetime") as mock_datetime:
+                    mock_datetime.now.return_value = old_cached_at
+                    cache.put("123456", 15, "<p>Old</p>", LAST_MODIFIED)
+                cache.put("123456", 16, "<p>New</p>", LAST_MODIFIED)
+
+                assert cache.get("123456", 15, LAST_MODIFIED) is None
+
+            with XHTMLPackCache(cache_dir, max_age_days=7) as cache:
+                assert ("123456", 15) not in cache._index
+                assert cache.get("123456", 16, LAST_MODIFIED) == "<p>New</p>"
+
+    def test_put_overwrites_existing_version(self):
+        """XHTMLPackCache.put() should replace an existing entry."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("123456", 15, "<p>Old</p>", LAST_MODIFIED)
+                cache.put("123456", 15, "<p>New</p>", LAST_MODIFIED)
+
+                assert cache.get("123456", 15, LAST_MODIFIED) == "<p>New</p>"
+
+
+class TestXHTMLPackCachePersistence:
+    """Test cases for reopening and recovering the pack file."""
+
+    def test_index_rebuilt_on_reopen(self):
+        """XHTMLPackCache should rebuild its index from an existing pack."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("111", 1, "<p>One</p>", LAST_MODIFIED)
+                cache.put("222", 3, "<p>Two</p>", LAST_MODIFIED)
+                cache.invalidate("111")
+
+            with XHTMLPackCache(cache_dir) as cache:
+                assert cache.get("111", 1, LAST_MODIFIED) is None
+                assert cache.get("222", 3, LAST_MODIFIED) == "<p>Two</p>"
+
+    def test_truncated_tail_is_discarded(self):
+        """XHTMLPackCache should drop a partially written record at the tail."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("111", 1, "<p>One</p>", LAST_MODIFIED)
+                cache.put("222", 1, "<p>Two</p>", LAST_MODIFIED)
+
+            pack_path = os.path.join(cache_dir, PACK_FILE_NAME)
+            size = os.path.getsize(pack_path)
+            with open(pack_path, "r+b") as f:
+                f.truncate(size - 3)
+
+            with XHTMLPackCache(cache_dir) as cache:
+                assert cache.get("111", 1, LAST_MODIFIED) == "<p>One</p>"
+                assert cache.get("222", 1, LAST_MODIFIED) is None
+                cache.put("333", 1, "<p>Three</p>", LAST_MODIFIED)
+
+            with XHTMLPackCache(cache_dir) as cache:
+                assert cache.get("333", 1, LAST_MODIFIED) == "<p>Three</p>"
+
+    def test_corrupted_payload_raises_cache_error(self):
+        """XHTMLPackCache.get() should raise CacheError on undecodable payload."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("111", 1, "<p>One</p>" * 10, LAST_MODIFIED)
+
+            pack_path = os.path.join(cache_dir, PACK_FILE_NAME)
+            with open(pack_path, "r+b") as f:
+                f.seek(-4, os.SEEK_END)
+                f.write(b"\x00\x00\x00\x00")
+
+            with XHTMLPackCache(cache_dir) as cache:
+                with pytest.raises(CacheError) as exc_info:
+                    cache.get("111", 1, LAST_MODIFIED)
+                assert "Failed to read record" in str(exc_info.value)
+
+
+class TestXHTMLPackCacheMaintenance:
+    """Test cases for invalidate, clear_all, cleanup_expired and compact."""
+
+    def test_invalidate_removes_all_versions_of_page(self):
+        """XHTMLPackCache.invalidate() should drop every version of a page."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("111", 1, "<p>v1</p>", LAST_MODIFIED)
+                cache.put("111", 2, "<p>v2</p>", LAST_MODIFIED)
+                cache.put("222", 1, "<p>Other</p>", LAST_MODIFIED)
+
+                cache.invalidate("111")
+
+                assert cache.get("111", 1, LAST_MODIFIED) is None
+                assert cache.get("111", 2, LAST_MODIFIED) is None
+                assert cache.get("222", 1, LAST_MODIFIED) == "<p>Other</p>"
+
+    def test_clear_all_empties_pack(self):
+        """XHTMLPackCache.clear_all() should remove every entry."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                cache.put("111", 1, "<p>One</p>", LAST_MODIFIED)
+
+                cache.clear_all()
+
+                assert cache.get("111", 1, LAST_MODIFIED) is None
+                assert os.path.getsize(cache.pack_path) == 0
+
+    def test_compact_reclaims_dead_records(self):
+        """XHTMLPackCache.compact() should keep only live records."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                for version in range(1, 11):
+                    cache.put("111", version, f"<p>{version}</p>" * 50, LAST_MODIFIED)
+                cache.put("222", 1, "<p>Keep</p>", LAST_MODIFIED)
+                cache.invalidate("111")
+                size_before = os.path.getsize(cache.pack_path)
+
+                cache.compact()
+
+                assert os.path.getsize(cache.pack_path) < size_before
+                assert cache.get("222", 1, LAST_MODIFIED) == "<p>Keep</p>"
+
+            with XHTMLPackCache(cache_dir) as cache:
+                assert cache.get("222", 1, LAST_MODIFIED) == "<p>Keep</p>"
+
+    def test_live_pack_has_no_garbage(self):
+        """Live bytes should count whole records, so a pack without dead records has no garbage."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir) as cache:
+                for page in range(200):
+                    cache.put(str(page), 1, "<p>x</p>", LAST_MODIFIED)
+
+                assert cache._live_bytes == cache._pack_size == os.path.getsize(cache.pack_path)
+
+                cache.put("0", 1, "<p>y</p>", LAST_MODIFIED)
+                cache.compact()
+
+                assert cache._live_bytes == cache._pack_size == os.path.getsize(cache.pack_path)
+
+            with XHTMLPackCache(cache_dir) as cache:
+                assert cache._live_bytes == cache._pack_size
+
+    def test_cleanup_expired_removes_old_entries(self):
+        """XHTMLPackCache.cleanup_expired() should remove entries past max age."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with XHTMLPackCache(cache_dir, max_age_days=7) as cache:
+                old_cached_at = datetime.now() - timedelta(days=8)
+                with patch("src.git_integration.xhtml_pack_cache.datetime") as mock_datetime:
+                    mock_datetime.now.return_value = old_cached_at
+                    cache.put("111", 1, "<p>Old</p>", LAST_MODIFIED)
+                cache.put("222", 1, "<p>New</p>", LAST_MODIFIED)
+
+                removed = cache.cleanup_expired()
+
+                assert removed == 1
+                assert cache.get("222", 1, LAST_MODIFIED) == "<p>New</p>"
+
+            with XHTMLPackCache(cache_dir) as cache:
+                assert cache.get("111", 1, LAST_MODIFIED) is None